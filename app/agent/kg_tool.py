@@ -12,11 +12,15 @@ Tool Return Format (per Claude Agent SDK):
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any, TypedDict
 from uuid import uuid4
 
 from claude_agent_sdk import tool
 
+from app.core.config import get_settings
+from app.kg.patterns import MAX_PATTERN_HOPS
+
 if TYPE_CHECKING:
     from app.kg.knowledge_base import KnowledgeBase
     from app.services.kg_service import KnowledgeGraphService
@@ -53,6 +57,9 @@ MCPToolResponse = MCPToolSuccess | MCPToolError
 # Maximum entity name length for input validation (security)
 MAX_ENTITY_NAME_LENGTH = 500
 
+# Maximum alternative paths shown for connection queries
+MAX_CONNECTION_PATHS = 5
+
 
 def _validate_entity_name(name: str, param_name: str) -> dict[str, Any] | None:
     """Validate entity name length. Returns error dict if invalid, None if valid."""
@@ -143,6 +150,11 @@ def _get_kg_service() -> "KnowledgeGraphService":
                 "description": "ID of the saved transcript (from save_transcript). "
                 "Recommended for evidence linking. If not provided, auto-detection by title is attempted.",
             },
+            "replace": {
+                "type": "boolean",
+                "description": "Re-extract an existing source: replace its previous "
+                "entities and relationships with the new results. Default false.",
+            },
         },
         "required": ["project_id", "transcript", "title"],
     },
@@ -160,6 +172,7 @@ async def extract_to_kg(args: dict[str, Any]) -> dict[str, Any]:
             - transcript: Full transcript text to extract from
             - title: Title of the source content
             - source_id: Optional unique identifier for the source
+            - replace: Optional flag to replace the source's previous results
 
     Returns:
         MCP tool response with extraction statistics or error
@@ -170,6 +183,7 @@ async def extract_to_kg(args: dict[str, Any]) -> dict[str, Any]:
         title = args.get("title", "")
         source_id = args.get("source_id") or uuid4().hex[:8]
         transcript_id = args.get("transcript_id")
+        replace = bool(args.get("replace", False))
 
         if not project_id:
             return {"success": False, "error": "project_id is required"}
@@ -200,6 +214,7 @@ async def extract_to_kg(args: dict[str, Any]) -> dict[str, Any]:
             title=title,
             source_id=source_id,
             transcript_id=transcript_id,
+            replace=replace,
         )
 
         # Format success response
@@ -213,6 +228,14 @@ async def extract_to_kg(args: dict[str, Any]) -> dict[str, Any]:
             f"- New discoveries: {result['discoveries']}\n"
         )
 
+        retracted = result.get("retracted")
+        if retracted:
+            text += (
+                f"- Replaced previous results: "
+                f"{retracted['relationships_removed']} relationships and "
+                f"{retracted['nodes_removed']} entities removed\n"
+            )
+
         if result.get("summary"):
             text += f"\n### Summary\n{result['summary']}\n"
 
@@ -579,7 +602,8 @@ async def get_kg_stats(args: dict[str, Any]) -> dict[str, Any]:
     "key_entities (find important entities), connection (how two entities connect), "
     "common_ground (shared connections), groups (discover clusters), "
     "isolated (find disconnected groups), mentions (where entity appears), "
-    "evidence (quotes for relationships), suggestions (what to explore next).",
+    "evidence (quotes for relationships), suggestions (what to explore next), "
+    "pattern (typed path query, e.g. (:Person)-[worked_for]->(:Organization)).",
     {
         "type": "object",
         "properties": {
@@ -598,9 +622,18 @@ async def get_kg_stats(args: dict[str, Any]) -> dict[str, Any]:
                     "mentions",
                     "evidence",
                     "suggestions",
+                    "pattern",
                 ],
                 "description": "Type of insight query to perform",
             },
+            "pattern": {
+                "type": "string",
+                "description": "Typed path pattern (for pattern), e.g. "
+                '(:Person {label: "Sidney Gottlieb"})-[worked_for]->(:Organization). '
+                "Nodes: (var:Type|Type {key: value}); relationships: "
+                "-[type|type]->, <-[type]-, -[type]- or -->. Types match "
+                f"case-insensitively; up to {MAX_PATTERN_HOPS} relationships",
+            },
             "entity_1": {
                 "type": "string",
                 "description": "First entity name (for connection, common_ground, evidence, mentions)",
@@ -618,6 +651,34 @@ async def get_kg_stats(args: dict[str, Any]) -> dict[str, Any]:
                 "type": "string",
                 "description": "Filter by entity type (for key_entities)",
             },
+            "resolution": {
+                "type": "number",
+                "description": "Community resolution for groups: above 1.0 "
+                "finds more, smaller groups; below 1.0 fewer, larger ones "
+                "(default: 1.0)",
+            },
+            "approximate": {
+                "type": "boolean",
+                "description": "Force approximate (true) or exact (false) "
+                "influence/bridging scores for key_entities (default: "
+                "approximate only on large graphs)",
+            },
+            "max_paths": {
+                "type": "integer",
+                "description": "Number of alternative paths to show for "
+                f"connection, shortest first (default: 1, max: {MAX_CONNECTION_PATHS})",
+            },
+            "relationship_types": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Only follow these relationship types (for connection)",
+            },
+            "entity_types": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Only pass through entities of these types "
+                "(for connection)",
+            },
             "limit": {
                 "type": "integer",
                 "description": "Maximum results to return (default: 10)",
@@ -640,6 +701,11 @@ async def ask_about_graph(args: dict[str, Any]) -> dict[str, Any]:
             - entity_1, entity_2: Entity names for relationship queries
             - method: Ranking method for key_entities
             - entity_type: Filter for key_entities
+            - resolution: Community resolution for groups
+            - approximate: Force approximate/exact centrality for key_entities
+            - max_paths: Alternative paths for connection
+            - relationship_types, entity_types: Path filters for connection
+            - pattern: Typed path pattern for pattern queries
             - limit: Max results
 
     Returns:
@@ -681,7 +747,11 @@ async def ask_about_graph(args: dict[str, Any]) -> dict[str, Any]:
             return _handle_common_ground(kb, args)
 
         elif question_type == "groups":
-            return _handle_groups(kb, project.name)
+            # Off the event loop (community detection waits on worker
+            # processes), on a snapshot the loop can't change underneath it
+            return await asyncio.to_thread(
+                _handle_groups, kb.snapshot(), args, project.name
+            )
 
         elif question_type == "isolated":
             return _handle_isolated(kb, project.name)
@@ -695,12 +765,15 @@ async def ask_about_graph(args: dict[str, Any]) -> dict[str, Any]:
         elif question_type == "suggestions":
             return _handle_suggestions(kb, project.name)
 
+        elif question_type == "pattern":
+            return _handle_pattern(kb, args)
+
         else:
             return {
                 "success": False,
                 "error": f"Unknown question_type: {question_type}. "
                 "Valid types: key_entities, connection, common_ground, groups, "
-                "isolated, mentions, evidence, suggestions",
+                "isolated, mentions, evidence, suggestions, pattern",
             }
 
     except Exception as e:
@@ -717,7 +790,15 @@ def _handle_key_entities(
     entity_type = args.get("entity_type")
     limit = args.get("limit", 10)
 
-    results = kb.get_key_entities(limit=limit, method=method, entity_type=entity_type)
+    settings = get_settings()
+    results = kb.get_key_entities(
+        limit=limit,
+        method=method,
+        entity_type=entity_type,
+        approximate=args.get("approximate"),
+        approximate_min_nodes=settings.kg_centrality_approx_min_nodes,
+        sample_size=settings.kg_betweenness_sample_size,
+    )
 
     if not results:
         return {
@@ -755,6 +836,11 @@ def _handle_key_entities(
 
     if entity_type:
         lines.append(f"\n*Filtered to {entity_type} entities*")
+    if results[0].get("approximate"):
+        lines.append(
+            "\n*Scores are approximate (sampled to keep this query fast on a "
+            "large graph)*"
+        )
 
     return {"content": [{"type": "text", "text": "\n".join(lines)}]}
 
@@ -779,7 +865,31 @@ def _handle_connection(
     if error := _validate_entity_name(entity_2, "entity_2"):
         return error
 
-    result = kb.find_connection(entity_1, entity_2)
+    from app.kg.paths import PathBudget
+
+    max_paths = min(max(int(args.get("max_paths", 1)), 1), MAX_CONNECTION_PATHS)
+    relationship_types = args.get("relationship_types") or None
+    entity_types = args.get("entity_types") or None
+
+    settings = get_settings()
+    result = kb.find_connection(
+        entity_1,
+        entity_2,
+        max_paths=max_paths,
+        relationship_types=relationship_types,
+        entity_types=entity_types,
+        budget=PathBudget(
+            max_expansions=settings.kg_path_max_expansions,
+            time_limit=settings.kg_path_time_budget_seconds,
+        ),
+    )
+
+    filter_notes = []
+    if relationship_types:
+        filter_notes.append(f"relationships: {', '.join(relationship_types)}")
+    if entity_types:
+        filter_notes.append(f"entity types: {', '.join(entity_types)}")
+    filter_text = f"\n\n*Filtered to {'; '.join(filter_notes)}*" if filter_notes else ""
 
     if not result["connected"]:
         return {
@@ -787,27 +897,45 @@ def _handle_connection(
                 {
                     "type": "text",
                     "text": f"## Connection: {entity_1} to {entity_2}\n\n"
-                    f"**Not connected:** {result['explanation']}",
+                    f"**Not connected:** {result['explanation']}{filter_text}",
                 }
             ]
         }
 
-    # Build path description
-    path_lines = []
-    for i, step in enumerate(result["path"]):
-        if step["relationship"]:
-            arrow = "->" if step["direction"] == "outgoing" else "<-"
-            path_lines.append(f"  {step['entity']} {arrow} ({step['relationship']})")
+    sections = []
+    for index, found in enumerate(result["paths"], 1):
+        # Build path description
+        path_lines = []
+        for step in found["path"]:
+            if step["relationship"]:
+                arrow = "->" if step["direction"] == "outgoing" else "<-"
+                path_lines.append(
+                    f"  {step['entity']} {arrow} ({step['relationship']})"
+                )
+            else:
+                path_lines.append(f"  {step['entity']}")
+
+        path_text = "\n".join(path_lines)
+        if len(result["paths"]) == 1:
+            heading = "### Path"
         else:
-            path_lines.append(f"  {step['entity']}")
-
-    path_text = "\n".join(path_lines)
+            steps = found["steps"]
+            heading = f"### Path {index} ({steps} step{'s' if steps != 1 else ''})"
+        sections.append(f"{heading}\n```\n{path_text}\n```")
 
     text = (
         f"## Connection: {entity_1} to {entity_2}\n\n"
-        f"**Connected:** Yes ({result['explanation']})\n\n"
-        f"### Path\n```\n{path_text}\n```"
+        f"**Connected:** Yes ({result['explanation']})\n\n" + "\n\n".join(sections)
     )
+    if len(result["paths"]) < max_paths:
+        if result["budget_exhausted"]:
+            text += (
+                f"\n\n*Only {len(result['paths'])} path(s) found before the "
+                "search budget ran out*"
+            )
+        else:
+            text += f"\n\n*No other paths found ({len(result['paths'])} total)*"
+    text += filter_text
 
     return {"content": [{"type": "text", "text": text}]}
 
@@ -859,9 +987,15 @@ def _handle_common_ground(
     return {"content": [{"type": "text", "text": "\n".join(lines)}]}
 
 
-def _handle_groups(kb: "KnowledgeBase", project_name: str) -> dict[str, Any]:
+def _handle_groups(
+    kb: "KnowledgeBase",
+    args: dict[str, Any],
+    project_name: str,
+) -> dict[str, Any]:
     """Handle groups query type."""
-    results = kb.discover_groups()
+    limit = args.get("limit", 10)
+    resolution = args.get("resolution", 1.0)
+    results = kb.discover_groups(resolution=resolution)
 
     if not results:
         return {
@@ -880,7 +1014,7 @@ def _handle_groups(kb: "KnowledgeBase", project_name: str) -> dict[str, Any]:
         f"Detected {len(results)} cluster(s):\n",
     ]
 
-    for i, group in enumerate(results, 1):
+    for i, group in enumerate(results[:limit], 1):
         sample_text = ", ".join(group["sample"])
         if group["size"] > 5:
             sample_text += f", ... (+{group['size'] - 5} more)"
@@ -888,8 +1022,12 @@ def _handle_groups(kb: "KnowledgeBase", project_name: str) -> dict[str, Any]:
         lines.append(f"### {i}. {group['name']}")
         lines.append(f"**Size:** {group['size']} entities")
         lines.append(f"**Members:** {sample_text}")
+        lines.append(f"**Modularity:** {group['modularity']:.3f}")
         lines.append("")
 
+    if len(results) > limit:
+        lines.append(f"*...and {len(results) - limit} smaller group(s)*")
+
     return {"content": [{"type": "text", "text": "\n".join(lines)}]}
 
 
@@ -960,13 +1098,62 @@ def _handle_mentions(
 
     lines = [
         f"## Mentions of {entity}\n",
-        f"Found in {len(results)} source(s):\n",
-        "| Source | Type |",
-        "|--------|------|",
+        f"Found in {len(results)} source(s), most mentions first:\n",
+        "| Source | Type | Mentions |",
+        "|--------|------|----------|",
     ]
 
     for mention in results:
-        lines.append(f"| {mention['source_title']} | {mention['source_type']} |")
+        lines.append(
+            f"| {mention['source_title']} | {mention['source_type']} "
+            f"| {mention['mention_count']} |"
+        )
+
+    return {"content": [{"type": "text", "text": "\n".join(lines)}]}
+
+
+def _handle_pattern(
+    kb: "KnowledgeBase",
+    args: dict[str, Any],
+) -> dict[str, Any]:
+    """Handle pattern query type."""
+    pattern = args.get("pattern", "")
+    limit = args.get("limit", 10)
+
+    if not pattern:
+        return {
+            "success": False,
+            "error": "pattern is required for pattern queries",
+        }
+
+    try:
+        matches = kb.match_pattern(pattern, limit=limit + 1)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+
+    if not matches:
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"## Pattern Matches\n\nNo paths match `{pattern}`.",
+                }
+            ]
+        }
+
+    lines = [f"## Pattern Matches for `{pattern}`\n"]
+    for i, match in enumerate(matches[:limit], 1):
+        nodes = match["nodes"]
+        steps = [f"{nodes[0]['label']} ({nodes[0]['entity_type']})"]
+        for edge, node in zip(match["edges"], nodes[1:], strict=True):
+            arrow = "/".join(edge["relationship_types"]) or "related_to"
+            forward = edge["target_node_id"] == node["id"]
+            steps.append(f"-[{arrow}]->" if forward else f"<-[{arrow}]-")
+            steps.append(f"{node['label']} ({node['entity_type']})")
+        lines.append(f"{i}. " + " ".join(steps))
+
+    if len(matches) > limit:
+        lines.append(f"\n*Showing the first {limit} matches; raise limit for more*")
 
     return {"content": [{"type": "text", "text": "\n".join(lines)}]}
 
@@ -1289,17 +1476,14 @@ async def merge_entities_tool(args: dict[str, Any]) -> dict[str, Any]:
         if not merged:
             return {"success": False, "error": f"Merged entity '{merged_id}' not found"}
 
-        # Perform the merge
-        history = kb.merge_nodes(
-            survivor_id=survivor_id,
-            merged_id=merged_id,
-            merge_type="agent",
-        )
-
-        # Save updated KB
-        from app.kg.persistence import save_knowledge_base
-
-        save_knowledge_base(kb, kg_service.kb_path)
+        # Perform the merge and save the updated KB
+        with kg_service.kb_transaction(kb):
+            history = kb.merge_nodes(
+                survivor_id=survivor_id,
+                merged_id=merged_id,
+                merge_type="agent",
+            )
+            kg_service.save_kb(kb)
 
         # Update project stats and add to merge history
         project.thing_count = len(kb._nodes)
@@ -1527,19 +1711,16 @@ async def approve_merge(args: dict[str, Any]) -> dict[str, Any]:
                 "error": "One or both entities no longer exist. Candidate removed.",
             }
 
-        # Perform the merge (node_a is the survivor)
-        history = kb.merge_nodes(
-            survivor_id=candidate.node_a_id,
-            merged_id=candidate.node_b_id,
-            merge_type="user",
-        )
+        # Perform the merge (node_a is the survivor) and save the KB
+        with kg_service.kb_transaction(kb):
+            history = kb.merge_nodes(
+                survivor_id=candidate.node_a_id,
+                merged_id=candidate.node_b_id,
+                merge_type="user",
+            )
+            kg_service.save_kb(kb)
         history.confidence = candidate.confidence
 
-        # Save KB
-        from app.kg.persistence import save_knowledge_base
-
-        save_knowledge_base(kb, kg_service.kb_path)
-
         # Update project: remove candidate, add to history, update stats
         project.pending_merges.pop(candidate_idx)
         project.merge_history.append(history)
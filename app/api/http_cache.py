@@ -0,0 +1,318 @@
+"""
+Conditional GET and cached, compressed JSON responses.
+
+Read endpoints whose payload depends only on stored state answer with a
+strong ETag and honor If-None-Match, so clients polling unchanged data get
+an empty 304. Serialized bodies are cached by ETag, so an unchanged payload
+is neither re-encoded nor re-compressed.
+
+Design Decisions:
+- ETags hash the request path and query together with a state tag supplied
+  by the caller (e.g. KnowledgeGraphService.state_tag), so they change
+  exactly when the payload can; callers check them before loading data
+- Each content-coding of a payload is a different representation, so it
+  gets its own strong ETag: the base tag for identity, the base tag with a
+  "-gzip"/"-br" suffix for compressed bodies. If-None-Match is matched on
+  the base tag, and a 304 echoes the tag the client holds
+- Bodies are compressed per the request's Accept-Encoding: brotli if the
+  optional brotli package is installed, otherwise gzip; small bodies are
+  sent as-is
+- The body cache is an in-process LRU keyed by (ETag, encoding), bounded
+  to RESPONSE_CACHE_MAX_BYTES; the uncompressed body is kept too, so a
+  client asking for another encoding isn't re-serialized
+- Streamed bodies (streaming_json_response) are compressed chunk by chunk
+  as they are sent; they are never cached, so only 304s skip their work
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import zlib
+from collections import OrderedDict
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+# Optional brotli support (smaller than gzip for JSON)
+try:
+    import brotli  # type: ignore[import-not-found]
+
+    BROTLI_SUPPORT = True
+except ImportError:
+    BROTLI_SUPPORT = False
+
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Total size of cached bodies
+COMPRESS_MIN_BYTES = 1024  # Smaller bodies aren't worth compressing
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+_cache: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+_cache_bytes = 0
+
+
+def make_etag(request: Request, state_tag: str) -> str:
+    """
+    Strong ETag for a request against a given state.
+
+    Args:
+        request: Incoming request (path and query identify the payload)
+        state_tag: Fingerprint of the state the payload is computed from
+
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.sha1(
+        f"{request.url.path}?{request.url.query}|{state_tag}".encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f'"{digest[:20]}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Whether the request's If-None-Match matches an ETag.
+
+    Args:
+        request: Incoming request
+        etag: Current (base) ETag of the resource; tags of its compressed
+            representations match too
+
+    Returns:
+        True if the client's copy is current (respond 304)
+    """
+    return _matching_etag(request, etag) is not None
+
+
+def _matching_etag(request: Request, etag: str) -> str | None:
+    """
+    The If-None-Match entry matching a base ETag, in any content-coding.
+
+    Returns:
+        The matching tag as the client holds it (without a weak prefix),
+        the base tag for "*", or None if nothing matches
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    if header.strip() == "*":
+        return etag
+    # If-None-Match uses weak comparison
+    for candidate in header.split(","):
+        tag = candidate.strip().removeprefix("W/")
+        if tag in (etag, *(_coded_etag(etag, coding) for coding in ("gzip", "br"))):
+            return tag
+    return None
+
+
+def _coded_etag(etag: str, encoding: str) -> str:
+    """The ETag of a payload's representation in a content-coding."""
+    if encoding == "identity":
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def not_modified(etag: str) -> Response:
+    """A 304 response for an unchanged resource."""
+    return Response(status_code=304, headers=_validator_headers(etag))
+
+
+def cached_response(request: Request, etag: str) -> Response | None:
+    """
+    Answer a request from its ETag alone, if possible.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        A 304 if the client is current, the cached body if one exists for
+        this ETag, otherwise None (the caller must build the payload)
+    """
+    held = _matching_etag(request, etag)
+    if held is not None:
+        return not_modified(held)
+    raw = _cache_get((etag, "identity"))
+    if raw is None:
+        return None
+    return _encoded_response(request, raw, etag)
+
+
+def json_response(request: Request, payload: Any, etag: str | None) -> Response:
+    """
+    Serialize, compress and (with an ETag) cache a JSON payload.
+
+    Args:
+        request: Incoming request (for Accept-Encoding)
+        payload: JSON-compatible data (Pydantic models are encoded)
+        etag: ETag of the payload, or None to skip validators and caching
+
+    Returns:
+        JSON response, compressed if the client accepts it and the body is
+        large enough
+    """
+    raw = json.dumps(
+        jsonable_encoder(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode()
+    if etag:
+        _cache_put((etag, "identity"), raw)
+    return _encoded_response(request, raw, etag)
+
+
+def streaming_json_response(
+    request: Request, chunks: AsyncIterable[str]
+) -> StreamingResponse:
+    """
+    Stream a JSON body, compressed as it is sent if the client accepts it.
+
+    The body's size isn't known up front, so COMPRESS_MIN_BYTES doesn't
+    apply. Attach validators with add_validators.
+
+    Args:
+        request: Incoming request (for Accept-Encoding)
+        chunks: Consecutive pieces of the JSON body
+
+    Returns:
+        Streaming JSON response
+    """
+    encoding = _negotiate_encoding(request)
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return StreamingResponse(
+        _compress_stream(chunks, encoding),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def add_validators(response: Response, etag: str) -> Response:
+    """Attach ETag and revalidation headers to a response built elsewhere."""
+    encoding = response.headers.get("content-encoding", "identity")
+    response.headers.update(_validator_headers(_coded_etag(etag, encoding)))
+    return response
+
+
+def clear_cache() -> None:
+    """Drop all cached bodies."""
+    global _cache_bytes
+    _cache.clear()
+    _cache_bytes = 0
+
+
+def _validator_headers(etag: str) -> dict[str, str]:
+    """ETag plus no-cache (clients may store the body but must revalidate)."""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def _encoded_response(request: Request, raw: bytes, etag: str | None) -> Response:
+    """Compress a serialized body as negotiated (cached by ETag) and wrap it."""
+    encoding = _negotiate_encoding(request)
+    if len(raw) < COMPRESS_MIN_BYTES:
+        encoding = "identity"
+    body = raw
+    if encoding != "identity":
+        cached = _cache_get((etag, encoding)) if etag else None
+        if cached is None:
+            cached = _compress(raw, encoding)
+            if etag:
+                _cache_put((etag, encoding), cached)
+        body = cached
+
+    headers = {"Vary": "Accept-Encoding"}
+    if etag:
+        headers |= _validator_headers(_coded_etag(etag, encoding))
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _negotiate_encoding(request: Request) -> str:
+    """
+    Pick "br", "gzip" or "identity" from Accept-Encoding.
+
+    The coding with the highest q-value wins, preferring br on a tie.
+    "*" sets the q-value of codings not listed by name, and q=0 excludes
+    a coding.
+    """
+    weights: dict[str, float] = {}
+    for item in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+
+    wildcard = weights.get("*", 0.0)
+    best, best_q = "identity", 0.0
+    for encoding in ("br", "gzip") if BROTLI_SUPPORT else ("gzip",):
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _compress(raw: bytes, encoding: str) -> bytes:
+    """Compress a body with "br" or "gzip" (deterministically)."""
+    if encoding == "br":
+        compressed: bytes = brotli.compress(raw, quality=BROTLI_QUALITY)
+        return compressed
+    return gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+async def _compress_stream(
+    chunks: AsyncIterable[str], encoding: str
+) -> AsyncIterator[bytes]:
+    """Encode body chunks and compress them incrementally as "br" or "gzip"."""
+    if encoding == "identity":
+        async for chunk in chunks:
+            yield chunk.encode()
+        return
+
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        compress, finish = compressor.process, compressor.finish
+    else:
+        # wbits 16 + MAX_WBITS writes a gzip header (with mtime 0)
+        compressobj = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        compress, finish = compressobj.compress, compressobj.flush
+    async for chunk in chunks:
+        data = compress(chunk.encode())
+        if data:
+            yield data
+    yield finish()
+
+
+def _cache_get(key: tuple[str, str]) -> bytes | None:
+    """Look up a cached body, marking it recently used."""
+    body = _cache.get(key)
+    if body is not None:
+        _cache.move_to_end(key)
+    return body
+
+
+def _cache_put(key: tuple[str, str], body: bytes) -> None:
+    """Cache a body, evicting the least recently used beyond the size limit."""
+    global _cache_bytes
+    if len(body) > RESPONSE_CACHE_MAX_BYTES // 4 or key in _cache:
+        return
+    _cache[key] = body
+    _cache_bytes += len(body)
+    while _cache_bytes > RESPONSE_CACHE_MAX_BYTES:
+        _, evicted = _cache.popitem(last=False)
+        _cache_bytes -= len(evicted)
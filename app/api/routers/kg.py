@@ -7,33 +7,62 @@ Provides endpoints for KG project management:
 - Discovery confirmation workflow
 - Entity extraction from transcripts
 - Graph export (GraphML/JSON)
-- Node queries and neighbor traversal
+- Node queries, typeahead search and neighbor traversal (cursor-paginated,
+  field-projected and streamed)
+- Change feed for delta sync of the graph view (polling and SSE)
+
+Polled read endpoints (graph stats, graph data, node listings, merge
+candidates) answer conditional GETs: ETags derive from the project's state
+(see KnowledgeGraphService.state_tag), so unchanged data costs a 304
+without loading the graph, and serialized bodies are cached and compressed
+(see app/api/http_cache.py).
 
 Follows existing router patterns (chat.py, transcripts.py).
 """
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import json
 import logging
 import re
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
 from pathlib import Path
-from typing import Any
-
-from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException
-from fastapi.responses import FileResponse
+from typing import Any, Literal
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import FileResponse, StreamingResponse
 
+from app.api import http_cache
 from app.api.deps import ValidatedProjectId, get_kg_service
 from app.core.config import get_settings
 from app.core.validators import UUID_PATTERN
 from app.kg.domain import DiscoveryStatus, ProjectState
-from app.kg.persistence import load_knowledge_base
+from app.kg.knowledge_base import KnowledgeBase
+from app.kg.mentions import read_excerpt
+from app.kg.models import Node
 from app.kg.resolution import MergeHistory, ResolutionCandidate
 from app.models.api import (
     CreateProjectResponse,
     DiscoveryResponse,
     ListProjectsResponse,
     NodeEvidenceResponse,
+    NodeSearchResponse,
+    NodeSearchResult,
+    PatternMatchResponse,
     ProjectStatusResponse,
+    RetractSourceResponse,
     SegmentEvidence,
 )
 from app.models.requests import (
@@ -89,6 +118,54 @@ async def validate_session_for_merge(
     return x_session_id
 
 
+async def _conditional(
+    request: Request,
+    kg_service: KnowledgeGraphService,
+    project_id: str,
+    build: Callable[[], Awaitable[Any]],
+    cacheable: Callable[[Any], bool] | None = None,
+) -> Response:
+    """
+    Serve a read endpoint with ETag revalidation and cached serialization.
+
+    If the project's state is known without loading it, a matching
+    If-None-Match gets a 304 and a previously serialized body is reused;
+    only otherwise is the payload built.
+
+    Args:
+        request: Incoming request
+        kg_service: KG service (provides the state tag)
+        project_id: Project the payload is computed from
+        build: Produces the payload, or a Response (e.g. streamed), which
+            only gets validator headers
+        cacheable: Whether a payload may be tagged and cached (default:
+            always), for payloads that also depend on background work
+
+    Returns:
+        304, cached or freshly serialized JSON response
+    """
+    tag = kg_service.state_tag(project_id)
+    if tag is not None:
+        hit = http_cache.cached_response(request, http_cache.make_etag(request, tag))
+        if hit is not None:
+            return hit
+
+    result = await build()
+
+    # Tag the payload only if the state didn't change while it was built
+    after = kg_service.state_tag(project_id)
+    etag = None
+    if (
+        after is not None
+        and tag in (None, after)
+        and (cacheable is None or cacheable(result))
+    ):
+        etag = http_cache.make_etag(request, after)
+    if isinstance(result, Response):
+        return http_cache.add_validators(result, etag) if etag else result
+    return http_cache.json_response(request, result, etag)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # ENDPOINTS
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -106,13 +183,15 @@ async def create_project(
     to trigger bootstrap and domain inference.
 
     Args:
-        request: Project creation request with name
+        request: Project creation request with name and storage backend
         kg_service: Injected KG service
 
     Returns:
         CreateProjectResponse with project ID, name, and state
     """
-    project = await kg_service.create_project(request.name)
+    project = await kg_service.create_project(
+        request.name, storage_backend=request.storage_backend
+    )
     return CreateProjectResponse(
         project_id=project.id,
         name=project.name,
@@ -353,7 +432,9 @@ async def extract_from_transcript(
 
     Runs asynchronously in background. The extraction uses the project's
     DomainProfile (created during bootstrap) to guide entity recognition.
-    Poll GET /kg/projects/{id} to check updated counts.
+    Poll GET /kg/projects/{id} to check updated counts. With replace, the
+    source's previous results are swapped for the new ones once extraction
+    succeeds.
 
     Args:
         project_id: Target project ID
@@ -383,23 +464,63 @@ async def extract_from_transcript(
         request.title,
         request.source_id,
         request.transcript_id,
+        request.replace,
     )
 
     return {"status": "extracting", "project_id": project_id}
 
 
+@router.delete(
+    "/projects/{project_id}/sources/{source_id}",
+    response_model=RetractSourceResponse,
+)
+async def retract_source(
+    source_id: str,
+    project_id: str = Depends(ValidatedProjectId()),
+    kg_service: KnowledgeGraphService = Depends(get_kg_service),
+) -> RetractSourceResponse:
+    """
+    Retract a source from the knowledge graph.
+
+    Removes the source's relationships, and entities no other source
+    mentions that are left unconnected. Entities shared with other
+    sources are kept.
+
+    Args:
+        source_id: ID of the source to retract
+        project_id: Target project ID
+        kg_service: Injected KG service
+
+    Returns:
+        RetractSourceResponse with what was removed
+
+    Raises:
+        HTTPException: 404 if project, knowledge base or source not found
+    """
+    try:
+        retracted = await kg_service.retract_source(project_id, source_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    return RetractSourceResponse(source_id=source_id, **retracted)
+
+
 @router.get("/projects/{project_id}/graph")
 async def get_graph_stats(
+    request: Request,
     project_id: str = Depends(ValidatedProjectId()),
     kg_service: KnowledgeGraphService = Depends(get_kg_service),
-) -> dict[str, Any]:
+) -> Response:
     """
     Get knowledge graph statistics.
 
     Returns counts of nodes, edges, sources, and breakdowns by
     entity type and relationship type.
 
+    Supports conditional GET (ETag / If-None-Match).
+
     Args:
+        request: Incoming request
         project_id: Target project ID
         kg_service: Injected KG service
 
@@ -410,10 +531,14 @@ async def get_graph_stats(
     Raises:
         HTTPException: 404 if no graph data exists
     """
-    stats = await kg_service.get_graph_stats(project_id)
-    if not stats:
-        raise HTTPException(status_code=404, detail="No graph data yet")
-    return stats
+
+    async def build() -> dict[str, Any]:
+        stats = await kg_service.get_graph_stats(project_id)
+        if not stats:
+            raise HTTPException(status_code=404, detail="No graph data yet")
+        return stats
+
+    return await _conditional(request, kg_service, project_id, build)
 
 
 @router.post("/projects/{project_id}/export")
@@ -659,26 +784,34 @@ async def merge_entities(
         raise HTTPException(status_code=400, detail=error_msg)
 
 
-@router.get("/projects/{project_id}/merge-candidates")
+@router.get(
+    "/projects/{project_id}/merge-candidates",
+    response_model=list[ResolutionCandidate],
+)
 async def get_merge_candidates(
+    request: Request,
     project_id: str = Depends(ValidatedProjectId()),
     kg_service: KnowledgeGraphService = Depends(get_kg_service),
-) -> list[ResolutionCandidate]:
+) -> Response:
     """
     Get pending merge candidates.
 
     Returns all resolution candidates that are awaiting user review
-    (not yet approved or rejected).
+    (not yet approved or rejected). Supports conditional GET.
 
     Args:
+        request: Incoming request
         project_id: Target project ID
         kg_service: Injected KG service
 
     Returns:
         List of pending ResolutionCandidate objects
     """
-    candidates = await kg_service.get_pending_merges(project_id)
-    return candidates
+
+    async def build() -> list[ResolutionCandidate]:
+        return await kg_service.get_pending_merges(project_id)
+
+    return await _conditional(request, kg_service, project_id, build)
 
 
 @router.post("/projects/{project_id}/merge-candidates/{candidate_id}/review")
@@ -739,24 +872,190 @@ async def get_merge_history(
     return history
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# NODE QUERY ENDPOINTS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# Fields a node listing can project: every Node field plus its edge count
+NODE_FIELDS = frozenset(Node.model_fields) | {"degree"}
+
+# Nodes serialized per chunk of a streamed page
+NODE_STREAM_BATCH = 50
+
+NodeSort = Literal["label", "degree", "recency"]
+
+
+def _parse_fields(fields: str | None) -> set[str] | None:
+    """Parse a comma-separated fields= projection (None means all fields).
+
+    Raises:
+        HTTPException: 400 if a field is unknown.
+    """
+    if fields is None:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - NODE_FIELDS
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    # The ID is always included so results can be referenced
+    return requested | {"id"}
+
+
+def _encode_cursor(sort: str, key: tuple[Any, ...]) -> str:
+    """Encode a page's last sort key as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps([sort, *key]).encode()).decode()
+
+
+def _decode_cursor(cursor: str | None, sort: str) -> tuple[Any, ...] | None:
+    """Decode a cursor into the sort key to continue after.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or from another sort.
+    """
+    if cursor is None:
+        return None
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError):
+        decoded = None
+    if not isinstance(decoded, list) or len(decoded) < 2 or decoded[0] != sort:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple(decoded[1:])
+
+
+def _node_page_response(
+    request: Request,
+    kb: KnowledgeBase,
+    sort: str,
+    limit: int,
+    cursor: str | None,
+    fields: str | None,
+    entity_type: str | None = None,
+    neighbors_of: str | None = None,
+) -> StreamingResponse:
+    """Stream one page of nodes as {"total_count", "next_cursor", "items"}.
+
+    Items are serialized (and compressed, if accepted) in batches as the
+    body is sent, so a page never exists as one large JSON string in
+    memory. Pass a snapshot: the body is read after the response is
+    tagged, so a live KB could send a later state under the ETag.
+
+    Raises:
+        HTTPException: 400 for unknown fields or an invalid cursor.
+    """
+    projection = _parse_fields(fields)
+    try:
+        nodes, next_key, total = kb.page_nodes(
+            sort=sort,
+            limit=limit,
+            after=_decode_cursor(cursor, sort),
+            entity_type=entity_type,
+            neighbors_of=neighbors_of,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+    next_cursor = _encode_cursor(sort, next_key) if next_key is not None else None
+    with_degree = projection is None or "degree" in projection
+
+    async def body() -> AsyncIterator[str]:
+        yield (
+            f'{{"total_count": {total}, '
+            f'"next_cursor": {json.dumps(next_cursor)}, "items": ['
+        )
+        for start in range(0, len(nodes), NODE_STREAM_BATCH):
+            items = []
+            for node in nodes[start : start + NODE_STREAM_BATCH]:
+                item = node.model_dump(mode="json", include=projection)
+                if with_degree:
+                    item["degree"] = kb.node_degree(node.id)
+                items.append(json.dumps(item))
+            yield ("," if start else "") + ",".join(items)
+        yield "]}"
+
+    return http_cache.streaming_json_response(request, body())
+
+
 @router.get("/projects/{project_id}/nodes")
 async def list_nodes(
+    request: Request,
     entity_type: str | None = None,
+    sort: NodeSort = Query("label", description="label, degree or recency"),
+    limit: int = Query(100, ge=1, le=500, description="Max nodes per page"),
+    cursor: str | None = Query(None, description="next_cursor of the last page"),
+    fields: str | None = Query(None, description="Comma-separated fields"),
     project_id: str = Depends(ValidatedProjectId()),
     kg_service: KnowledgeGraphService = Depends(get_kg_service),
-) -> list[dict[str, Any]]:
+) -> Response:
     """
-    List nodes in the knowledge graph.
+    List nodes in the knowledge graph, one page at a time.
 
     Optionally filter by entity type (e.g., "Person", "Organization").
+    Pages follow a stable sort order; pass each response's next_cursor
+    to get the next page (it is null on the last page). Supports
+    conditional GET.
 
     Args:
+        request: Incoming request
         project_id: Target project ID
         entity_type: Optional filter by entity type
+        sort: "label" (A-Z), "degree" (most connected first) or "recency"
+            (most recently updated first)
+        limit: Maximum nodes per page
+        cursor: Cursor from the previous page
+        fields: Node fields to include (e.g., "id,label,degree"); all
+            fields plus degree by default
+        kg_service: Injected KG service
+
+    Returns:
+        JSON body {"total_count", "next_cursor", "items"} where items are
+        node dicts with id, label, entity_type, aliases, degree, etc.
+
+    Raises:
+        HTTPException: 404 if no graph data exists, 400 for unknown fields
+            or an invalid cursor
+    """
+
+    async def build() -> StreamingResponse:
+        kb = await _load_project_kb(project_id, kg_service)
+        return _node_page_response(
+            request, kb.snapshot(), sort, limit, cursor, fields, entity_type=entity_type
+        )
+
+    return await _conditional(request, kg_service, project_id, build)
+
+
+@router.get("/projects/{project_id}/search", response_model=NodeSearchResponse)
+async def search_nodes(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    limit: int = Query(20, ge=1, le=100, description="Max results to return"),
+    offset: int = Query(0, ge=0, description="Results to skip"),
+    entity_type: str | None = Query(None, description="Filter by entity type"),
+    fuzzy: bool = Query(True, description="Include typo-tolerant matches"),
+    project_id: str = Depends(ValidatedProjectId()),
+    kg_service: KnowledgeGraphService = Depends(get_kg_service),
+) -> NodeSearchResponse:
+    """
+    Search node labels and aliases for typeahead.
+
+    Ranked server-side from the knowledge base's search index: exact,
+    prefix, word-prefix and substring matches first, then fuzzy matches,
+    with better connected entities first among equals.
+
+    Args:
+        q: Search text (case-insensitive)
+        limit: Maximum results to return
+        offset: Number of ranked results to skip (for pagination)
+        entity_type: Optional filter by entity type
+        fuzzy: Include typo-tolerant matches
+        project_id: Target project ID
         kg_service: Injected KG service
 
     Returns:
-        List of node dicts with id, label, entity_type, aliases, etc.
+        NodeSearchResponse with one page of ranked results
 
     Raises:
         HTTPException: 404 if no graph data exists
@@ -765,69 +1064,208 @@ async def list_nodes(
     if not project or not project.kb_id:
         raise HTTPException(status_code=404, detail="No graph data")
 
-    kb = load_knowledge_base(kg_service.kb_path / project.kb_id)
+    kb = kg_service.load_kb(project.kb_id)
     if not kb:
         raise HTTPException(status_code=404, detail="Knowledge base not found")
 
-    nodes = kb.find_nodes(entity_type=entity_type)
-    return [n.model_dump() for n in nodes]
+    results, total = kb.search_nodes(
+        q, limit=limit, offset=offset, entity_type=entity_type, fuzzy=fuzzy
+    )
+    return NodeSearchResponse(
+        query=q,
+        results=[
+            NodeSearchResult(
+                id=r["node"].id,
+                label=r["node"].label,
+                entity_type=r["node"].entity_type,
+                aliases=r["node"].aliases,
+                score=r["score"],
+                match=r["match"],
+                matched_name=r["matched_name"],
+                degree=r["degree"],
+            )
+            for r in results
+        ],
+        total_count=total,
+        has_more=offset + len(results) < total,
+    )
+
+
+@router.get("/projects/{project_id}/match", response_model=PatternMatchResponse)
+async def match_pattern(
+    request: Request,
+    pattern: str = Query(
+        ...,
+        min_length=2,
+        max_length=500,
+        description="Typed pattern, e.g. (:Person)-[worked_for]->(:Organization)",
+    ),
+    limit: int = Query(50, ge=1, le=500, description="Max matches to return"),
+    project_id: str = Depends(ValidatedProjectId()),
+    kg_service: KnowledgeGraphService = Depends(get_kg_service),
+) -> Response:
+    """
+    Find paths matching a typed pattern.
+
+    Patterns chain node patterns "(var:Type {key: value})" with relationship
+    patterns "-[type|type]->", "<-[type]-" or "-[type]-" (see
+    app/kg/patterns.py) and are matched from the entity and relationship
+    type indexes.
+
+    Args:
+        pattern: Pattern text
+        limit: Maximum number of matches to return
+        project_id: Target project ID
+        kg_service: Injected KG service
+
+    Returns:
+        PatternMatchResponse with the matches, in pattern order
+
+    Raises:
+        HTTPException: 404 if no graph data exists, 400 if the pattern is
+            invalid
+    """
+
+    async def build() -> PatternMatchResponse:
+        kb = await _load_project_kb(project_id, kg_service)
+        try:
+            matches = kb.match_pattern(pattern, limit=limit + 1)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return PatternMatchResponse.model_validate(
+            {
+                "pattern": pattern,
+                "matches": matches[:limit],
+                "has_more": len(matches) > limit,
+            }
+        )
+
+    return await _conditional(request, kg_service, project_id, build)
 
 
 @router.get("/projects/{project_id}/nodes/{node_id}/neighbors")
 async def get_neighbors(
+    request: Request,
     node_id: str,
+    sort: NodeSort = Query("degree", description="label, degree or recency"),
+    limit: int = Query(100, ge=1, le=500, description="Max neighbors per page"),
+    cursor: str | None = Query(None, description="next_cursor of the last page"),
+    fields: str | None = Query(None, description="Comma-separated fields"),
+    entity_type: str | None = Query(None, description="Filter by entity type"),
     project_id: str = Depends(ValidatedProjectId()),
     kg_service: KnowledgeGraphService = Depends(get_kg_service),
-) -> list[dict[str, Any]]:
+) -> Response:
     """
-    Get neighbors of a node.
+    Get neighbors of a node, one page at a time.
 
-    Returns all nodes connected to the specified node via any edge
-    (both incoming and outgoing connections).
+    Returns nodes connected to the specified node via any edge
+    (both incoming and outgoing connections), most connected first by
+    default. Paginated like the node listing; supports conditional GET.
 
     Args:
+        request: Incoming request
         project_id: Target project ID
         node_id: 12-character node identifier
+        sort: "label", "degree" or "recency"
+        limit: Maximum neighbors per page
+        cursor: Cursor from the previous page
+        fields: Node fields to include; all fields plus degree by default
+        entity_type: Optional filter by entity type
         kg_service: Injected KG service
 
     Returns:
-        List of neighbor node dicts
+        JSON body {"total_count", "next_cursor", "items"} of neighbor node
+        dicts (no items for an unknown node)
 
     Raises:
-        HTTPException: 404 if no graph data exists
+        HTTPException: 404 if no graph data exists, 400 for unknown fields
+            or an invalid cursor
     """
-    project = await kg_service.get_project(project_id)
-    if not project or not project.kb_id:
-        raise HTTPException(status_code=404, detail="No graph data")
 
-    kb = load_knowledge_base(kg_service.kb_path / project.kb_id)
-    if not kb:
-        raise HTTPException(status_code=404, detail="Knowledge base not found")
+    async def build() -> StreamingResponse:
+        kb = await _load_project_kb(project_id, kg_service)
+        return _node_page_response(
+            request,
+            kb.snapshot(),
+            sort,
+            limit,
+            cursor,
+            fields,
+            entity_type=entity_type,
+            neighbors_of=node_id,
+        )
+
+    return await _conditional(request, kg_service, project_id, build)
+
+
+def _search_excerpt(text: str, node: Node) -> str | None:
+    """
+    Find the first mention of a node's label or aliases by scanning text.
+
+    Fallback for sources without a mention index (see app/kg/mentions.py).
+
+    Args:
+        text: Full transcript text
+        node: Node whose names to look for
 
-    neighbors = kb.get_neighbors(node_id)
-    return [n.model_dump() for n in neighbors]
+    Returns:
+        Excerpt around the first match (100 chars before, 400 after), or
+        None if no name occurs in the text
+    """
+    # Build search terms: label + all aliases
+    search_terms = [node.label.lower()]
+    search_terms.extend(alias.lower() for alias in node.aliases)
+
+    # Find first occurrence of any search term in transcript
+    content_lower = text.lower()
+    best_match_idx = -1
+    for term in search_terms:
+        if len(term) < 2:  # Skip single-char terms
+            continue
+        idx = content_lower.find(term)
+        if idx >= 0 and (best_match_idx < 0 or idx < best_match_idx):
+            best_match_idx = idx
+
+    if best_match_idx < 0:
+        return None
+
+    # Extract context around the match (100 chars before, 400 after)
+    start_idx = max(0, best_match_idx - 100)
+    end_idx = min(len(text), best_match_idx + 400)
+    excerpt = text[start_idx:end_idx]
+
+    # Add ellipsis if truncated
+    if start_idx > 0:
+        excerpt = "..." + excerpt
+    if end_idx < len(text):
+        excerpt = excerpt + "..."
+    return excerpt
 
 
 @router.get("/projects/{project_id}/nodes/{node_id}/evidence")
 async def get_node_evidence(
     node_id: str,
+    limit: int = Query(20, ge=1, le=200, description="Maximum excerpts"),
     project_id: str = Depends(ValidatedProjectId()),
     kg_service: KnowledgeGraphService = Depends(get_kg_service),
 ) -> NodeEvidenceResponse:
     """
     Get evidence (source transcripts) for a specific node.
 
-    Returns the source transcripts that mention this entity. Evidence is
-    based on text-based search through the transcript content rather than
-    specific timestamp markers.
+    Returns excerpts around each mention of this entity in its source
+    transcripts. Sources indexed at extraction time are served from their
+    mention offsets, reading only a small window of the file per mention;
+    other sources are searched for the first mention of the entity's names.
 
     Args:
         project_id: Target project ID
         node_id: 12-character node identifier
+        limit: Maximum number of excerpts to return
         kg_service: Injected KG service
 
     Returns:
-        NodeEvidenceResponse with source evidence including transcript excerpts
+        NodeEvidenceResponse with transcript excerpts and the total number
+        of mentions found (which may exceed the excerpts returned)
 
     Raises:
         HTTPException: 404 if no graph data or node not found
@@ -838,7 +1276,7 @@ async def get_node_evidence(
     if not project or not project.kb_id:
         raise HTTPException(status_code=404, detail="No graph data")
 
-    kb = load_knowledge_base(kg_service.kb_path / project.kb_id)
+    kb = kg_service.load_kb(project.kb_id)
     if not kb:
         raise HTTPException(status_code=404, detail="Knowledge base not found")
 
@@ -848,9 +1286,9 @@ async def get_node_evidence(
 
     # Collect evidence from source transcripts
     evidence_list: list[SegmentEvidence] = []
+    mention_count = 0
     storage = get_services().storage
 
-    # Get transcript content from each source
     for source_id in node.source_ids:
         source = kb.get_source(source_id)
         if not source:
@@ -871,131 +1309,355 @@ async def get_node_evidence(
             logger.debug(f"No file_path in metadata for {transcript_id}")
             continue
 
+        template = SegmentEvidence(
+            source_id=source_id,
+            source_title=source.title,
+            segment_id="",
+            text="",
+            start=None,
+            end=None,
+            transcript_id=transcript_id,
+        )
+
+        # Indexed source: read just the bytes around each mention
+        spans = kb.get_mention_spans(node_id, source_id) or []
+        excerpts = [
+            read_excerpt(Path(file_path), span)
+            for span in spans[: max(0, limit - len(evidence_list))]
+        ]
+        if spans and all(excerpt is not None for excerpt in excerpts):
+            mention_count += len(spans)
+            evidence_list.extend(
+                template.model_copy(update={"text": excerpt}) for excerpt in excerpts
+            )
+            continue
+
+        # Not indexed (or the file changed since): search the transcript
         content = storage.get_transcript_content(file_path)
         if not content:
             continue
-
-        # Build search terms: label + all aliases
-        search_terms = [node.label.lower()]
-        search_terms.extend(alias.lower() for alias in node.aliases)
-
-        # Find first occurrence of any search term in transcript
-        content_lower = content.content.lower()
-        best_match_idx = -1
-        for term in search_terms:
-            if len(term) < 2:  # Skip single-char terms
-                continue
-            idx = content_lower.find(term)
-            if idx >= 0 and (best_match_idx < 0 or idx < best_match_idx):
-                best_match_idx = idx
-
-        if best_match_idx >= 0:
-            # Extract context around the match (100 chars before, 400 after)
-            start_idx = max(0, best_match_idx - 100)
-            end_idx = min(len(content.content), best_match_idx + 400)
-            excerpt = content.content[start_idx:end_idx]
-
-            # Add ellipsis if truncated
-            if start_idx > 0:
-                excerpt = "..." + excerpt
-            if end_idx < len(content.content):
-                excerpt = excerpt + "..."
-
-            evidence_list.append(
-                SegmentEvidence(
-                    source_id=source_id,
-                    source_title=source.title,
-                    segment_id="",
-                    text=excerpt,
-                    start=None,
-                    end=None,
-                    transcript_id=transcript_id,
-                )
-            )
+        excerpt = _search_excerpt(content.content, node)
+        if excerpt is not None:
+            mention_count += 1
         else:
             # Entity not found in text - show beginning with note
-            evidence_list.append(
-                SegmentEvidence(
-                    source_id=source_id,
-                    source_title=source.title,
-                    segment_id="",
-                    text=content.content[:500] + "...",
-                    start=None,
-                    end=None,
-                    transcript_id=transcript_id,
-                )
-            )
+            excerpt = content.content[:500] + "..."
+        if len(evidence_list) < limit:
+            evidence_list.append(template.model_copy(update={"text": excerpt}))
 
-    return NodeEvidenceResponse(node_id=node_id, evidence=evidence_list)
+    return NodeEvidenceResponse(
+        node_id=node_id, evidence=evidence_list, mention_count=mention_count
+    )
 
 
 @router.get("/projects/{project_id}/graph-data")
 async def get_graph_data(
+    request: Request,
+    mode: Literal["top", "ego", "communities", "full"] = Query(
+        "top", description="Level of detail"
+    ),
+    max_nodes: int | None = Query(None, ge=1, le=5000, description="Node budget"),
+    focus: str | None = Query(None, description="Center node ID (ego mode)"),
+    hops: int = Query(2, ge=1, le=3, description="Neighborhood depth (ego mode)"),
+    entity_type: list[str] | None = Query(None, description="Entity types to keep"),
+    centrality: Literal["connections", "influence", "bridging"] = Query(
+        "connections", description="Ranking for top mode"
+    ),
     project_id: str = Depends(ValidatedProjectId()),
     kg_service: KnowledgeGraphService = Depends(get_kg_service),
-) -> dict[str, Any]:
+) -> Response:
     """
     Get graph data in Cytoscape.js-compatible format.
 
-    Returns nodes and edges formatted for visualization with Cytoscape.js.
-    Nodes include label, type, and description. Edges include relationship
-    type and connect source to target nodes.
+    Returns nodes and edges formatted for visualization with Cytoscape.js,
+    at a bounded level of detail so large projects stay renderable:
+    - top: the most central nodes and the edges among them (default)
+    - ego: the neighborhood around a focus node
+    - communities: one supernode per detected community
+    - full: every node and edge
+
+    Views are cached until the graph changes; meta "epoch" and "version"
+    identify the graph state, for following changes via /changes. Nodes
+    carry precomputed
+    layout positions where available (Cytoscape "position" field); layouts
+    are computed in the background, so "meta.layout_ready" is false while
+    positions are still provisional or missing. Supports conditional GET
+    once the layout is ready.
 
     Args:
+        request: Incoming request
         project_id: Target project ID
+        mode: Level-of-detail mode
+        max_nodes: Node budget (defaults to the kg_graph_view_max_nodes setting)
+        focus: Center node ID, required for ego mode
+        hops: Neighborhood depth for ego mode
+        entity_type: Entity types to keep (repeatable)
+        centrality: Ranking used by top mode
         kg_service: Injected KG service
 
     Returns:
-        Dict with "nodes" and "edges" arrays in Cytoscape format:
+        Dict with "nodes" and "edges" arrays in Cytoscape format, plus "meta":
         {
-            "nodes": [{"data": {"id": "...", "label": "...", "type": "..."}}],
-            "edges": [{"data": {"id": "...", "source": "...", "target": "...", "label": "..."}}]
+            "nodes": [{"data": {"id": "...", "label": "...", "type": "..."},
+                       "position": {"x": 0.0, "y": 0.0}}],
+            "edges": [{"data": {"id": "...", "source": "...", "target": "...", "label": "..."}}],
+            "meta": {"mode": "top", "total_nodes": 0, "total_edges": 0, "truncated": false,
+                     "layout_ready": true, "epoch": "...", "version": 0}
         }
 
     Raises:
-        HTTPException: 404 if no graph data exists
+        HTTPException: 404 if no graph data exists or the focus node is
+            unknown, 400 if ego mode has no focus
     """
+
+    async def build() -> dict[str, Any]:
+        kb = await _load_project_kb(project_id, kg_service)
+        if mode == "ego":
+            if not focus:
+                raise HTTPException(status_code=400, detail="Ego mode requires a focus")
+            if not kb.get_node(focus):
+                raise HTTPException(status_code=404, detail="Focus node not found")
+
+        # Built from a snapshot off the event loop (community mode waits on
+        # worker processes); extraction may keep changing the live KB
+        stamp = {"epoch": kb.feed_epoch, "version": kb.generation}
+        snapshot = kb.snapshot()
+        view = await asyncio.to_thread(
+            snapshot.graph_view,
+            mode=mode,
+            max_nodes=max_nodes or get_settings().kg_graph_view_max_nodes,
+            focus=focus,
+            hops=hops,
+            entity_types=entity_type,
+            centrality=centrality,
+        )
+        positions, layout_ready = kb.get_layout()
+        view = _with_positions(view, positions, layout_ready)
+        view["meta"] |= stamp
+        return view
+
+    # Provisional layouts change without the graph changing; don't tag them
+    return await _conditional(
+        request,
+        kg_service,
+        project_id,
+        build,
+        cacheable=lambda view: view["meta"]["layout_ready"],
+    )
+
+
+def _with_positions(
+    view: dict[str, Any], positions: dict[str, tuple[float, float]], ready: bool
+) -> dict[str, Any]:
+    """
+    Copy a graph view with layout positions attached to its nodes.
+
+    The view itself is cached by the knowledge base, so it is not modified.
+    Community supernodes take the position of their leader node.
+
+    Args:
+        view: Result of KnowledgeBase.graph_view
+        positions: Canvas positions by node ID
+        ready: Whether the positions match the current graph
+
+    Returns:
+        The view with a "position" on every placed node and
+        meta.layout_ready set
+    """
+    nodes = []
+    for element in view["nodes"]:
+        data = element["data"]
+        position = positions.get(data.get("leader", data["id"]))
+        if position is not None:
+            element = {**element, "position": {"x": position[0], "y": position[1]}}
+        nodes.append(element)
+    return {
+        **view,
+        "nodes": nodes,
+        "meta": {**view["meta"], "layout_ready": ready},
+    }
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# CHANGE FEED ENDPOINTS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# Idle SSE streams send a comment this often, so proxies keep them open
+CHANGE_STREAM_KEEPALIVE_SECONDS = 15.0
+
+
+def _change_batch(kb: KnowledgeBase, since: int, epoch: str | None) -> dict[str, Any]:
+    """
+    Changes after a version, or a resync instruction if they're unavailable.
+
+    Args:
+        kb: Knowledge base to read the change feed of
+        since: Version the client last synced to
+        epoch: Feed epoch of that version (None = the current one)
+
+    Returns:
+        {"epoch", "version", "resync", "changes"}; on resync the client
+        should re-fetch graph-data and continue from the returned version
+    """
+    changes = kb.changes_since(since, epoch)
+    return {
+        "epoch": kb.feed_epoch,
+        "version": kb.generation,
+        "resync": changes is None,
+        "changes": changes or [],
+    }
+
+
+async def _load_project_kb(
+    project_id: str, kg_service: KnowledgeGraphService
+) -> KnowledgeBase:
+    """Load a project's knowledge base, raising 404 if there is none."""
     project = await kg_service.get_project(project_id)
     if not project or not project.kb_id:
         raise HTTPException(status_code=404, detail="No graph data")
-
-    kb = load_knowledge_base(kg_service.kb_path / project.kb_id)
+    kb = kg_service.load_kb(project.kb_id)
     if not kb:
         raise HTTPException(status_code=404, detail="Knowledge base not found")
+    return kb
 
-    # Convert nodes to Cytoscape format
-    cytoscape_nodes = []
-    for node in kb._nodes.values():
-        cytoscape_nodes.append(
-            {
-                "data": {
-                    "id": node.id,
-                    "label": node.label,
-                    "type": node.entity_type,
-                    "description": node.description or "",
-                    "aliases": node.aliases,
-                }
-            }
-        )
 
-    # Convert edges to Cytoscape format
-    cytoscape_edges = []
-    for edge in kb._edges.values():
-        # Get primary relationship type (use first one if multiple)
-        relationship_types = edge.get_relationship_types()
-        primary_label = relationship_types[0] if relationship_types else "related_to"
+async def _change_events(
+    kg_service: KnowledgeGraphService,
+    kb_id: str,
+    epoch: str,
+    version: int,
+    interval: float,
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncGenerator[str, None]:
+    """
+    Server-sent events for changes to a knowledge base.
 
-        cytoscape_edges.append(
-            {
-                "data": {
-                    "id": edge.id,
-                    "source": edge.source_node_id,
-                    "target": edge.target_node_id,
-                    "label": primary_label,
-                    "relationship_type": primary_label,
-                    "relationship_types": relationship_types,
-                }
-            }
-        )
+    Checks the knowledge base every `interval` seconds and sends a
+    "changes" event (or "resync", see _change_batch) whenever its version
+    or epoch moved. Event IDs are "<epoch>:<version>", so a reconnecting
+    EventSource resumes where it left off.
+
+    Args:
+        kg_service: Service the knowledge base is loaded through
+        kb_id: Knowledge base to follow
+        epoch: Feed epoch the client is synced to
+        version: Version the client is synced to
+        interval: Seconds between checks
+        is_disconnected: Returns True once the client has gone
+
+    Yields:
+        SSE-formatted events and keepalive comments
+    """
+    idle = 0.0
+    while not await is_disconnected():
+        kb = kg_service.load_kb(kb_id)
+        if kb is None:
+            return
+        if kb.feed_epoch != epoch or kb.generation != version:
+            batch = _change_batch(kb, version, epoch)
+            epoch, version = batch["epoch"], batch["version"]
+            event = "resync" if batch["resync"] else "changes"
+            yield (
+                f"id: {epoch}:{version}\nevent: {event}\n"
+                f"data: {json.dumps(batch, default=str)}\n\n"
+            )
+            idle = 0.0
+        elif idle >= CHANGE_STREAM_KEEPALIVE_SECONDS:
+            yield ": keepalive\n\n"
+            idle = 0.0
+        await asyncio.sleep(interval)
+        idle += interval
+
+
+@router.get("/projects/{project_id}/changes")
+async def get_changes(
+    since: int = Query(..., ge=0, description="Version last synced to"),
+    epoch: str | None = Query(None, description="Feed epoch of that version"),
+    project_id: str = Depends(ValidatedProjectId()),
+    kg_service: KnowledgeGraphService = Depends(get_kg_service),
+) -> dict[str, Any]:
+    """
+    Get graph changes since a version, for delta sync.
+
+    Clients take "epoch" and "version" from graph-data's meta, then ask for
+    the changes after them. Repeated changes to an entity or relationship
+    are coalesced into its current Cytoscape element (or a delete). If the
+    changes are no longer available (the feed is bounded, and reloading a
+    knowledge base starts a new epoch), "resync" is true and the client
+    should re-fetch graph-data.
 
-    return {"nodes": cytoscape_nodes, "edges": cytoscape_edges}
+    Args:
+        since: Version the client last synced to
+        epoch: Feed epoch of that version
+        project_id: Target project ID
+        kg_service: Injected KG service
+
+    Returns:
+        {
+            "epoch": "...",
+            "version": 42,
+            "resync": false,
+            "changes": [
+                {"op": "upsert", "kind": "node", "id": "...", "element": {"data": {...}}},
+                {"op": "delete", "kind": "edge", "id": "..."}
+            ]
+        }
+
+    Raises:
+        HTTPException: 404 if no graph data exists
+    """
+    kb = await _load_project_kb(project_id, kg_service)
+    return _change_batch(kb, since, epoch)
+
+
+@router.get("/projects/{project_id}/changes/stream")
+async def stream_changes(
+    request: Request,
+    since: int | None = Query(None, ge=0, description="Version last synced to"),
+    epoch: str | None = Query(None, description="Feed epoch of that version"),
+    last_event_id: str | None = Header(None),
+    project_id: str = Depends(ValidatedProjectId()),
+    kg_service: KnowledgeGraphService = Depends(get_kg_service),
+) -> StreamingResponse:
+    """
+    Stream graph changes as server-sent events.
+
+    The push variant of /changes: sends a "changes" or "resync" event with
+    the same payload whenever the graph changes. Without a version, the
+    stream starts from the current one. Reconnecting EventSources resume
+    from their Last-Event-ID.
+
+    Args:
+        request: Incoming request (to detect disconnects)
+        since: Version the client last synced to
+        epoch: Feed epoch of that version
+        last_event_id: ID of the last event received, on reconnect
+        project_id: Target project ID
+        kg_service: Injected KG service
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        HTTPException: 404 if no graph data exists
+    """
+    kb = await _load_project_kb(project_id, kg_service)
+    if last_event_id:
+        last_epoch, _, last_version = last_event_id.partition(":")
+        if last_version.isdigit():
+            epoch, since = last_epoch, int(last_version)
+    if since is None:
+        epoch, since = kb.feed_epoch, kb.generation
+
+    return StreamingResponse(
+        _change_events(
+            kg_service,
+            kb.id,
+            epoch or kb.feed_epoch,
+            since,
+            get_settings().kg_change_stream_interval_seconds,
+            request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -32,6 +32,20 @@ class Settings(BaseSettings):
     # Queue/cache configuration
     queue_max_size: int = 10
     kg_project_cache_max_size: int = 100
+    kg_kb_cache_max_size: int = 8  # Live KnowledgeBase objects kept in memory
+
+    # Knowledge base storage
+    kg_journal_enabled: bool = True  # Append changes instead of full rewrites
+    kg_journal_compact_ratio: float = 0.5  # Compact when journal > ratio * graph
+    kg_compact_json: bool = True  # Minified JSON files (False: indented)
+
+    # Graph insights
+    kg_centrality_approx_min_nodes: int = 5000  # Approximate centrality above
+    kg_betweenness_sample_size: int = 100  # Pivots for sampled betweenness
+    kg_path_max_expansions: int = 50000  # Node expansions per path query
+    kg_path_time_budget_seconds: float = 2.0  # Wall-clock limit per path query
+    kg_graph_view_max_nodes: int = 500  # Default node budget for graph-data views
+    kg_change_stream_interval_seconds: float = 1.0  # SSE change feed check interval
 
     # Frontend polling intervals (milliseconds)
     kg_poll_interval_ms: int = 5000
@@ -0,0 +1,184 @@
+"""
+Community detection across every connected component of a graph.
+
+Partitions each connected component independently (communities never span
+components, so this loses nothing versus running on the whole graph) and
+scores every community's contribution to the graph's modularity.
+
+Design Decisions:
+- Components with at most SMALL_COMPONENT_MAX_NODES nodes skip Louvain and
+  form a single community (there is nothing meaningful to split)
+- Larger components are partitioned with Louvain; when the graph is big
+  enough to amortize the hand-off, components are spread over a process
+  pool (they are independent, and Louvain is pure Python). Pools are
+  created on first use for each worker count and kept, like the layout
+  executor, so workers start (and import NetworkX) once per server
+  process, not per call
+- Waiting on the pool blocks the calling thread; async callers run
+  detection via asyncio.to_thread on a KnowledgeBase.snapshot()
+- Workers receive plain node/edge lists rather than NetworkX graphs to keep
+  pickling cheap
+- Results are deterministic for a given seed regardless of worker count
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+
+import networkx as nx  # type: ignore[import-untyped]
+
+# Components this small become one community without running Louvain
+SMALL_COMPONENT_MAX_NODES = 3
+
+# Use a process pool only when the Louvain work is at least this many nodes
+# spread over at least two components
+PARALLEL_COMMUNITY_MIN_NODES = 5000
+
+DEFAULT_RESOLUTION = 1.0
+DEFAULT_SEED = 42
+
+# Shared worker pools by size, created on first parallel detection
+_pools: dict[int, ProcessPoolExecutor] = {}
+_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Community:
+    """
+    One detected community.
+
+    Attributes:
+        node_ids: Members of the community
+        modularity: This community's term of the graph's modularity,
+            L_c / m - resolution * (d_c / 2m)^2 (terms sum to the total)
+    """
+
+    node_ids: frozenset[str]
+    modularity: float
+
+
+def _louvain_partition(
+    nodes: list[str],
+    edges: list[tuple[str, str]],
+    resolution: float,
+    seed: int,
+) -> list[set[str]]:
+    """
+    Run Louvain on one component given as node and edge lists.
+
+    Module-level so it can run in a worker process.
+    """
+    graph = nx.Graph()
+    graph.add_nodes_from(nodes)
+    graph.add_edges_from(edges)
+    try:
+        communities: list[set[str]] = nx.community.louvain_communities(
+            graph, resolution=resolution, seed=seed
+        )
+    except (nx.NetworkXError, ValueError, ZeroDivisionError):
+        # Louvain can fail on graphs with no edges (NetworkXError),
+        # negative weights (ValueError), or empty modularity (ZeroDivisionError)
+        return [set(nodes)]
+    return communities
+
+
+def _community_modularity(
+    graph: nx.Graph, members: set[str], resolution: float
+) -> float:
+    """Compute one community's term of the modularity of graph."""
+    m = graph.number_of_edges()
+    if m == 0:
+        return 0.0
+    degree_sum = sum(d for _, d in graph.degree(members))
+    internal = graph.subgraph(members).number_of_edges()
+    return internal / m - resolution * (degree_sum / (2 * m)) ** 2
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """The shared pool of this many processes, (re)created if missing or broken."""
+    with _pool_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            # spawn: forking a threaded server process is unsafe
+            pool = ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pools[workers] = pool
+        return pool
+
+
+def _discard_pool(workers: int, pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next call starts a fresh one."""
+    with _pool_lock:
+        if _pools.get(workers) is pool:
+            del _pools[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def detect_communities(
+    graph: nx.Graph,
+    components: list[set[str]],
+    resolution: float = DEFAULT_RESOLUTION,
+    seed: int = DEFAULT_SEED,
+    workers: int | None = None,
+) -> list[Community]:
+    """
+    Partition every connected component of an undirected graph.
+
+    Args:
+        graph: Undirected graph
+        components: Its connected components (e.g. from a union-find index)
+        resolution: Louvain resolution; above 1 favors smaller communities
+        seed: Random seed for Louvain
+        workers: Worker processes for large graphs (None: CPU count);
+            1 partitions in this process. Blocks until the workers finish.
+
+    Returns:
+        Communities in component order, each component's communities in
+        Louvain's order
+    """
+    partitions: list[list[set[str]] | None] = []
+    jobs: list[tuple[int, list[str], list[tuple[str, str]]]] = []
+    for index, component in enumerate(components):
+        if len(component) <= SMALL_COMPONENT_MAX_NODES:
+            partitions.append([set(component)])
+            continue
+        partitions.append(None)
+        # Sorted so results don't depend on set order (hash seeds differ
+        # between processes and runs)
+        nodes = sorted(component)
+        edges = sorted(
+            (u, v) if u <= v else (v, u) for u, v in graph.subgraph(nodes).edges()
+        )
+        jobs.append((index, nodes, edges))
+
+    job_nodes = sum(len(nodes) for _, nodes, _ in jobs)
+    pool_size = workers or os.cpu_count() or 1
+    if pool_size > 1 and len(jobs) > 1 and job_nodes >= PARALLEL_COMMUNITY_MIN_NODES:
+        pool = _get_pool(pool_size)
+        try:
+            futures = [
+                (index, pool.submit(_louvain_partition, nodes, edges, resolution, seed))
+                for index, nodes, edges in jobs
+            ]
+            for index, future in futures:
+                partitions[index] = future.result()
+        except BrokenProcessPool:
+            _discard_pool(pool_size, pool)  # Finish the remaining components here
+    for index, nodes, edges in jobs:
+        if partitions[index] is None:
+            partitions[index] = _louvain_partition(nodes, edges, resolution, seed)
+
+    return [
+        Community(
+            node_ids=frozenset(members),
+            modularity=_community_modularity(graph, members, resolution),
+        )
+        for partition in partitions
+        for members in partition or []
+    ]
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from enum import Enum
+from typing import Literal
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -213,6 +214,10 @@ class Discovery(BaseModel):
     created_at: datetime = Field(default_factory=_utc_now)
 
 
+# On-disk format of a project's knowledge base (see app.kg.persistence)
+StorageBackend = Literal["json", "sqlite"]
+
+
 class ProjectState(str, Enum):
     """State of a KG project lifecycle."""
 
@@ -242,6 +247,8 @@ class KGProject(BaseModel):
         thing_count: Number of entities extracted
         connection_count: Number of relationships extracted
         kb_id: Internal KnowledgeBase reference
+        storage_backend: On-disk format of the knowledge base ("json"
+            files or a "sqlite" database)
         error: Last error message (if any)
         created_at: Creation timestamp
         updated_at: Last modification timestamp
@@ -261,6 +268,7 @@ class KGProject(BaseModel):
     thing_count: int = 0
     connection_count: int = 0
     kb_id: str | None = None
+    storage_backend: StorageBackend = "json"
     error: str | None = None
     created_at: datetime = Field(default_factory=_utc_now)
     updated_at: datetime = Field(default_factory=_utc_now)
@@ -10,26 +10,218 @@ the DomainProfile which defines the schema/types to extract.
 
 Design Decisions:
 - In-memory storage with dict-based lookups for performance
-- NetworkX DiGraph for graph algorithms (paths, neighbors)
+- NetworkX DiGraph for graph algorithms (paths, centrality), built lazily
+  on first use so storage-only workloads never pay for it. It holds only
+  IDs plus label/entity_type (nodes) and edge_id/relationship types
+  (edges); the Pydantic models in the dicts are the source of truth
+- from_records bulk-loads nodes/edges/sources in one pass without the
+  per-call bookkeeping of add_node/add_edge (used by persistence)
 - Dual index for label/alias lookup (case-insensitive)
+- Adjacency index for O(1) edge lookup by node pair and by node
+- Blocking index (n-grams + normalized keys) for resolution candidate search
+- Change log of node/edge/source upserts and deletes since the last save,
+  so persistence can journal deltas instead of rewriting the graph
+- Connected components tracked incrementally with union-find on node/edge
+  insertion; removals and merges mark it stale for a lazy rebuild. The
+  cached undirected graph is likewise extended in place on insertion
+- Generation counter bumped by every mutation; insight computations
+  (centrality, components, communities, stats) are memoized per generation
+- Path queries (find_paths, find_connection) enumerate shortest paths
+  lazily under an expansion/time budget (see paths.py) rather than
+  materializing every simple path
+- Node listings (page_nodes) use keyset pagination over sort orders that
+  are cached per generation, so paging never re-sorts an unchanged graph
+- Visualization views (graph_view) select a bounded level of detail (top-k,
+  ego subgraph, community supernodes) and are memoized per generation
+- Every node/edge change is appended to a bounded change feed keyed by the
+  generation, so clients can pull deltas (changes_since) instead of
+  re-fetching the graph; a client too far behind is told to resync
+- Layout positions (get_layout) are computed on a background thread from a
+  snapshot and cached per generation; new nodes are placed incrementally
+  around the previous layout (see layout.py)
+- Reverse provenance index (source -> nodes, edges) maintained on every
+  change, so retracting or re-extracting a source touches only what that
+  source contributed
 - Single Edge per node pair with multiple RelationshipDetails
 """
 
 from __future__ import annotations
 
+import heapq
+import threading
+from bisect import bisect_right
+from collections import Counter, deque
+from collections.abc import Callable, Collection, Iterable, Iterator
+from concurrent.futures import Future
 from datetime import datetime, timezone
-from typing import Any
+from itertools import chain, islice
+from typing import Any, TypeVar
 from uuid import uuid4
 
 import networkx as nx  # type: ignore[import-untyped]
-
+import numpy as np
+import scipy.sparse as sp  # type: ignore[import-untyped]
+from rapidfuzz import fuzz
+
+from app.kg.communities import (
+    DEFAULT_RESOLUTION,
+    DEFAULT_SEED,
+    Community,
+    detect_communities,
+)
 from app.kg.domain import DomainProfile
+from app.kg.layout import Position, place_missing, submit_layout
+from app.kg.mentions import MentionMatcher, Span, merge_spans, to_byte_spans
 from app.kg.models import Edge, Node, RelationshipDetail, Source
+from app.kg.normalization import (
+    generate_ngrams,
+    normalize_entity_name,
+    normalize_for_index,
+)
+from app.kg.paths import PathBudget, iter_shortest_paths
+from app.kg.patterns import GraphPattern, NodePattern, parse_pattern
 from app.kg.resolution import MergeHistory, ResolutionCandidate, ResolutionConfig
 
 # Constants for insights queries
 GROUP_SAMPLE_SIZE = 5  # Number of entities to show in group samples
 
+# Approximate centrality (get_key_entities): graphs with at least this many
+# nodes use sampled betweenness and a looser PageRank tolerance by default
+APPROXIMATE_CENTRALITY_MIN_NODES = 5000
+BETWEENNESS_SAMPLE_SIZE = 100  # Pivot sources for sampled betweenness
+PAGERANK_APPROX_TOL = 1e-5  # Per-node tolerance (NetworkX default: 1e-6)
+PAGERANK_APPROX_MAX_ITER = 50  # Iteration budget (NetworkX default: 100)
+
+# Node search (search_nodes): queries shorter than a trigram match word
+# prefixes up to SEARCH_PREFIX_LENGTH characters. Queries with fewer than
+# SEARCH_FUZZY_FALLBACK direct matches (likely typos) add fuzzy matches
+# scoring at least SEARCH_FUZZY_MIN_SCORE (rapidfuzz ratio, 0-100), ignoring
+# trigrams shared by more than SEARCH_FUZZY_MAX_POSTING nodes and scoring
+# at most SEARCH_FUZZY_MAX_CANDIDATES nodes
+SEARCH_PREFIX_LENGTH = 2
+SEARCH_FUZZY_FALLBACK = 5
+SEARCH_FUZZY_MIN_SCORE = 80
+SEARCH_FUZZY_MAX_POSTING = 20000
+SEARCH_FUZZY_MAX_CANDIDATES = 500
+
+# Change feed (changes_since): node/edge changes kept for delta sync;
+# clients further behind than this must re-fetch the graph
+CHANGE_FEED_SIZE = 10_000
+
+# Node listing (page_nodes): label A-Z, most connected first, or most
+# recently updated first
+NODE_SORT_ORDERS = ("label", "degree", "recency")
+
+# Graph views (graph_view): level-of-detail modes, default node budget and
+# deepest ego neighborhood
+GRAPH_VIEW_MODES = ("full", "top", "ego", "communities")
+GRAPH_VIEW_MAX_NODES = 500
+GRAPH_VIEW_MAX_HOPS = 3
+
+# Typed pattern queries (match_pattern): default number of matches returned
+PATTERN_MATCH_LIMIT = 50
+
+_MISSING = object()  # Sentinel for absent property values
+
+_T = TypeVar("_T")
+
+
+def _budgeted_pagerank(
+    graph: nx.DiGraph,
+    alpha: float = 0.85,
+    tol: float = PAGERANK_APPROX_TOL,
+    max_iter: int = PAGERANK_APPROX_MAX_ITER,
+) -> dict[str, float]:
+    """
+    PageRank by power iteration on a SciPy sparse matrix, within a budget.
+
+    Same model as nx.pagerank (uniform teleport, dangling nodes spread
+    uniformly), but stops at max_iter and returns the current estimate
+    instead of raising when the tolerance hasn't been reached.
+
+    Args:
+        graph: Directed graph to rank
+        alpha: Damping factor
+        tol: Convergence tolerance per node (L1 error < len(graph) * tol)
+        max_iter: Maximum power iterations
+
+    Returns:
+        Dict mapping node_id -> score (sums to 1)
+    """
+    nodelist = list(graph)
+    n = len(nodelist)
+    if n == 0:
+        return {}
+
+    matrix = nx.to_scipy_sparse_array(graph, nodelist=nodelist, dtype=float)
+    out_degree = np.asarray(matrix.sum(axis=1)).ravel()
+    dangling = out_degree == 0
+    inverse = np.divide(1.0, out_degree, out=np.zeros_like(out_degree), where=~dangling)
+    transition = sp.csr_array(sp.diags_array(inverse) @ matrix)
+
+    uniform = np.full(n, 1.0 / n)
+    scores = uniform.copy()
+    for _ in range(max_iter):
+        previous = scores
+        scores = (
+            alpha * (previous @ transition + previous[dangling].sum() * uniform)
+            + (1 - alpha) * uniform
+        )
+        if np.abs(scores - previous).sum() < n * tol:
+            break
+    return dict(zip(nodelist, scores.tolist(), strict=True))
+
+
+class _ComponentIndex:
+    """
+    Union-find over node IDs for connected components of the undirected graph.
+
+    Supports insertion only; callers rebuild from scratch after deletions.
+    """
+
+    def __init__(self) -> None:
+        self._parent: dict[str, str] = {}
+        self._size: dict[str, int] = {}
+
+    def add(self, item: str) -> None:
+        """Add a singleton component (no-op if already present)."""
+        if item not in self._parent:
+            self._parent[item] = item
+            self._size[item] = 1
+
+    def find(self, item: str) -> str:
+        """Find the root of an item's component, with path halving."""
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: str, b: str) -> None:
+        """Merge the components containing a and b (adding them if needed)."""
+        self.add(a)
+        self.add(b)
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size.pop(root_b)
+
+    def connected(self, a: str, b: str) -> bool:
+        """Check whether two known items are in the same component."""
+        if a not in self._parent or b not in self._parent:
+            return False
+        return self.find(a) == self.find(b)
+
+    def groups(self) -> list[set[str]]:
+        """All components, ordered by the insertion of their first item."""
+        by_root: dict[str, set[str]] = {}
+        for item in self._parent:
+            by_root.setdefault(self.find(item), set()).add(item)
+        return list(by_root.values())
+
 
 def _generate_id() -> str:
     """Generate a 12-character hex ID from UUID4."""
@@ -41,6 +233,52 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _discard_indexed(index: dict[str, dict[str, None]], key: str, obj_id: str) -> None:
+    """Remove an ID from a type index entry, dropping the entry once empty."""
+    ids = index.get(key)
+    if ids is not None:
+        ids.pop(obj_id, None)
+        if not ids:
+            del index[key]
+
+
+def _reindex(
+    index: dict[str, dict[str, None]],
+    indexed_under: dict[str, frozenset[str]],
+    obj_id: str,
+    keys: frozenset[str] | None,
+) -> None:
+    """
+    Move an ID to the index entries for its current keys.
+
+    Args:
+        index: Key -> IDs index to update
+        indexed_under: ID -> keys it is currently indexed under
+        obj_id: ID of the changed object
+        keys: Its current keys, or None if it no longer exists
+    """
+    old_keys = indexed_under.pop(obj_id, frozenset())
+    new_keys = keys if keys is not None else frozenset()
+    if keys is not None:
+        indexed_under[obj_id] = keys
+    for key in old_keys - new_keys:
+        _discard_indexed(index, key, obj_id)
+    for key in new_keys - old_keys:
+        index.setdefault(key, {})[obj_id] = None
+
+
+def _no_connection(explanation: str) -> dict[str, Any]:
+    """find_connection result for entities that are not connected."""
+    return {
+        "connected": False,
+        "steps": 0,
+        "path": [],
+        "explanation": explanation,
+        "paths": [],
+        "budget_exhausted": False,
+    }
+
+
 class KnowledgeBase:
     """
     In-memory knowledge graph with NetworkX backend.
@@ -96,21 +334,247 @@ class KnowledgeBase:
         self._label_to_id: dict[str, str] = {}  # label.lower() -> node_id
         self._alias_to_id: dict[str, str] = {}  # alias.lower() -> node_id
 
-        # NetworkX graph for algorithms
-        self._graph: nx.DiGraph = nx.DiGraph()
-
-        # Cached undirected view (invalidated on graph modification)
+        # Adjacency indexes for edge lookup without scanning self._edges
+        self._edge_index: dict[tuple[str, str], str] = {}  # (src, tgt) -> edge_id
+        # node_id -> incident edge ids (dict used as an insertion-ordered set)
+        self._node_edges: dict[str, dict[str, None]] = {}
+
+        # Type indexes for typed queries, maintained by _record_change:
+        # entity_type -> node ids, relationship_type -> edge ids (ordered
+        # sets), plus what each node/edge is currently indexed under
+        self._type_to_nodes: dict[str, dict[str, None]] = {}
+        self._relationship_to_edges: dict[str, dict[str, None]] = {}
+        self._node_type: dict[str, str] = {}
+        self._edge_relationship_types: dict[str, frozenset[str]] = {}
+
+        # Provenance indexes, maintained by _record_change the same way:
+        # source_id -> node ids it mentions and edge ids holding its
+        # relationships (ordered sets), plus what each is indexed under
+        self._source_to_nodes: dict[str, dict[str, None]] = {}
+        self._source_to_edges: dict[str, dict[str, None]] = {}
+        self._node_source_ids: dict[str, frozenset[str]] = {}
+        self._edge_source_ids: dict[str, frozenset[str]] = {}
+        # node_id -> sources whose mention spans include it, and the node
+        # ids each source is indexed under (from Source.mentions)
+        self._node_to_mention_sources: dict[str, dict[str, None]] = {}
+        self._source_mention_nodes: dict[str, frozenset[str]] = {}
+
+        # Blocking indexes for resolution: only nodes sharing a label/alias
+        # trigram or normalized key are scored against each other
+        self._ngram_to_ids: dict[str, set[str]] = {}  # trigram -> node_ids
+        self._name_key_to_ids: dict[str, set[str]] = {}  # index key -> node_ids
+        # node_id -> (trigrams, keys) it is indexed under, for removal
+        self._node_blocking_keys: dict[str, tuple[set[str], set[str]]] = {}
+
+        # Search index: the trigram index above answers substring queries;
+        # queries shorter than a trigram use word prefixes instead. The
+        # prefix index is built on first use, then maintained in place
+        self._node_search_names: dict[str, tuple[str, ...]] = {}  # normalized
+        self._prefix_index: dict[str, set[str]] | None = None  # prefix -> ids
+
+        # Unsaved changes: (kind, id) -> "upsert" | "delete", in change order.
+        # Cleared by persistence once the changes are on disk.
+        self._changes: dict[tuple[str, str], str] = {}
+        # On-disk revision that _changes are relative to (None = never saved)
+        self._persisted_revision: str | None = None
+
+        # Bumped by every mutation (see _record_change); keys _insight_cache
+        self._generation = 0
+        # Recent node/edge changes as (generation, kind, id, op), oldest
+        # first. Changes at or before _feed_floor may have been dropped.
+        # The epoch tells clients the generation count restarted (reload)
+        self._feed: deque[tuple[int, str, str, str]] = deque(maxlen=CHANGE_FEED_SIZE)
+        self._feed_floor = 0
+        self._feed_epoch = _generate_id()
+        # Memoized insight computations, valid for _insight_generation only.
+        # Snapshots compute insights on worker threads, hence the lock
+        self._insight_cache: dict[tuple[Any, ...], Any] = {}
+        self._insight_generation = 0
+        self._insight_lock = threading.Lock()
+
+        # NetworkX graph for algorithms (built lazily, see _graph)
+        self._nx_graph: nx.DiGraph | None = None
+
+        # Cached undirected view (extended on insertion, dropped on removal)
         self._undirected_cache: nx.Graph | None = None
 
+        # Connected components via union-find; stale after removals/merges
+        self._components = _ComponentIndex()
+        self._components_stale = False
+
+        # Visualization layout (canvas positions) and the generation it
+        # was computed for; the running job, if any, and its generation.
+        # Jobs finish on the layout thread, hence the (reentrant) lock
+        self._layout: dict[str, Position] = {}
+        self._layout_generation = -1
+        self._layout_job: Future[dict[str, Position]] | None = None
+        self._layout_job_generation = -1
+        self._layout_lock = threading.RLock()
+
         self.created_at = _utc_now()
         self.updated_at = _utc_now()
 
+    @classmethod
+    def from_records(
+        cls,
+        nodes: Iterable[Node],
+        edges: Iterable[Edge] = (),
+        sources: Iterable[Source] = (),
+        *,
+        id: str | None = None,
+        name: str = "Untitled",
+        description: str | None = None,
+        domain_profile: DomainProfile | None = None,
+    ) -> KnowledgeBase:
+        """
+        Build a KnowledgeBase from existing records in one pass.
+
+        Fills storage and all lookup indexes directly instead of going
+        through add_node/add_edge, and records no changes (the records
+        are assumed to be persisted already). The NetworkX graph is built
+        on first use, as for any other KB. Duplicate IDs fall back to
+        add_node/add_edge replacement semantics.
+
+        Args:
+            nodes: Nodes to load, in insertion order
+            edges: Edges to load, in insertion order
+            sources: Sources to load
+            id: Optional ID (auto-generated if not provided)
+            name: Human-readable name for the knowledge base
+            description: Optional description of the KB's purpose
+            domain_profile: Optional DomainProfile for extraction guidance
+
+        Returns:
+            The populated KnowledgeBase
+        """
+        kb = cls(
+            id=id, name=name, description=description, domain_profile=domain_profile
+        )
+
+        for node in nodes:
+            if node.id in kb._nodes:
+                kb.add_node(node)
+                continue
+            kb._nodes[node.id] = node
+            kb._label_to_id[node.label.lower()] = node.id
+            for alias in node.aliases:
+                kb._alias_to_id[alias.lower()] = node.id
+            kb._index_node_names(node)
+            kb._index_types("node", node.id)
+            kb._index_provenance("node", node.id)
+
+        for edge in edges:
+            if edge.id in kb._edges:
+                kb.add_edge(edge)
+                continue
+            kb._edges[edge.id] = edge
+            kb._index_edge(edge)
+            kb._index_types("edge", edge.id)
+            kb._index_provenance("edge", edge.id)
+
+        for source in sources:
+            kb._sources[source.id] = source
+            kb._index_mention_sources(source.id)
+
+        # Components are built on first query
+        kb._components_stale = True
+        kb._changes.clear()
+        kb._feed.clear()
+        kb._feed_floor = kb._generation
+        return kb
+
+    def snapshot(self) -> KnowledgeBase:
+        """
+        Detached copy of the graph for reading on another thread.
+
+        Nodes, edges and sources are copied along with their mutable
+        fields, so changes made to this KB afterwards don't reach the
+        copy. The copy is memoized until the graph changes, so insights
+        it has computed are reused by later callers. Take it on the
+        thread that mutates this KB (the event loop) and don't mutate it.
+
+        Returns:
+            KnowledgeBase with this KB's ID, name and records
+        """
+        return self._cached_insight(("snapshot",), self._build_snapshot)
+
+    def _build_snapshot(self) -> KnowledgeBase:
+        """Copy the records into a new KnowledgeBase (see snapshot)."""
+        return KnowledgeBase.from_records(
+            (
+                node.model_copy(
+                    update={
+                        "aliases": list(node.aliases),
+                        "properties": dict(node.properties),
+                        "source_ids": list(node.source_ids),
+                    }
+                )
+                for node in self._nodes.values()
+            ),
+            (
+                edge.model_copy(update={"relationships": list(edge.relationships)})
+                for edge in self._edges.values()
+            ),
+            (
+                source.model_copy(
+                    update={
+                        "metadata": dict(source.metadata),
+                        "mentions": dict(source.mentions),
+                    }
+                )
+                for source in self._sources.values()
+            ),
+            id=self.id,
+            name=self.name,
+            description=self.description,
+            domain_profile=self.domain_profile,
+        )
+
+    @property
+    def _graph(self) -> nx.DiGraph:
+        """
+        NetworkX view of the graph, built on first use.
+
+        Lookups and mutations use the dict indexes and only keep this in
+        sync once it exists; algorithms that need NetworkX trigger the build.
+        """
+        if self._nx_graph is None:
+            graph = nx.DiGraph()
+            graph.add_nodes_from(
+                (node.id, self._graph_node_attrs(node)) for node in self._nodes.values()
+            )
+            graph.add_edges_from(
+                (edge.source_node_id, edge.target_node_id, self._graph_edge_attrs(edge))
+                for edge in self._edges.values()
+            )
+            self._nx_graph = graph
+        return self._nx_graph
+
+    @staticmethod
+    def _graph_node_attrs(node: Node) -> dict[str, Any]:
+        """NetworkX attributes for a node (the Node model stays in _nodes)."""
+        return {"label": node.label, "entity_type": node.entity_type}
+
+    @staticmethod
+    def _graph_edge_attrs(edge: Edge) -> dict[str, Any]:
+        """NetworkX attributes for an edge (the Edge model stays in _edges)."""
+        return {
+            "edge_id": edge.id,
+            "relationships": [r.relationship_type for r in edge.relationships],
+        }
+
+    def _invalidate_graph(self) -> None:
+        """Drop the NetworkX graph, undirected view and components; rebuilt on next use."""
+        self._nx_graph = None
+        self._undirected_cache = None
+        self._components_stale = True
+
     def _get_undirected(self) -> nx.Graph:
         """
         Get an undirected view of the graph, with caching.
 
-        The undirected view is cached and invalidated when the graph
-        is modified (add_node, add_edge). This avoids repeated O(V+E)
+        The undirected view is cached; add_node/add_edge extend it in
+        place and removals invalidate it. This avoids repeated O(V+E)
         conversion for multiple insight queries.
 
         Returns:
@@ -124,6 +588,342 @@ class KnowledgeBase:
         """Invalidate the cached undirected view. Called when graph is modified."""
         self._undirected_cache = None
 
+    def _component_index(self) -> _ComponentIndex:
+        """The union-find component index, rebuilt first if stale."""
+        if self._components_stale:
+            components = _ComponentIndex()
+            for node_id in self._nodes:
+                components.add(node_id)
+            for edge in self._edges.values():
+                components.union(edge.source_node_id, edge.target_node_id)
+            self._components = components
+            self._components_stale = False
+        return self._components
+
+    def _record_change(self, kind: str, obj_id: str, op: str = "upsert") -> None:
+        """
+        Record that a node, edge or source changed since the last save.
+
+        Re-recording moves the entry to the end so replay order follows
+        the most recent change.
+
+        Args:
+            kind: "node", "edge" or "source"
+            obj_id: ID of the changed object
+            op: "upsert" or "delete"
+        """
+        key = (kind, obj_id)
+        self._changes.pop(key, None)
+        self._changes[key] = op
+        self._generation += 1
+        if kind == "source":
+            self._index_mention_sources(obj_id)
+        else:
+            self._index_types(kind, obj_id)
+            self._index_provenance(kind, obj_id)
+            if len(self._feed) == self._feed.maxlen:
+                self._feed_floor = self._feed[0][0]
+            self._feed.append((self._generation, kind, obj_id, op))
+
+    def _index_types(self, kind: str, obj_id: str) -> None:
+        """
+        Bring a node's or edge's type index entries up to date.
+
+        Called for every recorded change, so types set on a node or
+        relationships added to an edge are indexed as soon as the change
+        is recorded; a missing object is removed from the indexes.
+
+        Args:
+            kind: "node" or "edge"
+            obj_id: ID of the changed object
+        """
+        if kind == "node":
+            node = self._nodes.get(obj_id)
+            old_type = self._node_type.pop(obj_id, None)
+            if node is not None:
+                self._node_type[obj_id] = node.entity_type
+            if old_type == (node.entity_type if node else None):
+                return
+            if old_type is not None:
+                _discard_indexed(self._type_to_nodes, old_type, obj_id)
+            if node is not None:
+                self._type_to_nodes.setdefault(node.entity_type, {})[obj_id] = None
+            return
+
+        edge = self._edges.get(obj_id)
+        _reindex(
+            self._relationship_to_edges,
+            self._edge_relationship_types,
+            obj_id,
+            frozenset(r.relationship_type for r in edge.relationships)
+            if edge is not None
+            else None,
+        )
+
+    def _index_provenance(self, kind: str, obj_id: str) -> None:
+        """
+        Bring a node's or edge's source index entries up to date.
+
+        Called for every recorded change, like _index_types. Nodes are
+        indexed under their source_ids, edges under the source_id of each
+        of their relationships.
+
+        Args:
+            kind: "node" or "edge"
+            obj_id: ID of the changed object
+        """
+        if kind == "node":
+            node = self._nodes.get(obj_id)
+            _reindex(
+                self._source_to_nodes,
+                self._node_source_ids,
+                obj_id,
+                frozenset(node.source_ids) if node is not None else None,
+            )
+            return
+
+        edge = self._edges.get(obj_id)
+        _reindex(
+            self._source_to_edges,
+            self._edge_source_ids,
+            obj_id,
+            frozenset(r.source_id for r in edge.relationships)
+            if edge is not None
+            else None,
+        )
+
+    def _index_mention_sources(self, source_id: str) -> None:
+        """
+        Bring a source's mention index entries up to date.
+
+        Called for every recorded source change, so removing or merging a
+        node only touches the sources that mention it.
+
+        Args:
+            source_id: ID of the changed source
+        """
+        source = self._sources.get(source_id)
+        _reindex(
+            self._node_to_mention_sources,
+            self._source_mention_nodes,
+            source_id,
+            frozenset(source.mentions) if source is not None else None,
+        )
+
+    @property
+    def generation(self) -> int:
+        """
+        Monotonic mutation counter for this in-memory KB.
+
+        Bumped by every node/edge/source change, so derived data computed
+        at one generation is valid until the value changes.
+        """
+        return self._generation
+
+    def _cached_insight(self, key: tuple[Any, ...], compute: Callable[[], _T]) -> _T:
+        """
+        Memoize an insight computation until the graph next changes.
+
+        The computation runs outside the lock. Its result is only stored
+        if the graph is still at the generation it started from, so a
+        value computed while the graph changed is never cached under the
+        newer generation.
+
+        Args:
+            key: Cache key identifying the computation and its parameters
+            compute: Zero-argument function producing the value
+
+        Returns:
+            The cached or freshly computed value (callers must not mutate it)
+        """
+        generation = self._generation
+        with self._insight_lock:
+            if self._insight_generation < generation:
+                self._insight_cache.clear()
+                self._insight_generation = generation
+            elif self._insight_generation == generation and key in self._insight_cache:
+                cached: _T = self._insight_cache[key]
+                return cached
+
+        value = compute()
+        with self._insight_lock:
+            if self._insight_generation == generation == self._generation:
+                self._insight_cache[key] = value
+        return value
+
+    def _index_edge(self, edge: Edge) -> None:
+        """
+        Add an edge to the adjacency indexes under its current endpoints.
+
+        If another edge already occupies the same (source, target) pair,
+        the existing mapping is kept so lookups keep returning the edge
+        that was added first.
+        """
+        self._edge_index.setdefault((edge.source_node_id, edge.target_node_id), edge.id)
+        self._node_edges.setdefault(edge.source_node_id, {})[edge.id] = None
+        self._node_edges.setdefault(edge.target_node_id, {})[edge.id] = None
+
+    def _unindex_edge(self, edge: Edge) -> None:
+        """Remove an edge from the adjacency indexes under its current endpoints."""
+        pair = (edge.source_node_id, edge.target_node_id)
+        for node_id in pair:
+            incident = self._node_edges.get(node_id)
+            if incident is not None:
+                incident.pop(edge.id, None)
+                if not incident:
+                    del self._node_edges[node_id]
+
+        if self._edge_index.get(pair) != edge.id:
+            return
+        del self._edge_index[pair]
+        # Fall back to another edge sharing the same endpoints, if any
+        for other_id in self._node_edges.get(edge.source_node_id, ()):
+            other = self._edges.get(other_id)
+            if (
+                other is not None
+                and other.id != edge.id
+                and (other.source_node_id, other.target_node_id) == pair
+            ):
+                self._edge_index[pair] = other.id
+                break
+
+    @staticmethod
+    def _normalized_names(node: Node) -> tuple[str, ...]:
+        """A node's normalized label and aliases (label first, no duplicates)."""
+        return tuple(
+            dict.fromkeys(
+                name
+                for name in map(normalize_entity_name, [node.label, *node.aliases])
+                if name
+            )
+        )
+
+    @classmethod
+    def _blocking_keys(
+        cls,
+        node: Node,
+        normalized_names: tuple[str, ...] | None = None,
+    ) -> tuple[set[str], set[str]]:
+        """Compute the trigrams and normalized keys for a node's label and aliases."""
+        if normalized_names is None:
+            normalized_names = cls._normalized_names(node)
+        ngrams: set[str] = set()
+        name_keys: set[str] = set()
+        for name in normalized_names:
+            ngrams.update(generate_ngrams(name, normalized=True))
+            key = normalize_for_index(name, normalized=True)
+            if key:
+                name_keys.add(key)
+        return ngrams, name_keys
+
+    def _index_node_names(self, node: Node) -> None:
+        """
+        Add a node's label and aliases to the blocking and search indexes.
+
+        Additive and idempotent, so it can be called again after aliases
+        are added to an existing node.
+        """
+        search_names = self._normalized_names(node)
+        ngrams, name_keys = self._blocking_keys(node, search_names)
+        indexed_ngrams, indexed_keys = self._node_blocking_keys.setdefault(
+            node.id, (set(), set())
+        )
+        for gram in ngrams - indexed_ngrams:
+            self._ngram_to_ids.setdefault(gram, set()).add(node.id)
+        for key in name_keys - indexed_keys:
+            self._name_key_to_ids.setdefault(key, set()).add(node.id)
+        indexed_ngrams.update(ngrams)
+        indexed_keys.update(name_keys)
+
+        indexed_names = self._node_search_names.get(node.id)
+        if indexed_names:
+            search_names = tuple(dict.fromkeys(indexed_names + search_names))
+        self._node_search_names[node.id] = search_names
+        if self._prefix_index is not None:
+            for prefix in self._word_prefixes(search_names):
+                self._prefix_index.setdefault(prefix, set()).add(node.id)
+
+    @staticmethod
+    def _word_prefixes(names: Iterable[str]) -> set[str]:
+        """Prefixes (up to SEARCH_PREFIX_LENGTH chars) of every word in names."""
+        return {
+            word[:length]
+            for name in names
+            for word in name.split()
+            for length in range(1, SEARCH_PREFIX_LENGTH + 1)
+        }
+
+    def _get_prefix_index(self) -> dict[str, set[str]]:
+        """The word-prefix search index, built on first use."""
+        if self._prefix_index is None:
+            index: dict[str, set[str]] = {}
+            for node_id, names in self._node_search_names.items():
+                for prefix in self._word_prefixes(names):
+                    index.setdefault(prefix, set()).add(node_id)
+            self._prefix_index = index
+        return self._prefix_index
+
+    def _unindex_node_names(self, node_id: str) -> None:
+        """Remove a node from the blocking and search indexes."""
+        search_names = self._node_search_names.pop(node_id, ())
+        if self._prefix_index is not None:
+            for prefix in self._word_prefixes(search_names):
+                ids = self._prefix_index.get(prefix)
+                if ids is not None:
+                    ids.discard(node_id)
+                    if not ids:
+                        del self._prefix_index[prefix]
+        indexed = self._node_blocking_keys.pop(node_id, None)
+        if indexed is None:
+            return
+        for terms, index in zip(indexed, (self._ngram_to_ids, self._name_key_to_ids)):
+            for term in terms:
+                ids = index.get(term)
+                if ids is not None:
+                    ids.discard(node_id)
+                    if not ids:
+                        del index[term]
+
+    def _blocked_candidate_ids(
+        self,
+        node: Node,
+        min_shared_ngrams: int = 2,
+        max_block_size: int | None = None,
+    ) -> list[str]:
+        """
+        Find IDs of nodes that could plausibly match the given node.
+
+        A node is a candidate if it shares a normalized key with the query
+        node, or at least ``min_shared_ngrams`` trigrams (capped at the
+        number of trigrams the query has, so very short names still block).
+
+        Args:
+            node: The node to find candidates for (need not be in the KB)
+            min_shared_ngrams: Minimum shared trigrams to consider a node
+            max_block_size: Skip trigrams shared by more nodes than this
+                (stop-grams). None disables pruning.
+
+        Returns:
+            Candidate node IDs, excluding the query node itself
+        """
+        ngrams, name_keys = self._blocking_keys(node)
+
+        shared: dict[str, int] = {}
+        for gram in ngrams:
+            node_ids = self._ngram_to_ids.get(gram, ())
+            if max_block_size is not None and len(node_ids) > max_block_size:
+                continue
+            for node_id in node_ids:
+                shared[node_id] = shared.get(node_id, 0) + 1
+
+        required = min(min_shared_ngrams, len(ngrams))
+        candidate_ids = {nid for nid, count in shared.items() if count >= required}
+        for key in name_keys:
+            candidate_ids.update(self._name_key_to_ids.get(key, ()))
+
+        candidate_ids.discard(node.id)
+        return sorted(candidate_ids)
+
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # NODE OPERATIONS
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -141,6 +941,9 @@ class KnowledgeBase:
         Returns:
             The added Node (same object)
         """
+        previous = self._nodes.get(node.id)
+        if previous is not None:
+            self._unindex_node_labels(previous)
         self._nodes[node.id] = node
         self._label_to_id[node.label.lower()] = node.id
 
@@ -148,11 +951,109 @@ class KnowledgeBase:
         for alias in node.aliases:
             self._alias_to_id[alias.lower()] = node.id
 
-        # Add to NetworkX graph with node data (including segment_ids)
-        self._graph.add_node(node.id, **node.model_dump())
+        # Re-adding an existing ID replaces its blocking entries
+        self._unindex_node_names(node.id)
+        self._index_node_names(node)
+        self._record_change("node", node.id)
+
+        attrs = self._graph_node_attrs(node)
+        if self._nx_graph is not None:
+            self._nx_graph.add_node(node.id, **attrs)
+        if self._undirected_cache is not None:
+            self._undirected_cache.add_node(node.id, **attrs)
+        if not self._components_stale:
+            self._components.add(node.id)
+        self.updated_at = _utc_now()
+
+        return node
+
+    def _unindex_node_labels(self, node: Node) -> None:
+        """Remove a node's label/alias lookup entries that still point to it."""
+        for name in [node.label, *node.aliases]:
+            key = name.lower()
+            if self._label_to_id.get(key) == node.id:
+                del self._label_to_id[key]
+            if self._alias_to_id.get(key) == node.id:
+                del self._alias_to_id[key]
+
+    def remove_node(self, node_id: str) -> bool:
+        """
+        Remove a node and all of its incident edges.
+
+        Args:
+            node_id: ID of the node to remove
+
+        Returns:
+            True if the node existed and was removed
+        """
+        node = self._nodes.get(node_id)
+        if node is None:
+            return False
+
+        for edge_id in list(self._node_edges.get(node_id, ())):
+            self.remove_edge(edge_id)
+
+        self._unindex_node_labels(node)
+        self._unindex_node_names(node_id)
+        for source_id in list(self._node_to_mention_sources.get(node_id, ())):
+            self._sources[source_id].mentions.pop(node_id, None)
+            self._record_change("source", source_id)
+        del self._nodes[node_id]
+        self._node_edges.pop(node_id, None)
+        if self._nx_graph is not None and node_id in self._nx_graph:
+            self._nx_graph.remove_node(node_id)
+        self._record_change("node", node_id, "delete")
+
         self._invalidate_undirected_cache()
+        self._components_stale = True
         self.updated_at = _utc_now()
+        return True
+
+    def add_alias(self, node_id: str, alias: str) -> Node | None:
+        """
+        Add an alias to an existing node and index it.
+
+        Prefer this over Node.add_alias for nodes already in the KB, so
+        alias lookup and resolution blocking see the new name.
+
+        Args:
+            node_id: ID of the node to update
+            alias: Alternative name to add
+
+        Returns:
+            The updated Node, or None if the node doesn't exist
+        """
+        node = self._nodes.get(node_id)
+        if node is None:
+            return None
+
+        node.add_alias(alias)
+        if alias in node.aliases:
+            self._alias_to_id[alias.lower()] = node_id
+            self._index_node_names(node)
+            self._record_change("node", node_id)
+        return node
+
+    def add_node_source(self, node_id: str, source_id: str) -> Node | None:
+        """
+        Record that a node was mentioned in a source.
+
+        Prefer this over Node.add_source for nodes already in the KB, so
+        the change is tracked for persistence.
+
+        Args:
+            node_id: ID of the node to update
+            source_id: ID of the source mentioning the node
+
+        Returns:
+            The updated Node, or None if the node doesn't exist
+        """
+        node = self._nodes.get(node_id)
+        if node is None:
+            return None
 
+        node.add_source(source_id)
+        self._record_change("node", node_id)
         return node
 
     def get_node(self, node_id: str) -> Node | None:
@@ -230,28 +1131,241 @@ class KnowledgeBase:
         """
         Find nodes matching the given criteria.
 
-        Supports filtering by partial label match (case-insensitive)
-        and/or exact entity type match.
+        Supports filtering by partial label or alias match (case-insensitive,
+        answered from the trigram index) and/or exact entity type match
+        (answered from the entity type index when no label is given).
 
         Args:
-            label: Optional partial label to match (case-insensitive)
+            label: Optional partial label or alias to match (case-insensitive)
             entity_type: Optional exact entity type to match
 
         Returns:
-            List of matching Nodes
+            List of matching Nodes, in insertion order (none if label
+            is given but normalizes to nothing, e.g. "...")
+        """
+        if not label:
+            if not entity_type:
+                return list(self._nodes.values())
+            return [
+                self._nodes[node_id]
+                for node_id in self._type_to_nodes.get(entity_type, ())
+            ]
+
+        query = normalize_entity_name(label)
+        if not query:
+            return []
+        matched = {
+            node_id
+            for node_id in self._substring_candidates(query)
+            if any(query in name for name in self._node_search_names[node_id])
+        }
+        return [
+            node
+            for node_id, node in self._nodes.items()
+            if node_id in matched
+            and (not entity_type or node.entity_type == entity_type)
+        ]
+
+    def _substring_candidates(self, query: str) -> Iterable[str]:
+        """
+        IDs of nodes that may have a label or alias containing query.
+
+        Intersects the trigram postings of a normalized query; queries
+        shorter than a trigram cannot use the index and get every node.
+        """
+        grams = generate_ngrams(query)
+        if len(query) < 3 or not grams:
+            return self._nodes.keys()
+        postings = sorted((self._ngram_to_ids.get(g, set()) for g in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return candidates
+
+    @staticmethod
+    def _score_name(query: str, name: str) -> tuple[float, str] | None:
         """
-        results = []
+        Score how well a normalized name matches a normalized query.
 
-        for node in self._nodes.values():
-            # Filter by label substring if provided
-            if label and label.lower() not in node.label.lower():
-                continue
-            # Filter by exact entity type if provided
-            if entity_type and node.entity_type != entity_type:
+        Tiers: exact 100, prefix 90-99, word prefix 80-89, substring 70-79;
+        within a tier, names closer in length to the query score higher.
+        """
+        if name == query:
+            return 100.0, "exact"
+        if query not in name:
+            return None
+        coverage = 9 * len(query) / len(name)
+        if name.startswith(query):
+            return 90 + coverage, "prefix"
+        if f" {query}" in name:
+            return 80 + coverage, "word_prefix"
+        return 70 + coverage, "substring"
+
+    def search_nodes(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        entity_type: str | None = None,
+        fuzzy: bool = True,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Ranked typeahead search over node labels and aliases.
+
+        Candidates come from the trigram index (word-prefix index for
+        queries shorter than a trigram), so cost scales with the number of
+        plausible matches rather than the size of the graph. Exact, prefix,
+        word-prefix and substring matches rank above fuzzy (typo-tolerant)
+        matches; ties go to the better connected entity.
+
+        Args:
+            query: Search text (case-insensitive)
+            limit: Maximum results to return
+            offset: Number of ranked results to skip (pagination)
+            entity_type: Optional exact entity type to match
+            fuzzy: Include typo-tolerant matches (queries of 3+ characters)
+
+        Returns:
+            (results, total) where results are dicts with {node, score,
+            match, matched_name, degree} and total counts all matches
+        """
+        normalized = normalize_entity_name(query)
+        if not normalized:
+            return [], 0
+
+        if len(normalized) <= SEARCH_PREFIX_LENGTH:
+            candidates: Iterable[str] = self._get_prefix_index().get(normalized, ())
+        else:
+            candidates = self._substring_candidates(normalized)
+
+        search_names = self._node_search_names
+        matches: dict[str, tuple[float, str, str]] = {}
+        for node_id in candidates:
+            if entity_type and self._nodes[node_id].entity_type != entity_type:
                 continue
-            results.append(node)
+            best: tuple[float, str, str] | None = None
+            for position, name in enumerate(search_names[node_id]):
+                if normalized not in name:
+                    continue
+                score, match = self._score_name(normalized, name)  # type: ignore[misc]
+                # Aliases rank just below the same match on the label
+                if position:
+                    score -= 0.5
+                if best is None or score > best[0]:
+                    best = (score, match, name)
+            if best is not None:
+                matches[node_id] = best
+
+        if fuzzy and len(normalized) >= 3 and len(matches) < SEARCH_FUZZY_FALLBACK:
+            matches.update(self._fuzzy_matches(normalized, matches, entity_type))
+
+        # Rank only as far as the requested page: by score, then higher
+        # degree, then label. Scores are tiered, so most ties share a score;
+        # degree and label are only looked up for those
+        node_edges = self._node_edges
+        by_score = heapq.nsmallest(
+            offset + limit, ((-best[0], node_id) for node_id, best in matches.items())
+        )
+        cutoff = by_score[-1][0] if by_score else 0.0
+        ranked = sorted(
+            (
+                -score,
+                -len(node_edges.get(node_id, ())),
+                search_names[node_id][0],
+                node_id,
+            )
+            for node_id, (score, _, _) in matches.items()
+            if -score <= cutoff
+        )[offset : offset + limit]
 
-        return results
+        results = []
+        for neg_score, neg_degree, _, node_id in ranked:
+            _, match, name = matches[node_id]
+            results.append(
+                {
+                    "node": self._nodes[node_id],
+                    "score": round(-neg_score, 2),
+                    "match": match,
+                    "matched_name": name,
+                    "degree": -neg_degree,
+                }
+            )
+        return results, len(matches)
+
+    def _fuzzy_matches(
+        self,
+        query: str,
+        exclude: dict[str, Any],
+        entity_type: str | None,
+    ) -> dict[str, tuple[float, str, str]]:
+        """
+        Typo-tolerant matches for a normalized query of 3+ characters.
+
+        Up to SEARCH_FUZZY_MAX_CANDIDATES nodes sharing at least half of the
+        query's trigrams are scored by _fuzzy_name_score; scores map into
+        0-69 so fuzzy matches always rank below substring matches.
+        """
+        grams = generate_ngrams(query)
+        shared = Counter(
+            chain.from_iterable(
+                node_ids
+                for node_ids in map(self._ngram_to_ids.get, grams)
+                if node_ids and len(node_ids) <= SEARCH_FUZZY_MAX_POSTING
+            )
+        )
+
+        # Score only the nodes with the most shared trigrams (ties by ID,
+        # so the cut is deterministic)
+        required = max(1, (len(grams) + 1) // 2)
+        best_overlaps = heapq.nsmallest(
+            SEARCH_FUZZY_MAX_CANDIDATES,
+            (
+                (-count, node_id)
+                for node_id, count in shared.items()
+                if count >= required
+                and node_id not in exclude
+                and (not entity_type or self._nodes[node_id].entity_type == entity_type)
+            ),
+        )
+        matches: dict[str, tuple[float, str, str]] = {}
+        for _, node_id in best_overlaps:
+            best_ratio, best_name = 0.0, ""
+            for name in self._node_search_names[node_id]:
+                ratio = self._fuzzy_name_score(query, name)
+                if ratio > best_ratio:
+                    best_ratio, best_name = ratio, name
+            if best_ratio:
+                matches[node_id] = (best_ratio * 0.69, "fuzzy", best_name)
+        return matches
+
+    @staticmethod
+    def _fuzzy_name_score(query: str, name: str) -> float:
+        """
+        Best rapidfuzz ratio between a query and word-aligned name windows.
+
+        Windows start at each word and are one character shorter, equal to
+        and one longer than the query, so a typo'd prefix ("gotlieb") scores
+        well against "sidney gottlieb" while unrelated tails do not.
+
+        Returns:
+            Score from SEARCH_FUZZY_MIN_SCORE to 100, or 0.0 below the cutoff
+        """
+        best = 0.0
+        start = 0
+        for word in name.split(" "):
+            for size in (len(query) - 1, len(query), len(query) + 1):
+                best = max(
+                    best,
+                    fuzz.ratio(
+                        query,
+                        name[start : start + size],
+                        score_cutoff=SEARCH_FUZZY_MIN_SCORE,
+                    ),
+                )
+            start += len(word) + 1
+        return best
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # EDGE OPERATIONS
@@ -270,20 +1384,66 @@ class KnowledgeBase:
         Returns:
             The added Edge (same object)
         """
+        previous = self._edges.get(edge.id)
+        if previous is not None:
+            self._unindex_edge(previous)
+            self._remove_graph_edge(previous)
         self._edges[edge.id] = edge
+        self._index_edge(edge)
+        self._record_change("edge", edge.id)
 
         # Add to NetworkX with relationship types as edge data
-        self._graph.add_edge(
-            edge.source_node_id,
-            edge.target_node_id,
-            edge_id=edge.id,
-            relationships=[r.relationship_type for r in edge.relationships],
-        )
-        self._invalidate_undirected_cache()
+        source, target = edge.source_node_id, edge.target_node_id
+        attrs = self._graph_edge_attrs(edge)
+        if self._nx_graph is not None:
+            self._nx_graph.add_edge(source, target, **attrs)
+        if previous is not None:
+            # Replacing an edge may have disconnected its old endpoints
+            self._invalidate_undirected_cache()
+            self._components_stale = True
+        else:
+            if self._undirected_cache is not None:
+                self._undirected_cache.add_edge(source, target, **attrs)
+            if not self._components_stale:
+                self._components.union(source, target)
 
         self.updated_at = _utc_now()
         return edge
 
+    def _remove_graph_edge(self, edge: Edge) -> None:
+        """Remove an edge's NetworkX counterpart if it still belongs to it."""
+        graph = self._nx_graph
+        source, target = edge.source_node_id, edge.target_node_id
+        if (
+            graph is not None
+            and graph.has_edge(source, target)
+            and graph[source][target].get("edge_id") == edge.id
+        ):
+            graph.remove_edge(source, target)
+
+    def remove_edge(self, edge_id: str) -> bool:
+        """
+        Remove an edge from the knowledge graph.
+
+        Args:
+            edge_id: ID of the edge to remove
+
+        Returns:
+            True if the edge existed and was removed
+        """
+        edge = self._edges.pop(edge_id, None)
+        if edge is None:
+            return False
+
+        self._unindex_edge(edge)
+        self._remove_graph_edge(edge)
+        self._record_change("edge", edge_id, "delete")
+
+        self._invalidate_undirected_cache()
+        self._components_stale = True
+        self.updated_at = _utc_now()
+        return True
+
     def get_edge(self, edge_id: str) -> Edge | None:
         """
         Get an edge by its ID.
@@ -300,6 +1460,8 @@ class KnowledgeBase:
         """
         Get the edge between two nodes by their IDs.
 
+        O(1) lookup via the (source, target) adjacency index.
+
         Args:
             source_id: ID of the source node
             target_id: ID of the target node
@@ -307,26 +1469,28 @@ class KnowledgeBase:
         Returns:
             The Edge if found, None otherwise
         """
-        for edge in self._edges.values():
-            if edge.source_node_id == source_id and edge.target_node_id == target_id:
-                return edge
-        return None
+        edge_id = self._edge_index.get((source_id, target_id))
+        if edge_id is None:
+            return None
+        return self._edges.get(edge_id)
 
     def get_edges_for_node(self, node_id: str) -> list[Edge]:
         """
         Get all edges connected to a node (both incoming and outgoing).
 
+        Uses the per-node incident edge index, so cost is O(degree).
+
         Args:
             node_id: ID of the node to find edges for
 
         Returns:
             List of Edge objects where the node is either source or target
         """
-        edges: list[Edge] = []
-        for edge in self._edges.values():
-            if edge.source_node_id == node_id or edge.target_node_id == node_id:
-                edges.append(edge)
-        return edges
+        return [
+            self._edges[edge_id]
+            for edge_id in self._node_edges.get(node_id, ())
+            if edge_id in self._edges
+        ]
 
     def get_or_create_edge(self, source_id: str, target_id: str) -> tuple[Edge, bool]:
         """
@@ -392,11 +1556,13 @@ class KnowledgeBase:
             evidence=evidence,
         )
         edge.add_relationship(detail)
+        self._record_change("edge", edge.id)
 
         # Update NetworkX edge data with new relationship types
-        self._graph[source_node.id][target_node.id]["relationships"] = (
-            edge.get_relationship_types()
-        )
+        if self._nx_graph is not None:
+            self._nx_graph[source_node.id][target_node.id]["relationships"] = (
+                edge.get_relationship_types()
+            )
 
         return edge
 
@@ -417,9 +1583,30 @@ class KnowledgeBase:
             The added Source (same object)
         """
         self._sources[source.id] = source
+        self._record_change("source", source.id)
         self.updated_at = _utc_now()
         return source
 
+    def remove_source(self, source_id: str) -> bool:
+        """
+        Remove a source record from the knowledge base.
+
+        Only the Source itself is removed; nodes and relationships citing
+        it are left alone (see retract_source to remove those too).
+
+        Args:
+            source_id: ID of the source to remove
+
+        Returns:
+            True if the source existed and was removed
+        """
+        if self._sources.pop(source_id, None) is None:
+            return False
+
+        self._record_change("source", source_id, "delete")
+        self.updated_at = _utc_now()
+        return True
+
     def get_source(self, source_id: str) -> Source | None:
         """
         Get a source by its ID.
@@ -432,6 +1619,168 @@ class KnowledgeBase:
         """
         return self._sources.get(source_id)
 
+    def index_mentions(self, source_id: str, text: str) -> int:
+        """
+        Record where every node is mentioned in a source's transcript.
+
+        Scans the text once for all labels and aliases in the knowledge base
+        and replaces the source's mention spans (see mentions.py).
+
+        Args:
+            source_id: ID of the source the text belongs to
+            text: Transcript exactly as stored on disk (read_transcript_text)
+
+        Returns:
+            Number of mentions found
+
+        Raises:
+            ValueError: If the source doesn't exist
+        """
+        source = self._sources.get(source_id)
+        if source is None:
+            raise ValueError(f"Source not found: {source_id}")
+
+        matcher = MentionMatcher(
+            (name, node.id)
+            for node in self._nodes.values()
+            for name in (node.label, *node.aliases)
+        )
+        source.mentions = to_byte_spans(text, matcher.find(text))
+        self._record_change("source", source_id)
+        return sum(len(spans) for spans in source.mentions.values())
+
+    def get_mention_spans(self, node_id: str, source_id: str) -> list[Span] | None:
+        """
+        Get where a node is mentioned in a source's transcript.
+
+        Args:
+            node_id: ID of the node
+            source_id: ID of the source
+
+        Returns:
+            (start, end) byte spans into the transcript file, in order, or
+            None if the source has not been indexed (or doesn't exist)
+        """
+        source = self._sources.get(source_id)
+        if source is None or not source.mentions:
+            return None
+        return source.mentions.get(node_id, [])
+
+    def mention_counts(self, node_id: str) -> dict[str, int]:
+        """
+        Count a node's mentions per indexed source.
+
+        Args:
+            node_id: ID of the node
+
+        Returns:
+            Source ID -> number of mentions, for sources that mention it
+        """
+        return {
+            source_id: len(spans)
+            for source_id in self._node_to_mention_sources.get(node_id, ())
+            if (spans := self._sources[source_id].mentions.get(node_id))
+        }
+
+    def get_source_footprint(self, source_id: str) -> dict[str, Any]:
+        """
+        Get everything a source contributed to the graph.
+
+        Reads the provenance index, so cost is proportional to the
+        source's footprint rather than the size of the graph.
+
+        Args:
+            source_id: ID of the source
+
+        Returns:
+            Dict with:
+            - node_ids: Nodes whose source_ids include the source
+            - relationships: (edge_id, relationship index) pairs for each
+              RelationshipDetail attributed to the source
+        """
+        relationships = [
+            (edge_id, index)
+            for edge_id in self._source_to_edges.get(source_id, ())
+            for index, rel in enumerate(self._edges[edge_id].relationships)
+            if rel.source_id == source_id
+        ]
+        return {
+            "node_ids": list(self._source_to_nodes.get(source_id, ())),
+            "relationships": relationships,
+        }
+
+    def retract_source(
+        self, source_id: str, keep_labels: Collection[str] = ()
+    ) -> dict[str, int]:
+        """
+        Remove a source and everything only it contributed.
+
+        Drops the source's relationships (and edges left without any),
+        removes the source from its nodes' source_ids, and removes nodes
+        left with no sources and no edges. Nodes still attributed to other
+        sources, or still connected, are kept. Cost is proportional to the
+        source's footprint (see get_source_footprint).
+
+        Args:
+            source_id: ID of the source to retract
+            keep_labels: Names (matched case-insensitively against labels
+                and aliases) of nodes to keep even if orphaned, e.g. the
+                entities of a re-extraction about to be applied, so they
+                keep their IDs
+
+        Returns:
+            Dict with relationships_removed, edges_removed, nodes_removed
+            and nodes_updated counts
+
+        Raises:
+            ValueError: If the source doesn't exist and contributed nothing
+        """
+        edge_ids = list(self._source_to_edges.get(source_id, ()))
+        node_ids = list(self._source_to_nodes.get(source_id, ()))
+        if source_id not in self._sources and not edge_ids and not node_ids:
+            raise ValueError(f"Source not found: {source_id}")
+
+        keep = {label.lower() for label in keep_labels}
+        relationships_removed = 0
+        edges_removed = 0
+        for edge_id in edge_ids:
+            edge = self._edges[edge_id]
+            kept = [r for r in edge.relationships if r.source_id != source_id]
+            relationships_removed += len(edge.relationships) - len(kept)
+            if not kept:
+                self.remove_edge(edge_id)
+                edges_removed += 1
+                continue
+            edge.relationships = kept
+            self._record_change("edge", edge_id)
+            if self._nx_graph is not None:
+                self._nx_graph[edge.source_node_id][edge.target_node_id][
+                    "relationships"
+                ] = edge.get_relationship_types()
+
+        nodes_removed = 0
+        for node_id in node_ids:
+            node = self._nodes[node_id]
+            node.source_ids.remove(source_id)
+            orphaned = not node.source_ids and not self._node_edges.get(node_id)
+            if orphaned and not keep.intersection(
+                name.lower() for name in (node.label, *node.aliases)
+            ):
+                self.remove_node(node_id)
+                nodes_removed += 1
+            else:
+                self._record_change("node", node_id)
+
+        self.remove_source(source_id)
+        self.updated_at = _utc_now()
+
+        return {
+            "relationships_removed": relationships_removed,
+            "edges_removed": edges_removed,
+            "nodes_removed": nodes_removed,
+            "nodes_updated": len(node_ids) - nodes_removed,
+        }
+
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # GRAPH QUERIES
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -449,51 +1798,469 @@ class KnowledgeBase:
         Returns:
             List of neighboring Nodes (empty if node not found)
         """
-        if node_id not in self._graph:
+        return [self._nodes[nid] for nid in self._neighbor_ids(node_id)]
+
+    def _neighbor_ids(self, node_id: str) -> list[str]:
+        """IDs of a node's neighbors in either direction, in edge order."""
+        # Other endpoint of every incident edge (outgoing and incoming),
+        # read from the adjacency index so no NetworkX graph is needed
+        neighbor_ids: dict[str, None] = {}
+        for edge_id in self._node_edges.get(node_id, ()):
+            edge = self._edges[edge_id]
+            other = (
+                edge.target_node_id
+                if edge.source_node_id == node_id
+                else edge.source_node_id
+            )
+            if other != node_id:
+                neighbor_ids[other] = None
+        return [nid for nid in neighbor_ids if nid in self._nodes]
+
+    def node_degree(self, node_id: str) -> int:
+        """
+        Number of edges incident to a node, in either direction.
+
+        Args:
+            node_id: ID of the node
+
+        Returns:
+            Edge count (0 if the node is unknown or isolated)
+        """
+        return len(self._node_edges.get(node_id, ()))
+
+    def page_nodes(
+        self,
+        sort: str = "label",
+        limit: int = 100,
+        after: tuple[Any, ...] | None = None,
+        entity_type: str | None = None,
+        neighbors_of: str | None = None,
+    ) -> tuple[list[Node], tuple[Any, ...] | None, int]:
+        """
+        One page of nodes in a stable sort order (keyset pagination).
+
+        Each node has a unique sort key ending in its ID; a page holds the
+        smallest keys greater than `after`. Whole-graph orders are sorted
+        once per graph generation and cached; neighbor pages are selected
+        with a bounded heap.
+
+        Args:
+            sort: "label" (A-Z), "degree" (most connected first) or
+                "recency" (most recently updated first)
+            limit: Maximum nodes to return
+            after: Sort key of the last node of the previous page
+            entity_type: Optional exact entity type to match
+            neighbors_of: Only list the neighbors of this node ID
+
+        Returns:
+            (nodes, next_key, total) where next_key is the `after` value for
+            the next page (None on the last page) and total counts all
+            matching nodes
+
+        Raises:
+            ValueError: If sort is unknown or `after` doesn't fit its keys
+        """
+        if sort not in NODE_SORT_ORDERS:
+            raise ValueError(f"Unknown sort order: {sort}")
+
+        if neighbors_of is not None:
+            # Neighborhoods are small: select the page with a bounded heap
+            node_ids = self._filter_entity_type(
+                self._neighbor_ids(neighbors_of), entity_type
+            )
+            keys = self._node_sort_keys(sort, node_ids)
+            if after is not None:
+                keys = (key for key in keys if key > after)
+            try:
+                page = heapq.nsmallest(limit + 1, keys)
+            except TypeError as e:
+                raise ValueError(f"Page key does not match sort order {sort!r}") from e
+            total = len(node_ids)
+        else:
+            # Whole-graph listings share one sorted key list per generation,
+            # so each page after the first is a binary search and a slice
+            order = self._cached_insight(
+                ("node_order", sort, entity_type),
+                lambda: sorted(
+                    self._node_sort_keys(
+                        sort, self._filter_entity_type(self._nodes, entity_type)
+                    )
+                ),
+            )
+            try:
+                start = bisect_right(order, after) if after is not None else 0
+            except TypeError as e:
+                raise ValueError(f"Page key does not match sort order {sort!r}") from e
+            page = order[start : start + limit + 1]
+            total = len(order)
+
+        next_key = page[limit - 1] if len(page) > limit else None
+        return [self._nodes[key[-1]] for key in page[:limit]], next_key, total
+
+    def _filter_entity_type(
+        self, node_ids: Collection[str], entity_type: str | None
+    ) -> Collection[str]:
+        """Node IDs with the given entity type (all of them if None)."""
+        if not entity_type:
+            return node_ids
+        return [nid for nid in node_ids if self._nodes[nid].entity_type == entity_type]
+
+    def _node_sort_keys(
+        self, sort: str, node_ids: Iterable[str]
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Sort keys for page_nodes, ascending in the requested order.
+
+        Keys end in the node ID, so they are unique and map back to nodes.
+        """
+        nodes = self._nodes
+        names = self._node_search_names
+
+        def sort_name(nid: str) -> str:
+            # Punctuation-only labels normalize to nothing
+            normalized = names[nid]
+            return normalized[0] if normalized else nodes[nid].label.casefold()
+
+        if sort == "label":
+            return ((sort_name(nid), nid) for nid in node_ids)
+        if sort == "degree":
+            return ((-self.node_degree(nid), sort_name(nid), nid) for nid in node_ids)
+        return ((-nodes[nid].updated_at.timestamp(), nid) for nid in node_ids)
+
+    def find_paths(
+        self,
+        source_id: str,
+        target_id: str,
+        max_length: int = 5,
+        limit: int = 10,
+        relationship_types: Iterable[str] | None = None,
+        entity_types: Iterable[str] | None = None,
+        budget: PathBudget | None = None,
+    ) -> list[list[str]]:
+        """
+        Find the shortest simple paths between two nodes.
+
+        Paths follow edge direction and are generated lazily, shortest
+        first (Yen's algorithm over bidirectional BFS), so only `limit`
+        paths are ever materialized.
+
+        Args:
+            source_id: ID of the starting node
+            target_id: ID of the ending node
+            max_length: Maximum path length in edges (default 5)
+            limit: Maximum number of paths to return (default 10)
+            relationship_types: Only traverse edges carrying one of these
+                relationship types (case-insensitive)
+            entity_types: Only pass through intermediate nodes of these
+                entity types (case-insensitive)
+            budget: Expansion/time budget; check budget.exhausted afterwards
+                to tell whether the search was cut short
+
+        Returns:
+            List of paths, where each path is a list of node IDs
+        """
+        if source_id not in self._nodes or target_id not in self._nodes:
             return []
 
-        # Combine successors (outgoing) and predecessors (incoming)
-        neighbor_ids = set(self._graph.successors(node_id)) | set(
-            self._graph.predecessors(node_id)
-        )
-        return [self._nodes[nid] for nid in neighbor_ids if nid in self._nodes]
+        successors, predecessors = self._path_neighbors(
+            source_id, target_id, True, relationship_types, entity_types
+        )
+        paths = iter_shortest_paths(
+            source_id,
+            target_id,
+            successors,
+            predecessors,
+            max_length,
+            budget or PathBudget(),
+        )
+        return list(islice(paths, limit))
+
+    def _path_neighbors(
+        self,
+        source_id: str,
+        target_id: str,
+        directed: bool,
+        relationship_types: Iterable[str] | None,
+        entity_types: Iterable[str] | None,
+    ) -> tuple[Callable[[str], Iterator[str]], Callable[[str], Iterator[str]]]:
+        """
+        Build filtered (successors, predecessors) callables for path search.
+
+        The endpoints are exempt from the entity type filter. Undirected
+        search treats both callables as "all neighbors".
+        """
+        graph = self._graph
+        rel_filter = (
+            {t.casefold() for t in relationship_types} if relationship_types else None
+        )
+        type_filter = {t.casefold() for t in entity_types} if entity_types else None
+
+        def node_ok(node_id: str) -> bool:
+            return (
+                type_filter is None
+                or node_id == source_id
+                or node_id == target_id
+                or graph.nodes[node_id]["entity_type"].casefold() in type_filter
+            )
+
+        def edge_ok(attrs: dict[str, Any]) -> bool:
+            return rel_filter is None or any(
+                t.casefold() in rel_filter for t in attrs["relationships"]
+            )
+
+        def successors(node_id: str) -> Iterator[str]:
+            for other, attrs in graph.succ[node_id].items():
+                if node_ok(other) and edge_ok(attrs):
+                    yield other
+
+        def predecessors(node_id: str) -> Iterator[str]:
+            for other, attrs in graph.pred[node_id].items():
+                if node_ok(other) and edge_ok(attrs):
+                    yield other
+
+        if directed:
+            return successors, predecessors
+
+        def neighbors(node_id: str) -> Iterator[str]:
+            yield from successors(node_id)
+            yield from predecessors(node_id)
+
+        return neighbors, neighbors
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # TYPED PATTERN QUERIES
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def get_edges_by_relationship_type(self, relationship_type: str) -> list[Edge]:
+        """
+        Get all edges carrying a relationship type (from the type index).
+
+        Args:
+            relationship_type: Exact relationship type (e.g., "worked_for")
+
+        Returns:
+            Matching edges, in the order they gained the type
+        """
+        return [
+            self._edges[edge_id]
+            for edge_id in self._relationship_to_edges.get(relationship_type, ())
+        ]
+
+    def match_pattern(
+        self, pattern: str | GraphPattern, limit: int = PATTERN_MATCH_LIMIT
+    ) -> list[dict[str, Any]]:
+        """
+        Find paths matching a typed pattern (see patterns.py).
+
+        E.g. "(:Person)-[worked_for]->(:Organization)". Entity and
+        relationship types match case-insensitively. Execution starts from
+        the more selective end of the pattern (fewest candidate nodes per
+        the entity type index) and joins one hop at a time: through the
+        relationship type index when the typed edges are fewer than the
+        frontier's incident edges, otherwise by expanding the frontier's
+        adjacency. A match never uses the same edge twice.
+
+        Args:
+            pattern: Pattern text or a parsed GraphPattern
+            limit: Maximum number of matches to return
+
+        Returns:
+            Up to limit matches, each {nodes: [{id, label, entity_type}],
+            edges: [{id, source_node_id, target_node_id, relationship_types}]}
+            in pattern order; relationship_types lists the edge's types that
+            satisfied the pattern
+
+        Raises:
+            ValueError: If the pattern text is invalid
+        """
+        if isinstance(pattern, str):
+            pattern = parse_pattern(pattern)
+
+        first = self._pattern_candidates(pattern.nodes[0])
+        if not pattern.relationships:
+            return [
+                self._pattern_match(pattern, (node_id,), ())
+                for node_id in islice(first, limit)
+            ]
+        last = self._pattern_candidates(pattern.nodes[-1])
+        reverse = len(last) < len(first)
+        plan = pattern.reversed() if reverse else pattern
+
+        # Partial matches: (node ids, edge ids) along the pattern so far
+        partials: list[tuple[tuple[str, ...], tuple[str, ...]]] = [
+            ((node_id,), ()) for node_id in (last if reverse else first)
+        ]
+        matches: list[dict[str, Any]] = []
+        hops = len(plan.relationships)
+        for hop, rel in enumerate(plan.relationships):
+            allowed = self._pattern_candidates(plan.nodes[hop + 1])
+            rel_types = (
+                self._resolve_types(self._relationship_to_edges, rel.relationship_types)
+                if rel.relationship_types
+                else None
+            )
+            adjacency = self._pattern_hop(
+                dict.fromkeys(nodes[-1] for nodes, _ in partials),
+                rel_types,
+                rel.direction,
+            )
+            extended: list[tuple[tuple[str, ...], tuple[str, ...]]] = []
+            for nodes, edges in partials:
+                for edge_id, other in adjacency.get(nodes[-1], ()):
+                    if edge_id in edges or other not in allowed:
+                        continue
+                    candidate = (nodes + (other,), edges + (edge_id,))
+                    if hop + 1 < hops:
+                        extended.append(candidate)
+                        continue
+                    node_ids, edge_ids = candidate
+                    if reverse:
+                        node_ids, edge_ids = node_ids[::-1], edge_ids[::-1]
+                    if not self._binds_consistently(pattern, node_ids):
+                        continue
+                    matches.append(self._pattern_match(pattern, node_ids, edge_ids))
+                    if len(matches) >= limit:
+                        return matches
+            partials = extended
+        return matches
+
+    def _pattern_candidates(self, node_pattern: NodePattern) -> Collection[str]:
+        """Node IDs satisfying a node pattern's types and property filters."""
+        if node_pattern.entity_types:
+            types = self._resolve_types(self._type_to_nodes, node_pattern.entity_types)
+            if not types:
+                return ()
+            candidates: Collection[str] = (
+                self._type_to_nodes[types[0]]
+                if len(types) == 1
+                else {nid: None for t in types for nid in self._type_to_nodes[t]}
+            )
+        else:
+            candidates = self._nodes.keys()
+
+        filters = node_pattern.properties
+        if not filters:
+            return candidates
+        label = filters.get("label")
+        label = label.casefold() if isinstance(label, str) else label
+        return {
+            node_id: None
+            for node_id in candidates
+            if all(
+                (
+                    label in {n.casefold() for n in (node.label, *node.aliases)}
+                    if key == "label"
+                    else node.properties.get(key, _MISSING) == value
+                )
+                for node in (self._nodes[node_id],)
+                for key, value in filters.items()
+            )
+        }
+
+    @staticmethod
+    def _resolve_types(
+        index: dict[str, dict[str, None]], names: tuple[str, ...]
+    ) -> list[str]:
+        """Index keys equal to any of names, ignoring case."""
+        wanted = {name.casefold() for name in names}
+        return [key for key in index if key.casefold() in wanted]
 
-    def find_paths(
+    def _pattern_hop(
         self,
-        source_id: str,
-        target_id: str,
-        max_length: int = 5,
-    ) -> list[list[str]]:
+        frontier: dict[str, None],
+        rel_types: list[str] | None,
+        direction: str,
+    ) -> dict[str, list[tuple[str, str]]]:
         """
-        Find all simple paths between two nodes.
-
-        Uses NetworkX's all_simple_paths algorithm with a cutoff
-        to limit path length. Returns up to 10 paths to prevent
-        explosion on highly connected graphs.
+        Edges leaving the frontier for one pattern hop.
 
         Args:
-            source_id: ID of the starting node
-            target_id: ID of the ending node
-            max_length: Maximum path length (default 5)
+            frontier: Node IDs the hop starts from (ordered set)
+            rel_types: Index keys of the accepted relationship types, or
+                None for any type
+            direction: "out", "in" or "any"
 
         Returns:
-            List of paths, where each path is a list of node IDs
+            Frontier node ID -> [(edge ID, node at the other end)]
         """
-        if source_id not in self._graph or target_id not in self._graph:
-            return []
+        if rel_types is None:
+            edge_ids: dict[str, None] = {
+                edge_id: None
+                for node_id in frontier
+                for edge_id in self._node_edges.get(node_id, ())
+            }
+        else:
+            typed = sum(len(self._relationship_to_edges[t]) for t in rel_types)
+            incident = sum(len(self._node_edges.get(n, ())) for n in frontier)
+            if typed <= incident:
+                # Join against the (smaller) typed edge set
+                edge_ids = {
+                    edge_id: None
+                    for t in rel_types
+                    for edge_id in self._relationship_to_edges[t]
+                }
+            else:
+                wanted = set(rel_types)
+                edge_ids = {
+                    edge_id: None
+                    for node_id in frontier
+                    for edge_id in self._node_edges.get(node_id, ())
+                    if not wanted.isdisjoint(self._edge_relationship_types[edge_id])
+                }
 
-        try:
-            paths = list(
-                nx.all_simple_paths(
-                    self._graph,
-                    source_id,
-                    target_id,
-                    cutoff=max_length,
-                )
+        adjacency: dict[str, list[tuple[str, str]]] = {}
+        for edge_id in edge_ids:
+            edge = self._edges[edge_id]
+            source, target = edge.source_node_id, edge.target_node_id
+            if direction != "in" and source in frontier:
+                adjacency.setdefault(source, []).append((edge_id, target))
+            if direction != "out" and target in frontier and target != source:
+                adjacency.setdefault(target, []).append((edge_id, source))
+        return adjacency
+
+    @staticmethod
+    def _binds_consistently(pattern: GraphPattern, node_ids: tuple[str, ...]) -> bool:
+        """Whether every repeated pattern variable binds the same node."""
+        bound: dict[str, str] = {}
+        return all(
+            bound.setdefault(node_pattern.variable, node_id) == node_id
+            for node_pattern, node_id in zip(pattern.nodes, node_ids, strict=True)
+            if node_pattern.variable is not None
+        )
+
+    def _pattern_match(
+        self,
+        pattern: GraphPattern,
+        node_ids: tuple[str, ...],
+        edge_ids: tuple[str, ...],
+    ) -> dict[str, Any]:
+        """Format a complete match (IDs in pattern order) for match_pattern."""
+        edges = []
+        for rel, edge_id in zip(pattern.relationships, edge_ids, strict=True):
+            edge = self._edges[edge_id]
+            types = self._edge_relationship_types[edge_id]
+            if rel.relationship_types:
+                wanted = {t.casefold() for t in rel.relationship_types}
+                types = frozenset(t for t in types if t.casefold() in wanted)
+            edges.append(
+                {
+                    "id": edge.id,
+                    "source_node_id": edge.source_node_id,
+                    "target_node_id": edge.target_node_id,
+                    "relationship_types": sorted(types),
+                }
             )
-            return paths[:10]  # Limit results to prevent explosion
-        except nx.NetworkXNoPath:
-            return []
+        return {
+            "nodes": [
+                {
+                    "id": node_id,
+                    "label": self._nodes[node_id].label,
+                    "entity_type": self._nodes[node_id].entity_type,
+                }
+                for node_id in node_ids
+            ],
+            "edges": edges,
+        }
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # STATISTICS
@@ -514,6 +2281,19 @@ class KnowledgeBase:
             - entity_types: Dict mapping entity type -> count
             - relationship_types: Dict mapping relationship type -> count
         """
+        entity_types, relationship_types = self._cached_insight(
+            ("type_counts",), self._count_types
+        )
+        return {
+            "node_count": len(self._nodes),
+            "edge_count": len(self._edges),
+            "source_count": len(self._sources),
+            "entity_types": dict(entity_types),
+            "relationship_types": dict(relationship_types),
+        }
+
+    def _count_types(self) -> tuple[dict[str, int], dict[str, int]]:
+        """Count nodes per entity type and relationships per relationship type."""
         # Count nodes by entity type
         entity_types: dict[str, int] = {}
         for node in self._nodes.values():
@@ -526,14 +2306,7 @@ class KnowledgeBase:
                 relationship_types[rel.relationship_type] = (
                     relationship_types.get(rel.relationship_type, 0) + 1
                 )
-
-        return {
-            "node_count": len(self._nodes),
-            "edge_count": len(self._edges),
-            "source_count": len(self._sources),
-            "entity_types": entity_types,
-            "relationship_types": relationship_types,
-        }
+        return entity_types, relationship_types
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # INSIGHTS QUERIES
@@ -559,6 +2332,9 @@ class KnowledgeBase:
         limit: int = 10,
         method: str = "connections",
         entity_type: str | None = None,
+        approximate: bool | None = None,
+        approximate_min_nodes: int = APPROXIMATE_CENTRALITY_MIN_NODES,
+        sample_size: int = BETWEENNESS_SAMPLE_SIZE,
     ) -> list[dict[str, Any]]:
         """
         Find the most important entities in the graph.
@@ -568,38 +2344,37 @@ class KnowledgeBase:
         - "influence": PageRank (connected to important entities)
         - "bridging": Betweenness centrality (connects groups)
 
+        Exact betweenness is O(VE), so large graphs switch to approximate
+        mode: betweenness from sample_size random pivot sources, and
+        PageRank with a looser tolerance and iteration budget. Degree
+        centrality is always exact.
+
         Args:
             limit: Maximum number of entities to return (default 10)
             method: Ranking method - "connections", "influence", or "bridging"
             entity_type: Optional filter by entity type
+            approximate: Force approximate (True) or exact (False) scores;
+                None decides by graph size
+            approximate_min_nodes: Node count at which None means approximate
+            sample_size: Pivot sources for approximate betweenness
 
         Returns:
-            List of dicts with {node_id, label, entity_type, score, why}
+            List of dicts with {node_id, label, entity_type, score, why,
+            approximate}
         """
         if len(self._nodes) == 0:
             return []
 
-        # Use cached undirected view for centrality calculations
-        undirected = self._get_undirected()
-
-        # Calculate centrality based on method
+        centrality, approximate = self._centrality(
+            method, approximate, approximate_min_nodes, sample_size
+        )
         if method == "influence":
-            try:
-                centrality = nx.pagerank(self._graph)
-            except (nx.NetworkXError, nx.PowerIterationFailedConvergence):
-                # PageRank can fail on empty graphs or fail to converge
-                centrality = {node_id: 0.0 for node_id in self._nodes}
             why_template = "Influences {score:.0%} of the network through connections"
             zero_why = "No measurable network influence"
         elif method == "bridging":
-            try:
-                centrality = nx.betweenness_centrality(undirected)
-            except nx.NetworkXError:
-                centrality = {node_id: 0.0 for node_id in self._nodes}
             why_template = "Bridges {pct:.0%} of shortest paths between entities"
             zero_why = "Does not bridge any paths"
         else:  # Default: connections (degree centrality)
-            centrality = dict(undirected.degree())
             why_template = "Connected to {count} other entities"
             zero_why = "No connections"
 
@@ -631,6 +2406,7 @@ class KnowledgeBase:
                     "entity_type": node.entity_type,
                     "score": float(score),
                     "why": why,
+                    "approximate": approximate,
                 }
             )
 
@@ -638,23 +2414,139 @@ class KnowledgeBase:
         results.sort(key=lambda x: x["score"], reverse=True)
         return results[:limit]
 
+    def _centrality(
+        self,
+        method: str,
+        approximate: bool | None = None,
+        approximate_min_nodes: int = APPROXIMATE_CENTRALITY_MIN_NODES,
+        sample_size: int = BETWEENNESS_SAMPLE_SIZE,
+    ) -> tuple[dict[str, float], bool]:
+        """
+        Memoized centrality scores (see get_key_entities for the arguments).
+
+        Returns:
+            (scores by node ID, whether they are approximate)
+        """
+        if method not in ("influence", "bridging"):
+            approximate = False
+        elif approximate is None:
+            approximate = len(self._nodes) >= approximate_min_nodes
+        # Sampling every node is exact betweenness
+        if method == "bridging" and approximate and sample_size >= len(self._nodes):
+            approximate = False
+
+        # Centrality vectors are memoized until the graph changes
+        key = ("centrality", method, approximate, sample_size if approximate else None)
+        centrality = self._cached_insight(
+            key, lambda: self._compute_centrality(method, approximate, sample_size)
+        )
+        return centrality, approximate
+
+    def _compute_centrality(
+        self,
+        method: str,
+        approximate: bool = False,
+        sample_size: int = BETWEENNESS_SAMPLE_SIZE,
+    ) -> dict[str, float]:
+        """
+        Compute a centrality score for every node.
+
+        Args:
+            method: "influence" (PageRank), "bridging" (betweenness),
+                anything else for degree
+            approximate: Use sampled betweenness / budgeted PageRank
+            sample_size: Pivot sources for sampled betweenness
+
+        Returns:
+            Dict mapping node_id -> score
+        """
+        if method == "influence":
+            try:
+                if approximate:
+                    result: dict[str, float] = _budgeted_pagerank(self._graph)
+                else:
+                    result = nx.pagerank(self._graph)
+            except (nx.NetworkXError, nx.PowerIterationFailedConvergence):
+                # PageRank can fail on empty graphs or fail to converge
+                result = {node_id: 0.0 for node_id in self._nodes}
+            return result
+        undirected = self._get_undirected()
+        if method == "bridging":
+            try:
+                if approximate:
+                    # Seeded so repeated queries rank the same way
+                    result = nx.betweenness_centrality(
+                        undirected, k=min(sample_size, len(undirected)), seed=42
+                    )
+                else:
+                    result = nx.betweenness_centrality(undirected)
+            except nx.NetworkXError:
+                result = {node_id: 0.0 for node_id in self._nodes}
+            return result
+        return dict(undirected.degree())
+
+    def _connected_components(self) -> list[set[str]]:
+        """
+        Connected components of the undirected graph, largest first (memoized).
+
+        Read from the union-find index, so no graph traversal is needed.
+        Ties keep the insertion order of each component's first node.
+        """
+
+        def compute() -> list[set[str]]:
+            components = self._component_index().groups()
+            components.sort(key=len, reverse=True)
+            return components
+
+        return self._cached_insight(("components",), compute)
+
+    def in_same_component(self, node_id_1: str, node_id_2: str) -> bool:
+        """
+        Check whether two nodes are connected by any undirected path.
+
+        Answered from the union-find index in near-constant time.
+
+        Args:
+            node_id_1: First node ID
+            node_id_2: Second node ID
+
+        Returns:
+            True if both nodes exist and a path links them
+        """
+        return self._component_index().connected(node_id_1, node_id_2)
+
     def find_connection(
         self,
         entity_1: str,
         entity_2: str,
+        max_paths: int = 1,
+        relationship_types: Iterable[str] | None = None,
+        entity_types: Iterable[str] | None = None,
+        max_length: int | None = None,
+        budget: PathBudget | None = None,
     ) -> dict[str, Any]:
         """
-        Show how two entities connect via shortest path.
+        Show how two entities connect via their shortest paths.
 
-        Uses NetworkX shortest_path on undirected graph to find
-        the most direct connection between two entities.
+        Searches the graph as undirected, shortest paths first (Yen's
+        algorithm over bidirectional BFS), stopping after max_paths paths
+        or when the budget runs out.
 
         Args:
             entity_1: Label of the first entity
             entity_2: Label of the second entity
+            max_paths: Number of alternative paths to find (default 1)
+            relationship_types: Only traverse edges carrying one of these
+                relationship types (case-insensitive)
+            entity_types: Only pass through intermediate entities of these
+                types (case-insensitive)
+            max_length: Maximum path length in steps (default: unbounded)
+            budget: Expansion/time budget (default: PathBudget())
 
         Returns:
-            Dict with {connected, steps, path, explanation}
+            Dict with {connected, steps, path, explanation, paths,
+            budget_exhausted}. path/steps describe the shortest path;
+            paths lists every path found as {steps, path}.
             Path items contain {entity, relationship, direction}
         """
         # Resolve labels to nodes
@@ -662,44 +2554,101 @@ class KnowledgeBase:
         node2 = self._find_node_by_label(entity_2)
 
         if not node1:
-            return {
-                "connected": False,
-                "steps": 0,
-                "path": [],
-                "explanation": f"Entity '{entity_1}' not found in graph",
-            }
+            return _no_connection(f"Entity '{entity_1}' not found in graph")
 
         if not node2:
-            return {
-                "connected": False,
-                "steps": 0,
-                "path": [],
-                "explanation": f"Entity '{entity_2}' not found in graph",
-            }
+            return _no_connection(f"Entity '{entity_2}' not found in graph")
 
         if node1.id == node2.id:
+            path = [{"entity": node1.label, "relationship": None, "direction": None}]
             return {
                 "connected": True,
                 "steps": 0,
-                "path": [
-                    {"entity": node1.label, "relationship": None, "direction": None}
-                ],
+                "path": path,
                 "explanation": "Same entity",
+                "paths": [{"steps": 0, "path": path}],
+                "budget_exhausted": False,
             }
 
-        # Find shortest path on undirected graph (uses cached view)
-        undirected = self._get_undirected()
-        try:
-            path_ids = nx.shortest_path(undirected, node1.id, node2.id)
-        except nx.NetworkXNoPath:
-            return {
-                "connected": False,
-                "steps": 0,
-                "path": [],
-                "explanation": f"No connection found between '{entity_1}' and '{entity_2}'",
+        no_path = f"No connection found between '{entity_1}' and '{entity_2}'"
+
+        # Different components: no path, skip the search entirely
+        if not self.in_same_component(node1.id, node2.id):
+            return _no_connection(no_path)
+
+        budget = budget or PathBudget()
+        neighbors, _ = self._path_neighbors(
+            node1.id, node2.id, False, relationship_types, entity_types
+        )
+        found = list(
+            islice(
+                iter_shortest_paths(
+                    node1.id,
+                    node2.id,
+                    neighbors,
+                    neighbors,
+                    max_length if max_length is not None else len(self._nodes),
+                    budget,
+                    directed=False,
+                ),
+                max(max_paths, 1),
+            )
+        )
+
+        if not found:
+            if budget.exhausted:
+                no_path = (
+                    f"Search budget exhausted before a connection between "
+                    f"'{entity_1}' and '{entity_2}' was found"
+                )
+            elif relationship_types or entity_types or max_length is not None:
+                no_path += " matching the filters"
+            result = _no_connection(no_path)
+            result["budget_exhausted"] = budget.exhausted
+            return result
+
+        paths = [
+            {
+                "steps": len(path_ids) - 1,
+                "path": self._describe_path(path_ids, relationship_types),
             }
+            for path_ids in found
+        ]
+        steps = paths[0]["steps"]
+        explanation = f"Connected through {steps} step{'s' if steps != 1 else ''}"
+
+        return {
+            "connected": True,
+            "steps": steps,
+            "path": paths[0]["path"],
+            "explanation": explanation,
+            "paths": paths,
+            "budget_exhausted": budget.exhausted,
+        }
+
+    def _describe_path(
+        self,
+        path_ids: list[str],
+        relationship_types: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Describe a path as {entity, relationship, direction} steps.
+
+        Each step names the relationship to the next entity, preferring
+        one of relationship_types when given.
+        """
+        wanted = (
+            {t.casefold() for t in relationship_types} if relationship_types else None
+        )
+
+        def pick(edge: Edge) -> str:
+            rel_types = edge.get_relationship_types()
+            if wanted:
+                for rel_type in rel_types:
+                    if rel_type.casefold() in wanted:
+                        return rel_type
+            return rel_types[0] if rel_types else "connected"
 
-        # Build detailed path with relationships
         path_details: list[dict[str, Any]] = []
         for i, node_id in enumerate(path_ids):
             node = self._nodes.get(node_id)
@@ -715,35 +2664,23 @@ class KnowledgeBase:
             # Add relationship info for edges (not the last node)
             if i < len(path_ids) - 1:
                 next_id = path_ids[i + 1]
-                # Check forward edge
-                edge = self.get_edge_between(node_id, next_id)
-                if edge:
-                    rel_types = edge.get_relationship_types()
-                    path_item["relationship"] = (
-                        rel_types[0] if rel_types else "connected"
-                    )
+                forward = self.get_edge_between(node_id, next_id)
+                backward = self.get_edge_between(next_id, node_id)
+                # Prefer the forward edge unless only the reverse one matches
+                # the relationship filter
+                if forward and (
+                    backward is None
+                    or wanted is None
+                    or pick(forward).casefold() in wanted
+                ):
+                    path_item["relationship"] = pick(forward)
                     path_item["direction"] = "outgoing"
-                else:
-                    # Check reverse edge
-                    edge = self.get_edge_between(next_id, node_id)
-                    if edge:
-                        rel_types = edge.get_relationship_types()
-                        path_item["relationship"] = (
-                            rel_types[0] if rel_types else "connected"
-                        )
-                        path_item["direction"] = "incoming"
+                elif backward:
+                    path_item["relationship"] = pick(backward)
+                    path_item["direction"] = "incoming"
 
             path_details.append(path_item)
-
-        steps = len(path_ids) - 1
-        explanation = f"Connected through {steps} step{'s' if steps != 1 else ''}"
-
-        return {
-            "connected": True,
-            "steps": steps,
-            "path": path_details,
-            "explanation": explanation,
-        }
+        return path_details
 
     def find_common_ground(
         self,
@@ -823,60 +2760,43 @@ class KnowledgeBase:
 
         return "connected"
 
-    def discover_groups(self) -> list[dict[str, Any]]:
+    def discover_groups(
+        self,
+        resolution: float = DEFAULT_RESOLUTION,
+        seed: int = DEFAULT_SEED,
+        workers: int | None = None,
+    ) -> list[dict[str, Any]]:
         """
         Discover clusters of related entities using community detection.
 
         Uses the Louvain community detection algorithm (Blondel et al., 2008)
-        on the undirected graph to find groups of closely connected entities.
+        on every connected component of the undirected graph to find groups
+        of closely connected entities (see app.kg.communities).
 
         Algorithm Details:
         - Time complexity: O(n log n) where n is the number of edges
         - Optimizes modularity to find natural community structure
-        - Deterministic results via seed=42 for reproducibility
-        - Falls back gracefully if graph is too small or disconnected
+        - Components of a few nodes become one group without Louvain;
+          large graphs partition components in a process pool
+        - Deterministic results for a given seed
+        - Partitions are memoized until the graph changes
+
+        Args:
+            resolution: Louvain resolution; above 1 favors smaller groups
+            seed: Random seed for Louvain
+            workers: Max worker processes (None: CPU count, 1: in-process)
 
         Returns:
-            List of groups with {name, entities, size, sample}
-            Name is derived from the most connected entity in each group
+            List of groups with {name, entities, size, sample, modularity},
+            largest first. Name is derived from the most connected entity
+            in each group; modularity is the group's share of the graph's
+            modularity score.
         """
         if len(self._nodes) == 0:
             return []
 
         undirected = self._get_undirected()
-
-        # Handle disconnected graphs by only analyzing largest component
-        if not nx.is_connected(undirected):
-            # Get all connected components
-            components = list(nx.connected_components(undirected))
-            if not components:
-                return []
-            # Use largest component for community detection
-            largest = max(components, key=len)
-            undirected = undirected.subgraph(largest).copy()
-
-        if len(undirected.nodes()) < 2:
-            # Single node or empty - return as one group
-            if len(undirected.nodes()) == 1:
-                node_id = list(undirected.nodes())[0]
-                node = self._nodes.get(node_id)
-                if node:
-                    return [
-                        {
-                            "name": f"{node.label} group",
-                            "entities": [node.label],
-                            "size": 1,
-                            "sample": [node.label],
-                        }
-                    ]
-            return []
-
-        try:
-            communities = nx.community.louvain_communities(undirected, seed=42)
-        except (nx.NetworkXError, ValueError, ZeroDivisionError):
-            # Louvain can fail on graphs with no edges (NetworkXError),
-            # negative weights (ValueError), or empty modularity (ZeroDivisionError)
-            return []
+        communities = self._communities(resolution, seed, workers)
 
         results: list[dict[str, Any]] = []
         for community in communities:
@@ -885,7 +2805,7 @@ class KnowledgeBase:
             best_node = None
             best_degree = -1
 
-            for node_id in community:
+            for node_id in community.node_ids:
                 node = self._nodes.get(node_id)
                 if node:
                     entities.append(node.label)
@@ -906,6 +2826,7 @@ class KnowledgeBase:
                     "entities": entities,
                     "size": len(entities),
                     "sample": entities[:GROUP_SAMPLE_SIZE],
+                    "modularity": community.modularity,
                 }
             )
 
@@ -913,6 +2834,24 @@ class KnowledgeBase:
         results.sort(key=lambda x: x["size"], reverse=True)
         return results
 
+    def _communities(
+        self,
+        resolution: float = DEFAULT_RESOLUTION,
+        seed: int = DEFAULT_SEED,
+        workers: int | None = None,
+    ) -> list[Community]:
+        """Community partition of the whole graph (memoized per generation)."""
+        return self._cached_insight(
+            ("communities", resolution, seed),
+            lambda: detect_communities(
+                self._get_undirected(),
+                self._connected_components(),
+                resolution=resolution,
+                seed=seed,
+                workers=workers,
+            ),
+        )
+
     def find_isolated_topics(self) -> list[dict[str, Any]]:
         """
         Find isolated groups with no connection to the main graph.
@@ -926,15 +2865,11 @@ class KnowledgeBase:
         if len(self._nodes) == 0:
             return []
 
-        undirected = self._get_undirected()
-        components = list(nx.connected_components(undirected))
+        components = self._connected_components()
 
         if len(components) <= 1:
             return []  # No isolated groups
 
-        # Sort by size, largest first
-        components.sort(key=len, reverse=True)
-
         # Skip the main (largest) component, return the rest as "isolated"
         results: list[dict[str, Any]] = []
         for component in components[1:]:  # Skip first (main) component
@@ -958,23 +2893,30 @@ class KnowledgeBase:
 
     def get_mentions(self, entity: str) -> list[dict[str, Any]]:
         """
-        Find where an entity appears in sources.
+        Find where an entity appears in sources, most mentions first.
 
-        Looks at the node's source_ids and cross-references with
-        stored Source objects to provide provenance information.
+        Covers the node's source_ids plus any indexed source whose
+        transcript mentions one of its names. Counts come from the mention
+        index (see index_mentions); a source the node was extracted from
+        counts at least once, including sources that were never indexed.
 
         Args:
             entity: Label of the entity to look up
 
         Returns:
-            List of {source_title, source_type, mention_count}
+            List of {source_id, source_title, source_type, mention_count},
+            sorted by mention_count (descending)
         """
         node = self._find_node_by_label(entity)
         if not node:
             return []
 
-        results: list[dict[str, Any]] = []
+        counts = self.mention_counts(node.id)
         for source_id in node.source_ids:
+            counts[source_id] = max(counts.get(source_id, 0), 1)
+
+        results: list[dict[str, Any]] = []
+        for source_id, count in counts.items():
             source = self._sources.get(source_id)
             if source:
                 results.append(
@@ -982,7 +2924,7 @@ class KnowledgeBase:
                         "source_id": source.id,
                         "source_title": source.title,
                         "source_type": source.source_type.value,
-                        "mention_count": 1,  # Each source_id represents one mention
+                        "mention_count": count,
                     }
                 )
             else:
@@ -992,10 +2934,11 @@ class KnowledgeBase:
                         "source_id": source_id,
                         "source_title": f"Source {source_id}",
                         "source_type": "unknown",
-                        "mention_count": 1,
+                        "mention_count": count,
                     }
                 )
 
+        results.sort(key=lambda r: r["mention_count"], reverse=True)
         return results
 
     def get_evidence(
@@ -1163,6 +3106,385 @@ class KnowledgeBase:
 
         return suggestions[:limit]
 
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # VISUALIZATION
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def graph_view(
+        self,
+        mode: str = "top",
+        max_nodes: int = GRAPH_VIEW_MAX_NODES,
+        focus: str | None = None,
+        hops: int = 2,
+        entity_types: Iterable[str] | None = None,
+        centrality: str = "connections",
+    ) -> dict[str, Any]:
+        """
+        Graph data at a bounded level of detail, in Cytoscape.js format.
+
+        Modes:
+        - "full": every node and edge (max_nodes is ignored)
+        - "top": the max_nodes most central nodes and the edges among them
+        - "ego": nodes within `hops` of `focus`, nearest rings first, up to
+          max_nodes (a ring that doesn't fit keeps its best connected nodes)
+        - "communities": one supernode per community, the max_nodes largest,
+          joined by edges weighted with the relationships between them
+
+        Views are memoized until the graph changes, so repeated requests
+        for an unchanged graph cost a dictionary lookup.
+
+        Args:
+            mode: One of GRAPH_VIEW_MODES
+            max_nodes: Node budget for the view
+            focus: Center node ID (ego mode)
+            hops: Neighborhood depth, 1 to GRAPH_VIEW_MAX_HOPS (ego mode)
+            entity_types: Only include nodes of these types (the ego focus
+                is always included)
+            centrality: "connections", "influence" or "bridging" (top mode)
+
+        Returns:
+            Dict with "nodes" and "edges" element lists and "meta"
+            ({mode, total_nodes, total_edges, truncated}); callers must not
+            mutate it
+
+        Raises:
+            ValueError: For an unknown mode or centrality, hops out of range,
+                or an ego view without a known focus node
+        """
+        if mode not in GRAPH_VIEW_MODES:
+            raise ValueError(f"Unknown graph view mode: {mode}")
+        if centrality not in ("connections", "influence", "bridging"):
+            raise ValueError(f"Unknown centrality method: {centrality}")
+        if mode == "ego":
+            if focus not in self._nodes:
+                raise ValueError(f"Unknown focus node: {focus}")
+            if not 1 <= hops <= GRAPH_VIEW_MAX_HOPS:
+                raise ValueError(f"hops must be between 1 and {GRAPH_VIEW_MAX_HOPS}")
+        else:
+            focus, hops = None, 0
+        if mode != "top":
+            centrality = ""
+        types = frozenset(entity_types) if entity_types else None
+
+        return self._cached_insight(
+            ("graph_view", mode, max_nodes, focus, hops, types, centrality),
+            lambda: self._build_graph_view(
+                mode, max_nodes, focus, hops, types, centrality
+            ),
+        )
+
+    def _build_graph_view(
+        self,
+        mode: str,
+        max_nodes: int,
+        focus: str | None,
+        hops: int,
+        types: frozenset[str] | None,
+        centrality: str,
+    ) -> dict[str, Any]:
+        """Compute a graph_view (arguments already validated)."""
+        nodes = self._nodes
+
+        def included(node_id: str) -> bool:
+            return types is None or nodes[node_id].entity_type in types
+
+        if mode == "communities":
+            return self._community_view(max_nodes, included)
+
+        truncated = False
+        if mode == "ego":
+            selected, truncated = self._ego_node_ids(
+                focus,  # type: ignore[arg-type]
+                hops,
+                max_nodes,
+                included,
+            )
+        else:
+            selected = [node_id for node_id in nodes if included(node_id)]
+            if mode == "top" and len(selected) > max_nodes:
+                # nlargest is stable, so ties keep insertion order
+                if centrality == "connections":
+                    # Edge counts from the adjacency index; no NetworkX needed
+                    selected = heapq.nlargest(max_nodes, selected, key=self.node_degree)
+                else:
+                    scores, _ = self._centrality(centrality)
+                    selected = heapq.nlargest(
+                        max_nodes, selected, key=lambda nid: scores.get(nid, 0.0)
+                    )
+                truncated = True
+
+        # Edges with both endpoints in the view, via the adjacency index
+        selected_set = set(selected)
+        edge_ids: dict[str, None] = {}
+        for node_id in selected:
+            for edge_id in self._node_edges.get(node_id, ()):
+                edge = self._edges[edge_id]
+                if (
+                    edge.source_node_id in selected_set
+                    and edge.target_node_id in selected_set
+                ):
+                    edge_ids[edge_id] = None
+
+        return {
+            "nodes": [self._cytoscape_node(nodes[node_id]) for node_id in selected],
+            "edges": [self._cytoscape_edge(self._edges[eid]) for eid in edge_ids],
+            "meta": {
+                "mode": mode,
+                "total_nodes": len(nodes),
+                "total_edges": len(self._edges),
+                "truncated": truncated,
+            },
+        }
+
+    def _ego_node_ids(
+        self,
+        focus: str,
+        hops: int,
+        max_nodes: int,
+        included: Callable[[str], bool],
+    ) -> tuple[list[str], bool]:
+        """
+        Breadth-first rings around focus, within a node budget.
+
+        Returns:
+            (node IDs nearest first, whether the budget cut the view short)
+        """
+        selected = [focus]
+        seen = {focus}
+        frontier = [focus]
+        for _ in range(hops):
+            ring: list[str] = []
+            for node_id in frontier:
+                for other in self._neighbor_ids(node_id):
+                    if other not in seen and included(other):
+                        seen.add(other)
+                        ring.append(other)
+            room = max_nodes - len(selected)
+            if len(ring) > room:
+                # Keep the best connected part of the ring that doesn't fit
+                selected.extend(heapq.nlargest(room, ring, key=self.node_degree))
+                return selected, True
+            if not ring:
+                break
+            selected.extend(ring)
+            frontier = ring
+        return selected, False
+
+    def _community_view(
+        self, max_nodes: int, included: Callable[[str], bool]
+    ) -> dict[str, Any]:
+        """Collapse each community into a supernode (see graph_view)."""
+        groups: list[tuple[str, list[str]]] = []
+        for community in self._communities():
+            members = [nid for nid in community.node_ids if included(nid)]
+            if members:
+                # Named and keyed after the best connected member, so the
+                # supernode ID is stable while that member leads the group
+                leader = max(members, key=lambda nid: (self.node_degree(nid), nid))
+                groups.append((leader, members))
+        groups.sort(key=lambda group: (-len(group[1]), group[0]))
+        kept = groups[:max_nodes]
+
+        community_of: dict[str, str] = {}
+        supernodes = []
+        for leader, members in kept:
+            supernode_id = f"community:{leader}"
+            for node_id in members:
+                community_of[node_id] = supernode_id
+            supernodes.append(
+                {
+                    "data": {
+                        "id": supernode_id,
+                        "label": f"{self._nodes[leader].label} group",
+                        "type": "Community",
+                        "size": len(members),
+                        "leader": leader,
+                    }
+                }
+            )
+
+        weights: Counter[tuple[str, str]] = Counter()
+        for edge in self._edges.values():
+            source = community_of.get(edge.source_node_id)
+            target = community_of.get(edge.target_node_id)
+            if source and target and source != target:
+                weights[min(source, target), max(source, target)] += 1
+
+        return {
+            "nodes": supernodes,
+            "edges": [
+                {
+                    "data": {
+                        "id": f"{source}|{target}",
+                        "source": source,
+                        "target": target,
+                        "label": f"{weight} relationships",
+                        "weight": weight,
+                    }
+                }
+                for (source, target), weight in weights.items()
+            ],
+            "meta": {
+                "mode": "communities",
+                "total_nodes": len(self._nodes),
+                "total_edges": len(self._edges),
+                "total_communities": len(groups),
+                "truncated": len(groups) > len(kept),
+            },
+        }
+
+    def get_layout(self, wait: bool = False) -> tuple[dict[str, Position], bool]:
+        """
+        Precomputed node positions for visualization, in canvas pixels.
+
+        Layouts run on a background thread and are cached per generation.
+        If the graph changed since the last layout, a relayout is started
+        (unless one is already running) and the last layout is returned,
+        with new nodes placed at the centroid of their neighbors.
+
+        Args:
+            wait: Block until the layout for the current generation is done
+
+        Returns:
+            (positions by node ID, whether they match the current graph);
+            positions are empty until the first layout completes
+        """
+        generation = self._generation
+        with self._layout_lock:
+            if self._layout_generation == generation:
+                return self._layout, True
+            if self._layout_job is None:
+                # Snapshot now: the graph may change while the job runs
+                self._layout_job = submit_layout(
+                    list(self._nodes),
+                    [
+                        (e.source_node_id, e.target_node_id)
+                        for e in self._edges.values()
+                    ],
+                    self._layout,
+                )
+                self._layout_job_generation = generation
+                self._layout_job.add_done_callback(
+                    lambda done: self._finish_layout(generation, done)
+                )
+            job, job_generation = self._layout_job, self._layout_job_generation
+            layout = self._layout
+
+        if wait:
+            # Done-callbacks may run after result() returns; finishing twice
+            # is harmless. Repeat if the graph changed meanwhile
+            job.result()
+            self._finish_layout(job_generation, job)
+            return self.get_layout(wait=True)
+
+        positions = {
+            node_id: layout[node_id] for node_id in self._nodes if node_id in layout
+        }
+        if positions:
+            missing = [node_id for node_id in self._nodes if node_id not in layout]
+            neighbors = {node_id: self._neighbor_ids(node_id) for node_id in missing}
+            positions |= place_missing(missing, neighbors, layout)
+        return positions, False
+
+    def _finish_layout(self, generation: int, job: Future[dict[str, Position]]) -> None:
+        """Store a finished layout unless a newer one is already stored."""
+        with self._layout_lock:
+            if job is self._layout_job:
+                self._layout_job = None
+            if job.exception() is not None or generation <= self._layout_generation:
+                return
+            self._layout = job.result()
+            self._layout_generation = generation
+
+    def _cytoscape_node(self, node: Node) -> dict[str, Any]:
+        """A node as a Cytoscape.js element."""
+        return {
+            "data": {
+                "id": node.id,
+                "label": node.label,
+                "type": node.entity_type,
+                "description": node.description or "",
+                "aliases": node.aliases,
+                "degree": self.node_degree(node.id),
+            }
+        }
+
+    @staticmethod
+    def _cytoscape_edge(edge: Edge) -> dict[str, Any]:
+        """An edge as a Cytoscape.js element, labeled by its first type."""
+        relationship_types = edge.get_relationship_types()
+        primary_label = relationship_types[0] if relationship_types else "related_to"
+        return {
+            "data": {
+                "id": edge.id,
+                "source": edge.source_node_id,
+                "target": edge.target_node_id,
+                "label": primary_label,
+                "relationship_type": primary_label,
+                "relationship_types": relationship_types,
+            }
+        }
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # CHANGE FEED
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    @property
+    def feed_epoch(self) -> str:
+        """
+        Identifier of this in-memory KB's change feed.
+
+        Versions (generations) are only comparable within one epoch; a KB
+        reloaded from disk starts a new epoch at generation 0.
+        """
+        return self._feed_epoch
+
+    def changes_since(
+        self, version: int, epoch: str | None = None
+    ) -> list[dict[str, Any]] | None:
+        """
+        Node and edge changes after a version, for delta sync.
+
+        Repeated changes to one object are coalesced into its latest state:
+        an "upsert" with its current Cytoscape element, or a "delete".
+
+        Args:
+            version: Generation the client last synced to
+            epoch: feed_epoch the version belongs to (None = this one)
+
+        Returns:
+            Changes in the order they last happened, as
+            {"op", "kind", "id"[, "element"]} dicts; None if the client
+            must re-fetch the graph (other epoch, unknown version, or
+            changes it missed were dropped from the feed)
+        """
+        if (
+            (epoch is not None and epoch != self._feed_epoch)
+            or version < self._feed_floor
+            or version > self._generation
+        ):
+            return None
+
+        # Walk back to the client's version; later changes win
+        latest: dict[tuple[str, str], str] = {}
+        for generation, kind, obj_id, op in reversed(self._feed):
+            if generation <= version:
+                break
+            latest.setdefault((kind, obj_id), op)
+
+        changes: list[dict[str, Any]] = []
+        for (kind, obj_id), op in reversed(latest.items()):
+            change: dict[str, Any] = {"op": op, "kind": kind, "id": obj_id}
+            if op == "upsert":
+                if kind == "node" and obj_id in self._nodes:
+                    change["element"] = self._cytoscape_node(self._nodes[obj_id])
+                elif kind == "edge" and obj_id in self._edges:
+                    change["element"] = self._cytoscape_edge(self._edges[obj_id])
+                else:
+                    change["op"] = "delete"
+            changes.append(change)
+        return changes
+
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # ENTITY RESOLUTION
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1208,7 +3530,7 @@ class KnowledgeBase:
         - Aliases (including merged node's label as new alias)
         - Edges (redirected to survivor)
         - Properties (survivor wins on conflict)
-        - Source IDs (combined)
+        - Source IDs and mention spans (combined)
 
         After merge, the merged node is removed from the graph.
 
@@ -1256,71 +3578,60 @@ class KnowledgeBase:
             if key not in survivor.properties:
                 survivor.properties[key] = value
 
-        # 4. Combine source_ids
+        # 4. Combine source_ids and mention spans
         for source_id in merged.source_ids:
             survivor.add_source(source_id)
-
-        # 5. Redirect edges - find all edges involving merged node
-        edges_to_update: list[str] = []
-        edges_to_remove: list[str] = []
-
-        for edge_id, edge in list(self._edges.items()):
-            if edge.source_node_id == merged_id or edge.target_node_id == merged_id:
-                # Determine new source/target
-                new_source = (
-                    survivor_id
-                    if edge.source_node_id == merged_id
-                    else edge.source_node_id
+        for source_id in list(self._node_to_mention_sources.get(merged_id, ())):
+            source = self._sources[source_id]
+            merged_spans = source.mentions.pop(merged_id, None)
+            if merged_spans is not None:
+                source.mentions[survivor_id] = merge_spans(
+                    source.mentions.get(survivor_id, ()), merged_spans
                 )
-                new_target = (
-                    survivor_id
-                    if edge.target_node_id == merged_id
-                    else edge.target_node_id
-                )
-
-                # Skip self-loops that would result from merge
-                if new_source == new_target:
-                    edges_to_remove.append(edge_id)
-                    continue
+            self._record_change("source", source_id)
 
-                # Check if an edge already exists between these nodes
-                existing_edge = self.get_edge_between(new_source, new_target)
-                if existing_edge is not None and existing_edge.id != edge_id:
-                    # Merge relationships into existing edge
-                    for rel in edge.relationships:
-                        existing_edge.add_relationship(rel)
-                    edges_to_remove.append(edge_id)
-                else:
-                    # Update this edge to use survivor
-                    edge.source_node_id = new_source
-                    edge.target_node_id = new_target
-                    edges_to_update.append(edge_id)
+        # 5. Redirect edges - only the merged node's incident edges (O(degree))
+        edges_to_remove: list[str] = []
 
-        # 6. Update NetworkX graph for updated edges
-        for edge_id in edges_to_update:
+        for edge_id in list(self._node_edges.get(merged_id, ())):
             edge = self._edges[edge_id]
-            # Remove old edge from NetworkX (if exists)
-            if self._graph.has_edge(merged_id, edge.target_node_id):
-                self._graph.remove_edge(merged_id, edge.target_node_id)
-            if self._graph.has_edge(edge.source_node_id, merged_id):
-                self._graph.remove_edge(edge.source_node_id, merged_id)
-            # Add/update edge with new endpoints
-            self._graph.add_edge(
-                edge.source_node_id,
-                edge.target_node_id,
-                edge_id=edge.id,
-                relationships=edge.get_relationship_types(),
+            # Determine new source/target
+            new_source = (
+                survivor_id if edge.source_node_id == merged_id else edge.source_node_id
+            )
+            new_target = (
+                survivor_id if edge.target_node_id == merged_id else edge.target_node_id
             )
 
-        # 7. Remove edges that became redundant
+            # Skip self-loops that would result from merge
+            if new_source == new_target:
+                edges_to_remove.append(edge_id)
+                continue
+
+            # Check if an edge already exists between these nodes
+            existing_edge = self.get_edge_between(new_source, new_target)
+            if existing_edge is not None and existing_edge.id != edge_id:
+                # Merge relationships into existing edge
+                for rel in edge.relationships:
+                    existing_edge.add_relationship(rel)
+                self._record_change("edge", existing_edge.id)
+                edges_to_remove.append(edge_id)
+            else:
+                # Update this edge to use survivor (re-index under new endpoints)
+                self._unindex_edge(edge)
+                edge.source_node_id = new_source
+                edge.target_node_id = new_target
+                self._index_edge(edge)
+                self._record_change("edge", edge_id)
+
+        # 6. Remove edges that became redundant
         for edge_id in edges_to_remove:
             if edge_id in self._edges:
                 edge = self._edges.pop(edge_id)
-                # Remove from NetworkX if it exists
-                if self._graph.has_edge(edge.source_node_id, edge.target_node_id):
-                    self._graph.remove_edge(edge.source_node_id, edge.target_node_id)
+                self._unindex_edge(edge)
+                self._record_change("edge", edge_id, "delete")
 
-        # 8. Update label/alias indices
+        # 7. Update label/alias indices
         # Remove merged node's entries
         if merged.label.lower() in self._label_to_id:
             del self._label_to_id[merged.label.lower()]
@@ -1334,16 +3645,19 @@ class KnowledgeBase:
         for alias in new_aliases:
             self._alias_to_id[alias.lower()] = survivor_id
 
-        # 9. Remove merged node from graph and storage
-        if merged_id in self._graph:
-            self._graph.remove_node(merged_id)
-        del self._nodes[merged_id]
+        # Survivor is now also blocked under the merged node's names
+        self._unindex_node_names(merged_id)
+        self._index_node_names(survivor)
 
-        # 10. Update survivor's data in NetworkX
-        self._graph.nodes[survivor_id].update(survivor.model_dump())
+        # 8. Remove merged node from storage
+        del self._nodes[merged_id]
+        self._node_edges.pop(merged_id, None)
+        self._record_change("node", merged_id, "delete")
+        self._record_change("node", survivor_id)
 
-        # Invalidate caches
-        self._invalidate_undirected_cache()
+        # Invalidate caches (NetworkX graph is rebuilt with the merged
+        # topology on next use)
+        self._invalidate_graph()
         self.updated_at = _utc_now()
         survivor.updated_at = _utc_now()
 
@@ -1420,6 +3734,7 @@ class KnowledgeBase:
         self,
         node: Node,
         config: ResolutionConfig | None = None,
+        min_shared_ngrams: int = 2,
     ) -> list[ResolutionCandidate]:
         """
         Find resolution candidates for a single node against existing nodes.
@@ -1427,9 +3742,14 @@ class KnowledgeBase:
         Useful for checking if a newly extracted entity is a duplicate
         of an existing node before adding it to the graph.
 
+        Only nodes returned by the blocking index (shared label/alias
+        trigrams or normalized key) are scored, so the cost scales with
+        the number of plausible matches rather than the size of the KB.
+
         Args:
             node: The node to find candidates for
             config: Optional ResolutionConfig. Uses defaults if not provided.
+            min_shared_ngrams: Minimum shared trigrams for a node to be scored
 
         Returns:
             List of ResolutionCandidate objects sorted by confidence (desc)
@@ -1440,23 +3760,16 @@ class KnowledgeBase:
             config = ResolutionConfig()
 
         matcher = EntityMatcher(config)
-        candidates: list[ResolutionCandidate] = []
-
-        for existing in self._nodes.values():
-            # Skip comparing with itself
-            if existing.id == node.id:
-                continue
-
-            confidence, signals = matcher.compute_similarity(node, existing, kb=self)
-
-            if confidence >= config.review_threshold:
-                candidate = ResolutionCandidate(
-                    node_a_id=node.id,
-                    node_b_id=existing.id,
-                    confidence=confidence,
-                    signals=signals,
-                )
-                candidates.append(candidate)
+        nodes = [node] + [
+            self._nodes[existing_id]
+            for existing_id in self._blocked_candidate_ids(
+                node, min_shared_ngrams, max_block_size=config.max_block_size
+            )
+        ]
+        pairs = [(0, i) for i in range(1, len(nodes))]
+        candidates = matcher.candidates_from_pairs(
+            nodes, pairs, kb=self, min_confidence=config.review_threshold
+        )
 
         # Sort by confidence descending
         candidates.sort(key=lambda c: c.confidence, reverse=True)
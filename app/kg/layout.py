@@ -0,0 +1,347 @@
+"""
+Server-side force-directed layout for graph visualization.
+
+Computes Fruchterman-Reingold style positions with NumPy/SciPy so clients
+can render a precomputed layout instead of simulating one in the browser.
+
+Design Decisions:
+- Attraction runs over the sparse edge list (O(E) per iteration); repulsion
+  is measured against a random sample of REPULSION_SAMPLE_SIZE nodes per
+  iteration and scaled up, so an iteration costs O(V * sample + E) rather
+  than O(V^2). Graphs no larger than the sample use exact repulsion
+- Random state is seeded, so the same graph always gets the same layout
+- Incremental updates: nodes without a previous position start at the
+  centroid of their placed neighbors and only they move, so the rest of
+  the picture stays where users last saw it
+- Simulation runs in the unit square; results are canvas pixels, on a
+  canvas that grows with the square root of the node count
+- Layouts run on a single background thread (submit_layout) so requests
+  never wait for them
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import scipy.sparse as sp  # type: ignore[import-untyped]
+from scipy.spatial import cKDTree  # type: ignore[import-untyped]
+
+LAYOUT_SEED = 42
+LAYOUT_ITERATIONS = 100  # Full layout
+INCREMENTAL_ITERATIONS = 30  # Placing new nodes around a fixed layout
+REPULSION_SAMPLE_SIZE = 256  # Nodes each node is repelled by per iteration
+# Above this share of new nodes, lay the whole graph out again
+INCREMENTAL_MAX_NEW_FRACTION = 0.25
+# Canvas pixels per unit of layout, per square root of the node count
+CANVAS_SPACING = 80.0
+
+# Rows of the repulsion matrix computed at once (bounds temporary memory)
+_CHUNK_ROWS = 4096
+
+_GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+Position = tuple[float, float]
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kg-layout")
+
+
+def force_layout(
+    num_nodes: int,
+    edges: np.ndarray,
+    initial: np.ndarray | None = None,
+    movable: np.ndarray | None = None,
+    iterations: int = LAYOUT_ITERATIONS,
+    seed: int = LAYOUT_SEED,
+    sample_size: int = REPULSION_SAMPLE_SIZE,
+    temperature: float = 0.1,
+    cutoff: float | None = None,
+) -> np.ndarray:
+    """
+    Force-directed positions, simulated in the unit square.
+
+    Args:
+        num_nodes: Number of nodes (indexed 0..num_nodes-1)
+        edges: (E, 2) integer array of node index pairs (direction ignored)
+        initial: (V, 2) starting positions (random if None)
+        movable: Boolean mask of nodes allowed to move (all if None)
+        iterations: Cooling steps to run
+        seed: Random seed for starting positions and repulsion samples
+        sample_size: Nodes sampled for repulsion in each iteration
+        temperature: Largest step a node may take; cools linearly to zero
+        cutoff: Only repel nodes closer than this, exactly (for placing a
+            few movable nodes); otherwise repulsion is global and sampled
+
+    Returns:
+        (V, 2) float array of positions
+    """
+    rng = np.random.default_rng(seed)
+    if initial is None:
+        pos = rng.random((num_nodes, 2))
+    else:
+        pos = np.array(initial, dtype=float)
+    if num_nodes < 2:
+        return pos
+
+    # Symmetric, deduplicated adjacency; attraction uses each pair once
+    adjacency = sp.coo_matrix(
+        (np.ones(len(edges)), (edges[:, 0], edges[:, 1])),
+        shape=(num_nodes, num_nodes),
+    )
+    adjacency = sp.triu((adjacency + adjacency.T).tocsr(), k=1).tocoo()
+    sources, targets = adjacency.row, adjacency.col
+
+    k = 1.0 / math.sqrt(num_nodes)  # Ideal edge length
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        displacement = np.zeros_like(pos)
+
+        if cutoff is not None:
+            _add_local_repulsion(displacement, pos, movable, k, cutoff)
+        else:
+            _add_sampled_repulsion(displacement, pos, k, rng, sample_size)
+
+        # Attraction d^2 / k along every edge
+        if len(sources):
+            delta = pos[sources] - pos[targets]
+            pull = delta * (np.sqrt((delta**2).sum(axis=1)) / k)[:, None]
+            for axis in range(2):
+                displacement[:, axis] -= np.bincount(
+                    sources, weights=pull[:, axis], minlength=num_nodes
+                )
+                displacement[:, axis] += np.bincount(
+                    targets, weights=pull[:, axis], minlength=num_nodes
+                )
+
+        if movable is not None:
+            displacement[~movable] = 0.0
+        # Move each node at most `temperature` along its displacement
+        length = np.maximum(np.sqrt((displacement**2).sum(axis=1)), 1e-9)
+        pos += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    return pos
+
+
+def _add_sampled_repulsion(
+    displacement: np.ndarray,
+    pos: np.ndarray,
+    k: float,
+    rng: np.random.Generator,
+    sample_size: int,
+) -> None:
+    """Add repulsion k^2 / d from every node (or a sample, scaled up)."""
+    num_nodes = len(pos)
+    if num_nodes <= sample_size:
+        others = pos
+        scale = 1.0
+    else:
+        others = pos[rng.choice(num_nodes, sample_size, replace=False)]
+        scale = num_nodes / sample_size
+    # sum_j (p_i - p_j) w_ij = p_i * sum_j w_ij - W @ p, with squared
+    # distances from matrix products rather than pairwise differences
+    others_sq = (others**2).sum(axis=1)
+    for start in range(0, num_nodes, _CHUNK_ROWS):
+        rows = pos[start : start + _CHUNK_ROWS]
+        dist_sq = (rows**2).sum(axis=1)[:, None] + others_sq - 2 * rows @ others.T
+        weights = (k * k) / np.maximum(dist_sq, 1e-6)
+        displacement[start : start + _CHUNK_ROWS] += scale * (
+            rows * weights.sum(axis=1)[:, None] - weights @ others
+        )
+
+
+def _add_local_repulsion(
+    displacement: np.ndarray,
+    pos: np.ndarray,
+    movable: np.ndarray | None,
+    k: float,
+    cutoff: float,
+) -> None:
+    """Add exact repulsion k^2 / d between movable nodes and any node within cutoff."""
+    active = np.arange(len(pos)) if movable is None else np.flatnonzero(movable)
+    near = cKDTree(pos[active]).sparse_distance_matrix(
+        cKDTree(pos), cutoff, output_type="coo_matrix"
+    )
+    rows, cols, dist = active[near.row], near.col, near.data
+    apart = dist > 0
+    rows, cols, dist = rows[apart], cols[apart], dist[apart]
+    push = (pos[rows] - pos[cols]) * ((k * k) / dist**2)[:, None]
+    for axis in range(2):
+        displacement[:, axis] += np.bincount(
+            rows, weights=push[:, axis], minlength=len(pos)
+        )
+
+
+def layout_graph(
+    node_ids: list[str],
+    edges: Iterable[tuple[str, str]],
+    previous: dict[str, Position] | None = None,
+    seed: int = LAYOUT_SEED,
+) -> dict[str, Position]:
+    """
+    Lay out a graph in canvas pixels, reusing a previous layout if possible.
+
+    When at most INCREMENTAL_MAX_NEW_FRACTION of the nodes are new, they are
+    seeded next to their placed neighbors and moved around the previous
+    positions, which are kept exactly. Otherwise the whole graph is laid
+    out again, starting from the previous positions.
+
+    Args:
+        node_ids: Nodes to place
+        edges: (source, target) node ID pairs; unknown IDs are ignored
+        previous: Earlier positions by node ID (from this function)
+        seed: Random seed
+
+    Returns:
+        Positions by node ID, centered on the origin
+    """
+    if not node_ids:
+        return {}
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    pairs = np.array(
+        [(index[u], index[v]) for u, v in edges if u in index and v in index],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+
+    # Simulate in the unit square: map previous positions into it by their
+    # bounding box, and results back the same way
+    previous = {n: p for n, p in (previous or {}).items() if n in index}
+    placed = np.array([node_id in previous for node_id in node_ids])
+    rng = np.random.default_rng(seed)
+    initial = rng.random((len(node_ids), 2))
+    low, extent = np.zeros(2), 1.0
+    if previous:
+        prev = np.array(list(previous.values()))
+        low = prev.min(axis=0)
+        extent = max(float((prev.max(axis=0) - low).max()), 1e-9)
+        rows = [index[node_id] for node_id in previous]
+        initial[rows] = (prev - low) / extent
+
+    new_count = int((~placed).sum())
+    if previous and new_count <= INCREMENTAL_MAX_NEW_FRACTION * len(node_ids):
+        if new_count == 0:
+            return {node_id: previous[node_id] for node_id in node_ids}
+        _seed_near_neighbors(initial, placed, pairs, rng, len(node_ids))
+        # Move only the new nodes, in small steps and repelled only by
+        # nearby nodes, so they settle next to their neighbors
+        k = 1.0 / math.sqrt(len(node_ids))
+        unit = force_layout(
+            len(node_ids),
+            pairs,
+            initial=initial,
+            movable=~placed,
+            iterations=INCREMENTAL_ITERATIONS,
+            seed=seed,
+            temperature=k,
+            cutoff=2 * k,
+        )
+        canvas = unit * extent + low
+    else:
+        unit = _fit_unit_square(
+            force_layout(len(node_ids), pairs, initial=initial, seed=seed)
+        )
+        # The canvas grows with sqrt(V), keeping density roughly constant
+        canvas = (unit - 0.5) * (CANVAS_SPACING * math.sqrt(len(node_ids)))
+        previous = {}
+
+    positions = {
+        node_id: (round(float(x), 1), round(float(y), 1))
+        for node_id, (x, y) in zip(node_ids, canvas)
+    }
+    # Keep placed nodes exactly where they were
+    positions.update(previous)
+    return positions
+
+
+def _fit_unit_square(pos: np.ndarray) -> np.ndarray:
+    """Shift and uniformly scale positions to fill the unit square."""
+    low = pos.min(axis=0)
+    extent = float((pos.max(axis=0) - low).max())
+    if extent == 0.0:
+        return np.full_like(pos, 0.5)
+    fitted: np.ndarray = (pos - low) / extent
+    # Center the shorter side
+    fitted += (1.0 - fitted.max(axis=0)) / 2
+    return fitted
+
+
+def _seed_near_neighbors(
+    pos: np.ndarray,
+    placed: np.ndarray,
+    pairs: np.ndarray,
+    rng: np.random.Generator,
+    num_nodes: int,
+) -> None:
+    """Move unplaced nodes to the centroid of their placed neighbors, in place."""
+    if not len(pairs):
+        return
+    both = np.concatenate([pairs, pairs[:, ::-1]])
+    # Links from an unplaced node to a placed neighbor
+    links = both[~placed[both[:, 0]] & placed[both[:, 1]]]
+    counts = np.bincount(links[:, 0], minlength=num_nodes)
+    seeded = counts > 0
+    for axis in range(2):
+        sums = np.bincount(
+            links[:, 0], weights=pos[links[:, 1], axis], minlength=num_nodes
+        )
+        pos[seeded, axis] = sums[seeded] / counts[seeded]
+    # Jitter so nodes sharing neighbors don't start on top of each other
+    pos[seeded] += rng.normal(scale=0.1 / math.sqrt(num_nodes), size=(seeded.sum(), 2))
+
+
+def place_missing(
+    node_ids: Iterable[str],
+    neighbors: dict[str, list[str]],
+    positions: dict[str, Position],
+) -> dict[str, Position]:
+    """
+    Provisional positions for nodes a layout doesn't cover yet.
+
+    Each missing node goes next to the centroid of its placed neighbors
+    (offset on a spiral, so nodes sharing neighbors don't overlap); nodes
+    with none are left out.
+
+    Args:
+        node_ids: Nodes that need a position
+        neighbors: Neighbor IDs of each missing node
+        positions: Existing positions by node ID
+
+    Returns:
+        Positions for the nodes that could be placed
+    """
+    placed: dict[str, Position] = {}
+    for node_id in node_ids:
+        anchors = [positions[n] for n in neighbors.get(node_id, ()) if n in positions]
+        if anchors:
+            turn = len(placed) * _GOLDEN_ANGLE
+            radius = CANVAS_SPACING * (0.5 + 0.05 * len(placed))
+            placed[node_id] = (
+                round(
+                    sum(x for x, _ in anchors) / len(anchors) + radius * math.cos(turn),
+                    1,
+                ),
+                round(
+                    sum(y for _, y in anchors) / len(anchors) + radius * math.sin(turn),
+                    1,
+                ),
+            )
+    return placed
+
+
+def submit_layout(
+    node_ids: list[str],
+    edges: list[tuple[str, str]],
+    previous: dict[str, Position] | None = None,
+) -> Future[dict[str, Position]]:
+    """
+    Run layout_graph on the background layout thread.
+
+    Callers must pass snapshots (not live views) of the graph, since the
+    graph may change while the layout runs.
+
+    Returns:
+        Future resolving to positions by node ID
+    """
+    return _executor.submit(layout_graph, node_ids, edges, previous)
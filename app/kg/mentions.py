@@ -0,0 +1,235 @@
+"""
+Entity mention index: where each node's label and aliases occur in a source.
+
+Transcripts are scanned once, at extraction time, with an Aho-Corasick
+automaton over every label and alias in the knowledge base, so finding all
+mentions of all entities costs one pass over the text regardless of how
+many entities there are. The resulting spans are stored on the Source and
+evidence lookups read only a small window around each span from disk.
+
+Design Decisions:
+- Spans are UTF-8 byte offsets into the transcript file as stored (read in
+  binary, no newline translation), so a lookup can seek straight to them
+- Matching is case-insensitive and whole-word: a match must not be preceded
+  or followed by a letter or digit
+- Case folding is done one character at a time (keeping characters whose
+  lowercase form is longer), so offsets in the folded text equal offsets
+  in the original
+- Per node, overlapping matches keep the leftmost-longest one, so
+  "Sidney Gottlieb" counts once rather than also as "Gottlieb"
+- Names shorter than MIN_PATTERN_LENGTH are not indexed
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+
+MIN_PATTERN_LENGTH = 2
+CONTEXT_BEFORE_BYTES = 100  # Evidence excerpt context around a mention
+CONTEXT_AFTER_BYTES = 400
+
+Span = tuple[int, int]  # (start, end) byte offsets, end exclusive
+
+
+def _fold(text: str) -> str:
+    """Lowercase text without changing its length."""
+    if text.isascii():
+        return text.lower()
+    return "".join(
+        lowered if len(lowered := char.lower()) == 1 else char for char in text
+    )
+
+
+class MentionMatcher:
+    """
+    Aho-Corasick automaton mapping names to the IDs of nodes they belong to.
+
+    Build once over all (name, node ID) pairs, then call find() per text.
+    """
+
+    def __init__(self, names: Iterable[tuple[str, str]]) -> None:
+        """
+        Build the automaton.
+
+        Args:
+            names: (label or alias, node ID) pairs; a name may belong to
+                several nodes
+        """
+        # Trie as parallel lists: goto transitions, failure links, and the
+        # (node IDs, pattern length) emitted when a state is reached
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[str, int]]] = [[]]
+
+        for name, node_id in names:
+            pattern = _fold(name.strip())
+            if len(pattern) < MIN_PATTERN_LENGTH:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            if (node_id, len(pattern)) not in self._out[state]:
+                self._out[state].append((node_id, len(pattern)))
+
+        # Breadth-first failure links; each state also emits its failure
+        # state's outputs (suffix patterns)
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child].extend(self._out[self._fail[child]])
+
+    def find(self, text: str) -> dict[str, list[Span]]:
+        """
+        Find all whole-word mentions of every node in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Node ID -> sorted, non-overlapping (start, end) character spans
+        """
+        folded = _fold(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        found: dict[str, list[Span]] = {}
+
+        state = 0
+        for index, char in enumerate(folded):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not out[state]:
+                continue
+            end = index + 1
+            if end < len(text) and text[end].isalnum():
+                continue
+            for node_id, length in out[state]:
+                start = end - length
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                found.setdefault(node_id, []).append((start, end))
+
+        return {node_id: _leftmost_longest(spans) for node_id, spans in found.items()}
+
+
+def _leftmost_longest(spans: list[Span]) -> list[Span]:
+    """Drop spans overlapping an earlier (or, at the same start, longer) one."""
+    kept: list[Span] = []
+    for start, end in sorted(spans, key=lambda span: (span[0], -span[1])):
+        if kept and start < kept[-1][1]:
+            continue
+        kept.append((start, end))
+    return kept
+
+
+def merge_spans(first: Iterable[Span], second: Iterable[Span]) -> list[Span]:
+    """
+    Combine two nodes' spans in the same source (after a merge).
+
+    Args:
+        first: Spans of one node
+        second: Spans of the other
+
+    Returns:
+        Sorted, non-overlapping union of both
+    """
+    return _leftmost_longest([*first, *second])
+
+
+def to_byte_spans(text: str, spans: dict[str, list[Span]]) -> dict[str, list[Span]]:
+    """
+    Convert character spans to UTF-8 byte spans of the same text.
+
+    Args:
+        text: Text the spans index into
+        spans: Node ID -> character spans
+
+    Returns:
+        Node ID -> byte spans, in the same order
+    """
+    if text.isascii():
+        return spans
+
+    offsets = sorted(
+        {offset for node_spans in spans.values() for s in node_spans for offset in s}
+    )
+    byte_offset: dict[int, int] = {}
+    position = 0
+    size = 0
+    for offset in offsets:
+        size += len(text[position:offset].encode("utf-8", "surrogateescape"))
+        position = offset
+        byte_offset[offset] = size
+
+    return {
+        node_id: [(byte_offset[start], byte_offset[end]) for start, end in node_spans]
+        for node_id, node_spans in spans.items()
+    }
+
+
+def read_transcript_text(path: Path) -> str:
+    """
+    Read a transcript exactly as stored, for indexing.
+
+    Args:
+        path: Transcript file
+
+    Returns:
+        File contents decoded as UTF-8, line endings untouched and invalid
+        bytes kept as surrogate escapes, so offsets match the bytes on disk
+    """
+    return path.read_bytes().decode("utf-8", errors="surrogateescape")
+
+
+def read_excerpt(
+    path: Path,
+    span: Span,
+    before: int = CONTEXT_BEFORE_BYTES,
+    after: int = CONTEXT_AFTER_BYTES,
+) -> str | None:
+    """
+    Read the text around one mention without loading the whole file.
+
+    Args:
+        path: Transcript file
+        span: (start, end) byte span of the mention
+        before: Bytes of context to include before the mention
+        after: Bytes of context to include from the start of the mention
+
+    Returns:
+        Excerpt, with "..." where it was cut, or None if the file is missing
+        or shorter than the span (it changed since it was indexed)
+    """
+    start = max(0, span[0] - before)
+    try:
+        with path.open("rb") as handle:
+            size = handle.seek(0, 2)
+            if span[1] > size:
+                return None
+            handle.seek(start)
+            chunk = handle.read(span[0] + after - start)
+    except OSError:
+        return None
+
+    # Cut points may fall inside a multi-byte character; drop the fragments
+    excerpt = chunk.decode("utf-8", errors="ignore")
+    if start > 0:
+        excerpt = "..." + excerpt
+    if start + len(chunk) < size:
+        excerpt += "..."
+    return excerpt
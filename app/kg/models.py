@@ -56,6 +56,8 @@ class Source(BaseModel):
         url: Optional URL or file path to the source
         metadata: Flexible key-value storage for source-specific data
         processed_at: When this source was processed for extraction
+        mentions: Node ID -> (start, end) byte spans where the node's label
+            or an alias occurs in the source transcript (see mentions.py)
     """
 
     id: str = Field(default_factory=_generate_id)
@@ -64,6 +66,7 @@ class Source(BaseModel):
     url: str | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
     processed_at: datetime = Field(default_factory=_utc_now)
+    mentions: dict[str, list[tuple[int, int]]] = Field(default_factory=dict)
 
 
 class RelationshipDetail(BaseModel):
@@ -57,7 +57,7 @@ def normalize_entity_name(name: str) -> str:
     return text
 
 
-def generate_ngrams(text: str, n: int = 3) -> set[str]:
+def generate_ngrams(text: str, n: int = 3, normalized: bool = False) -> set[str]:
     """
     Generate character n-grams for blocking.
 
@@ -67,6 +67,8 @@ def generate_ngrams(text: str, n: int = 3) -> set[str]:
     Args:
         text: The text to generate n-grams from.
         n: The size of each n-gram (default: 3 for trigrams).
+        normalized: True if text is already normalize_entity_name() output
+            (skips normalizing it again).
 
     Returns:
         Set of n-gram strings.
@@ -79,13 +81,14 @@ def generate_ngrams(text: str, n: int = 3) -> set[str]:
         >>> generate_ngrams("")
         set()
     """
-    normalized = normalize_entity_name(text)
-    if len(normalized) < n:
-        return {normalized} if normalized else set()
-    return {normalized[i : i + n] for i in range(len(normalized) - n + 1)}
+    if not normalized:
+        text = normalize_entity_name(text)
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
 
 
-def normalize_for_index(name: str) -> str:
+def normalize_for_index(name: str, normalized: bool = False) -> str:
     """
     Normalize name for index lookup (more aggressive).
 
@@ -94,6 +97,8 @@ def normalize_for_index(name: str) -> str:
 
     Args:
         name: The name to normalize for indexing.
+        normalized: True if name is already normalize_entity_name() output
+            (skips normalizing it again).
 
     Returns:
         Normalized key suitable for index lookup.
@@ -106,6 +111,7 @@ def normalize_for_index(name: str) -> str:
         >>> normalize_for_index("Dr. Jane Doe")
         'drjanedoe'
     """
-    normalized = normalize_entity_name(name)
+    if not normalized:
+        name = normalize_entity_name(name)
     # Remove spaces and remaining punctuation for index key
-    return re.sub(r"[\s\-'.,:;!?\"()[\]{}]", "", normalized)
+    return re.sub(r"[\s\-'.,:;!?\"()[\]{}]", "", name)
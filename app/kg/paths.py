@@ -0,0 +1,237 @@
+"""
+Bounded k-shortest simple path enumeration.
+
+Lazily yields simple paths between two nodes in order of increasing length
+(Yen's algorithm), finding each shortest path with a depth-limited
+bidirectional BFS. Callers pull only as many paths as they need, so dense
+hubs never force enumerating every simple path up to the cutoff.
+
+Design Decisions:
+- Graph access goes through successor/predecessor callables, so callers can
+  apply relationship-type and entity-type filters (or treat a directed graph
+  as undirected) without building a filtered copy
+- Every node expansion is charged to a PathBudget; when its expansion or
+  time limit runs out the generator stops and the budget is marked
+  exhausted, so callers can tell "no more paths" from "gave up"
+- Ties between equal-length paths break by discovery order, which follows
+  the adjacency order of the graph (deterministic for a given graph)
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+
+# Per-query defaults: node expansions and wall-clock seconds
+DEFAULT_MAX_EXPANSIONS = 50_000
+DEFAULT_TIME_BUDGET_SECONDS = 2.0
+
+Neighbors = Callable[[str], Iterable[str]]
+
+
+@dataclass
+class PathBudget:
+    """
+    Expansion and time budget for one path query.
+
+    Attributes:
+        max_expansions: Maximum node expansions across all searches
+        time_limit: Maximum wall-clock seconds, or None for no limit
+        expansions: Node expansions spent so far
+        exhausted: True once either limit was hit
+    """
+
+    max_expansions: int = DEFAULT_MAX_EXPANSIONS
+    time_limit: float | None = DEFAULT_TIME_BUDGET_SECONDS
+    expansions: int = 0
+    exhausted: bool = False
+    _deadline: float | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.time_limit is not None:
+            self._deadline = time.monotonic() + self.time_limit
+
+    def spend(self) -> bool:
+        """
+        Charge one node expansion.
+
+        Returns:
+            False (and marks the budget exhausted) if no budget is left
+        """
+        if self.exhausted:
+            return False
+        self.expansions += 1
+        if self.expansions > self.max_expansions or (
+            self._deadline is not None and time.monotonic() >= self._deadline
+        ):
+            self.exhausted = True
+            return False
+        return True
+
+
+def _join_path(
+    meet: str,
+    pred: dict[str, str | None],
+    succ: dict[str, str | None],
+) -> list[str]:
+    """Join the forward and backward BFS trees at their meeting node."""
+    path: list[str] = []
+    node: str | None = meet
+    while node is not None:
+        path.append(node)
+        node = pred[node]
+    path.reverse()
+    node = succ[meet]
+    while node is not None:
+        path.append(node)
+        node = succ[node]
+    return path
+
+
+def bidirectional_shortest_path(
+    source: str,
+    target: str,
+    successors: Neighbors,
+    predecessors: Neighbors,
+    max_length: int,
+    budget: PathBudget,
+    ignore_nodes: set[str] | None = None,
+    ignore_edges: set[tuple[str, str]] | None = None,
+) -> list[str] | None:
+    """
+    Find one shortest path with a depth-limited bidirectional BFS.
+
+    Expands the smaller frontier one level at a time from each end.
+
+    Args:
+        source: Start node
+        target: End node
+        successors: Outgoing neighbors of a node
+        predecessors: Incoming neighbors of a node
+        max_length: Maximum path length in edges
+        budget: Budget charged one unit per node expanded
+        ignore_nodes: Nodes the path may not visit
+        ignore_edges: (u, v) edges the path may not use
+
+    Returns:
+        Node IDs from source to target, or None if there is no path within
+        max_length (or the budget ran out)
+    """
+    ignore_nodes = ignore_nodes or set()
+    ignore_edges = ignore_edges or set()
+    if source in ignore_nodes or target in ignore_nodes:
+        return None
+    if source == target:
+        return [source]
+
+    pred: dict[str, str | None] = {source: None}
+    succ: dict[str, str | None] = {target: None}
+    forward = [source]
+    backward = [target]
+    depth = 0
+    while forward and backward and depth < max_length:
+        depth += 1
+        frontier: list[str] = []
+        if len(forward) <= len(backward):
+            for v in forward:
+                if not budget.spend():
+                    return None
+                for w in successors(v):
+                    if w in ignore_nodes or (v, w) in ignore_edges:
+                        continue
+                    if w not in pred:
+                        pred[w] = v
+                        frontier.append(w)
+                    if w in succ:
+                        return _join_path(w, pred, succ)
+            forward = frontier
+        else:
+            for v in backward:
+                if not budget.spend():
+                    return None
+                for w in predecessors(v):
+                    if w in ignore_nodes or (w, v) in ignore_edges:
+                        continue
+                    if w not in succ:
+                        succ[w] = v
+                        frontier.append(w)
+                    if w in pred:
+                        return _join_path(w, pred, succ)
+            backward = frontier
+    return None
+
+
+def iter_shortest_paths(
+    source: str,
+    target: str,
+    successors: Neighbors,
+    predecessors: Neighbors,
+    max_length: int,
+    budget: PathBudget,
+    directed: bool = True,
+) -> Iterator[list[str]]:
+    """
+    Yield simple paths from source to target, shortest first (Yen's algorithm).
+
+    Args:
+        source: Start node
+        target: End node
+        successors: Outgoing neighbors of a node (already filtered)
+        predecessors: Incoming neighbors of a node (already filtered)
+        max_length: Maximum path length in edges
+        budget: Shared budget; the generator stops when it runs out
+        directed: False if successors/predecessors describe an undirected
+            graph (removing a path edge then removes both orientations)
+
+    Yields:
+        Paths as lists of node IDs, in non-decreasing length
+    """
+    first = bidirectional_shortest_path(
+        source, target, successors, predecessors, max_length, budget
+    )
+    if first is None:
+        return
+    yield first
+
+    accepted = [first]
+    seen = {tuple(first)}
+    candidates: list[tuple[int, int, list[str]]] = []
+    order = itertools.count()
+    while True:
+        last = accepted[-1]
+        for i in range(len(last) - 1):
+            root = last[: i + 1]
+            ignore_edges: set[tuple[str, str]] = set()
+            for path in accepted:
+                if len(path) > i + 1 and path[: i + 1] == root:
+                    ignore_edges.add((path[i], path[i + 1]))
+                    if not directed:
+                        ignore_edges.add((path[i + 1], path[i]))
+            spur = bidirectional_shortest_path(
+                last[i],
+                target,
+                successors,
+                predecessors,
+                max_length - i,
+                budget,
+                ignore_nodes=set(root[:-1]),
+                ignore_edges=ignore_edges,
+            )
+            if budget.exhausted:
+                return
+            if spur is None:
+                continue
+            candidate = root[:-1] + spur
+            key = tuple(candidate)
+            if key not in seen:
+                seen.add(key)
+                heapq.heappush(candidates, (len(candidate), next(order), candidate))
+
+        if not candidates:
+            return
+        _, _, path = heapq.heappop(candidates)
+        accepted.append(path)
+        yield path
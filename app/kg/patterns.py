@@ -0,0 +1,238 @@
+"""
+Typed graph patterns: a small Cypher-like syntax for path queries.
+
+A pattern is a chain of node patterns joined by relationship patterns:
+
+    (:Person)-[worked_for]->(:Organization)
+    (p:Person {label: "Sidney Gottlieb"})-[worked_for|funded_by]->(o)
+    (:Person)<-[employed]-(:Organization)--(:Location {country: "USA"})
+
+Node patterns take an optional variable, entity types (":A|B") and property
+filters ("{key: value, ...}"). Relationship patterns take optional types
+between brackets ("-[a|b]->") and a direction: "->", "<-" or undirected
+("-[...]-", "--"). The pattern is parsed here and matched by
+KnowledgeBase.match_pattern.
+
+Design Decisions:
+- Parsing is a hand-written scanner over a handful of token regexes; the
+  grammar is small enough that a parser generator would add more than it
+  saves
+- Property values are JSON-style literals (quoted strings, numbers, true,
+  false, null); the "label" key matches the node's label or any alias,
+  case-insensitively, all other keys compare to Node.properties exactly
+- A variable repeated in a pattern means the same node, so
+  "(a)-->(b)-->(a)" finds round trips
+- Syntax errors raise ValueError with the offending position
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Literal, NoReturn
+
+Direction = Literal["out", "in", "any"]
+
+MAX_PATTERN_HOPS = 4
+
+_WHITESPACE = re.compile(r"\s*")
+_NAME = re.compile(r"`([^`]+)`|([\w.-]+)")
+_VALUE = re.compile(
+    r'"(?:[^"\\]|\\.)*"'
+    r"|'(?:[^'\\]|\\.)*'"
+    r"|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?"
+    r"|true|false|null"
+)
+
+
+@dataclass(frozen=True)
+class NodePattern:
+    """
+    Constraints on one node of a pattern.
+
+    Attributes:
+        variable: Optional name; repeated names must bind the same node
+        entity_types: Accepted entity types (empty: any)
+        properties: Property filters ("label" matches label or aliases)
+    """
+
+    variable: str | None = None
+    entity_types: tuple[str, ...] = ()
+    properties: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class RelationshipPattern:
+    """
+    Constraints on one hop of a pattern.
+
+    Attributes:
+        relationship_types: Accepted relationship types (empty: any)
+        direction: "out" (left to right), "in" (right to left) or "any"
+    """
+
+    relationship_types: tuple[str, ...] = ()
+    direction: Direction = "out"
+
+
+@dataclass(frozen=True)
+class GraphPattern:
+    """
+    A parsed pattern: len(nodes) == len(relationships) + 1.
+
+    Attributes:
+        nodes: Node patterns, left to right
+        relationships: Relationship patterns between consecutive nodes
+    """
+
+    nodes: tuple[NodePattern, ...]
+    relationships: tuple[RelationshipPattern, ...] = ()
+
+    def reversed(self) -> GraphPattern:
+        """The same pattern read right to left (directions flipped)."""
+        flipped: dict[Direction, Direction] = {"out": "in", "in": "out", "any": "any"}
+        return GraphPattern(
+            nodes=self.nodes[::-1],
+            relationships=tuple(
+                RelationshipPattern(rel.relationship_types, flipped[rel.direction])
+                for rel in self.relationships[::-1]
+            ),
+        )
+
+
+class _Scanner:
+    """Cursor over pattern text with small token helpers."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+
+    def skip_space(self) -> None:
+        match = _WHITESPACE.match(self.text, self.pos)
+        self.pos = match.end() if match else self.pos
+
+    def at_end(self) -> bool:
+        self.skip_space()
+        return self.pos >= len(self.text)
+
+    def peek(self, token: str) -> bool:
+        self.skip_space()
+        return self.text.startswith(token, self.pos)
+
+    def accept(self, token: str) -> bool:
+        if self.peek(token):
+            self.pos += len(token)
+            return True
+        return False
+
+    def expect(self, token: str) -> None:
+        if not self.accept(token):
+            self.fail(f"expected {token!r}")
+
+    def name(self) -> str | None:
+        self.skip_space()
+        match = _NAME.match(self.text, self.pos)
+        if not match:
+            return None
+        self.pos = match.end()
+        return match.group(1) or match.group(2)
+
+    def names(self) -> tuple[str, ...]:
+        """One or more names separated by "|"."""
+        names: list[str] = []
+        while True:
+            name = self.name()
+            if name is None:
+                self.fail("expected a type name")
+            names.append(name)
+            if not self.accept("|"):
+                return tuple(names)
+            self.accept(":")  # Cypher-style "a|:b"
+
+    def value(self) -> Any:
+        self.skip_space()
+        match = _VALUE.match(self.text, self.pos)
+        if not match:
+            self.fail("expected a string, number, true, false or null")
+        self.pos = match.end()
+        literal = match.group(0)
+        if literal.startswith("'"):
+            literal = '"' + literal[1:-1].replace('"', '\\"') + '"'
+        return json.loads(literal)
+
+    def fail(self, message: str) -> NoReturn:
+        raise ValueError(f"Invalid pattern at position {self.pos}: {message}")
+
+
+def _parse_node(scanner: _Scanner) -> NodePattern:
+    """Parse "(variable:Type|Type {key: value, ...})"."""
+    scanner.expect("(")
+    variable = None if scanner.peek(":") else scanner.name()
+    entity_types = scanner.names() if scanner.accept(":") else ()
+
+    properties: dict[str, Any] = {}
+    if scanner.accept("{") and not scanner.accept("}"):
+        while True:
+            key = scanner.name()
+            if key is None:
+                scanner.fail("expected a property name")
+            scanner.expect(":")
+            properties[key] = scanner.value()
+            if scanner.accept("}"):
+                break
+            scanner.expect(",")
+
+    scanner.expect(")")
+    return NodePattern(variable, entity_types, properties)
+
+
+def _parse_relationship(scanner: _Scanner) -> RelationshipPattern:
+    """Parse "-[types]->", "<-[types]-", "-[types]-" or a bare arrow."""
+    incoming = scanner.accept("<")
+    scanner.expect("-")
+
+    relationship_types: tuple[str, ...] = ()
+    if scanner.accept("["):
+        scanner.accept(":")  # Cypher-style "[:type]"
+        if not scanner.peek("]"):
+            relationship_types = scanner.names()
+        scanner.expect("]")
+        scanner.expect("-")
+    elif not scanner.accept("-"):
+        scanner.fail("expected '[' or '-'")
+
+    outgoing = scanner.accept(">")
+    if incoming and outgoing:
+        scanner.fail("a relationship can't point both ways")
+    direction: Direction = "in" if incoming else "out" if outgoing else "any"
+    return RelationshipPattern(relationship_types, direction)
+
+
+def parse_pattern(text: str) -> GraphPattern:
+    """
+    Parse a pattern like "(:Person)-[worked_for]->(:Organization)".
+
+    Args:
+        text: Pattern text
+
+    Returns:
+        The parsed GraphPattern
+
+    Raises:
+        ValueError: If the text is not a valid pattern, or has more than
+            MAX_PATTERN_HOPS relationships
+    """
+    scanner = _Scanner(text)
+    nodes = [_parse_node(scanner)]
+    relationships: list[RelationshipPattern] = []
+    while not scanner.at_end():
+        relationships.append(_parse_relationship(scanner))
+        nodes.append(_parse_node(scanner))
+
+    if len(relationships) > MAX_PATTERN_HOPS:
+        raise ValueError(
+            f"Patterns are limited to {MAX_PATTERN_HOPS} relationships, "
+            f"got {len(relationships)}"
+        )
+    return GraphPattern(tuple(nodes), tuple(relationships))
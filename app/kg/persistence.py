@@ -3,18 +3,42 @@ Knowledge base persistence: save, load, list, export.
 
 Handles serialization of KnowledgeBase objects to disk using a multi-file
 directory structure. Each knowledge base gets its own directory with:
-- meta.json: Basic metadata (id, name, timestamps, counts)
+- meta.json: Basic metadata (id, name, timestamps, counts, revision)
 - nodes.json: All Node objects
 - edges.json: All Edge objects
 - sources.json: All Source objects
 - domain_profile.json: Associated DomainProfile (if present)
-- graph.graphml: NetworkX-compatible graph export
+- graph.graphml: NetworkX-compatible graph export (generated on demand,
+  see ensure_graphml)
+- journal.jsonl: Append-only log of changes since the last snapshot
+  (journaled saves only)
+- kb.sqlite: Nodes/edges/sources as table rows, replacing the JSON
+  data files and journal (sqlite backend only, see sqlite_store.py)
 
 Design Decisions:
 - Atomic writes using tempfile + os.replace to prevent corruption
-- JSON for data files (human-readable, easy debugging)
+- JSON for data files, minified by default; pass compact=False for
+  indented, human-readable files when debugging
+- Each data file is encoded/decoded in one call through a pydantic
+  TypeAdapter (list[Node] etc.) rather than per-object model_dump /
+  model_validate with the stdlib json module
 - GraphML for interoperability (Gephi, Neo4j, yEd, etc.)
 - Sorted list_knowledge_bases by updated_at for recency ordering
+- Every save stamps a fresh revision token into meta.json so in-memory
+  caches can detect out-of-band writes without re-reading the graph
+- Journaled saves append only the changed nodes/edges/sources to
+  journal.jsonl; meta.json records the committed journal length, so a
+  torn append is ignored on load. The journal is compacted into a fresh
+  snapshot once it grows past a fraction of the graph size.
+- Snapshots are staged as nodes.json.<snapshot> etc. and only moved into
+  place after meta.json names the snapshot, so a crash mid-save never
+  pairs a new snapshot with the journal of the old one (loads read the
+  staged files of the committed snapshot if they are still there)
+- Derived exports are not produced on save: every save deletes
+  graph.graphml, so an existing file always matches the current revision
+  and ensure_graphml only rebuilds it after the graph has changed
+- meta.json records the storage backend ("json" or "sqlite"); saves keep
+  the existing backend unless asked to switch, and loads dispatch on it
 """
 
 from __future__ import annotations
@@ -25,15 +49,39 @@ import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 import networkx as nx  # type: ignore[import-untyped]
+from pydantic import TypeAdapter
 
 from app.kg.domain import DomainProfile
 from app.kg.knowledge_base import KnowledgeBase
 from app.kg.models import Edge, Node, Source
+from app.kg.sqlite_store import SQLITE_FILE, read_records, write_knowledge_base
 
+STORAGE_BACKENDS = ("json", "sqlite")
 
-def _atomic_write(path: Path, content: str) -> None:
+JOURNAL_FILE = "journal.jsonl"
+SNAPSHOT_FILES = ("nodes.json", "edges.json", "sources.json")
+GRAPHML_FILE = "graph.graphml"
+
+# Compact once the journal holds more entries than this fraction of the
+# graph's nodes + edges + sources (and at least JOURNAL_COMPACT_MIN_ENTRIES)
+JOURNAL_COMPACT_RATIO = 0.5
+JOURNAL_COMPACT_MIN_ENTRIES = 1000
+
+_NODES_ADAPTER = TypeAdapter(list[Node])
+_EDGES_ADAPTER = TypeAdapter(list[Edge])
+_SOURCES_ADAPTER = TypeAdapter(list[Source])
+
+_JOURNAL_MODELS: dict[str, type[Node | Edge | Source]] = {
+    "node": Node,
+    "edge": Edge,
+    "source": Source,
+}
+
+
+def _atomic_write(path: Path, content: str | bytes) -> None:
     """
     Atomically write content to a file.
 
@@ -43,7 +91,7 @@ def _atomic_write(path: Path, content: str) -> None:
 
     Args:
         path: Target file path
-        content: String content to write
+        content: String (written as UTF-8) or bytes content to write
 
     Raises:
         OSError: If write or rename fails
@@ -51,8 +99,9 @@ def _atomic_write(path: Path, content: str) -> None:
     # Create temp file in same directory to ensure same filesystem for atomic rename
     fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(content)
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
         # Atomic rename - guaranteed atomic on POSIX, nearly atomic on Windows
         os.replace(temp_path, path)
     except Exception:
@@ -62,12 +111,217 @@ def _atomic_write(path: Path, content: str) -> None:
         raise
 
 
-def save_knowledge_base(kb: KnowledgeBase, base_path: Path) -> None:
+def _generate_revision() -> str:
+    """Generate a 12-character hex revision token from UUID4."""
+    return uuid4().hex[:12]
+
+
+def _read_meta(kb_path: Path) -> dict[str, Any] | None:
+    """Read meta.json, returning None if it is missing or unreadable."""
+    try:
+        meta: dict[str, Any] = json.loads((kb_path / "meta.json").read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return meta
+
+
+def _journal_record(kb: KnowledgeBase, kind: str, obj_id: str, op: str) -> str:
+    """Serialize one pending change as a journal line."""
+    if op == "delete":
+        return json.dumps({"op": "delete", "kind": kind, "id": obj_id})
+
+    obj: Node | Edge | Source | None
+    if kind == "node":
+        obj = kb._nodes.get(obj_id)
+    elif kind == "edge":
+        obj = kb._edges.get(obj_id)
+    else:
+        obj = kb._sources.get(obj_id)
+    if obj is None:
+        # Upserted then removed without going through a delete
+        return json.dumps({"op": "delete", "kind": kind, "id": obj_id})
+    # kind is one of the fixed _JOURNAL_MODELS keys, so no escaping needed
+    return f'{{"op": "upsert", "kind": "{kind}", "data": {obj.model_dump_json()}}}'
+
+
+def _append_journal(
+    kb: KnowledgeBase, kb_path: Path, committed_size: int
+) -> int | None:
+    """
+    Append the KB's pending changes to the journal.
+
+    Anything past committed_size (a torn append from an interrupted save)
+    is truncated first.
+
+    Returns:
+        New committed journal size in bytes, or None if the journal on
+        disk is shorter than meta.json says and a snapshot is required.
+    """
+    journal_path = kb_path / JOURNAL_FILE
+    lines = [
+        _journal_record(kb, kind, obj_id, op)
+        for (kind, obj_id), op in kb._changes.items()
+    ]
+    payload = "".join(line + "\n" for line in lines).encode("utf-8")
+
+    mode = "r+b" if journal_path.exists() else "w+b"
+    with open(journal_path, mode) as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() < committed_size:
+            return None
+        f.truncate(committed_size)
+        f.seek(committed_size)
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+    return committed_size + len(payload)
+
+
+def _write_snapshot(
+    kb: KnowledgeBase, kb_path: Path, snapshot: str, compact: bool = True
+) -> None:
+    """
+    Stage the full nodes/edges/sources snapshot as <file>.<snapshot>.
+
+    The staged files replace the live ones only once meta.json names the
+    snapshot (see _install_snapshot).
+    """
+    indent = None if compact else 2
+    _atomic_write(
+        kb_path / f"nodes.json.{snapshot}",
+        _NODES_ADAPTER.dump_json(list(kb._nodes.values()), indent=indent),
+    )
+    _atomic_write(
+        kb_path / f"edges.json.{snapshot}",
+        _EDGES_ADAPTER.dump_json(list(kb._edges.values()), indent=indent),
+    )
+    _atomic_write(
+        kb_path / f"sources.json.{snapshot}",
+        _SOURCES_ADAPTER.dump_json(list(kb._sources.values()), indent=indent),
+    )
+
+
+def _install_snapshot(kb_path: Path, snapshot: str | None) -> None:
+    """
+    Move a committed snapshot's staged files into place.
+
+    Staged files of any other snapshot were left by a save that failed
+    before writing meta.json and are deleted.
+
+    Args:
+        kb_path: Path to the knowledge base directory
+        snapshot: Snapshot id from meta.json (None for older saves)
+    """
+    for name in SNAPSHOT_FILES:
+        if snapshot is not None:
+            staged = kb_path / f"{name}.{snapshot}"
+            if staged.exists():
+                os.replace(staged, kb_path / name)
+        for leftover in kb_path.glob(f"{name}.*"):
+            leftover.unlink(missing_ok=True)
+
+
+def _read_snapshot_file(kb_path: Path, name: str, snapshot: str | None) -> bytes | None:
+    """Read a snapshot data file, preferring the committed snapshot's staged copy."""
+    paths = [kb_path / name]
+    if snapshot is not None:
+        paths.insert(0, kb_path / f"{name}.{snapshot}")
+    for path in paths:
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            continue
+    return None
+
+
+def _save_json(
+    kb: KnowledgeBase,
+    kb_path: Path,
+    previous: dict[str, Any] | None,
+    journaled: bool,
+    compact_ratio: float,
+    compact: bool,
+) -> tuple[int, int, str | None, bool]:
+    """
+    Stage a JSON snapshot or append to the journal.
+
+    Returns:
+        (journal_size, journal_entries, snapshot, appended), where snapshot
+        is the id of the snapshot the journal applies to (None if the
+        journal applies to a snapshot from before snapshot ids existed)
+    """
+    if (
+        journaled
+        and previous is not None
+        and previous.get("storage", "json") == "json"
+        and kb._persisted_revision is not None
+        and previous.get("revision") == kb._persisted_revision
+    ):
+        journal_entries = previous.get("journal_entries", 0) + len(kb._changes)
+        object_count = len(kb._nodes) + len(kb._edges) + len(kb._sources)
+        compact_at = max(JOURNAL_COMPACT_MIN_ENTRIES, compact_ratio * object_count)
+        if journal_entries <= compact_at:
+            new_size = _append_journal(kb, kb_path, previous.get("journal_size", 0))
+            if new_size is not None:
+                return new_size, journal_entries, previous.get("snapshot"), True
+
+    snapshot = _generate_revision()
+    _write_snapshot(kb, kb_path, snapshot, compact)
+    return 0, 0, snapshot, False
+
+
+def _save_sqlite(
+    kb: KnowledgeBase, kb_path: Path, previous: dict[str, Any] | None
+) -> None:
+    """Write kb.sqlite, applying only recorded changes when possible."""
+    incremental = (
+        previous is not None
+        and previous.get("storage") == "sqlite"
+        and kb._persisted_revision is not None
+        and previous.get("revision") == kb._persisted_revision
+        and (kb_path / SQLITE_FILE).exists()
+    )
+    write_knowledge_base(kb, kb_path, full=not incremental)
+
+
+def _remove_files(kb_path: Path, names: tuple[str, ...]) -> None:
+    """Delete data files left behind by another storage backend."""
+    for name in names:
+        (kb_path / name).unlink(missing_ok=True)
+
+
+def save_knowledge_base(
+    kb: KnowledgeBase,
+    base_path: Path,
+    journaled: bool = False,
+    compact_ratio: float = JOURNAL_COMPACT_RATIO,
+    backend: str | None = None,
+    compact: bool = True,
+) -> str:
     """
     Save a knowledge base to disk.
 
     Creates a directory structure under base_path/{kb.id}/ with separate
-    JSON files for each data type plus a GraphML export.
+    JSON files for each data type. The GraphML export is not written here;
+    any previous export is deleted and ensure_graphml regenerates it on
+    demand.
+
+    With journaled=True, only the changes recorded on the KB since its
+    last save or load are appended to journal.jsonl, so the cost is
+    proportional to the changes rather than the graph. A full snapshot
+    is still written when there is none yet, when the on-disk copy was
+    written by someone else since this KB was loaded, or when the journal
+    outgrows compact_ratio of the graph (compaction).
+
+    With backend="sqlite", nodes/edges/sources are stored as table rows
+    in kb.sqlite instead; a save touches only the changed rows when the
+    database is at the KB's revision, otherwise it rewrites every row in
+    one transaction. Switching backends removes the other backend's data
+    files once meta.json points at the new one.
+
+    meta.json is written last so that its revision token only changes
+    once the data files are complete.
 
     Directory structure created:
         base_path/{kb.id}/
@@ -76,16 +330,58 @@ def save_knowledge_base(kb: KnowledgeBase, base_path: Path) -> None:
             edges.json          - All Edge objects
             sources.json        - All Source objects
             domain_profile.json - DomainProfile (if present)
-            graph.graphml       - NetworkX graph export
+            journal.jsonl       - Changes since the snapshot (journaled only)
+            kb.sqlite           - Replaces the three data files and the
+                                  journal (sqlite backend only)
 
     Args:
         kb: KnowledgeBase to save
         base_path: Parent directory for knowledge base storage
+        journaled: Append changes to the journal instead of rewriting
+        compact_ratio: Journal size (as a fraction of graph objects) that
+            triggers compaction into a new snapshot
+        backend: "json" or "sqlite"; None keeps the backend already on
+            disk (json for new knowledge bases)
+        compact: Write minified JSON (False: indented for readability)
+
+    Returns:
+        The revision token written to meta.json
+
+    Raises:
+        ValueError: If backend is not a known storage backend
     """
     kb_path = base_path / kb.id
     kb_path.mkdir(parents=True, exist_ok=True)
 
-    # Meta file with summary info
+    previous = _read_meta(kb_path)
+    if backend is None:
+        backend = previous.get("storage", "json") if previous else "json"
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f"Unknown storage backend: {backend}")
+    if previous is not None and previous.get("storage", "json") == "json":
+        # Finish installing the last snapshot if a crash interrupted it
+        _install_snapshot(kb_path, previous.get("snapshot"))
+
+    journal_size = 0
+    journal_entries = 0
+    snapshot: str | None = None
+    appended = False
+    if backend == "sqlite":
+        _save_sqlite(kb, kb_path, previous)
+    else:
+        journal_size, journal_entries, snapshot, appended = _save_json(
+            kb, kb_path, previous, journaled, compact_ratio, compact
+        )
+
+    # Domain profile (if present)
+    if kb.domain_profile:
+        _atomic_write(
+            kb_path / "domain_profile.json",
+            kb.domain_profile.model_dump_json(indent=None if compact else 2),
+        )
+
+    # Meta file with summary info (written last, see docstring)
+    revision = _generate_revision()
     meta = {
         "id": kb.id,
         "name": kb.name,
@@ -95,32 +391,71 @@ def save_knowledge_base(kb: KnowledgeBase, base_path: Path) -> None:
         "node_count": len(kb._nodes),
         "edge_count": len(kb._edges),
         "source_count": len(kb._sources),
+        "revision": revision,
+        "storage": backend,
+        "journal_size": journal_size,
+        "journal_entries": journal_entries,
+        "snapshot": snapshot,
     }
     _atomic_write(kb_path / "meta.json", json.dumps(meta, indent=2))
 
-    # Nodes - serialize with datetime handling
-    nodes_data = [n.model_dump() for n in kb._nodes.values()]
-    _atomic_write(kb_path / "nodes.json", json.dumps(nodes_data, indent=2, default=str))
+    # Any existing export describes the previous revision
+    (kb_path / GRAPHML_FILE).unlink(missing_ok=True)
+
+    if backend == "sqlite":
+        _remove_files(kb_path, (*SNAPSHOT_FILES, JOURNAL_FILE))
+    else:
+        if not appended:
+            # meta.json now commits the new snapshot, which already contains
+            # everything in the old journal
+            _install_snapshot(kb_path, snapshot)
+            (kb_path / JOURNAL_FILE).unlink(missing_ok=True)
+        _remove_files(
+            kb_path, (SQLITE_FILE, f"{SQLITE_FILE}-wal", f"{SQLITE_FILE}-shm")
+        )
 
-    # Edges - serialize with datetime handling
-    edges_data = [e.model_dump() for e in kb._edges.values()]
-    _atomic_write(kb_path / "edges.json", json.dumps(edges_data, indent=2, default=str))
+    kb._changes.clear()
+    kb._persisted_revision = revision
+    return revision
 
-    # Sources - serialize with datetime handling
-    sources_data = [s.model_dump() for s in kb._sources.values()]
-    _atomic_write(
-        kb_path / "sources.json", json.dumps(sources_data, indent=2, default=str)
-    )
 
-    # Domain profile (if present)
-    if kb.domain_profile:
-        _atomic_write(
-            kb_path / "domain_profile.json",
-            kb.domain_profile.model_dump_json(indent=2),
-        )
+def _replay_journal(kb: KnowledgeBase, kb_path: Path, size: int) -> None:
+    """
+    Apply the committed part of the journal on top of a loaded snapshot.
 
-    # GraphML export for visualization tools
-    export_graphml(kb, kb_path / "graph.graphml")
+    Args:
+        kb: KnowledgeBase loaded from the snapshot
+        kb_path: Path to the knowledge base directory
+        size: Committed journal length in bytes (from meta.json)
+    """
+    journal_path = kb_path / JOURNAL_FILE
+    if size <= 0 or not journal_path.exists():
+        return
+
+    with open(journal_path, "rb") as f:
+        committed = f.read(size)
+
+    for line in committed.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        kind = record["kind"]
+        if record["op"] == "delete":
+            if kind == "node":
+                kb.remove_node(record["id"])
+            elif kind == "edge":
+                kb.remove_edge(record["id"])
+            else:
+                kb.remove_source(record["id"])
+            continue
+
+        obj = _JOURNAL_MODELS[kind].model_validate(record["data"])
+        if isinstance(obj, Node):
+            kb.add_node(obj)
+        elif isinstance(obj, Edge):
+            kb.add_edge(obj)
+        else:
+            kb.add_source(obj)
 
 
 def load_knowledge_base(kb_path: Path) -> KnowledgeBase | None:
@@ -128,7 +463,9 @@ def load_knowledge_base(kb_path: Path) -> KnowledgeBase | None:
     Load a knowledge base from disk.
 
     Reads the multi-file directory structure and reconstructs a
-    KnowledgeBase object with all its nodes, edges, and sources.
+    KnowledgeBase object with all its nodes, edges, and sources, then
+    replays any journaled changes on top of the snapshot. Knowledge bases
+    stored with the sqlite backend are read from kb.sqlite instead.
 
     Args:
         kb_path: Path to the knowledge base directory
@@ -136,6 +473,10 @@ def load_knowledge_base(kb_path: Path) -> KnowledgeBase | None:
     Returns:
         Reconstructed KnowledgeBase, or None if path doesn't exist
         or is missing required files (meta.json)
+
+    Raises:
+        FileNotFoundError: If meta.json names the sqlite backend but
+            kb.sqlite is missing
     """
     if not kb_path.exists():
         return None
@@ -153,43 +494,74 @@ def load_knowledge_base(kb_path: Path) -> KnowledgeBase | None:
     if dp_file.exists():
         domain_profile = DomainProfile.model_validate_json(dp_file.read_text())
 
-    # Create KnowledgeBase with metadata
-    kb = KnowledgeBase(
+    # Decode each data file in one call, then build all indexes in one pass
+    nodes: list[Node] = []
+    edges: list[Edge] = []
+    sources: list[Source] = []
+    if meta.get("storage") == "sqlite":
+        nodes, edges, sources = read_records(kb_path)
+    else:
+        snapshot = meta.get("snapshot")
+        raw = _read_snapshot_file(kb_path, "nodes.json", snapshot)
+        if raw is not None:
+            nodes = _NODES_ADAPTER.validate_json(raw)
+        raw = _read_snapshot_file(kb_path, "edges.json", snapshot)
+        if raw is not None:
+            edges = _EDGES_ADAPTER.validate_json(raw)
+        raw = _read_snapshot_file(kb_path, "sources.json", snapshot)
+        if raw is not None:
+            sources = _SOURCES_ADAPTER.validate_json(raw)
+
+    kb = KnowledgeBase.from_records(
+        nodes,
+        edges,
+        sources,
         id=meta["id"],
         name=meta["name"],
         description=meta.get("description"),
         domain_profile=domain_profile,
     )
     kb.created_at = datetime.fromisoformat(meta["created_at"])
-    kb.updated_at = datetime.fromisoformat(meta["updated_at"])
 
-    # Load nodes
-    nodes_file = kb_path / "nodes.json"
-    if nodes_file.exists():
-        nodes_data = json.loads(nodes_file.read_text())
-        for nd in nodes_data:
-            node = Node.model_validate(nd)
-            kb.add_node(node)
-
-    # Load edges
-    edges_file = kb_path / "edges.json"
-    if edges_file.exists():
-        edges_data = json.loads(edges_file.read_text())
-        for ed in edges_data:
-            edge = Edge.model_validate(ed)
-            kb.add_edge(edge)
-
-    # Load sources
-    sources_file = kb_path / "sources.json"
-    if sources_file.exists():
-        sources_data = json.loads(sources_file.read_text())
-        for sd in sources_data:
-            source = Source.model_validate(sd)
-            kb.add_source(source)
+    # Replay changes appended since the snapshot
+    _replay_journal(kb, kb_path, meta.get("journal_size", 0))
 
+    # Freshly loaded: nothing is unsaved relative to this revision
+    kb.updated_at = datetime.fromisoformat(meta["updated_at"])
+    kb._changes.clear()
+    kb._persisted_revision = meta.get("revision")
     return kb
 
 
+def get_knowledge_base_revision(kb_path: Path) -> str | None:
+    """
+    Get the current on-disk revision of a knowledge base.
+
+    Only reads meta.json, so this is cheap enough to call on every
+    request to validate an in-memory copy. Knowledge bases saved before
+    revision tokens existed fall back to the meta.json modification time.
+
+    Args:
+        kb_path: Path to the knowledge base directory
+
+    Returns:
+        Revision string, or None if the knowledge base doesn't exist
+    """
+    meta_file = kb_path / "meta.json"
+    try:
+        raw = meta_file.read_text()
+        mtime_ns = meta_file.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    try:
+        revision = json.loads(raw).get("revision")
+    except json.JSONDecodeError:
+        return None
+
+    return revision or f"mtime:{mtime_ns}"
+
+
 def list_knowledge_bases(base_path: Path) -> list[dict[str, Any]]:
     """
     List all knowledge bases in a directory.
@@ -227,6 +599,55 @@ def list_knowledge_bases(base_path: Path) -> list[dict[str, Any]]:
     return sorted(results, key=lambda x: x.get("updated_at", ""), reverse=True)
 
 
+def ensure_graphml(kb: KnowledgeBase, base_path: Path) -> Path | None:
+    """
+    Get the knowledge base's GraphML export, generating it if needed.
+
+    save_knowledge_base deletes graph.graphml, so a file that exists was
+    written from the current on-disk revision and is reused as-is. It is
+    only (re)generated when the in-memory KB matches that revision; a KB
+    with unsaved changes or a stale revision can't populate the cache.
+
+    Args:
+        kb: KnowledgeBase to export
+        base_path: Parent directory for knowledge base storage
+
+    Returns:
+        Path to graph.graphml, or None if the KB differs from what is on
+        disk (call export_graphml with an explicit path instead)
+    """
+    kb_path = base_path / kb.id
+    meta = _read_meta(kb_path)
+    if (
+        kb._changes
+        or meta is None
+        or kb._persisted_revision is None
+        or meta.get("revision") != kb._persisted_revision
+    ):
+        return None
+
+    graphml_path = kb_path / GRAPHML_FILE
+    if not graphml_path.exists():
+        # Write to a temp file first so readers never see a partial export
+        fd, temp_path = tempfile.mkstemp(dir=kb_path, suffix=".tmp")
+        os.close(fd)
+        try:
+            export_graphml(kb, Path(temp_path))
+            os.replace(temp_path, graphml_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        # A save that landed while exporting may have deleted the file
+        # before it existed; don't leave an export of the old revision
+        latest = _read_meta(kb_path)
+        if latest is None or latest.get("revision") != kb._persisted_revision:
+            graphml_path.unlink(missing_ok=True)
+            return None
+    return graphml_path
+
+
 def export_graphml(kb: KnowledgeBase, output_path: Path) -> None:
     """
     Export a knowledge base to GraphML format.
@@ -4,8 +4,10 @@ Entity Resolution models and algorithms for Knowledge Graph duplicate detection.
 This module provides:
 - Models: ResolutionCandidate, MergeHistory, ResolutionConfig
 - String similarity functions: Jaro-Winkler, Levenshtein, alias overlap (via rapidfuzz)
-- N-gram blocking strategy for efficient candidate generation
-- EntityMatcher class for computing similarity scores
+- Blocking strategies (n-gram, sorted neighborhood, MinHash-LSH) that
+  stream candidate pairs with bounded memory
+- EntityMatcher class for computing similarity scores (single pair or
+  vectorized batches of blocked pairs)
 
 The resolution system uses a multi-signal approach:
 1. String similarity (label matching)
@@ -17,21 +19,44 @@ The resolution system uses a multi-signal approach:
 
 from __future__ import annotations
 
+import zlib
+from bisect import bisect_right
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Literal
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, model_validator
 from rapidfuzz.distance import JaroWinkler, Levenshtein
+from rapidfuzz.process import cpdist
 
-from app.kg.normalization import generate_ngrams, normalize_entity_name
+from app.kg.normalization import (
+    generate_ngrams,
+    normalize_entity_name,
+    normalize_for_index,
+)
 
 if TYPE_CHECKING:
     from app.kg.knowledge_base import KnowledgeBase
     from app.kg.models import Node
 
 
+# Below this many pairs, thread startup costs more than batch scoring saves
+PARALLEL_SCORING_MIN_PAIRS = 10_000
+
+# Pairs scored per batch when streaming blocked pairs into the matcher
+SCORING_CHUNK_SIZE = 50_000
+
+# Mersenne prime for MinHash universal hashing (fits in uint64 arithmetic)
+_MINHASH_PRIME = (1 << 31) - 1
+
+# Signal names in the order compute_similarity reports them
+_SIGNAL_NAMES = ("string_sim", "alias_sim", "type_sim", "graph_sim", "semantic_sim")
+
+
 def _generate_short_id() -> str:
     """Generate an 8-character hex ID from UUID4."""
     return uuid4().hex[:8]
@@ -135,6 +160,13 @@ class ResolutionConfig(BaseModel):
         graph_weight: Weight for shared neighbors
         semantic_weight: Weight for semantic similarity (future, default 0)
         max_candidates: Maximum candidates to return (memory safety for large graphs)
+        blocking_strategy: How candidate pairs are generated before scoring
+        max_block_size: Blocks (n-gram posting lists, LSH buckets) larger than
+            this are skipped as uninformative stop-grams (default: no limit,
+            so every candidate pair is scored)
+        sorted_neighborhood_window: Window size for sorted-neighborhood blocking
+        minhash_num_perm: Number of MinHash permutations for LSH blocking
+        minhash_bands: LSH bands (minhash_num_perm must be divisible by it)
     """
 
     auto_merge_threshold: float = Field(default=0.9, ge=0.0, le=1.0)
@@ -147,6 +179,20 @@ class ResolutionConfig(BaseModel):
     max_candidates: int = Field(
         default=1000, ge=1, description="Max candidates to return"
     )
+    blocking_strategy: Literal["ngram", "sorted_neighborhood", "minhash"] = "ngram"
+    max_block_size: int | None = Field(
+        default=None, ge=2, description="Skip blocks larger than this"
+    )
+    sorted_neighborhood_window: int = Field(default=10, ge=2)
+    minhash_num_perm: int = Field(default=64, ge=1)
+    minhash_bands: int = Field(default=16, ge=1)
+
+    @model_validator(mode="after")
+    def _check_minhash_bands(self) -> ResolutionConfig:
+        """Require minhash_num_perm to split evenly into bands."""
+        if self.minhash_num_perm % self.minhash_bands != 0:
+            raise ValueError("minhash_num_perm must be divisible by minhash_bands")
+        return self
 
 
 # ============================================================================
@@ -283,58 +329,249 @@ def alias_overlap_score(aliases_a: list[str], aliases_b: list[str]) -> float:
 # ============================================================================
 
 
+def _node_names(node: Node) -> list[str]:
+    """Return a node's label followed by its aliases."""
+    return [node.label if node.label else "", *node.aliases]
+
+
+def _iter_ngram_pairs(
+    nodes: list[Node],
+    n: int = 3,
+    min_shared_ngrams: int = 2,
+    max_block_size: int | None = None,
+) -> Iterator[tuple[int, int]]:
+    """
+    Stream candidate pairs that share at least min_shared_ngrams n-grams.
+
+    Instead of counting every pair in every posting list up front, shared
+    n-grams are counted one node at a time against higher-indexed nodes,
+    so memory stays proportional to the index plus one node's neighborhood.
+
+    Args:
+        nodes: List of Node objects to find candidates among.
+        n: Size of n-grams to generate (default: 3 for trigrams).
+        min_shared_ngrams: Minimum shared n-grams to consider a pair.
+        max_block_size: Posting lists longer than this are skipped as
+            stop-grams. None disables pruning.
+
+    Yields:
+        (index_a, index_b) tuples with index_a < index_b, ordered by
+        index_a then index_b.
+    """
+    node_ngrams: list[set[str]] = []
+    ngram_to_indices: dict[str, list[int]] = defaultdict(list)
+
+    for idx, node in enumerate(nodes):
+        ngrams: set[str] = set()
+        for name in _node_names(node):
+            ngrams.update(generate_ngrams(name, n))
+        node_ngrams.append(ngrams)
+        for ngram in ngrams:
+            # Appended in index order, so each posting list stays sorted
+            ngram_to_indices[ngram].append(idx)
+
+    for idx_a, ngrams in enumerate(node_ngrams):
+        shared: dict[int, int] = defaultdict(int)
+        for ngram in ngrams:
+            indices = ngram_to_indices[ngram]
+            if max_block_size is not None and len(indices) > max_block_size:
+                continue
+            for idx_b in indices[bisect_right(indices, idx_a) :]:
+                shared[idx_b] += 1
+        for idx_b in sorted(shared):
+            if shared[idx_b] >= min_shared_ngrams:
+                yield idx_a, idx_b
+
+
 def _block_by_ngrams(
     nodes: list[Node],
     n: int = 3,
     min_shared_ngrams: int = 2,
+    max_block_size: int | None = None,
 ) -> list[tuple[int, int]]:
     """
     Find candidate pairs using n-gram blocking.
 
-    Builds an inverted index of ngram -> node indices, then finds pairs
-    that share at least min_shared_ngrams. This is more effective than
-    first-character blocking for catching typos and variations.
+    Materialized form of _iter_ngram_pairs. Prefer the iterator for
+    large node sets.
 
     Args:
         nodes: List of Node objects to find candidates among.
         n: Size of n-grams to generate (default: 3 for trigrams).
         min_shared_ngrams: Minimum shared n-grams to consider a pair (default: 2).
+        max_block_size: Skip posting lists longer than this (default: no limit).
 
     Returns:
         List of (index_a, index_b) tuples where index_a < index_b.
     """
-    if len(nodes) < 2:
-        return []
+    return list(_iter_ngram_pairs(nodes, n, min_shared_ngrams, max_block_size))
+
+
+def _iter_sorted_neighborhood_pairs(
+    nodes: list[Node],
+    window: int = 10,
+) -> Iterator[tuple[int, int]]:
+    """
+    Stream candidate pairs using sorted-neighborhood blocking.
+
+    Every label and alias is reduced to its normalize_for_index key and the
+    keys are sorted. Nodes whose keys fall within the same sliding window
+    become candidate pairs. Memory is linear in the number of names.
 
-    # Build inverted index: ngram -> set of node indices
-    ngram_to_indices: dict[str, set[int]] = defaultdict(set)
+    Args:
+        nodes: List of Node objects to find candidates among.
+        window: Number of consecutive sorted keys compared with each other.
 
+    Yields:
+        (index_a, index_b) tuples with index_a < index_b, ordered by
+        index_a then index_b.
+    """
+    entries = sorted(
+        (key, idx)
+        for idx, node in enumerate(nodes)
+        for name in _node_names(node)
+        if (key := normalize_for_index(name))
+    )
+    positions: dict[int, list[int]] = defaultdict(list)
+    for pos, (_, idx) in enumerate(entries):
+        positions[idx].append(pos)
+
+    for idx_a in range(len(nodes)):
+        partners: set[int] = set()
+        for pos in positions.get(idx_a, ()):
+            lo = max(0, pos - window + 1)
+            hi = min(len(entries), pos + window)
+            partners.update(idx for _, idx in entries[lo:hi] if idx > idx_a)
+        yield from ((idx_a, idx_b) for idx_b in sorted(partners))
+
+
+def _minhash_signatures(
+    nodes: list[Node],
+    num_perm: int,
+    n: int = 3,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Compute MinHash signatures over each node's name n-grams.
+
+    N-grams are hashed with CRC32 (stable across processes, unlike hash())
+    and permuted with seeded universal hash functions.
+
+    Args:
+        nodes: Nodes to sign.
+        num_perm: Number of hash permutations (signature length).
+        n: N-gram size.
+        seed: Seed for the permutation coefficients.
+
+    Returns:
+        Array of shape (len(nodes), num_perm). Nodes without any n-grams
+        get a row of the maximum value, which never collides in LSH
+        because such rows are skipped.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, _MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+
+    signatures = np.full((len(nodes), num_perm), _MINHASH_PRIME, dtype=np.uint64)
     for idx, node in enumerate(nodes):
-        label = node.label if node.label else ""
-        ngrams = generate_ngrams(label, n)
+        ngrams: set[str] = set()
+        for name in _node_names(node):
+            ngrams.update(generate_ngrams(name, n))
+        if not ngrams:
+            continue
+        hashes = np.fromiter(
+            (zlib.crc32(g.encode("utf-8")) for g in ngrams), np.uint64, len(ngrams)
+        )
+        hashes %= np.uint64(_MINHASH_PRIME)
+        permuted = (np.outer(hashes, a) + b) % np.uint64(_MINHASH_PRIME)
+        signatures[idx] = permuted.min(axis=0)
+    return signatures
 
-        # Also include ngrams from aliases for better recall
-        for alias in node.aliases:
-            ngrams.update(generate_ngrams(alias, n))
 
-        for ngram in ngrams:
-            ngram_to_indices[ngram].add(idx)
+def _iter_minhash_pairs(
+    nodes: list[Node],
+    num_perm: int = 64,
+    bands: int = 16,
+    max_block_size: int | None = None,
+) -> Iterator[tuple[int, int]]:
+    """
+    Stream candidate pairs using MinHash locality-sensitive hashing.
 
-    # Count shared ngrams between pairs
-    pair_counts: dict[tuple[int, int], int] = defaultdict(int)
+    Signatures are split into bands; nodes that agree on every row of at
+    least one band share a bucket and become a candidate pair. More bands
+    (fewer rows each) raises recall at the cost of more pairs.
+
+    Args:
+        nodes: List of Node objects to find candidates among.
+        num_perm: MinHash signature length.
+        bands: Number of LSH bands (must divide num_perm).
+        max_block_size: Buckets larger than this are skipped.
 
-    for indices in ngram_to_indices.values():
-        indices_list = sorted(indices)
-        for i, idx_a in enumerate(indices_list):
-            for idx_b in indices_list[i + 1 :]:
-                pair_counts[(idx_a, idx_b)] += 1
+    Yields:
+        (index_a, index_b) tuples with index_a < index_b, ordered by
+        index_a then index_b.
+    """
+    signatures = _minhash_signatures(nodes, num_perm)
+    rows = num_perm // bands
+    empty = signatures[:, 0] == _MINHASH_PRIME
+
+    # Per band: bucket key -> sorted node indices
+    band_buckets: list[dict[bytes, list[int]]] = []
+    node_keys: list[list[bytes]] = [[] for _ in nodes]
+    for band in range(bands):
+        buckets: dict[bytes, list[int]] = defaultdict(list)
+        band_slice = signatures[:, band * rows : (band + 1) * rows]
+        for idx in range(len(nodes)):
+            if empty[idx]:
+                continue
+            key = band_slice[idx].tobytes()
+            buckets[key].append(idx)
+            node_keys[idx].append(key)
+        band_buckets.append(buckets)
+
+    for idx_a in range(len(nodes)):
+        partners: set[int] = set()
+        for band, key in enumerate(node_keys[idx_a]):
+            members = band_buckets[band][key]
+            if max_block_size is not None and len(members) > max_block_size:
+                continue
+            partners.update(members[bisect_right(members, idx_a) :])
+        yield from ((idx_a, idx_b) for idx_b in sorted(partners))
+
+
+def iter_candidate_pairs(
+    nodes: list[Node],
+    config: ResolutionConfig,
+    min_shared_ngrams: int = 2,
+) -> Iterator[tuple[int, int]]:
+    """
+    Stream candidate pairs using the blocking strategy from config.
 
-    # Filter pairs by minimum shared ngrams
-    candidate_pairs = [
-        pair for pair, count in pair_counts.items() if count >= min_shared_ngrams
-    ]
+    Args:
+        nodes: List of Node objects to find candidates among.
+        config: ResolutionConfig selecting the strategy and its knobs.
+        min_shared_ngrams: Minimum shared n-grams (n-gram strategy only).
 
-    return candidate_pairs
+    Yields:
+        (index_a, index_b) tuples with index_a < index_b.
+    """
+    if config.blocking_strategy == "sorted_neighborhood":
+        return _iter_sorted_neighborhood_pairs(
+            nodes, window=config.sorted_neighborhood_window
+        )
+    if config.blocking_strategy == "minhash":
+        return _iter_minhash_pairs(
+            nodes,
+            num_perm=config.minhash_num_perm,
+            bands=config.minhash_bands,
+            max_block_size=config.max_block_size,
+        )
+    return _iter_ngram_pairs(
+        nodes,
+        n=3,
+        min_shared_ngrams=min_shared_ngrams,
+        max_block_size=config.max_block_size,
+    )
 
 
 def _block_by_first_char(nodes: list[Node]) -> dict[str, list[Node]]:
@@ -370,6 +607,51 @@ def _block_by_first_char(nodes: list[Node]) -> dict[str, list[Node]]:
 # ============================================================================
 
 
+class _NodeFeatures:
+    """
+    Per-node inputs to batch scoring, computed once per node list.
+
+    Labels and alias sets are normalized up front; neighbor sets are
+    fetched lazily (only for nodes that appear in a scored pair) and
+    memoized across batches.
+    """
+
+    def __init__(self, nodes: list[Node], kb: KnowledgeBase | None = None) -> None:
+        self.nodes = nodes
+        self.kb = kb
+        self.labels = [normalize_entity_name(n.label) for n in nodes]
+        self.has_label = np.fromiter((bool(n.label) for n in nodes), bool, len(nodes))
+        self.has_norm = np.fromiter(
+            (bool(label) for label in self.labels), bool, len(nodes)
+        )
+        # Same sets alias_overlap_score builds from aliases + label
+        self.name_sets = [
+            frozenset(
+                normalized
+                for name in [*n.aliases, n.label]
+                if name and (normalized := normalize_entity_name(name))
+            )
+            for n in nodes
+        ]
+        type_codes: dict[str, int] = {}
+        self.types = np.fromiter(
+            (type_codes.setdefault(n.entity_type, len(type_codes)) for n in nodes),
+            np.intp,
+            len(nodes),
+        )
+        self._neighbor_sets: dict[int, frozenset[str]] = {}
+
+    def neighbor_sets(self, indices: list[int]) -> dict[int, frozenset[str]]:
+        """Return neighbor ID sets for the given node positions."""
+        if self.kb is not None:
+            for i in indices:
+                if i not in self._neighbor_sets:
+                    self._neighbor_sets[i] = frozenset(
+                        n.id for n in self.kb.get_neighbors(self.nodes[i].id)
+                    )
+        return self._neighbor_sets
+
+
 class EntityMatcher:
     """
     Computes similarity between entity nodes for resolution.
@@ -387,14 +669,19 @@ class EntityMatcher:
         candidates = matcher.find_candidates(nodes, kb, min_confidence=0.7)
     """
 
-    def __init__(self, config: ResolutionConfig | None = None) -> None:
+    def __init__(
+        self, config: ResolutionConfig | None = None, workers: int = -1
+    ) -> None:
         """
         Initialize the EntityMatcher with configuration.
 
         Args:
             config: Optional ResolutionConfig. Uses defaults if not provided.
+            workers: Threads for batch string scoring (-1 = all cores).
+                Only used for batches of PARALLEL_SCORING_MIN_PAIRS or more.
         """
         self.config = config or ResolutionConfig()
+        self.workers = workers
 
     def compute_similarity(
         self,
@@ -466,6 +753,162 @@ class EntityMatcher:
 
         return confidence, signals
 
+    def score_pairs(
+        self,
+        nodes: list[Node],
+        pairs: list[tuple[int, int]],
+        kb: KnowledgeBase | None = None,
+        features: _NodeFeatures | None = None,
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """
+        Compute similarity scores for many node pairs at once.
+
+        Produces the same values as calling compute_similarity on each
+        pair, but normalizes labels, alias sets and neighbor sets once per
+        node and scores all labels in one rapidfuzz batch.
+
+        Args:
+            nodes: Nodes referenced by the pairs
+            pairs: (index_a, index_b) positions into nodes
+            kb: Optional KnowledgeBase for graph context
+            features: Precomputed features for nodes, reused across batches
+
+        Returns:
+            Tuple of (confidence array, signal name -> score array), each
+            aligned with pairs
+        """
+        config = self.config
+        n_pairs = len(pairs)
+        if n_pairs == 0:
+            empty = np.zeros(0, dtype=np.float64)
+            return empty, dict.fromkeys(_SIGNAL_NAMES, empty)
+
+        idx = np.asarray(pairs, dtype=np.intp)
+        idx_a, idx_b = idx[:, 0], idx[:, 1]
+
+        if features is None:
+            features = _NodeFeatures(nodes, kb)
+        labels = features.labels
+        has_label, has_norm = features.has_label, features.has_norm
+        name_sets, types = features.name_sets, features.types
+
+        # 1. String similarity (mirrors jaro_winkler_similarity edge cases)
+        workers = self.workers if n_pairs >= PARALLEL_SCORING_MIN_PAIRS else 1
+        # Scored as 1 - distance: that is how the scalar normalized_similarity
+        # is computed, so the batch result is bit-for-bit identical
+        string_sim = 1.0 - cpdist(
+            [labels[i] for i in idx_a.tolist()],
+            [labels[i] for i in idx_b.tolist()],
+            scorer=JaroWinkler.normalized_distance,
+            dtype=np.float64,
+            workers=workers,
+        )
+        string_sim[~(has_norm[idx_a] & has_norm[idx_b])] = 0.0
+        string_sim[~has_label[idx_a] & ~has_label[idx_b]] = 1.0
+
+        # 2. Alias overlap (Jaccard on normalized label + alias sets)
+        alias_sim = np.fromiter(
+            (
+                len(set_a & set_b) / len(set_a | set_b) if set_a or set_b else 0.0
+                for set_a, set_b in (
+                    (name_sets[a], name_sets[b])
+                    for a, b in zip(idx_a.tolist(), idx_b.tolist())
+                )
+            ),
+            np.float64,
+            n_pairs,
+        )
+
+        # 3. Type matching
+        type_sim = (types[idx_a] == types[idx_b]).astype(np.float64)
+
+        # 4. Graph context (Jaccard on neighbor sets)
+        graph_sim = np.zeros(n_pairs, dtype=np.float64)
+        if kb is not None:
+            neighbor_sets = features.neighbor_sets(np.unique(idx).tolist())
+            graph_sim = np.fromiter(
+                (
+                    len(set_a & set_b) / len(set_a | set_b) if set_a or set_b else 0.0
+                    for set_a, set_b in (
+                        (neighbor_sets[a], neighbor_sets[b])
+                        for a, b in zip(idx_a.tolist(), idx_b.tolist())
+                    )
+                ),
+                np.float64,
+                n_pairs,
+            )
+
+        # 5. Semantic similarity (placeholder for embeddings)
+        semantic_sim = np.zeros(n_pairs, dtype=np.float64)
+
+        # Same operand order as compute_similarity, so results are identical
+        confidence = (
+            config.string_weight * string_sim
+            + config.alias_weight * alias_sim
+            + config.type_weight * type_sim
+            + config.graph_weight * graph_sim
+            + config.semantic_weight * semantic_sim
+        )
+        signals = dict(
+            zip(
+                _SIGNAL_NAMES,
+                (string_sim, alias_sim, type_sim, graph_sim, semantic_sim),
+                strict=True,
+            )
+        )
+        return confidence, signals
+
+    def candidates_from_pairs(
+        self,
+        nodes: list[Node],
+        pairs: list[tuple[int, int]],
+        kb: KnowledgeBase | None = None,
+        min_confidence: float = 0.5,
+        features: _NodeFeatures | None = None,
+    ) -> list[ResolutionCandidate]:
+        """
+        Batch-score pairs and build candidates for those above min_confidence.
+
+        Candidates are returned in pair order (unsorted).
+
+        Args:
+            nodes: Nodes referenced by the pairs
+            pairs: (index_a, index_b) positions into nodes
+            kb: Optional KnowledgeBase for graph context
+            min_confidence: Minimum confidence to include as candidate
+            features: Precomputed features for nodes, reused across batches
+
+        Returns:
+            List of ResolutionCandidate objects
+        """
+        confidence, signals = self.score_pairs(nodes, pairs, kb, features)
+        keep = np.flatnonzero(confidence >= min_confidence)
+
+        candidates: list[ResolutionCandidate] = []
+        for k in keep.tolist():
+            idx_a, idx_b = pairs[k]
+            candidates.append(
+                ResolutionCandidate(
+                    node_a_id=nodes[idx_a].id,
+                    node_b_id=nodes[idx_b].id,
+                    confidence=float(confidence[k]),
+                    signals={
+                        name: float(values[k]) for name, values in signals.items()
+                    },
+                )
+            )
+        return candidates
+
+    @staticmethod
+    def _iter_first_char_pairs(nodes: list[Node]) -> Iterator[tuple[int, int]]:
+        """Yield index pairs within each first-character block."""
+        position = {id(node): idx for idx, node in enumerate(nodes)}
+        for block_nodes in _block_by_first_char(nodes).values():
+            block_idx = [position[id(node)] for node in block_nodes]
+            for i, idx_a in enumerate(block_idx):
+                for idx_b in block_idx[i + 1 :]:
+                    yield idx_a, idx_b
+
     def find_candidates(
         self,
         nodes: list[Node],
@@ -478,14 +921,16 @@ class EntityMatcher:
         """
         Find potential duplicate pairs among a set of nodes.
 
-        Uses n-gram blocking (default) or first-character blocking to reduce
-        the O(n^2) comparison space, then scores candidate pairs.
+        Uses the configured blocking strategy (default) or first-character
+        blocking to reduce the O(n^2) comparison space. Blocked pairs are
+        streamed and scored in chunks, so memory stays bounded on large
+        node sets.
 
         Args:
             nodes: List of nodes to search for duplicates.
             kb: Optional KnowledgeBase for graph context.
             min_confidence: Minimum confidence to include as candidate.
-            use_ngram_blocking: If True, use n-gram blocking (default).
+            use_ngram_blocking: If True, use config.blocking_strategy (default).
                 If False, use first-character blocking (legacy).
             min_shared_ngrams: Minimum shared n-grams for blocking (default: 2).
             max_candidates: Maximum candidates to return. Defaults to config value.
@@ -494,51 +939,30 @@ class EntityMatcher:
             List of ResolutionCandidate objects sorted by confidence (desc),
             limited to max_candidates.
         """
-        candidates: list[ResolutionCandidate] = []
         limit = (
             max_candidates if max_candidates is not None else self.config.max_candidates
         )
 
+        candidate_pairs: Iterator[tuple[int, int]]
         if use_ngram_blocking:
-            # Use n-gram blocking for better accuracy
-            candidate_pairs = _block_by_ngrams(
-                nodes, n=3, min_shared_ngrams=min_shared_ngrams
+            candidate_pairs = iter_candidate_pairs(
+                nodes, self.config, min_shared_ngrams=min_shared_ngrams
             )
-
-            for idx_a, idx_b in candidate_pairs:
-                node_a = nodes[idx_a]
-                node_b = nodes[idx_b]
-                confidence, signals = self.compute_similarity(node_a, node_b, kb)
-
-                if confidence >= min_confidence:
-                    candidate = ResolutionCandidate(
-                        node_a_id=node_a.id,
-                        node_b_id=node_b.id,
-                        confidence=confidence,
-                        signals=signals,
-                    )
-                    candidates.append(candidate)
         else:
-            # Legacy: Block nodes by first character
-            blocks = _block_by_first_char(nodes)
-
-            # Compare within each block
-            for block_nodes in blocks.values():
-                for i, node_a in enumerate(block_nodes):
-                    for node_b in block_nodes[i + 1 :]:
-                        confidence, signals = self.compute_similarity(
-                            node_a, node_b, kb
-                        )
-
-                        if confidence >= min_confidence:
-                            candidate = ResolutionCandidate(
-                                node_a_id=node_a.id,
-                                node_b_id=node_b.id,
-                                confidence=confidence,
-                                signals=signals,
-                            )
-                            candidates.append(candidate)
-
-        # Sort by confidence descending and limit results
-        candidates.sort(key=lambda c: c.confidence, reverse=True)
-        return candidates[:limit]
+            # Legacy: Block nodes by first character, compare within each block
+            candidate_pairs = self._iter_first_char_pairs(nodes)
+
+        features = _NodeFeatures(nodes, kb)
+        candidates: list[ResolutionCandidate] = []
+        while chunk := list(islice(candidate_pairs, SCORING_CHUNK_SIZE)):
+            candidates.extend(
+                self.candidates_from_pairs(
+                    nodes, chunk, kb, min_confidence=min_confidence, features=features
+                )
+            )
+            # Stable sort + truncate per chunk keeps memory at `limit` and
+            # gives the same result as sorting everything at the end
+            candidates.sort(key=lambda c: c.confidence, reverse=True)
+            del candidates[limit:]
+
+        return candidates
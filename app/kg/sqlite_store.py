@@ -0,0 +1,279 @@
+"""
+SQLite storage engine for knowledge bases.
+
+Alternative to the JSON-file-per-type layout for large projects. A single
+kb.sqlite file inside the knowledge base directory holds:
+- nodes: one row per Node
+- edges: one row per Edge (without its relationships)
+- relationships: one row per RelationshipDetail, ordered by position
+- sources: one row per Source (mention spans included, see Source.mentions)
+
+Every table keeps the model as JSON in a `data` column, keyed by ID. The
+file is storage only: knowledge bases are read whole (read_records) into a
+KnowledgeBase, which is the runtime representation and answers every
+lookup from its own indexes. meta.json in the same directory remains the
+commit point and revision token (see persistence.py).
+
+Design Decisions:
+- Writes are a single transaction, schema changes included; when the
+  KnowledgeBase's change log is relative to the revision on disk, only
+  the changed rows are touched instead of rewriting the whole graph
+- WAL journal mode so readers don't block the writer
+- Upserts keep a row's rowid, so loading in rowid order reproduces the
+  KB's insertion order (merge and resolution order depend on it)
+- The schema version is stored in PRAGMA user_version; a file with any
+  other version is rebuilt from the KnowledgeBase on its next save
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any
+
+from app.kg.knowledge_base import KnowledgeBase
+from app.kg.models import Edge, Node, Source
+
+SQLITE_FILE = "kb.sqlite"
+
+SCHEMA_VERSION = 2
+
+# Tables of every schema version, dropped before a rebuild
+_TABLES = (
+    "relationships",
+    "edges",
+    "node_aliases",
+    "nodes",
+    "mention_counts",
+    "sources",
+)
+
+# Run one statement at a time: executescript would commit the transaction
+_SCHEMA = (
+    """
+    CREATE TABLE nodes (
+        id TEXT PRIMARY KEY,
+        data TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE edges (
+        id TEXT PRIMARY KEY,
+        data TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE relationships (
+        edge_id TEXT NOT NULL REFERENCES edges (id) ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (edge_id, position)
+    )
+    """,
+    """
+    CREATE TABLE sources (
+        id TEXT PRIMARY KEY,
+        data TEXT NOT NULL
+    )
+    """,
+)
+
+
+def _connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """
+    Open an existing database read-only.
+
+    Raises:
+        FileNotFoundError: If the database doesn't exist (it is never
+            created by a read)
+    """
+    if not db_path.exists():
+        raise FileNotFoundError(f"SQLite knowledge base not found: {db_path}")
+    return sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+@contextmanager
+def _transaction(db_path: Path) -> Iterator[sqlite3.Connection]:
+    """
+    Open a writable connection in one transaction.
+
+    Commits on success and rolls back on error. WAL mode is set here (it
+    persists in the file), so reads never have to.
+    """
+    with closing(sqlite3.connect(db_path, isolation_level=None)) as conn:
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> bool:
+    """
+    Create the tables if the file isn't at SCHEMA_VERSION.
+
+    Tables of an older layout are dropped; the caller must then write
+    every row.
+
+    Returns:
+        True if the tables were (re)created empty
+    """
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    if version == SCHEMA_VERSION:
+        return False
+    for table in _TABLES:
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+    for statement in _SCHEMA:
+        conn.execute(statement)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return True
+
+
+# ============================================================================
+# Writes
+# ============================================================================
+
+
+def _upsert_node(conn: sqlite3.Connection, node: Node) -> None:
+    """Insert or replace a node row."""
+    conn.execute(
+        "INSERT INTO nodes (id, data) VALUES (?, ?) "
+        "ON CONFLICT (id) DO UPDATE SET data = excluded.data",
+        (node.id, node.model_dump_json()),
+    )
+
+
+def _upsert_edge(conn: sqlite3.Connection, edge: Edge) -> None:
+    """Insert or replace an edge and its relationship rows."""
+    conn.execute(
+        "INSERT INTO edges (id, data) VALUES (?, ?) "
+        "ON CONFLICT (id) DO UPDATE SET data = excluded.data",
+        (edge.id, edge.model_dump_json(exclude={"relationships"})),
+    )
+    conn.execute("DELETE FROM relationships WHERE edge_id = ?", (edge.id,))
+    conn.executemany(
+        "INSERT INTO relationships (edge_id, position, data) VALUES (?, ?, ?)",
+        [
+            (edge.id, pos, rel.model_dump_json())
+            for pos, rel in enumerate(edge.relationships)
+        ],
+    )
+
+
+def _upsert_source(conn: sqlite3.Connection, source: Source) -> None:
+    """Insert or replace a source row."""
+    conn.execute(
+        "INSERT INTO sources (id, data) VALUES (?, ?) "
+        "ON CONFLICT (id) DO UPDATE SET data = excluded.data",
+        (source.id, source.model_dump_json()),
+    )
+
+
+def write_knowledge_base(kb: KnowledgeBase, kb_path: Path, full: bool) -> None:
+    """
+    Write a knowledge base to kb.sqlite in one transaction.
+
+    Args:
+        kb: KnowledgeBase to write
+        kb_path: Knowledge base directory
+        full: If True, replace every row. Otherwise apply only the KB's
+            recorded changes (caller must ensure they are relative to
+            what is on disk); a file with an outdated schema is rewritten
+            in full regardless.
+    """
+    with _transaction(kb_path / SQLITE_FILE) as conn:
+        if _ensure_schema(conn) or full:
+            for table in ("relationships", "edges", "nodes", "sources"):
+                conn.execute(f"DELETE FROM {table}")
+            for node in kb._nodes.values():
+                _upsert_node(conn, node)
+            for edge in kb._edges.values():
+                _upsert_edge(conn, edge)
+            for source in kb._sources.values():
+                _upsert_source(conn, source)
+            return
+
+        for (kind, obj_id), op in kb._changes.items():
+            if kind == "node":
+                changed_node = kb._nodes.get(obj_id)
+                if op == "delete" or changed_node is None:
+                    conn.execute("DELETE FROM nodes WHERE id = ?", (obj_id,))
+                else:
+                    _upsert_node(conn, changed_node)
+            elif kind == "edge":
+                changed_edge = kb._edges.get(obj_id)
+                if op == "delete" or changed_edge is None:
+                    conn.execute("DELETE FROM edges WHERE id = ?", (obj_id,))
+                else:
+                    _upsert_edge(conn, changed_edge)
+            else:
+                changed_source = kb._sources.get(obj_id)
+                if op == "delete" or changed_source is None:
+                    conn.execute("DELETE FROM sources WHERE id = ?", (obj_id,))
+                else:
+                    _upsert_source(conn, changed_source)
+
+
+# ============================================================================
+# Reads
+# ============================================================================
+
+
+def _edge_from_rows(data: str, relationship_rows: list[str]) -> Edge:
+    """Rebuild an Edge from its row and ordered relationship rows."""
+    edge_data: dict[str, Any] = json.loads(data)
+    edge_data["relationships"] = [json.loads(r) for r in relationship_rows]
+    return Edge.model_validate(edge_data)
+
+
+def read_records(kb_path: Path) -> tuple[list[Node], list[Edge], list[Source]]:
+    """
+    Read all nodes, edges and sources from kb.sqlite in insertion order.
+
+    Args:
+        kb_path: Knowledge base directory
+
+    Returns:
+        (nodes, edges, sources), ready for KnowledgeBase.from_records
+
+    Raises:
+        FileNotFoundError: If kb.sqlite doesn't exist
+    """
+    with closing(_connect_readonly(kb_path / SQLITE_FILE)) as conn:
+        nodes = [
+            Node.model_validate_json(data)
+            for (data,) in conn.execute("SELECT data FROM nodes ORDER BY rowid")
+        ]
+
+        relationships: dict[str, list[str]] = {}
+        for edge_id, data in conn.execute(
+            "SELECT edge_id, data FROM relationships ORDER BY edge_id, position"
+        ):
+            relationships.setdefault(edge_id, []).append(data)
+        edges = [
+            _edge_from_rows(data, relationships.get(edge_id, []))
+            for edge_id, data in conn.execute(
+                "SELECT id, data FROM edges ORDER BY rowid"
+            )
+        ]
+
+        sources = [
+            Source.model_validate_json(data)
+            for (data,) in conn.execute("SELECT data FROM sources ORDER BY rowid")
+        ]
+    return nodes, edges, sources
+
+
+__all__ = [
+    "SCHEMA_VERSION",
+    "SQLITE_FILE",
+    "read_records",
+    "write_knowledge_base",
+]
@@ -197,3 +197,68 @@ class NodeEvidenceResponse(BaseModel):
 
     node_id: str
     evidence: list[SegmentEvidence]
+    mention_count: int = 0  # All mentions found, including any beyond the limit
+
+
+class PatternMatchNode(BaseModel):
+    """A node bound by a pattern match."""
+
+    id: str
+    label: str
+    entity_type: str
+
+
+class PatternMatchEdge(BaseModel):
+    """An edge traversed by a pattern match."""
+
+    id: str
+    source_node_id: str
+    target_node_id: str
+    relationship_types: list[str]  # The edge's types that satisfied the pattern
+
+
+class PatternMatch(BaseModel):
+    """One path matching a typed pattern, in pattern order."""
+
+    nodes: list[PatternMatchNode]
+    edges: list[PatternMatchEdge]
+
+
+class PatternMatchResponse(BaseModel):
+    """Response model for typed pattern queries."""
+
+    pattern: str
+    matches: list[PatternMatch]
+    has_more: bool
+
+
+class RetractSourceResponse(BaseModel):
+    """Response model for retracting a source from a knowledge graph."""
+
+    source_id: str
+    relationships_removed: int
+    edges_removed: int
+    nodes_removed: int
+    nodes_updated: int
+
+
+class NodeSearchResult(BaseModel):
+    """A node matching a search query, with how it matched."""
+
+    id: str
+    label: str
+    entity_type: str
+    aliases: list[str]
+    score: float  # 0-100; exact > prefix > word prefix > substring > fuzzy
+    match: str  # exact, prefix, word_prefix, substring or fuzzy
+    matched_name: str  # Normalized label or alias that matched
+    degree: int
+
+
+class NodeSearchResponse(BaseModel):
+    """Response model for ranked, paginated node search."""
+
+    query: str
+    results: list[NodeSearchResult]
+    total_count: int
+    has_more: bool
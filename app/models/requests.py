@@ -8,6 +8,7 @@ including chat messages and session initialization.
 from __future__ import annotations
 
 import re
+from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -135,6 +136,10 @@ class CreateProjectRequest(BaseModel):
     """Request model for creating a new KG project."""
 
     name: str = Field(..., min_length=1, max_length=200, description="Project name")
+    storage_backend: Literal["json", "sqlite"] = Field(
+        default="json",
+        description="Knowledge base storage: JSON files or a SQLite database",
+    )
 
 
 class BootstrapRequest(BaseModel):
@@ -163,6 +168,10 @@ class ExtractRequest(BaseModel):
         max_length=50,
         description="Transcript ID (from save_transcript) for evidence linking",
     )
+    replace: bool = Field(
+        default=False,
+        description="Replace results previously extracted from this source_id",
+    )
 
 
 class ExportRequest(BaseModel):
@@ -22,6 +22,8 @@ import tempfile
 import time
 import zipfile
 from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from io import StringIO
 from pathlib import Path
@@ -47,11 +49,19 @@ from app.kg.domain import (
     KGProject,
     ProjectState,
     SeedEntity,
+    StorageBackend,
     ThingType,
 )
 from app.kg.knowledge_base import KnowledgeBase
+from app.kg.mentions import read_transcript_text
 from app.kg.models import Node, Source, SourceType
-from app.kg.persistence import export_graphml, load_knowledge_base, save_knowledge_base
+from app.kg.persistence import (
+    ensure_graphml,
+    export_graphml,
+    get_knowledge_base_revision,
+    load_knowledge_base,
+    save_knowledge_base,
+)
 from app.kg.prompts.bootstrap_prompt import BOOTSTRAP_SYSTEM_PROMPT
 from app.kg.prompts.templates import generate_extraction_prompt
 from app.kg.resolution import MergeHistory, ResolutionCandidate, ResolutionConfig
@@ -179,6 +189,11 @@ class KnowledgeGraphService:
         self._projects: OrderedDict[str, KGProject] = OrderedDict()
         self._max_cache_size = get_settings().kg_project_cache_max_size
 
+        # Live KnowledgeBase cache (kb_id -> (kb, on-disk revision)) with LRU
+        # eviction. Shared by all read paths; writes go through save_kb().
+        self._kbs: OrderedDict[str, tuple[KnowledgeBase, str]] = OrderedDict()
+        self._max_kb_cache_size = get_settings().kg_kb_cache_max_size
+
         # Concurrency control for Claude API calls
         self._claude_semaphore = asyncio.Semaphore(
             get_settings().claude_api_max_concurrent
@@ -206,7 +221,9 @@ class KnowledgeGraphService:
     # PROJECT LIFECYCLE
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-    async def create_project(self, name: str) -> KGProject:
+    async def create_project(
+        self, name: str, storage_backend: StorageBackend = "json"
+    ) -> KGProject:
         """
         Create a new KG project.
 
@@ -215,11 +232,15 @@ class KnowledgeGraphService:
 
         Args:
             name: User-provided project name
+            storage_backend: How the project's knowledge base is stored
+                ("json" files or a "sqlite" database)
 
         Returns:
             The newly created KGProject
         """
-        project = KGProject(name=name, state=ProjectState.CREATED)
+        project = KGProject(
+            name=name, state=ProjectState.CREATED, storage_backend=storage_backend
+        )
 
         # Enforce cache limit before adding
         self._enforce_cache_limit()
@@ -251,8 +272,7 @@ class KnowledgeGraphService:
         project_file = self.projects_path / f"{project_id}.json"
         if project_file.exists():
             try:
-                data = json.loads(project_file.read_text(encoding="utf-8"))
-                project = KGProject.model_validate(data)
+                project = KGProject.model_validate_json(project_file.read_bytes())
                 # Enforce cache limit before adding
                 self._enforce_cache_limit()
                 self._projects[project_id] = project
@@ -276,8 +296,7 @@ class KnowledgeGraphService:
 
         for f in self.projects_path.glob("*.json"):
             try:
-                data = json.loads(f.read_text(encoding="utf-8"))
-                project = KGProject.model_validate(data)
+                project = KGProject.model_validate_json(f.read_bytes())
                 projects.append(project)
             except (json.JSONDecodeError, ValueError) as e:
                 logger.warning(f"Skipping invalid project file {f.name}: {e}")
@@ -309,6 +328,8 @@ class KnowledgeGraphService:
         # Remove from cache
         if project_id in self._projects:
             del self._projects[project_id]
+        if project.kb_id:
+            self._kbs.pop(project.kb_id, None)
 
         # Delete project JSON file
         project_file = self.projects_path / f"{project_id}.json"
@@ -735,6 +756,7 @@ Call all bootstrap tools in order to build a complete domain profile.
         title: str,
         source_id: str,
         transcript_id: str | None = None,
+        replace: bool = False,
     ) -> dict[str, Any]:
         """
         Extract entities and relationships from a transcript.
@@ -743,6 +765,12 @@ Call all bootstrap tools in order to build a complete domain profile.
         the extraction MCP tool to analyze content and return structured data.
         Results are stored in the project's KnowledgeBase.
 
+        With replace, a source extracted before is re-extracted: its previous
+        results are retracted only once the new ones are in, in the same
+        synchronous step that applies them, so readers of the live KB see
+        either the old results or the new ones and a failed extraction
+        leaves the old ones in place.
+
         Args:
             project_id: Target project ID
             transcript: Full transcript text to extract from
@@ -750,6 +778,8 @@ Call all bootstrap tools in order to build a complete domain profile.
             source_id: Unique identifier for this source
             transcript_id: Optional transcript ID for evidence linking (from save_transcript).
                            If not provided, auto-detection by title is attempted.
+            replace: Retract the source's previous results before applying
+                     the new ones
 
         Returns:
             Dict with extraction statistics:
@@ -757,6 +787,7 @@ Call all bootstrap tools in order to build a complete domain profile.
             - relationships_extracted: Number of relationships found
             - discoveries: Number of new type discoveries
             - summary: Optional summary from the extraction
+            - retracted: Counts from retract_source (only when replacing)
 
         Raises:
             ValueError: If project not found or not bootstrapped
@@ -771,9 +802,6 @@ Call all bootstrap tools in order to build a complete domain profile.
 
         logger.info(f"Starting extraction for project {project_id}, source: {title}")
 
-        # Get or create KB
-        kb = await self._get_or_create_kb(project)
-
         # Generate extraction prompt from domain profile
         prompt = generate_extraction_prompt(
             profile=project.domain_profile,
@@ -881,80 +909,107 @@ Call all bootstrap tools in order to build a complete domain profile.
         else:
             logger.warning("No transcript_id resolved - evidence linking will not work")
 
-        source = Source(
-            id=source_id,
-            title=title,
-            source_type=SourceType.VIDEO,
-            metadata=source_metadata,
-        )
-        logger.debug(
-            f"Created Source: id={source.id}, title={source.title}, metadata={source.metadata}"
-        )
-        kb.add_source(source)
+        # Get or create KB only now that results are in, so concurrent merges
+        # made while the agent was running are not overwritten
+        kb = await self._get_or_create_kb(project)
 
-        # Apply extraction results to KB
-        newly_added_nodes = self._apply_extraction_to_kb(
-            kb, extraction_result, source_id
-        )
+        # From here on nothing awaits until the KB is saved, so the swap of
+        # old results for new is atomic with respect to other requests
+        retracted: dict[str, int] | None = None
+        with self.kb_transaction(kb):
+            if replace and kb.get_source(source_id) is not None:
+                # Entities named again keep their node (and ID) if orphaned
+                retracted = kb.retract_source(
+                    source_id,
+                    keep_labels=[
+                        name
+                        for entity in extraction_result.entities
+                        for name in (entity.label, *entity.aliases)
+                    ],
+                )
+                self._prune_pending_merges(project, kb)
+                logger.info(
+                    f"Retracted previous results of source {source_id}: {retracted}"
+                )
 
-        # Proactive entity resolution for newly added nodes
-        auto_merge_count = 0
-        review_count = 0
-        config = project.resolution_config
+            source = Source(
+                id=source_id,
+                title=title,
+                source_type=SourceType.VIDEO,
+                metadata=source_metadata,
+            )
+            logger.debug(
+                f"Created Source: id={source.id}, title={source.title}, metadata={source.metadata}"
+            )
+            kb.add_source(source)
 
-        for new_node in newly_added_nodes:
-            # Check if new node still exists (may have been merged already)
-            if kb.get_node(new_node.id) is None:
-                continue
+            # Apply extraction results to KB
+            newly_added_nodes = self._apply_extraction_to_kb(
+                kb, extraction_result, source_id
+            )
 
-            candidates = kb.find_candidates_for_node(new_node, config)
-            for candidate in candidates:
-                # Skip if either node no longer exists
-                if kb.get_node(candidate.node_a_id) is None:
-                    continue
-                if kb.get_node(candidate.node_b_id) is None:
+            # Index mentions before resolution, so merges carry them over
+            if resolved_transcript_id:
+                self._index_transcript_mentions(kb, source_id, resolved_transcript_id)
+
+            # Proactive entity resolution for newly added nodes
+            auto_merge_count = 0
+            review_count = 0
+            config = project.resolution_config
+
+            for new_node in newly_added_nodes:
+                # Check if new node still exists (may have been merged already)
+                if kb.get_node(new_node.id) is None:
                     continue
 
-                if candidate.confidence >= config.auto_merge_threshold:
-                    # Auto-merge high confidence matches
-                    try:
-                        # new_node.id is node_a_id, merge it into the existing node
-                        history = kb.merge_nodes(
-                            survivor_id=candidate.node_b_id,
-                            merged_id=candidate.node_a_id,
-                            merge_type="auto",
-                        )
-                        history.confidence = candidate.confidence
-                        project.merge_history.append(history)
-                        auto_merge_count += 1
-                        logger.debug(
-                            f"Auto-merged new node {new_node.label} into existing "
-                            f"node {candidate.node_b_id} (confidence: {candidate.confidence:.2f})"
-                        )
-                        # Node was merged, stop looking for more candidates
-                        break
-                    except ValueError:
-                        # Node disappeared during processing
+                candidates = kb.find_candidates_for_node(new_node, config)
+                for candidate in candidates:
+                    # Skip if either node no longer exists
+                    if kb.get_node(candidate.node_a_id) is None:
+                        continue
+                    if kb.get_node(candidate.node_b_id) is None:
                         continue
-                elif candidate.confidence >= config.review_threshold:
-                    # Queue for user review (avoid duplicates)
-                    already_pending = any(
-                        pm.node_a_id == candidate.node_a_id
-                        and pm.node_b_id == candidate.node_b_id
-                        for pm in project.pending_merges
-                    )
-                    if not already_pending:
-                        project.pending_merges.append(candidate)
-                        review_count += 1
 
-        if auto_merge_count > 0 or review_count > 0:
-            logger.info(
-                f"Proactive resolution: {auto_merge_count} auto-merges, "
-                f"{review_count} candidates queued for review"
-            )
+                    if candidate.confidence >= config.auto_merge_threshold:
+                        # Auto-merge high confidence matches
+                        try:
+                            # new_node.id is node_a_id, merge it into the existing node
+                            history = kb.merge_nodes(
+                                survivor_id=candidate.node_b_id,
+                                merged_id=candidate.node_a_id,
+                                merge_type="auto",
+                            )
+                            history.confidence = candidate.confidence
+                            project.merge_history.append(history)
+                            auto_merge_count += 1
+                            logger.debug(
+                                f"Auto-merged new node {new_node.label} into existing "
+                                f"node {candidate.node_b_id} (confidence: {candidate.confidence:.2f})"
+                            )
+                            # Node was merged, stop looking for more candidates
+                            break
+                        except ValueError:
+                            # Node disappeared during processing
+                            continue
+                    elif candidate.confidence >= config.review_threshold:
+                        # Queue for user review (avoid duplicates)
+                        already_pending = any(
+                            pm.node_a_id == candidate.node_a_id
+                            and pm.node_b_id == candidate.node_b_id
+                            for pm in project.pending_merges
+                        )
+                        if not already_pending:
+                            project.pending_merges.append(candidate)
+                            review_count += 1
+
+            if auto_merge_count > 0 or review_count > 0:
+                logger.info(
+                    f"Proactive resolution: {auto_merge_count} auto-merges, "
+                    f"{review_count} candidates queued for review"
+                )
 
-        # Save KB
-        save_knowledge_base(kb, self.kb_path)
+            # Save KB
+            self.save_kb(kb, backend=project.storage_backend)
 
         # Update project stats
         stats = kb.stats()
@@ -987,12 +1042,98 @@ Call all bootstrap tools in order to build a complete domain profile.
             f"{len(extraction_result.discoveries)} discoveries"
         )
 
-        return {
+        result: dict[str, Any] = {
             "entities_extracted": len(extraction_result.entities),
             "relationships_extracted": len(extraction_result.relationships),
             "discoveries": len(extraction_result.discoveries),
             "summary": extraction_result.summary,
         }
+        if retracted is not None:
+            result["retracted"] = retracted
+        return result
+
+    async def retract_source(self, project_id: str, source_id: str) -> dict[str, int]:
+        """
+        Remove a source and everything only it contributed from a project.
+
+        See KnowledgeBase.retract_source. Pending merge candidates that
+        refer to removed nodes are dropped and project counts updated.
+
+        Args:
+            project_id: Target project ID
+            source_id: ID of the source to retract
+
+        Returns:
+            Dict with relationships_removed, edges_removed, nodes_removed
+            and nodes_updated counts
+
+        Raises:
+            ValueError: If the project, its KB or the source is not found
+        """
+        project = await self.get_project(project_id)
+        if not project:
+            raise ValueError(f"Project {project_id} not found")
+
+        if not project.kb_id:
+            raise ValueError(f"Project {project_id} has no knowledge base")
+
+        kb = self.load_kb(project.kb_id)
+        if not kb:
+            raise ValueError(f"Knowledge base not found for project {project_id}")
+
+        with self.kb_transaction(kb):
+            retracted = kb.retract_source(source_id)
+            self._prune_pending_merges(project, kb)
+            self.save_kb(kb, backend=project.storage_backend)
+
+        stats = kb.stats()
+        project.thing_count = stats["node_count"]
+        project.connection_count = stats["edge_count"]
+        project.source_count = stats["source_count"]
+        project.updated_at = _utc_now()
+        await self._save_project(project)
+
+        logger.info(
+            f"Retracted source {source_id} from project {project_id}: {retracted}"
+        )
+        return retracted
+
+    @staticmethod
+    def _prune_pending_merges(project: KGProject, kb: KnowledgeBase) -> None:
+        """Drop pending merge candidates that refer to nodes no longer in the KB."""
+        project.pending_merges = [
+            pm
+            for pm in project.pending_merges
+            if kb.get_node(pm.node_a_id) is not None
+            and kb.get_node(pm.node_b_id) is not None
+        ]
+
+    def _index_transcript_mentions(
+        self, kb: KnowledgeBase, source_id: str, transcript_id: str
+    ) -> None:
+        """
+        Index where the KB's entities are mentioned in a saved transcript.
+
+        Failures are logged, not raised: evidence lookups fall back to
+        searching the transcript when a source has no index.
+
+        Args:
+            kb: Knowledge base containing the source
+            source_id: Source the transcript was extracted into
+            transcript_id: Saved transcript ID (from save_transcript)
+        """
+        from app.services import get_services
+
+        try:
+            raw_metadata = get_services().storage.get_transcript_raw(transcript_id)
+            file_path = raw_metadata.get("file_path") if raw_metadata else None
+            if not file_path:
+                logger.debug(f"No transcript file to index for {transcript_id}")
+                return
+            count = kb.index_mentions(source_id, read_transcript_text(Path(file_path)))
+            logger.debug(f"Indexed {count} mentions in transcript {transcript_id}")
+        except (OSError, RuntimeError, ValueError) as e:
+            logger.warning(f"Failed to index mentions for {transcript_id}: {e}")
 
     def _apply_extraction_to_kb(
         self,
@@ -1024,11 +1165,11 @@ Call all bootstrap tools in order to build a complete domain profile.
                 aliases=entity.aliases,
                 description=entity.description,
             )
-            node.add_source(source_id)
+            kb.add_node_source(node.id, source_id)
 
             # Add any new aliases from this extraction
             for alias in entity.aliases:
-                node.add_alias(alias)
+                kb.add_alias(node.id, alias)
 
             if created:
                 newly_added_nodes.append(node)
@@ -1060,13 +1201,13 @@ Call all bootstrap tools in order to build a complete domain profile.
             KnowledgeBase instance (existing or newly created)
         """
         if project.kb_id:
-            kb_path = self.kb_path / project.kb_id
-            kb = load_knowledge_base(kb_path)
+            kb = self.load_kb(project.kb_id)
             if kb:
                 return kb
             # Existing KB failed to load - log warning for investigation
             logger.warning(
-                f"Failed to load existing KB at {kb_path} for project {project.id}. "
+                f"Failed to load existing KB at {self.kb_path / project.kb_id} "
+                f"for project {project.id}. "
                 f"Creating new KB. This may indicate data corruption."
             )
 
@@ -1174,7 +1315,7 @@ Call all bootstrap tools in order to build a complete domain profile.
         if not project or not project.kb_id:
             return None
 
-        kb = load_knowledge_base(self.kb_path / project.kb_id)
+        kb = self.load_kb(project.kb_id)
         if not kb:
             return None
 
@@ -1185,7 +1326,11 @@ Call all bootstrap tools in order to build a complete domain profile.
         output_file = export_path / f"{project_id}.{export_format}"
 
         if export_format == "graphml":
-            export_graphml(kb, output_file)
+            cached = ensure_graphml(kb, self.kb_path)
+            if cached:
+                shutil.copyfile(cached, output_file)
+            else:
+                export_graphml(kb, output_file)
         elif export_format == "csv":
             output_file = self._export_csv(kb, project_id, export_path)
         else:
@@ -1364,7 +1509,7 @@ Call all bootstrap tools in order to build a complete domain profile.
                         logger.warning(f"Skipping project {project_id}: no graph data")
                         continue
 
-                    kb = load_knowledge_base(self.kb_path / project.kb_id)
+                    kb = self.load_kb(project.kb_id)
                     if not kb:
                         logger.warning(f"Skipping project {project_id}: KB not found")
                         continue
@@ -1430,6 +1575,10 @@ Call all bootstrap tools in order to build a complete domain profile.
 
     def _create_graphml_content(self, kb: KnowledgeBase) -> str:
         """Create GraphML content as string."""
+        cached = ensure_graphml(kb, self.kb_path)
+        if cached:
+            return cached.read_text()
+
         # Use a temporary file to generate GraphML
         with tempfile.NamedTemporaryFile(
             mode="w", suffix=".graphml", delete=False
@@ -1498,7 +1647,7 @@ Call all bootstrap tools in order to build a complete domain profile.
         if not project or not project.kb_id:
             return None
 
-        kb = load_knowledge_base(self.kb_path / project.kb_id)
+        kb = self.load_kb(project.kb_id)
         if not kb:
             return None
 
@@ -1508,8 +1657,9 @@ Call all bootstrap tools in order to build a complete domain profile.
         """
         Get the knowledge base for a project.
 
-        Loads the KnowledgeBase from disk if it exists. Used for
-        insight queries and graph analysis operations.
+        Returns the cached live KnowledgeBase, loading it from disk only
+        when it is not cached or has changed on disk. Used for insight
+        queries and graph analysis operations.
 
         Args:
             project_id: ID of the project
@@ -1521,12 +1671,140 @@ Call all bootstrap tools in order to build a complete domain profile.
         if not project or not project.kb_id:
             return None
 
-        return load_knowledge_base(self.kb_path / project.kb_id)
+        return self.load_kb(project.kb_id)
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # CACHE MANAGEMENT
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+    def load_kb(self, kb_id: str) -> KnowledgeBase | None:
+        """
+        Get a live KnowledgeBase by ID, loading from disk only when needed.
+
+        Cached instances are validated against the revision stamped in
+        meta.json, which is cheap to read. Saves made outside this service
+        (e.g. another process) change the revision and force a reload.
+
+        Callers share the returned object, so any mutation must be
+        persisted with save_kb().
+
+        Args:
+            kb_id: 12-character knowledge base identifier
+
+        Returns:
+            KnowledgeBase if found, None otherwise
+        """
+        kb_dir = self.kb_path / kb_id
+        revision = get_knowledge_base_revision(kb_dir)
+        if revision is None:
+            self._kbs.pop(kb_id, None)
+            return None
+
+        cached = self._kbs.get(kb_id)
+        if cached is not None and cached[1] == revision:
+            # Move to end (LRU update)
+            self._kbs.move_to_end(kb_id)
+            return cached[0]
+
+        kb = load_knowledge_base(kb_dir)
+        if kb is None:
+            self._kbs.pop(kb_id, None)
+            return None
+
+        self._cache_kb(kb, revision)
+        return kb
+
+    def state_tag(self, project_id: str) -> str | None:
+        """
+        Cheap fingerprint of a project's current state, for HTTP ETags.
+
+        Combines the project file's modification stamp, the knowledge
+        base's on-disk revision and, if that revision is cached, the live
+        KB's generation (so unsaved changes count). Only stat/meta.json
+        reads are involved; nothing is loaded.
+
+        Args:
+            project_id: 12-character project identifier
+
+        Returns:
+            Opaque tag that changes whenever the project or its graph
+            does, or None if the project isn't cached (the state can't be
+            fingerprinted without loading it)
+        """
+        project = self._projects.get(project_id)
+        if project is None:
+            return None
+        try:
+            stat = (self.projects_path / f"{project_id}.json").stat()
+        except OSError:
+            return None
+
+        parts = [f"{stat.st_mtime_ns}.{stat.st_size}"]
+        if project.kb_id:
+            revision = get_knowledge_base_revision(self.kb_path / project.kb_id)
+            parts.append(revision or "-")
+            cached = self._kbs.get(project.kb_id)
+            if cached is not None and cached[1] == revision:
+                parts.append(f"{cached[0].feed_epoch}.{cached[0].generation}")
+        return ":".join(parts)
+
+    def save_kb(self, kb: KnowledgeBase, backend: str | None = None) -> None:
+        """
+        Persist a KnowledgeBase and keep it cached (write-through).
+
+        Args:
+            kb: KnowledgeBase to save
+            backend: Storage backend ("json" or "sqlite"); None keeps the
+                backend already on disk
+        """
+        settings = get_settings()
+        with self.kb_transaction(kb):
+            revision = save_knowledge_base(
+                kb,
+                self.kb_path,
+                journaled=settings.kg_journal_enabled,
+                compact_ratio=settings.kg_journal_compact_ratio,
+                backend=backend,
+                compact=settings.kg_compact_json,
+            )
+        self._cache_kb(kb, revision)
+
+    @contextmanager
+    def kb_transaction(self, kb: KnowledgeBase) -> Iterator[KnowledgeBase]:
+        """
+        Guard a mutate-then-save section on a shared KnowledgeBase.
+
+        Cached KBs are live objects shared by all readers. If the block
+        raises before its changes are saved, the KB is dropped from the
+        cache so the next load_kb() reads the last saved state from disk
+        instead of serving (and later persisting) half-applied changes.
+
+        Args:
+            kb: KnowledgeBase about to be mutated
+
+        Yields:
+            The same KnowledgeBase
+        """
+        try:
+            yield kb
+        except BaseException:
+            self._kbs.pop(kb.id, None)
+            raise
+
+    def _cache_kb(self, kb: KnowledgeBase, revision: str) -> None:
+        """
+        Store a KnowledgeBase in the LRU cache, evicting the oldest entries.
+
+        Args:
+            kb: KnowledgeBase to cache
+            revision: On-disk revision the in-memory object corresponds to
+        """
+        self._kbs.pop(kb.id, None)
+        while self._kbs and len(self._kbs) >= self._max_kb_cache_size:
+            evicted_id, _ = self._kbs.popitem(last=False)
+            logger.info(f"KB cache eviction: removed knowledge base {evicted_id}")
+        self._kbs[kb.id] = (kb, revision)
+
     def _enforce_cache_limit(self) -> None:
         """
         Evict oldest entries if cache exceeds limit.
@@ -1562,8 +1840,9 @@ Call all bootstrap tools in order to build a complete domain profile.
         )
 
         try:
+            indent = None if get_settings().kg_compact_json else 2
             with os.fdopen(fd, "w", encoding="utf-8") as f:
-                f.write(project.model_dump_json(indent=2))
+                f.write(project.model_dump_json(indent=indent))
 
             # Atomic rename
             os.replace(temp_path, project_file)
@@ -1618,7 +1897,7 @@ Call all bootstrap tools in order to build a complete domain profile.
         if not project.kb_id:
             raise ValueError(f"Project {project_id} has no knowledge base")
 
-        kb = load_knowledge_base(self.kb_path / project.kb_id)
+        kb = self.load_kb(project.kb_id)
         if not kb:
             raise ValueError(f"Knowledge base not found for project {project_id}")
 
@@ -1687,7 +1966,7 @@ Call all bootstrap tools in order to build a complete domain profile.
         if not project.kb_id:
             return []
 
-        kb = load_knowledge_base(self.kb_path / project.kb_id)
+        kb = self.load_kb(project.kb_id)
         if not kb:
             return []
 
@@ -1746,7 +2025,7 @@ Call all bootstrap tools in order to build a complete domain profile.
             if not project.kb_id:
                 raise ValueError(f"Project {project_id} has no knowledge base")
 
-            kb = load_knowledge_base(self.kb_path / project.kb_id)
+            kb = self.load_kb(project.kb_id)
             if not kb:
                 raise ValueError(f"Knowledge base not found for project {project_id}")
 
@@ -1767,40 +2046,41 @@ Call all bootstrap tools in order to build a complete domain profile.
             survivor_aliases_before = list(survivor.aliases)
             edges_redirected = len(pre_merge_state["edges"])
 
-            # Execute the merge in the KB
-            history = kb.merge_nodes(
-                survivor_id=survivor_id,
-                merged_id=merged_id,
-                merge_type=merge_type,
-                merged_by=session_id,
-            )
+            with self.kb_transaction(kb):
+                # Execute the merge in the KB
+                history = kb.merge_nodes(
+                    survivor_id=survivor_id,
+                    merged_id=merged_id,
+                    merge_type=merge_type,
+                    merged_by=session_id,
+                )
 
-            # Attach safety data
-            history.request_id = request_id
-            history.pre_merge_state = pre_merge_state
-            history.survivor_label_before = survivor_label_before
-            history.survivor_aliases_before = survivor_aliases_before
-            history.edges_redirected = edges_redirected
-            history.confidence = confidence
-
-            # Append to project's merge history
-            project.merge_history.append(history)
-
-            # Remove any pending merges involving the merged node
-            project.pending_merges = [
-                pm
-                for pm in project.pending_merges
-                if pm.node_a_id != merged_id and pm.node_b_id != merged_id
-            ]
+                # Attach safety data
+                history.request_id = request_id
+                history.pre_merge_state = pre_merge_state
+                history.survivor_label_before = survivor_label_before
+                history.survivor_aliases_before = survivor_aliases_before
+                history.edges_redirected = edges_redirected
+                history.confidence = confidence
+
+                # Append to project's merge history
+                project.merge_history.append(history)
+
+                # Remove any pending merges involving the merged node
+                project.pending_merges = [
+                    pm
+                    for pm in project.pending_merges
+                    if pm.node_a_id != merged_id and pm.node_b_id != merged_id
+                ]
 
-            # Update project stats
-            stats = kb.stats()
-            project.thing_count = stats["node_count"]
-            project.connection_count = stats["edge_count"]
-            project.updated_at = _utc_now()
+                # Update project stats
+                stats = kb.stats()
+                project.thing_count = stats["node_count"]
+                project.connection_count = stats["edge_count"]
+                project.updated_at = _utc_now()
 
-            # Save KB and project
-            save_knowledge_base(kb, self.kb_path)
+                # Save KB and project
+                self.save_kb(kb, backend=project.storage_backend)
             await self._save_project(project)
 
             # Clean up lock
@@ -1852,7 +2132,7 @@ Call all bootstrap tools in order to build a complete domain profile.
         if not project.kb_id:
             return {"conflict": True, "reason": "No knowledge base"}
 
-        kb = load_knowledge_base(self.kb_path / project.kb_id)
+        kb = self.load_kb(project.kb_id)
         if not kb:
             return {"conflict": True, "reason": "Knowledge base not found"}
 
@@ -2023,7 +2303,7 @@ Call all bootstrap tools in order to build a complete domain profile.
         if not project.kb_id:
             raise ValueError(f"Project {project_id} has no knowledge base")
 
-        kb = load_knowledge_base(self.kb_path / project.kb_id)
+        kb = self.load_kb(project.kb_id)
         if not kb:
             raise ValueError(f"Knowledge base not found for project {project_id}")
 
@@ -44,6 +44,7 @@ export const state = {
     // KG Graph View State
     kgCurrentView: localStorage.getItem(KG_VIEW_STORAGE_KEY) || 'list',
     cytoscapeInstance: null,
+    kgGraphSync: null,  // Stops the graph change feed subscription
     selectedNodeData: null,
     graphResizeObserver: null,
 
@@ -4,7 +4,7 @@
 import { state, KG_VIEW_STORAGE_KEY } from '../core/state.js';
 import { escapeHtml } from '../core/utils.js';
 import { showToast } from '../ui/toast.js';
-import { TYPE_COLOR_PALETTE, DEFAULT_TYPE_COLOR } from '../core/config.js';
+import { TYPE_COLOR_PALETTE, DEFAULT_TYPE_COLOR, getKGPollInterval } from '../core/config.js';
 
 // Circular dependency resolution - inspector module will call setInspectorModule
 let inspectorModule = null;
@@ -92,14 +92,18 @@ function toggleKGView(view) {
 // KG Graph Visualization
 // ============================================
 
-async function initKGGraph(projectId) {
+// view selects the server-side level of detail, e.g. { mode: 'ego', focus: id };
+// by default the server sends the most central entities of large graphs
+async function initKGGraph(projectId, view = {}) {
     if (!window.cytoscape) {
         showToast('Cytoscape library not loaded', 'error');
         return;
     }
 
+    stopGraphSync();
     try {
-        const response = await fetch(`/kg/projects/${projectId}/graph-data`);
+        const params = new URLSearchParams(view);
+        const response = await fetch(`/kg/projects/${projectId}/graph-data?${params}`);
         if (!response.ok) {
             if (response.status === 404) {
                 renderEmptyGraph();
@@ -111,6 +115,7 @@ async function initKGGraph(projectId) {
         const graphData = await response.json();
         renderGraph(graphData);
         updateGraphStats(graphData);
+        startGraphSync(projectId, view, graphData.meta);
     } catch (e) {
         console.error('Failed to initialize graph:', e);
         showToast(e.message, 'error');
@@ -161,6 +166,10 @@ function renderGraph(data) {
     // Store mapping in state for use by search/filter
     state.kgTypeColors = typeColors;
 
+    // Use the server's precomputed layout when every node has a position;
+    // otherwise fall back to simulating one in the browser
+    const hasServerLayout = data.nodes.length > 0 && data.nodes.every(n => n.position);
+
     // Helper to get color for a type
     const getTypeColor = (type) => typeColors[type] || DEFAULT_TYPE_COLOR;
 
@@ -311,7 +320,11 @@ function renderGraph(data) {
                 }
             }
         ],
-        layout: {
+        layout: hasServerLayout ? {
+            name: 'preset',
+            fit: true,
+            padding: 40
+        } : {
             name: 'cose',
             animate: true,
             animationDuration: 800,
@@ -562,6 +575,109 @@ function resetGraphView() {
     state.cytoscapeInstance.center();
 }
 
+// Live Graph Updates
+// ============================================
+
+// Follow the server's change feed and apply deltas to the rendered graph,
+// instead of re-fetching it. Uses the SSE stream, or polls /changes where
+// EventSource is unavailable; re-fetches the view when told to resync.
+function startGraphSync(projectId, view, meta) {
+    stopGraphSync();
+    if (!meta?.epoch) return;
+
+    let { epoch, version } = meta;
+    const handleBatch = (batch) => {
+        if (batch.resync || (batch.changes.length > 0 && meta.mode === 'communities')) {
+            // Supernodes can't be patched; the view is rebuilt server-side
+            stopGraphSync();
+            initKGGraph(projectId, view);
+            return;
+        }
+        ({ epoch, version } = batch);
+        applyGraphChanges(batch.changes, meta);
+    };
+
+    if (window.EventSource) {
+        const params = new URLSearchParams({ since: version, epoch });
+        const source = new EventSource(`/kg/projects/${projectId}/changes/stream?${params}`);
+        const onEvent = (evt) => handleBatch(JSON.parse(evt.data));
+        source.addEventListener('changes', onEvent);
+        source.addEventListener('resync', onEvent);
+        state.kgGraphSync = () => source.close();
+    } else {
+        const timer = setInterval(async () => {
+            try {
+                const params = new URLSearchParams({ since: version, epoch });
+                const response = await fetch(`/kg/projects/${projectId}/changes?${params}`);
+                if (response.ok) handleBatch(await response.json());
+            } catch (e) {
+                console.error('Failed to sync graph changes:', e);
+            }
+        }, getKGPollInterval());
+        state.kgGraphSync = () => clearInterval(timer);
+    }
+}
+
+function stopGraphSync() {
+    if (state.kgGraphSync) {
+        state.kgGraphSync();
+        state.kgGraphSync = null;
+    }
+}
+
+function applyGraphChanges(changes, meta) {
+    const cy = state.cytoscapeInstance;
+    if (!cy || changes.length === 0) return;
+
+    // Truncated views show a selection of the graph, so only views showing
+    // everything gain new nodes; others just update what they show
+    const showsAll = !meta.truncated && (meta.mode === 'full' || meta.mode === 'top');
+    const addedNodes = [];
+
+    cy.batch(() => {
+        // Nodes first, so new edges find their endpoints
+        for (const kind of ['node', 'edge']) {
+            changes.filter(change => change.kind === kind).forEach(change => {
+                const existing = cy.getElementById(change.id);
+                if (change.op === 'delete') {
+                    existing.remove();
+                } else if (existing.nonempty()) {
+                    existing.data(change.element.data);
+                } else if (kind === 'node') {
+                    if (showsAll) addedNodes.push(cy.add(change.element));
+                } else {
+                    const { source, target } = change.element.data;
+                    if (cy.getElementById(source).nonempty() && cy.getElementById(target).nonempty()) {
+                        cy.add(change.element);
+                    }
+                }
+            });
+        }
+
+        // Sizes follow the degree within the shown graph
+        cy.nodes().forEach(node => node.data('degree', node.degree(false)));
+
+        // Place new nodes next to their neighbors
+        const center = { x: (cy.extent().x1 + cy.extent().x2) / 2, y: (cy.extent().y1 + cy.extent().y2) / 2 };
+        addedNodes.forEach(node => {
+            const neighbors = node.neighborhood('node').not(addedNodes);
+            const anchor = neighbors.nonempty()
+                ? {
+                    x: neighbors.reduce((sum, n) => sum + n.position('x'), 0) / neighbors.length,
+                    y: neighbors.reduce((sum, n) => sum + n.position('y'), 0) / neighbors.length
+                }
+                : center;
+            node.position({ x: anchor.x + (Math.random() - 0.5) * 80, y: anchor.y + (Math.random() - 0.5) * 80 });
+        });
+    });
+
+    updateGraphStats({
+        nodes: cy.nodes().map(node => ({ data: node.data() })),
+        edges: cy.edges().map(edge => ({ data: edge.data() })),
+        meta
+    });
+}
+
 function updateGraphStats(data) {
     const nodes = data.nodes || [];
     const edges = data.edges || [];
@@ -569,8 +685,12 @@ function updateGraphStats(data) {
     // Count unique entity types
     const types = new Set(nodes.map(n => n.data.type));
 
-    document.getElementById('kg-stat-nodes').textContent = nodes.length;
-    document.getElementById('kg-stat-edges').textContent = edges.length;
+    // Large graphs arrive truncated; show how much of the graph is loaded
+    const meta = data.meta;
+    document.getElementById('kg-stat-nodes').textContent =
+        meta?.truncated ? `${nodes.length} / ${meta.total_nodes}` : nodes.length;
+    document.getElementById('kg-stat-edges').textContent =
+        meta?.truncated ? `${edges.length} / ${meta.total_edges}` : edges.length;
 }
 
 export {
@@ -587,5 +707,7 @@ export {
     resetGraphView,
     renderEmptyGraph,
     updateGraphStats,
+    startGraphSync,
+    stopGraphSync,
     setInspectorModule
 };
@@ -39,7 +39,9 @@ export {
     fitGraphView,
     resetGraphView,
     renderEmptyGraph,
-    updateGraphStats
+    updateGraphStats,
+    startGraphSync,
+    stopGraphSync
 } from './graph.js';
 export { initGraphSearch, performGraphSearch, navigateToNode, hideSearchResults, toggleTypeFilter, clearAllFilters } from './search.js';
 export {
@@ -8,6 +8,9 @@ import { fetchNodeEvidence, renderEvidenceSection } from './evidence.js';
 import { getPendingMerges } from './api.js';
 import { showMergeModal, getConfidenceLevel } from './merge-modal.js';
 
+// Connections list: first page of neighbors, most connected first
+const NEIGHBOR_QUERY = 'sort=degree&limit=200&fields=id,label,entity_type';
+
 // Circular dependency resolution - graph module will call setGraphModule
 let graphModule = null;
 
@@ -27,7 +30,7 @@ async function selectNode(nodeData) {
 
         // Fetch neighbors, evidence, and duplicates in parallel
         const [neighborsResponse, evidence, duplicates] = await Promise.all([
-            fetch(`/kg/projects/${state.kgCurrentProjectId}/nodes/${nodeData.id}/neighbors`),
+            fetch(`/kg/projects/${state.kgCurrentProjectId}/nodes/${nodeData.id}/neighbors?${NEIGHBOR_QUERY}`),
             fetchNodeEvidence(state.kgCurrentProjectId, nodeData.id),
             loadPotentialDuplicates(nodeData.id, state.kgCurrentProjectId)
         ]);
@@ -37,7 +40,7 @@ async function selectNode(nodeData) {
         }
 
         const neighbors = await neighborsResponse.json();
-        updateInspector(nodeData, neighbors, evidence, duplicates);
+        updateInspector(nodeData, neighbors.items, evidence, duplicates, neighbors.total_count);
         showInspector();
     } catch (e) {
         console.error('Failed to select node:', e);
@@ -45,7 +48,7 @@ async function selectNode(nodeData) {
     }
 }
 
-function updateInspector(nodeData, neighbors, evidence = null, duplicates = []) {
+function updateInspector(nodeData, neighbors, evidence = null, duplicates = [], neighborCount = neighbors.length) {
     const inspectorTitle = document.getElementById('kg-inspector-title');
     const inspectorContent = document.getElementById('kg-inspector-content');
 
@@ -99,7 +102,7 @@ function updateInspector(nodeData, neighbors, evidence = null, duplicates = [])
     if (neighbors && neighbors.length > 0) {
         html += `
             <div class="inspector-connections-section">
-                <div class="text-[10px] font-semibold text-[var(--text-muted)] uppercase tracking-wide mb-2">Connections (${neighbors.length})</div>
+                <div class="text-[10px] font-semibold text-[var(--text-muted)] uppercase tracking-wide mb-2">Connections (${neighborCount})</div>
                 <div class="connection-list">
                     ${neighbors.map(neighbor => `
                         <button onclick="window.kg_selectNodeById('${neighbor.id}')"
@@ -9,7 +9,7 @@ import { kgClient, getPendingMerges, reviewMergeCandidate } from './api.js';
 import { startKGPolling, stopKGPolling, refreshKGProjectStatus } from './polling.js';
 import { updateKGUI } from './ui.js';
 import { showMergeModal, getConfidenceLevel } from './merge-modal.js';
-import { initKGGraph } from './graph.js';
+import { initKGGraph, stopGraphSync } from './graph.js';
 
 function toggleKGPanel() {
     if (!state.kgContent || !state.kgCaret) return;
@@ -95,6 +95,7 @@ async function deleteKGProject(projectId, projectName) {
             state.kgDropdownLabel.textContent = '-- Select Project --';
             state.kgWorkflow?.classList.add('hidden');
             stopKGPolling();
+            stopGraphSync();
         }
 
         // Refresh the project list
@@ -293,6 +294,9 @@ function handleDropdownKeydown(e) {
 }
 
 async function selectKGProject(projectId) {
+    // The rendered graph belongs to the previous project
+    stopGraphSync();
+
     if (!projectId) {
         state.kgCurrentProjectId = null;
         state.kgCurrentProject = null;
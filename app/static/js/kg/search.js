@@ -3,13 +3,17 @@
 
 import { state } from '../core/state.js';
 import { DEFAULT_TYPE_COLOR } from '../core/config.js';
-import { highlightNodeNeighborhood, clearHighlights } from './graph.js';
+import { highlightNodeNeighborhood, clearHighlights, initKGGraph } from './graph.js';
 import { selectNode } from './inspector.js';
 
 // Search state
 let graphSearchData = []; // Cache of all nodes for searching
 let searchSelectedIndex = -1;
 let activeTypeFilters = new Set(); // Active entity type filters
+let searchRequestId = 0; // Latest search; responses to older ones are dropped
+
+// Results requested per server search (the dropdown shows the top 8)
+const SEARCH_RESULT_LIMIT = 8;
 
 // escapeHtml utility - uses DOMPurify if available, falls back to textContent
 function escapeHtml(text) {
@@ -106,12 +110,84 @@ function initGraphSearch() {
     });
 }
 
-function performGraphSearch(query) {
+async function performGraphSearch(query) {
     if (!state.cytoscapeInstance) return;
 
     const resultsContainer = document.getElementById('kg-search-results');
     if (!resultsContainer) return;
 
+    const requestId = ++searchRequestId;
+    let result;
+    if (activeTypeFilters.size > 1) {
+        // The server filters on one entity type; search the loaded graph instead
+        result = searchLoadedNodes(query);
+    } else {
+        try {
+            result = await fetchSearchResults(query);
+        } catch (e) {
+            console.warn('Server search failed, searching loaded graph:', e);
+            result = searchLoadedNodes(query);
+        }
+    }
+
+    // Drop responses to queries that were superseded or cleared meanwhile
+    if (requestId !== searchRequestId) return;
+
+    const matches = result.matches;
+
+    // Update match count display
+    updateMatchCount(result.total);
+
+    // Limit results
+    const topMatches = matches.slice(0, 8);
+
+    if (topMatches.length === 0) {
+        resultsContainer.innerHTML = '<div class="search-no-results">No entities found</div>';
+    } else {
+        // Use shared type colors (defined in getTypeColors())
+        const typeColors = getTypeColors();
+
+        resultsContainer.innerHTML = topMatches.map((match, idx) => {
+            const color = typeColors[match.type] || typeColors.default;
+            return `
+                <div class="search-result-item ${idx === searchSelectedIndex ? 'selected' : ''}"
+                     data-node-id="${escapeHtml(match.id)}"
+                     onclick="window.kg_navigateToNode('${escapeHtml(match.id)}')">
+                    <span class="result-dot" style="background-color: ${color}"></span>
+                    <div class="result-info">
+                        <div class="result-name">${escapeHtml(match.label)}</div>
+                        <div class="result-type">${escapeHtml(match.type)}</div>
+                    </div>
+                </div>
+            `;
+        }).join('');
+    }
+
+    resultsContainer.classList.remove('hidden');
+}
+
+async function fetchSearchResults(query) {
+    const params = new URLSearchParams({ q: query, limit: String(SEARCH_RESULT_LIMIT) });
+    if (activeTypeFilters.size === 1) {
+        params.set('entity_type', [...activeTypeFilters][0]);
+    }
+
+    const response = await fetch(
+        `/kg/projects/${state.kgCurrentProjectId}/search?${params}`
+    );
+    if (!response.ok) {
+        throw new Error(`Search request failed (${response.status})`);
+    }
+
+    // Results arrive ranked (exact, prefix, substring, then fuzzy matches)
+    const data = await response.json();
+    return {
+        matches: data.results.map(r => ({ id: r.id, label: r.label, type: r.entity_type })),
+        total: data.total_count
+    };
+}
+
+function searchLoadedNodes(query) {
     const lowerQuery = query.toLowerCase();
 
     // Search through nodes
@@ -147,42 +223,21 @@ function performGraphSearch(query) {
         return b.degree - a.degree;
     });
 
-    // Update match count display
-    updateMatchCount(matches.length);
-
-    // Limit results
-    const topMatches = matches.slice(0, 8);
-
-    if (topMatches.length === 0) {
-        resultsContainer.innerHTML = '<div class="search-no-results">No entities found</div>';
-    } else {
-        // Use shared type colors (defined in getTypeColors())
-        const typeColors = getTypeColors();
-
-        resultsContainer.innerHTML = topMatches.map((match, idx) => {
-            const color = typeColors[match.type] || typeColors.default;
-            return `
-                <div class="search-result-item ${idx === searchSelectedIndex ? 'selected' : ''}"
-                     data-node-id="${escapeHtml(match.id)}"
-                     onclick="window.kg_navigateToNode('${escapeHtml(match.id)}')">
-                    <span class="result-dot" style="background-color: ${color}"></span>
-                    <div class="result-info">
-                        <div class="result-name">${escapeHtml(match.label)}</div>
-                        <div class="result-type">${escapeHtml(match.type)}</div>
-                    </div>
-                </div>
-            `;
-        }).join('');
-    }
-
-    resultsContainer.classList.remove('hidden');
+    return { matches, total: matches.length };
 }
 
-function navigateToNode(nodeId) {
+async function navigateToNode(nodeId) {
     if (!state.cytoscapeInstance) return;
 
-    const node = state.cytoscapeInstance.nodes(`[id = "${nodeId}"]`);
-    if (node.length === 0) return;
+    let node = state.cytoscapeInstance.nodes(`[id = "${nodeId}"]`);
+    if (node.length === 0) {
+        // Search covers the whole graph, but large graphs are only partly
+        // loaded: switch to the neighborhood around the result
+        await initKGGraph(state.kgCurrentProjectId, { mode: 'ego', focus: nodeId });
+        if (!state.cytoscapeInstance) return;
+        node = state.cytoscapeInstance.nodes(`[id = "${nodeId}"]`);
+        if (node.length === 0) return;
+    }
 
     // Hide search results
     hideSearchResults();
@@ -214,6 +269,7 @@ function hideSearchResults() {
     const resultsContainer = document.getElementById('kg-search-results');
     resultsContainer?.classList.add('hidden');
     searchSelectedIndex = -1;
+    searchRequestId++; // Don't reopen for an in-flight search
 }
 
 function updateMatchCount(matchCount) {
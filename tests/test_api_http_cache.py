@@ -0,0 +1,194 @@
+"""
+Unit tests for conditional GET and cached JSON responses (app/api/http_cache.py).
+
+Tests cover:
+- make_etag: depends on path, query and state
+- is_not_modified / cached_response: If-None-Match handling and body reuse
+- json_response: encoding negotiation and compression threshold
+- streaming_json_response: chunk-by-chunk compression of streamed bodies
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from app.api import http_cache
+
+
+def _request(
+    headers: dict[str, str] | None = None, path: str = "/kg/items", query: str = ""
+) -> Request:
+    """A GET request with the given headers."""
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query.encode(),
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in (headers or {}).items()
+            ],
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Iterator[None]:
+    """Start and end every test with an empty body cache."""
+    http_cache.clear_cache()
+    yield
+    http_cache.clear_cache()
+
+
+def test_make_etag_depends_on_request_and_state() -> None:
+    """ETags should differ by path, query and state, and be quoted."""
+    etag = http_cache.make_etag(_request(), "state-1")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == http_cache.make_etag(_request(), "state-1")
+    assert etag != http_cache.make_etag(_request(), "state-2")
+    assert etag != http_cache.make_etag(_request(query="limit=5"), "state-1")
+    assert etag != http_cache.make_etag(_request(path="/kg/other"), "state-1")
+
+
+def test_is_not_modified_matches_if_none_match() -> None:
+    """Exact, weak, listed and wildcard validators should all match."""
+    etag = '"abc"'
+
+    assert not http_cache.is_not_modified(_request(), etag)
+    assert http_cache.is_not_modified(_request({"If-None-Match": '"abc"'}), etag)
+    assert http_cache.is_not_modified(_request({"If-None-Match": 'W/"abc"'}), etag)
+    assert http_cache.is_not_modified(_request({"If-None-Match": '"old", "abc"'}), etag)
+    assert http_cache.is_not_modified(_request({"If-None-Match": "*"}), etag)
+    assert not http_cache.is_not_modified(_request({"If-None-Match": '"old"'}), etag)
+
+
+def test_cached_response_reuses_serialized_body() -> None:
+    """After one response, the same ETag should be answered from cache."""
+    etag = '"v1"'
+    assert http_cache.cached_response(_request(), etag) is None
+
+    http_cache.json_response(_request(), {"count": 1}, etag)
+    cached = http_cache.cached_response(_request(), etag)
+    not_modified = http_cache.cached_response(_request({"If-None-Match": etag}), etag)
+
+    assert cached is not None
+    assert json.loads(bytes(cached.body)) == {"count": 1}
+    assert cached.headers["etag"] == etag
+    assert not_modified is not None
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+
+
+def test_json_response_compresses_large_bodies() -> None:
+    """Large bodies should be gzipped when accepted; small ones never."""
+    payload = {"items": [{"id": i, "label": f"Entity {i}"} for i in range(200)]}
+    accepts_gzip = {"Accept-Encoding": "gzip, deflate"}
+
+    compressed = http_cache.json_response(_request(accepts_gzip), payload, '"big"')
+    plain = http_cache.json_response(_request(), payload, '"big"')
+    small = http_cache.json_response(_request(accepts_gzip), {"a": 1}, None)
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(bytes(compressed.body))) == payload
+    assert "content-encoding" not in plain.headers
+    assert json.loads(bytes(plain.body)) == payload
+    assert "content-encoding" not in small.headers
+    assert "etag" not in small.headers
+
+
+def test_compressed_representations_get_their_own_etags() -> None:
+    """Each content-coding should have a distinct strong ETag that revalidates."""
+    payload = {"items": [{"id": i, "label": f"Entity {i}"} for i in range(200)]}
+    accepts_gzip = {"Accept-Encoding": "gzip"}
+
+    compressed = http_cache.json_response(_request(accepts_gzip), payload, '"v2"')
+    plain = http_cache.json_response(_request(), payload, '"v2"')
+    gzip_tag = compressed.headers["etag"]
+    revalidated = http_cache.cached_response(
+        _request({**accepts_gzip, "If-None-Match": gzip_tag}), '"v2"'
+    )
+
+    assert gzip_tag == '"v2-gzip"'
+    assert plain.headers["etag"] == '"v2"'
+    assert revalidated is not None
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == gzip_tag
+    assert not http_cache.is_not_modified(
+        _request({"If-None-Match": '"v1-gzip"'}), '"v2"'
+    )
+
+
+def test_json_response_ignores_refused_encodings() -> None:
+    """An encoding with q=0 should not be used."""
+    payload = {"text": "x" * 5000}
+
+    response = http_cache.json_response(
+        _request({"Accept-Encoding": "gzip;q=0"}), payload, None
+    )
+
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip;q=0.5, br;q=1", "br"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("gzip, br", "br"),
+        ("*", "br"),
+        ("br;q=0, *", "gzip"),
+        ("*;q=0.5, gzip", "gzip"),
+        ("*;q=0", "identity"),
+        ("deflate", "identity"),
+        ("", "identity"),
+    ],
+)
+def test_negotiate_encoding_uses_q_values(
+    monkeypatch: pytest.MonkeyPatch, accept_encoding: str, expected: str
+) -> None:
+    """The highest-q coding should win, with "*" covering unlisted codings."""
+    monkeypatch.setattr(http_cache, "BROTLI_SUPPORT", True)
+
+    request = _request({"Accept-Encoding": accept_encoding})
+
+    assert http_cache._negotiate_encoding(request) == expected
+
+
+async def _chunks(*parts: str) -> AsyncIterator[str]:
+    """Yield body chunks as an async stream."""
+    for part in parts:
+        yield part
+
+
+async def _read_stream(response: StreamingResponse) -> bytes:
+    """Collect a streamed response body."""
+    body = b""
+    async for chunk in response.body_iterator:
+        body += chunk.encode() if isinstance(chunk, str) else bytes(chunk)
+    return body
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_response_compresses_chunks() -> None:
+    """Streamed bodies should be gzipped as they are sent when accepted."""
+    parts = ('{"items": [', '{"id": 1}', ",", '{"id": 2}', "]}")
+
+    compressed = http_cache.streaming_json_response(
+        _request({"Accept-Encoding": "gzip"}), _chunks(*parts)
+    )
+    plain = http_cache.streaming_json_response(_request(), _chunks(*parts))
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(await _read_stream(compressed)) == "".join(parts).encode()
+    assert "content-encoding" not in plain.headers
+    assert await _read_stream(plain) == "".join(parts).encode()
+    assert http_cache.add_validators(compressed, '"v1"').headers["etag"] == '"v1-gzip"'
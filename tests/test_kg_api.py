@@ -29,6 +29,7 @@ from app.kg.domain import (
     DomainProfile,
     KGProject,
     ProjectState,
+    StorageBackend,
     ThingType,
 )
 from app.services.kg_service import KnowledgeGraphService
@@ -53,9 +54,13 @@ class MockKGService:
         # Track calls for verification
         self.bootstrap_calls: list[dict[str, Any]] = []
 
-    async def create_project(self, name: str) -> KGProject:
+    async def create_project(
+        self, name: str, storage_backend: StorageBackend = "json"
+    ) -> KGProject:
         """Create a mock project."""
-        project = KGProject(name=name, state=ProjectState.CREATED)
+        project = KGProject(
+            name=name, state=ProjectState.CREATED, storage_backend=storage_backend
+        )
         self.projects[project.id] = project
         return project
 
@@ -63,6 +68,10 @@ class MockKGService:
         """Get project by ID."""
         return self.projects.get(project_id)
 
+    def state_tag(self, project_id: str) -> str | None:
+        """No state fingerprint (conditional GET disabled)."""
+        return None
+
     async def list_projects(self) -> list[KGProject]:
         """List all projects."""
         return list(self.projects.values())
@@ -925,6 +934,274 @@ class TestGetGraphData:
         finally:
             app.dependency_overrides.pop(get_kg_service, None)
 
+    @pytest.mark.asyncio
+    async def test_get_graph_data_modes(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Test graph-data honors the level-of-detail mode and node budget."""
+        from app.kg.knowledge_base import KnowledgeBase
+        from app.kg.models import Node
+        from app.kg.persistence import save_knowledge_base
+        from app.main import app
+
+        project = await kg_service.create_project("View Project")
+        kb = KnowledgeBase(name="View KB")
+        hub = kb.add_node(Node(id="hub000000001", label="Hub", entity_type="Topic"))
+        for i in range(5):
+            leaf = kb.add_node(Node(label=f"Leaf {i}", entity_type="Person"))
+            kb.add_relationship(hub.label, leaf.label, "mentions", "src_1")
+        save_knowledge_base(kb, kg_service.kb_path)
+        project.kb_id = kb.id
+        await kg_service._save_project(project)
+
+        app.dependency_overrides[get_kg_service] = lambda: kg_service
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                url = f"/kg/projects/{project.id}/graph-data"
+                top = await client.get(url, params={"max_nodes": 2})
+                ego = await client.get(
+                    url, params={"mode": "ego", "focus": hub.id, "hops": 1}
+                )
+                no_focus = await client.get(url, params={"mode": "ego"})
+                bad_focus = await client.get(
+                    url, params={"mode": "ego", "focus": "missing00000"}
+                )
+
+            assert top.status_code == 200
+            data = top.json()
+            assert len(data["nodes"]) == 2
+            assert data["nodes"][0]["data"]["id"] == hub.id
+            assert data["meta"]["truncated"] is True
+            assert data["meta"]["total_nodes"] == 6
+
+            assert ego.status_code == 200
+            assert len(ego.json()["nodes"]) == 6
+            assert len(ego.json()["edges"]) == 5
+
+            assert no_focus.status_code == 400
+            assert bad_focus.status_code == 404
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
+    @pytest.mark.asyncio
+    async def test_get_graph_data_includes_layout_positions(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Test graph-data attaches precomputed positions once laid out."""
+        from app.kg.knowledge_base import KnowledgeBase
+        from app.kg.models import Node
+        from app.kg.persistence import save_knowledge_base
+        from app.main import app
+
+        project = await kg_service.create_project("Layout Project")
+        kb = KnowledgeBase(name="Layout KB")
+        for label in ("Alpha", "Beta", "Gamma"):
+            kb.add_node(Node(label=label, entity_type="Topic"))
+        kb.add_relationship("Alpha", "Beta", "mentions", "src_1")
+        kb.add_relationship("Beta", "Gamma", "mentions", "src_1")
+        save_knowledge_base(kb, kg_service.kb_path)
+        project.kb_id = kb.id
+        await kg_service._save_project(project)
+
+        app.dependency_overrides[get_kg_service] = lambda: kg_service
+        try:
+            loaded = kg_service.load_kb(kb.id)
+            assert loaded is not None
+            loaded.get_layout(wait=True)
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                response = await client.get(
+                    f"/kg/projects/{project.id}/graph-data", params={"mode": "full"}
+                )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["meta"]["layout_ready"] is True
+            assert len(data["nodes"]) == 3
+            for element in data["nodes"]:
+                assert set(element["position"]) == {"x", "y"}
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# TEST: GET /kg/projects/{id}/changes
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestChangeFeed:
+    """Test the change feed endpoints used for graph delta sync."""
+
+    @pytest.mark.asyncio
+    async def test_changes_return_deltas_since_graph_data(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Test /changes returns only what changed after graph-data's version."""
+        from app.kg.knowledge_base import KnowledgeBase
+        from app.kg.models import Node
+        from app.kg.persistence import save_knowledge_base
+        from app.main import app
+
+        project = await kg_service.create_project("Feed Project")
+        kb = KnowledgeBase(name="Feed KB")
+        kb.add_node(Node(label="Alpha", entity_type="Topic"))
+        save_knowledge_base(kb, kg_service.kb_path)
+        project.kb_id = kb.id
+        await kg_service._save_project(project)
+
+        app.dependency_overrides[get_kg_service] = lambda: kg_service
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                base = f"/kg/projects/{project.id}"
+                meta = (await client.get(f"{base}/graph-data")).json()["meta"]
+
+                loaded = kg_service.load_kb(kb.id)
+                assert loaded is not None
+                beta = loaded.add_node(Node(label="Beta", entity_type="Topic"))
+                loaded.add_relationship("Alpha", "Beta", "mentions", "src_1")
+
+                response = await client.get(
+                    f"{base}/changes",
+                    params={"since": meta["version"], "epoch": meta["epoch"]},
+                )
+                stale = await client.get(
+                    f"{base}/changes", params={"since": 0, "epoch": "other_epoch"}
+                )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["resync"] is False
+            assert data["version"] == loaded.generation
+            assert [(c["op"], c["kind"]) for c in data["changes"]] == [
+                ("upsert", "node"),
+                ("upsert", "edge"),
+            ]
+            assert data["changes"][0]["element"]["data"]["id"] == beta.id
+
+            assert stale.json()["resync"] is True
+            assert stale.json()["changes"] == []
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
+    @pytest.mark.asyncio
+    async def test_change_events_stream_deltas(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Test the SSE generator emits a changes event per graph change."""
+        import json
+
+        from app.api.routers.kg import _change_events
+        from app.kg.knowledge_base import KnowledgeBase
+        from app.kg.models import Node
+
+        kb = KnowledgeBase(name="Stream KB")
+        kg_service.save_kb(kb)
+        loaded = kg_service.load_kb(kb.id)
+        assert loaded is not None
+
+        async def connected() -> bool:
+            return False
+
+        events = _change_events(
+            kg_service, kb.id, loaded.feed_epoch, loaded.generation, 0.01, connected
+        )
+        loaded.add_node(Node(label="Gamma", entity_type="Topic"))
+        event = await anext(events)
+        await events.aclose()
+
+        header, _, payload = event.partition("data: ")
+        assert f"id: {loaded.feed_epoch}:{loaded.generation}" in header
+        assert "event: changes" in header
+        assert json.loads(payload)["changes"][0]["element"]["data"]["label"] == "Gamma"
+
+    @pytest.mark.asyncio
+    async def test_changes_no_graph_data(self) -> None:
+        """Test /changes returns 404 when the project has no knowledge base."""
+        from app.main import app
+
+        mock_service = MockKGService()
+        project = await mock_service.create_project("Empty")
+        app.dependency_overrides[get_kg_service] = lambda: mock_service
+
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                response = await client.get(
+                    f"/kg/projects/{project.id}/changes", params={"since": 0}
+                )
+
+            assert response.status_code == 404
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# TEST: Conditional GET (ETag / If-None-Match)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestConditionalGet:
+    """Test ETag revalidation on polled read endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_graph_returns_304_until_it_changes(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Test If-None-Match gets 304 until the graph is modified."""
+        from app.kg.knowledge_base import KnowledgeBase
+        from app.kg.models import Node
+        from app.main import app
+
+        project = await kg_service.create_project("ETag Project")
+        kb = KnowledgeBase(name="ETag KB")
+        kb.add_node(Node(label="Alpha", entity_type="Topic"))
+        kg_service.save_kb(kb)
+        project.kb_id = kb.id
+        await kg_service._save_project(project)
+
+        app.dependency_overrides[get_kg_service] = lambda: kg_service
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                url = f"/kg/projects/{project.id}/graph"
+                first = await client.get(url)
+                etag = first.headers["etag"]
+                unchanged = await client.get(url, headers={"If-None-Match": etag})
+                nodes = await client.get(f"/kg/projects/{project.id}/nodes")
+                nodes_unchanged = await client.get(
+                    f"/kg/projects/{project.id}/nodes",
+                    headers={"If-None-Match": nodes.headers["etag"]},
+                )
+
+                kb.add_node(Node(label="Beta", entity_type="Topic"))
+                kg_service.save_kb(kb)
+                changed = await client.get(url, headers={"If-None-Match": etag})
+
+            assert first.status_code == 200
+            assert unchanged.status_code == 304
+            assert unchanged.content == b""
+            assert nodes_unchanged.status_code == 304
+            assert nodes.headers["etag"] != etag
+
+            assert changed.status_code == 200
+            assert changed.json()["node_count"] == 2
+            assert changed.headers["etag"] != etag
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # TEST: NODE EVIDENCE ENDPOINT
@@ -983,6 +1260,65 @@ class TestNodeEvidence:
         finally:
             app.dependency_overrides.pop(get_kg_service, None)
 
+    @pytest.mark.asyncio
+    async def test_get_node_evidence_reads_indexed_mentions(
+        self,
+        tmp_path: Path,
+        kg_service: KnowledgeGraphService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Indexed sources should return an excerpt per mention, with counts."""
+        from app.kg.knowledge_base import KnowledgeBase
+        from app.kg.models import Node, Source
+        from app.kg.persistence import save_knowledge_base
+        from app.main import app
+        from app.services import get_services
+
+        transcript = tmp_path / "episode.txt"
+        transcript.write_text(
+            "Gottlieb ran the program. " + "Filler. " * 100 + "Later, Gottlieb left."
+        )
+        monkeypatch.setattr(
+            get_services().storage,
+            "get_transcript_raw",
+            lambda transcript_id: {"file_path": str(transcript)},
+        )
+
+        project = await kg_service.create_project("Test Project")
+        kb = KnowledgeBase(name="Test KB")
+        kb.add_source(
+            Source(id="src1", title="Episode", metadata={"transcript_id": "t1"})
+        )
+        node = kb.add_node(
+            Node(label="Gottlieb", entity_type="Person", source_ids=["src1"])
+        )
+        kb.index_mentions("src1", transcript.read_text())
+        save_knowledge_base(kb, kg_service.kb_path)
+        project.kb_id = kb.id
+        await kg_service._save_project(project)
+
+        app.dependency_overrides[get_kg_service] = lambda: kg_service
+
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                url = f"/kg/projects/{project.id}/nodes/{node.id}/evidence"
+                response = await client.get(url)
+                limited = await client.get(url, params={"limit": 1})
+
+            data = response.json()
+            assert data["mention_count"] == 2
+            assert [e["transcript_id"] for e in data["evidence"]] == ["t1", "t1"]
+            assert data["evidence"][0]["text"].startswith("Gottlieb ran")
+            assert data["evidence"][1]["text"].startswith("...")
+            assert data["evidence"][1]["text"].endswith("Later, Gottlieb left.")
+            assert limited.json()["mention_count"] == 2
+            assert len(limited.json()["evidence"]) == 1
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
     # NOTE: Evidence/segment retrieval removed in clean break to simple transcription
     # Test deleted as part of Phase 2B simplification
     pass
@@ -1009,6 +1345,213 @@ class TestNodeEvidence:
             app.dependency_overrides.pop(get_kg_service, None)
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# TEST: NODE SEARCH ENDPOINT
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestNodeSearch:
+    """Test GET /kg/projects/{id}/search endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_search_returns_ranked_page(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Search should return one ranked page plus pagination metadata."""
+        from app.kg.knowledge_base import KnowledgeBase
+        from app.kg.models import Node
+        from app.kg.persistence import save_knowledge_base
+        from app.main import app
+
+        project = await kg_service.create_project("Search Project")
+        kb = KnowledgeBase(name="Search KB")
+        for label in ["Operation", "Operation Midnight Climax", "Covert Operations"]:
+            kb.add_node(Node(label=label, entity_type="Project"))
+        kb.add_node(
+            Node(label="CIA", entity_type="Organization", aliases=["The Company"])
+        )
+        save_knowledge_base(kb, kg_service.kb_path)
+        project.kb_id = kb.id
+        await kg_service._save_project(project)
+
+        app.dependency_overrides[get_kg_service] = lambda: kg_service
+
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                response = await client.get(
+                    f"/kg/projects/{project.id}/search",
+                    params={"q": "operation", "limit": 2},
+                )
+                alias_response = await client.get(
+                    f"/kg/projects/{project.id}/search", params={"q": "company"}
+                )
+                empty_response = await client.get(
+                    f"/kg/projects/{project.id}/search", params={"q": ""}
+                )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["query"] == "operation"
+            assert [r["label"] for r in data["results"]] == [
+                "Operation",
+                "Operation Midnight Climax",
+            ]
+            assert data["results"][0]["match"] == "exact"
+            assert data["total_count"] == 3
+            assert data["has_more"] is True
+
+            alias_data = alias_response.json()
+            assert alias_data["results"][0]["label"] == "CIA"
+            assert alias_data["results"][0]["matched_name"] == "the company"
+
+            assert empty_response.status_code == 422
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
+    @pytest.mark.asyncio
+    async def test_search_no_graph_data(self) -> None:
+        """Search should 404 when the project has no knowledge base."""
+        from app.main import app
+
+        mock_service = MockKGService()
+        project = await mock_service.create_project("Empty")
+        app.dependency_overrides[get_kg_service] = lambda: mock_service
+
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                response = await client.get(
+                    f"/kg/projects/{project.id}/search", params={"q": "cia"}
+                )
+
+            assert response.status_code == 404
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# TEST: PATTERN MATCH ENDPOINT
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestPatternMatch:
+    """Test GET /kg/projects/{id}/match endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_match_returns_typed_paths(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Matches should come back in pattern order; bad patterns are 400."""
+        from app.kg.knowledge_base import KnowledgeBase
+        from app.kg.models import Node
+        from app.kg.persistence import save_knowledge_base
+        from app.main import app
+
+        project = await kg_service.create_project("Pattern Project")
+        kb = KnowledgeBase(name="Pattern KB")
+        for label, entity_type in [
+            ("Gottlieb", "Person"),
+            ("White", "Person"),
+            ("CIA", "Organization"),
+        ]:
+            kb.add_node(Node(label=label, entity_type=entity_type))
+        kb.add_relationship("Gottlieb", "CIA", "worked_for", "src")
+        kb.add_relationship("White", "CIA", "worked_for", "src")
+        save_knowledge_base(kb, kg_service.kb_path)
+        project.kb_id = kb.id
+        await kg_service._save_project(project)
+
+        app.dependency_overrides[get_kg_service] = lambda: kg_service
+
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                url = f"/kg/projects/{project.id}/match"
+                response = await client.get(
+                    url,
+                    params={
+                        "pattern": "(:Organization)<-[worked_for]-(:Person)",
+                        "limit": 1,
+                    },
+                )
+                invalid = await client.get(url, params={"pattern": "(:Person"})
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["has_more"] is True
+            match = data["matches"][0]
+            assert [n["label"] for n in match["nodes"]] == ["CIA", "Gottlieb"]
+            assert match["edges"][0]["relationship_types"] == ["worked_for"]
+            assert invalid.status_code == 400
+            assert "Invalid pattern" in invalid.json()["detail"]
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# TEST: RETRACT SOURCE ENDPOINT
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestRetractSource:
+    """Test DELETE /kg/projects/{id}/sources/{source_id} endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_retract_source_removes_its_contributions(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Retraction should report removals and update counts; unknown is 404."""
+        from app.kg.knowledge_base import KnowledgeBase
+        from app.kg.models import Node, Source
+        from app.kg.persistence import save_knowledge_base
+        from app.main import app
+
+        project = await kg_service.create_project("Retract Project")
+        kb = KnowledgeBase(name="Retract KB")
+        kb.add_source(Source(id="ep1", title="Episode 1"))
+        for label in ["Gottlieb", "CIA"]:
+            node = kb.add_node(Node(label=label, entity_type="Entity"))
+            kb.add_node_source(node.id, "ep1")
+        kb.add_relationship("Gottlieb", "CIA", "worked_for", "ep1")
+        save_knowledge_base(kb, kg_service.kb_path)
+        project.kb_id = kb.id
+        await kg_service._save_project(project)
+
+        app.dependency_overrides[get_kg_service] = lambda: kg_service
+
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                url = f"/kg/projects/{project.id}/sources"
+                response = await client.delete(f"{url}/ep1")
+                missing = await client.delete(f"{url}/ep1")
+
+            assert response.status_code == 200
+            assert response.json() == {
+                "source_id": "ep1",
+                "relationships_removed": 1,
+                "edges_removed": 1,
+                "nodes_removed": 2,
+                "nodes_updated": 0,
+            }
+            assert missing.status_code == 404
+            updated = await kg_service.get_project(project.id)
+            assert updated is not None
+            assert updated.thing_count == 0
+            assert updated.source_count == 0
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # TEST: CSV EXPORT
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -48,6 +48,10 @@ class MockKnowledgeGraphService:
             return self.project
         return None
 
+    def state_tag(self, project_id: str) -> str | None:
+        """No state fingerprint (conditional GET disabled)."""
+        return None
+
     async def extract_from_transcript(
         self,
         project_id: str,
@@ -55,6 +59,7 @@ class MockKnowledgeGraphService:
         title: str,
         source_id: str,
         transcript_id: str | None = None,
+        replace: bool = False,
     ) -> dict[str, Any]:
         """Mock extraction - tracks that it was called."""
         self.extract_called = True
@@ -408,9 +413,13 @@ class MockKGServiceWithPersistence(MockKnowledgeGraphService):
         kb: KnowledgeBase | None = None,
     ) -> None:
         super().__init__(project=project, kb=kb)
-        # Override kb_path to return our mock KB via load_knowledge_base
+        # Served to the router via load_kb
         self._mock_kb = kb
 
+    def load_kb(self, kb_id: str) -> KnowledgeBase | None:
+        """Return the mock KB regardless of ID."""
+        return self._mock_kb
+
 
 @pytest.mark.asyncio
 async def test_list_nodes_endpoint_all() -> None:
@@ -427,8 +436,8 @@ async def test_list_nodes_endpoint_all() -> None:
 
     app.dependency_overrides[get_kg_service] = lambda: mock_service
 
-    # Mock load_knowledge_base to return our test KB
-    with patch("app.api.routers.kg.load_knowledge_base", return_value=kb):
+    # Mock load_kb to return our test KB
+    with patch.object(mock_service, "load_kb", return_value=kb):
         try:
             transport = ASGITransport(app=app)
             async with AsyncClient(
@@ -437,7 +446,7 @@ async def test_list_nodes_endpoint_all() -> None:
                 response = await client.get(f"/kg/projects/{project_id}/nodes")
 
             assert response.status_code == 200
-            data = response.json()
+            data = response.json()["items"]
             assert len(data) == 3  # Alice, Bob, CIA
 
             # Verify node structure
@@ -449,6 +458,38 @@ async def test_list_nodes_endpoint_all() -> None:
             app.dependency_overrides.pop(get_kg_service, None)
 
 
+@pytest.mark.asyncio
+async def test_list_nodes_endpoint_compresses_stream() -> None:
+    """A streamed page should be gzipped as it is sent when accepted."""
+    from app.api.deps import get_kg_service
+    from app.main import app
+
+    project_id = "1e5101234567"
+    project = _create_test_project(project_id=project_id)
+    kb = _create_test_kb()
+    mock_service = MockKGServiceWithPersistence(project=project, kb=kb)
+
+    app.dependency_overrides[get_kg_service] = lambda: mock_service
+
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                f"/kg/projects/{project_id}/nodes",
+                headers={"Accept-Encoding": "gzip"},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert {node["label"] for node in response.json()["items"]} == {
+            "Alice",
+            "Bob",
+            "CIA",
+        }
+    finally:
+        app.dependency_overrides.pop(get_kg_service, None)
+
+
 @pytest.mark.asyncio
 async def test_list_nodes_endpoint_filtered_by_type() -> None:
     """Test listing nodes filtered by entity type."""
@@ -464,7 +505,7 @@ async def test_list_nodes_endpoint_filtered_by_type() -> None:
 
     app.dependency_overrides[get_kg_service] = lambda: mock_service
 
-    with patch("app.api.routers.kg.load_knowledge_base", return_value=kb):
+    with patch.object(mock_service, "load_kb", return_value=kb):
         try:
             transport = ASGITransport(app=app)
             async with AsyncClient(
@@ -476,7 +517,7 @@ async def test_list_nodes_endpoint_filtered_by_type() -> None:
                 )
 
             assert response.status_code == 200
-            data = response.json()
+            data = response.json()["items"]
             assert len(data) == 2  # Alice and Bob only
 
             for node in data:
@@ -485,6 +526,95 @@ async def test_list_nodes_endpoint_filtered_by_type() -> None:
             app.dependency_overrides.pop(get_kg_service, None)
 
 
+@pytest.mark.asyncio
+async def test_list_nodes_endpoint_paginates_with_cursor() -> None:
+    """Following next_cursor should visit every node once, in sort order."""
+    from unittest.mock import patch
+
+    from app.api.deps import get_kg_service
+    from app.main import app
+
+    project_id = "1e5101234567"
+    project = _create_test_project(project_id=project_id)
+    kb = _create_test_kb()
+    mock_service = MockKGServiceWithPersistence(project=project, kb=kb)
+
+    app.dependency_overrides[get_kg_service] = lambda: mock_service
+
+    with patch.object(mock_service, "load_kb", return_value=kb):
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                pages = []
+                params: dict[str, Any] = {
+                    "sort": "degree",
+                    "limit": 2,
+                    "fields": "label,degree",
+                }
+                while True:
+                    response = await client.get(
+                        f"/kg/projects/{project_id}/nodes", params=params
+                    )
+                    assert response.status_code == 200
+                    pages.append(response.json())
+                    if pages[-1]["next_cursor"] is None:
+                        break
+                    params["cursor"] = pages[-1]["next_cursor"]
+
+            assert [len(page["items"]) for page in pages] == [2, 1]
+            assert all(page["total_count"] == 3 for page in pages)
+            items = [item for page in pages for item in page["items"]]
+            # Alice has two edges; Bob and CIA one each (A-Z among equals)
+            assert [item["label"] for item in items] == ["Alice", "Bob", "CIA"]
+            assert [item["degree"] for item in items] == [2, 1, 1]
+            # Projection keeps only the requested fields (plus the ID)
+            assert set(items[0]) == {"id", "label", "degree"}
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
+
+@pytest.mark.asyncio
+async def test_list_nodes_endpoint_rejects_bad_fields_and_cursor() -> None:
+    """Unknown fields and malformed or mismatched cursors should be 400s."""
+    from unittest.mock import patch
+
+    from app.api.deps import get_kg_service
+    from app.main import app
+
+    project_id = "1e5101234567"
+    project = _create_test_project(project_id=project_id)
+    kb = _create_test_kb()
+    mock_service = MockKGServiceWithPersistence(project=project, kb=kb)
+
+    app.dependency_overrides[get_kg_service] = lambda: mock_service
+
+    with patch.object(mock_service, "load_kb", return_value=kb):
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                url = f"/kg/projects/{project_id}/nodes"
+                bad_fields = await client.get(url, params={"fields": "label,secret"})
+                bad_cursor = await client.get(url, params={"cursor": "not-a-cursor"})
+                first = await client.get(url, params={"sort": "label", "limit": 1})
+                other_sort = await client.get(
+                    url,
+                    params={"sort": "recency", "cursor": first.json()["next_cursor"]},
+                )
+                bad_sort = await client.get(url, params={"sort": "size"})
+
+            assert bad_fields.status_code == 400
+            assert "secret" in bad_fields.json()["detail"]
+            assert bad_cursor.status_code == 400
+            assert other_sort.status_code == 400
+            assert bad_sort.status_code == 422
+        finally:
+            app.dependency_overrides.pop(get_kg_service, None)
+
+
 @pytest.mark.asyncio
 async def test_list_nodes_endpoint_no_graph() -> None:
     """Test listing nodes returns 404 when no graph exists."""
@@ -528,7 +658,7 @@ async def test_get_neighbors_endpoint_success() -> None:
 
     app.dependency_overrides[get_kg_service] = lambda: mock_service
 
-    with patch("app.api.routers.kg.load_knowledge_base", return_value=kb):
+    with patch.object(mock_service, "load_kb", return_value=kb):
         try:
             transport = ASGITransport(app=app)
             async with AsyncClient(
@@ -540,7 +670,7 @@ async def test_get_neighbors_endpoint_success() -> None:
                 )
 
             assert response.status_code == 200
-            data = response.json()
+            data = response.json()["items"]
 
             # Alice is connected to CIA (via worked_for) and Bob (via knows)
             assert len(data) == 2
@@ -571,7 +701,7 @@ async def test_get_neighbors_endpoint_isolated_node() -> None:
 
     app.dependency_overrides[get_kg_service] = lambda: mock_service
 
-    with patch("app.api.routers.kg.load_knowledge_base", return_value=kb):
+    with patch.object(mock_service, "load_kb", return_value=kb):
         try:
             transport = ASGITransport(app=app)
             async with AsyncClient(
@@ -582,7 +712,7 @@ async def test_get_neighbors_endpoint_isolated_node() -> None:
                 )
 
             assert response.status_code == 200
-            data = response.json()
+            data = response.json()["items"]
             assert len(data) == 0  # No neighbors
         finally:
             app.dependency_overrides.pop(get_kg_service, None)
@@ -0,0 +1,89 @@
+"""
+Tests for community detection across connected components.
+
+Tests cover:
+- Fast path for small components
+- Process-pool partitioning matching in-process results
+- Per-community modularity
+"""
+
+from __future__ import annotations
+
+import networkx as nx  # type: ignore[import-untyped]
+import pytest
+
+from app.kg import communities
+from app.kg.communities import Community, detect_communities
+
+
+def _two_cliques_graph(prefix: str) -> nx.Graph:
+    """Two 5-cliques joined by a single edge."""
+    graph = nx.Graph()
+    left = [f"{prefix}_l{i}" for i in range(5)]
+    right = [f"{prefix}_r{i}" for i in range(5)]
+    for group in (left, right):
+        graph.add_edges_from(
+            (a, b) for i, a in enumerate(group) for b in group[i + 1 :]
+        )
+    graph.add_edge(left[0], right[0])
+    return graph
+
+
+@pytest.fixture
+def graph() -> nx.Graph:
+    """Two disconnected barbell-like components plus a small pair."""
+    graph = nx.compose(_two_cliques_graph("a"), _two_cliques_graph("b"))
+    graph.add_edge("pair_1", "pair_2")
+    return graph
+
+
+def _components(graph: nx.Graph) -> list[set[str]]:
+    return sorted(nx.connected_components(graph), key=len, reverse=True)
+
+
+def test_partitions_every_component(graph: nx.Graph) -> None:
+    """Each clique and the small pair should become its own community."""
+    communities = detect_communities(graph, _components(graph), workers=1)
+
+    assert {c.node_ids for c in communities} == {
+        frozenset(f"{p}_{side}{i}" for i in range(5))
+        for p in ("a", "b")
+        for side in ("l", "r")
+    } | {frozenset({"pair_1", "pair_2"})}
+    assert all(isinstance(c, Community) for c in communities)
+
+
+def test_modularity_terms_sum_to_total(graph: nx.Graph) -> None:
+    """Community modularity terms should add up to NetworkX's modularity."""
+    communities = detect_communities(
+        graph, _components(graph), resolution=0.8, workers=1
+    )
+
+    total = nx.community.modularity(
+        graph, [set(c.node_ids) for c in communities], resolution=0.8
+    )
+    assert sum(c.modularity for c in communities) == pytest.approx(total)
+
+
+def test_process_pool_matches_in_process(
+    graph: nx.Graph, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Partitioning in worker processes should give identical results."""
+    components = _components(graph)
+    expected = detect_communities(graph, components, workers=1)
+
+    monkeypatch.setattr("app.kg.communities.PARALLEL_COMMUNITY_MIN_NODES", 0)
+    existing = set(communities._pools)
+    parallel = detect_communities(graph, components, workers=2)
+    pool = communities._pools[2]
+    again = detect_communities(graph, components, workers=2)
+
+    assert parallel == expected == again
+    # Pools are keyed (and sized) by the requested worker count
+    assert set(communities._pools) <= existing | {2}
+    assert communities._pools[2] is pool  # Workers are reused across calls
+
+
+def test_empty_graph() -> None:
+    """No components means no communities."""
+    assert detect_communities(nx.Graph(), []) == []
@@ -10,14 +10,22 @@ Tests cover the graph analysis and query functionality:
 - get_mentions: Source provenance
 - get_evidence: Relationship evidence
 - get_smart_suggestions: Exploration recommendations
+- graph_view: Level-of-detail visualization views
+- get_layout: Background layout positions cached per generation
+- Insight memoization keyed by the graph generation
 """
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import networkx as nx  # type: ignore[import-untyped]
 import pytest
 
+from app.agent.kg_tool import _handle_connection
 from app.kg.knowledge_base import KnowledgeBase
 from app.kg.models import Edge, Node, RelationshipDetail, Source, SourceType
+from app.kg.paths import PathBudget
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -439,6 +447,33 @@ def test_get_mentions_no_sources(empty_kb: KnowledgeBase) -> None:
     assert result == []
 
 
+def test_get_mentions_counts_and_ranks_indexed_sources(
+    simple_kb: KnowledgeBase,
+) -> None:
+    """Indexed sources should report real counts, highest first."""
+    simple_kb.add_source(Source(id="src_2", title="Documentary 2"))
+    simple_kb.add_source(Source(id="src_3", title="Documentary 3"))
+    simple_kb.index_mentions("src_1", "Bob met Bob.")  # Alice extracted, unnamed
+    simple_kb.index_mentions("src_2", "Alice, Alice and alice again.")
+    simple_kb.index_mentions("src_3", "Bob met Alice.")
+
+    result = simple_kb.get_mentions("Alice")
+
+    assert result[0]["source_id"] == "src_2"
+    assert {r["source_id"]: r["mention_count"] for r in result} == {
+        "src_1": 1,
+        "src_2": 3,
+        "src_3": 1,
+    }
+
+    # Merging sums the counts per source
+    simple_kb.merge_nodes("node_a", "node_b")
+    merged = {
+        r["source_id"]: r["mention_count"] for r in simple_kb.get_mentions("Alice")
+    }
+    assert merged == {"src_1": 2, "src_2": 3, "src_3": 2}
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # get_evidence Tests
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -702,3 +737,453 @@ def test_transcript_id_evidence_linking() -> None:
 
     assert transcript_id in transcript_ids_found
     assert transcript_id_2 in transcript_ids_found
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Insight Cache Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def test_generation_bumps_on_mutation(simple_kb: KnowledgeBase) -> None:
+    """Every mutation should advance the generation counter."""
+    before = simple_kb.generation
+    simple_kb.add_alias("node_a", "Al")
+    after_alias = simple_kb.generation
+    simple_kb.add_relationship("Alice", "CIA", "visited", "src_1")
+
+    assert before < after_alias < simple_kb.generation
+
+
+def test_centrality_memoized_until_graph_changes(complex_kb: KnowledgeBase) -> None:
+    """Repeated bridging queries should reuse the betweenness vector."""
+    with patch(
+        "app.kg.knowledge_base.nx.betweenness_centrality",
+        wraps=nx.betweenness_centrality,
+    ) as betweenness:
+        first = complex_kb.get_key_entities(method="bridging")
+        second = complex_kb.get_key_entities(method="bridging", limit=2)
+        assert betweenness.call_count == 1
+        assert second == first[:2]
+
+        complex_kb.add_node(Node(label="Newcomer", entity_type="Person"))
+        complex_kb.get_key_entities(method="bridging")
+        assert betweenness.call_count == 2
+
+
+def test_communities_and_components_memoized(complex_kb: KnowledgeBase) -> None:
+    """discover_groups and find_isolated_topics should reuse cached results."""
+    with (
+        patch(
+            "app.kg.communities.nx.community.louvain_communities",
+            wraps=nx.community.louvain_communities,
+        ) as louvain,
+        patch(
+            "app.kg.knowledge_base.nx.connected_components",
+            wraps=nx.connected_components,
+        ) as components,
+    ):
+        groups = complex_kb.discover_groups()
+        isolated = complex_kb.find_isolated_topics()
+        complex_kb.get_smart_suggestions()
+
+        assert complex_kb.discover_groups() == groups
+        assert complex_kb.find_isolated_topics() == isolated
+        assert louvain.call_count == 1
+        # Components come from the union-find index, not a traversal
+        assert components.call_count == 0
+
+
+def test_components_match_networkx_through_mutations(
+    complex_kb: KnowledgeBase,
+) -> None:
+    """Union-find components should track inserts, removals and merges."""
+
+    def expected() -> list[frozenset[str]]:
+        undirected = complex_kb._graph.to_undirected()
+        return sorted(
+            (frozenset(c) for c in nx.connected_components(undirected)),
+            key=sorted,
+        )
+
+    def actual() -> list[frozenset[str]]:
+        return sorted(
+            (frozenset(c) for c in complex_kb._connected_components()), key=sorted
+        )
+
+    assert actual() == expected()
+
+    complex_kb.add_node(Node(id="node_new", label="Newcomer", entity_type="Person"))
+    complex_kb.add_relationship("Newcomer", "CIA", "worked_for", "src_1")
+    assert actual() == expected()
+
+    edge_id = next(iter(complex_kb._node_edges["node_new"]))
+    complex_kb.remove_edge(edge_id)
+    assert actual() == expected()
+
+    node_ids = list(complex_kb._nodes)
+    complex_kb.merge_nodes(node_ids[0], node_ids[-1])
+    assert actual() == expected()
+
+
+def test_in_same_component(complex_kb: KnowledgeBase) -> None:
+    """in_same_component should agree with find_connection."""
+    isolated = complex_kb.find_isolated_topics()
+    assert isolated
+    lonely = complex_kb.get_node_by_label(isolated[0]["entities"][0])
+    cia = complex_kb.get_node_by_label("CIA")
+    assert lonely is not None and cia is not None
+
+    assert complex_kb.in_same_component(cia.id, "n_gottlieb")
+    assert not complex_kb.in_same_component(cia.id, lonely.id)
+    assert not complex_kb.in_same_component(cia.id, "missing")
+    assert not complex_kb.find_connection("CIA", lonely.label)["connected"]
+
+
+def test_insert_extends_undirected_cache(simple_kb: KnowledgeBase) -> None:
+    """add_node/add_edge should update the cached undirected graph in place."""
+    undirected = simple_kb._get_undirected()
+
+    simple_kb.add_node(Node(id="node_d", label="Dave", entity_type="Person"))
+    simple_kb.add_relationship("Dave", "Alice", "knows", "src_1")
+
+    assert simple_kb._get_undirected() is undirected
+    assert undirected.has_edge("node_a", "node_d")
+
+
+def test_stats_returns_independent_copies(simple_kb: KnowledgeBase) -> None:
+    """Mutating a stats() result must not corrupt the cached counts."""
+    stats = simple_kb.stats()
+    stats["entity_types"]["Person"] = 99
+
+    assert simple_kb.stats()["entity_types"]["Person"] == 2
+
+
+def test_key_entities_exact_by_default_on_small_graphs(
+    complex_kb: KnowledgeBase,
+) -> None:
+    """Small graphs should report exact scores."""
+    results = complex_kb.get_key_entities(method="bridging")
+
+    assert results
+    assert all(r["approximate"] is False for r in results)
+
+
+def test_key_entities_switch_to_approximate_above_threshold(
+    complex_kb: KnowledgeBase,
+) -> None:
+    """Graphs at the node threshold should sample betweenness pivots."""
+    with patch(
+        "app.kg.knowledge_base.nx.betweenness_centrality",
+        wraps=nx.betweenness_centrality,
+    ) as betweenness:
+        results = complex_kb.get_key_entities(
+            method="bridging", approximate_min_nodes=2, sample_size=2
+        )
+
+    assert all(r["approximate"] is True for r in results)
+    assert betweenness.call_args.kwargs["k"] == 2
+
+
+def test_key_entities_approximate_influence_close_to_exact(
+    complex_kb: KnowledgeBase,
+) -> None:
+    """Budgeted PageRank should agree closely with NetworkX PageRank."""
+    exact = complex_kb.get_key_entities(method="influence", approximate=False)
+    approx = complex_kb.get_key_entities(method="influence", approximate=True)
+
+    assert all(r["approximate"] is True for r in approx)
+    exact_scores = {r["node_id"]: r["score"] for r in exact}
+    for r in approx:
+        assert r["score"] == pytest.approx(exact_scores[r["node_id"]], abs=1e-3)
+
+
+def test_key_entities_connections_never_approximate(
+    complex_kb: KnowledgeBase,
+) -> None:
+    """Degree centrality is cheap and always exact."""
+    results = complex_kb.get_key_entities(method="connections", approximate=True)
+
+    assert all(r["approximate"] is False for r in results)
+
+
+def test_discover_groups_covers_all_components(complex_kb: KnowledgeBase) -> None:
+    """Groups should include entities outside the largest component."""
+    groups = complex_kb.discover_groups()
+
+    grouped = {label for group in groups for label in group["entities"]}
+    assert grouped == {node.label for node in complex_kb._nodes.values()}
+    assert any(
+        set(group["entities"]) == {"Isolated Researcher", "Isolated Lab"}
+        for group in groups
+    )
+
+
+def test_discover_groups_modularity_sums_to_total(complex_kb: KnowledgeBase) -> None:
+    """Per-group modularity terms should add up to the partition's modularity."""
+    groups = complex_kb.discover_groups(resolution=1.5)
+
+    undirected = complex_kb._get_undirected()
+    partition = [
+        {complex_kb.get_node_by_label(label).id for label in group["entities"]}  # type: ignore[union-attr]
+        for group in groups
+    ]
+    total = nx.community.modularity(undirected, partition, resolution=1.5)
+    assert sum(g["modularity"] for g in groups) == pytest.approx(total)
+
+
+def test_discover_groups_small_components_skip_louvain(
+    complex_kb: KnowledgeBase,
+) -> None:
+    """Components at or below the fast-path size should not run Louvain."""
+    with patch(
+        "app.kg.communities.nx.community.louvain_communities",
+        wraps=nx.community.louvain_communities,
+    ) as louvain:
+        complex_kb.discover_groups()
+
+    # One large component plus the two-node isolated pair
+    assert louvain.call_count == 1
+
+
+def test_find_connection_multiple_paths(complex_kb: KnowledgeBase) -> None:
+    """find_connection should return alternative paths, shortest first."""
+    result = complex_kb.find_connection("Richard Helms", "MK-Ultra", max_paths=3)
+
+    assert result["connected"] is True
+    assert result["steps"] == 2
+    assert len(result["paths"]) == 3
+    assert result["paths"][0]["path"] == result["path"]
+    steps = [p["steps"] for p in result["paths"]]
+    assert steps == sorted(steps)
+    assert len({tuple(s["entity"] for s in p["path"]) for p in result["paths"]}) == 3
+
+
+def test_find_connection_relationship_filter(complex_kb: KnowledgeBase) -> None:
+    """Only edges with the requested relationship types should be followed."""
+    result = complex_kb.find_connection(
+        "Richard Helms",
+        "MK-Ultra",
+        relationship_types=["reported_to", "directed"],
+    )
+
+    assert result["steps"] == 3
+    assert [s["entity"] for s in result["path"]] == [
+        "Richard Helms",
+        "Allen Dulles",
+        "Sidney Gottlieb",
+        "MK-Ultra",
+    ]
+    assert [s["relationship"] for s in result["path"][:-1]] == [
+        "reported_to",
+        "reported_to",
+        "directed",
+    ]
+    assert result["path"][1]["direction"] == "incoming"
+
+
+def test_find_connection_entity_type_filter(complex_kb: KnowledgeBase) -> None:
+    """Intermediate entities should match the entity type filter."""
+    result = complex_kb.find_connection(
+        "Richard Helms", "MK-Ultra", max_paths=5, entity_types=["person"]
+    )
+
+    assert result["connected"] is True
+    for found in result["paths"]:
+        assert "CIA" not in [s["entity"] for s in found["path"]]
+
+
+def test_find_connection_filters_exclude_all(complex_kb: KnowledgeBase) -> None:
+    """Filters that rule out every path should report no connection."""
+    result = complex_kb.find_connection(
+        "Richard Helms", "MK-Ultra", relationship_types=["parent_of"]
+    )
+
+    assert result["connected"] is False
+    assert "matching the filters" in result["explanation"]
+
+
+def test_find_connection_budget_exhausted(complex_kb: KnowledgeBase) -> None:
+    """An exhausted budget should be reported rather than 'not connected'."""
+    result = complex_kb.find_connection(
+        "Richard Helms", "MK-Ultra", budget=PathBudget(max_expansions=0)
+    )
+
+    assert result["connected"] is False
+    assert result["budget_exhausted"] is True
+    assert "budget" in result["explanation"]
+
+
+def test_handle_connection_lists_paths(complex_kb: KnowledgeBase) -> None:
+    """The ask_about_graph connection handler should show each path found."""
+    result = _handle_connection(
+        complex_kb,
+        {
+            "entity_1": "Richard Helms",
+            "entity_2": "MK-Ultra",
+            "max_paths": 2,
+            "relationship_types": ["worked_for", "funded", "reported_to"],
+        },
+    )
+
+    text = result["content"][0]["text"]
+    assert "### Path 1 (2 steps)" in text
+    assert "### Path 2" in text
+    assert "*Filtered to relationships: worked_for, funded, reported_to*" in text
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# graph_view Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def _view_ids(view: dict) -> list[str]:
+    return [element["data"]["id"] for element in view["nodes"]]
+
+
+def test_graph_view_full_matches_graph(complex_kb: KnowledgeBase) -> None:
+    """Full mode should return every node and edge in Cytoscape format."""
+    view = complex_kb.graph_view(mode="full")
+
+    assert len(view["nodes"]) == 8
+    assert len(view["edges"]) == 9
+    assert view["meta"]["truncated"] is False
+    edge = view["edges"][0]["data"]
+    assert {"id", "source", "target", "label", "relationship_types"} <= set(edge)
+
+
+def test_graph_view_top_keeps_most_central(complex_kb: KnowledgeBase) -> None:
+    """Top mode should keep the best connected nodes and their edges."""
+    view = complex_kb.graph_view(mode="top", max_nodes=2)
+
+    # CIA has 4 connections; Gottlieb is the first of the 3-connection nodes
+    assert _view_ids(view) == ["n_cia", "n_gottlieb"]
+    assert [e["data"]["target"] for e in view["edges"]] == ["n_cia"]
+    assert view["meta"] == {
+        "mode": "top",
+        "total_nodes": 8,
+        "total_edges": 9,
+        "truncated": True,
+    }
+
+
+def test_graph_view_ego_respects_hops_and_budget(complex_kb: KnowledgeBase) -> None:
+    """Ego mode should grow rings from the focus within the node budget."""
+    one_hop = complex_kb.graph_view(mode="ego", focus="n_midnight", hops=1)
+    assert _view_ids(one_hop) == ["n_midnight", "n_mkultra"]
+    assert one_hop["meta"]["truncated"] is False
+
+    # The second ring (Gottlieb, CIA) doesn't fit; CIA is better connected
+    budgeted = complex_kb.graph_view(
+        mode="ego", focus="n_midnight", hops=2, max_nodes=3
+    )
+    assert _view_ids(budgeted) == ["n_midnight", "n_mkultra", "n_cia"]
+    assert budgeted["meta"]["truncated"] is True
+
+
+def test_graph_view_entity_type_filter(complex_kb: KnowledgeBase) -> None:
+    """Only the requested entity types should be included."""
+    view = complex_kb.graph_view(mode="full", entity_types=["Person"])
+
+    assert {e["data"]["type"] for e in view["nodes"]} == {"Person"}
+    ids = set(_view_ids(view))
+    assert all(
+        e["data"]["source"] in ids and e["data"]["target"] in ids for e in view["edges"]
+    )
+
+
+def test_graph_view_communities_collapse_members(complex_kb: KnowledgeBase) -> None:
+    """Community mode should emit one weighted supernode per community."""
+    view = complex_kb.graph_view(mode="communities")
+
+    sizes = [n["data"]["size"] for n in view["nodes"]]
+    assert sum(sizes) == 8
+    assert sizes == sorted(sizes, reverse=True)
+    assert all(n["data"]["type"] == "Community" for n in view["nodes"])
+    # The isolated pair is its own community, named after a member
+    assert any(n["data"]["label"].startswith("Isolated") for n in view["nodes"])
+    assert all(e["data"]["weight"] >= 1 for e in view["edges"])
+    assert view["meta"]["total_communities"] == len(view["nodes"])
+
+
+def test_graph_view_cached_per_generation(complex_kb: KnowledgeBase) -> None:
+    """Views should be reused until the graph changes."""
+    first = complex_kb.graph_view(mode="top", max_nodes=3)
+    assert complex_kb.graph_view(mode="top", max_nodes=3) is first
+
+    complex_kb.add_node(Node(label="Newcomer", entity_type="Person"))
+
+    rebuilt = complex_kb.graph_view(mode="top", max_nodes=3)
+    assert rebuilt is not first
+    assert rebuilt["meta"]["total_nodes"] == 9
+
+
+def test_snapshot_is_detached_and_memoized(simple_kb: KnowledgeBase) -> None:
+    """Snapshots should not see later changes and be reused until one happens."""
+    snapshot = simple_kb.snapshot()
+    assert simple_kb.snapshot() is snapshot
+    assert snapshot.graph_view(mode="full") == simple_kb.graph_view(mode="full")
+
+    simple_kb.add_alias("node_a", "Ali")
+    simple_kb.add_node(Node(id="node_d", label="Dana", entity_type="Person"))
+
+    assert snapshot.get_node("node_d") is None
+    assert snapshot.get_node("node_a").aliases == []  # type: ignore[union-attr]
+    assert simple_kb.snapshot() is not snapshot
+
+
+def test_cached_insight_not_stored_after_concurrent_change(
+    simple_kb: KnowledgeBase,
+) -> None:
+    """A value computed while the graph changed must not be cached as current."""
+
+    def compute() -> int:
+        simple_kb.add_node(Node(label="Meanwhile", entity_type="Person"))
+        return 1
+
+    assert simple_kb._cached_insight(("probe",), compute) == 1
+    assert simple_kb._cached_insight(("probe",), lambda: 2) == 2
+
+
+def test_graph_view_rejects_invalid_arguments(complex_kb: KnowledgeBase) -> None:
+    """Unknown modes and ego views without a valid focus should raise."""
+    with pytest.raises(ValueError):
+        complex_kb.graph_view(mode="everything")
+    with pytest.raises(ValueError):
+        complex_kb.graph_view(mode="ego")
+    with pytest.raises(ValueError):
+        complex_kb.graph_view(mode="ego", focus="n_cia", hops=4)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# get_layout Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def test_get_layout_wait_returns_current_positions(
+    complex_kb: KnowledgeBase,
+) -> None:
+    """Waiting should yield a position for every node, cached until a change."""
+    positions, ready = complex_kb.get_layout(wait=True)
+
+    assert ready is True
+    assert set(positions) == set(complex_kb._nodes)
+    assert complex_kb.get_layout() == (positions, True)
+
+
+def test_get_layout_stale_until_relayout(complex_kb: KnowledgeBase) -> None:
+    """After a change, the old layout is served with the new node placed."""
+    before, _ = complex_kb.get_layout(wait=True)
+    newcomer = complex_kb.add_node(Node(label="Newcomer", entity_type="Person"))
+    complex_kb.add_relationship("Newcomer", "CIA", "works_for", "src_1")
+
+    with patch("app.kg.knowledge_base.submit_layout") as submit:
+        stale, ready = complex_kb.get_layout()
+    assert ready is False
+    submit.assert_called_once()
+    assert {n: stale[n] for n in before} == before
+    assert newcomer.id in stale
+
+    positions, ready = complex_kb.get_layout(wait=True)
+    assert ready is True
+    assert {n: positions[n] for n in before} == before
+    assert newcomer.id in positions
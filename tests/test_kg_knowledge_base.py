@@ -7,12 +7,16 @@ Tests cover the core KnowledgeBase functionality:
 - Edge operations: add, get between nodes, add_relationship
 - Graph queries: neighbors, path finding
 - Statistics
+- Change feed: coalesced deltas and resync conditions
 """
 
+from typing import Any
+
 import pytest
 
 from app.kg.knowledge_base import KnowledgeBase
 from app.kg.models import Edge, Node, RelationshipDetail, Source, SourceType
+from app.kg.paths import PathBudget
 from app.kg.domain import DomainProfile
 
 
@@ -403,6 +407,152 @@ def test_find_nodes_empty_kb(empty_kb: KnowledgeBase) -> None:
     assert results == []
 
 
+def test_find_nodes_blank_query_matches_nothing(kb_with_nodes: KnowledgeBase) -> None:
+    """A label query that normalizes to nothing should not match every node."""
+    assert kb_with_nodes.find_nodes(label="...") == []
+    assert kb_with_nodes.find_nodes(label="  ", entity_type="Person") == []
+
+
+def test_find_nodes_matches_aliases(kb_with_nodes: KnowledgeBase) -> None:
+    """find_nodes should match partial aliases as well as labels."""
+    results = kb_with_nodes.find_nodes(label="intelligence")
+    assert [n.label for n in results] == ["CIA"]
+
+    # Short queries (below trigram length) still work
+    results = kb_with_nodes.find_nodes(label="mk")
+    assert [n.label for n in results] == ["MKUltra"]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# search_nodes Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+@pytest.fixture
+def search_kb() -> KnowledgeBase:
+    """KnowledgeBase with labels that exercise every match tier."""
+    kb = KnowledgeBase(name="Search KB")
+    for node_id, label, entity_type in [
+        ("n_ops", "Operation Midnight Climax", "Project"),
+        ("n_op", "Operation", "Concept"),
+        ("n_covert", "Covert Operations Unit", "Organization"),
+        ("n_coop", "Cooperation Treaty", "Document"),
+        ("n_gott", "Sidney Gottlieb", "Person"),
+    ]:
+        kb.add_node(Node(id=node_id, label=label, entity_type=entity_type))
+    kb.add_node(
+        Node(
+            id="n_cia",
+            label="CIA",
+            entity_type="Organization",
+            aliases=["The Company", "Operations Directorate"],
+        )
+    )
+    return kb
+
+
+def test_search_nodes_ranks_match_tiers(search_kb: KnowledgeBase) -> None:
+    """Exact beats prefix beats word prefix beats substring."""
+    results, total = search_kb.search_nodes("operation")
+
+    assert [r["node"].id for r in results] == [
+        "n_op",
+        "n_ops",
+        "n_cia",
+        "n_covert",
+        "n_coop",
+    ]
+    assert [r["match"] for r in results] == [
+        "exact",
+        "prefix",
+        "prefix",
+        "word_prefix",
+        "substring",
+    ]
+    assert results[2]["matched_name"] == "operations directorate"
+    assert total == 5
+
+
+def test_search_nodes_alias_ranks_below_label(search_kb: KnowledgeBase) -> None:
+    """An alias match should rank just below the same match on a label."""
+    results, _ = search_kb.search_nodes("operation")
+    scores = {r["node"].id: r["score"] for r in results}
+
+    assert scores["n_ops"] > scores["n_cia"] > scores["n_covert"]
+
+
+def test_search_nodes_short_query_uses_word_prefixes(
+    search_kb: KnowledgeBase,
+) -> None:
+    """One- and two-character queries match word prefixes only."""
+    results, total = search_kb.search_nodes("co")
+
+    assert {r["node"].id for r in results} == {"n_covert", "n_coop", "n_cia"}
+    assert total == 3
+
+
+def test_search_nodes_fuzzy_fallback(search_kb: KnowledgeBase) -> None:
+    """Typos should fall back to fuzzy matches ranked below real matches."""
+    results, total = search_kb.search_nodes("gotlieb")
+
+    assert total == 1
+    assert results[0]["node"].id == "n_gott"
+    assert results[0]["match"] == "fuzzy"
+    assert results[0]["score"] < 70
+
+    assert search_kb.search_nodes("gotlieb", fuzzy=False) == ([], 0)
+
+
+def test_search_nodes_pagination_and_filter(search_kb: KnowledgeBase) -> None:
+    """offset/limit should page through the ranking; entity_type filters."""
+    first, total = search_kb.search_nodes("operation", limit=2)
+    second, _ = search_kb.search_nodes("operation", limit=2, offset=2)
+    everything, _ = search_kb.search_nodes("operation")
+
+    assert total == 5
+    assert [r["node"].id for r in first + second] == [
+        r["node"].id for r in everything[:4]
+    ]
+
+    orgs, total = search_kb.search_nodes("operation", entity_type="Organization")
+    assert {r["node"].id for r in orgs} == {"n_covert", "n_cia"}
+    assert total == 2
+
+
+def test_search_nodes_ties_prefer_higher_degree(search_kb: KnowledgeBase) -> None:
+    """Equal scores should rank the better connected entity first."""
+    search_kb.add_node(
+        Node(id="n_ops2", label="Operation Midnight Climbs", entity_type="Project")
+    )
+    edge = Edge(source_node_id="n_ops2", target_node_id="n_gott")
+    search_kb.add_edge(edge)
+
+    results, _ = search_kb.search_nodes("operation midnight cli")
+
+    assert [r["node"].id for r in results] == ["n_ops2", "n_ops"]
+    assert results[0]["degree"] == 1
+
+
+def test_search_index_tracks_mutations(search_kb: KnowledgeBase) -> None:
+    """The search index should follow node additions, aliases, merges and removals."""
+    # Build the lazy prefix index first so in-place maintenance is exercised
+    search_kb.search_nodes("mk")
+
+    search_kb.add_node(Node(id="n_mk", label="MKUltra", entity_type="Project"))
+    assert [r["node"].id for r in search_kb.search_nodes("mk")[0]] == ["n_mk"]
+
+    search_kb.add_alias("n_mk", "Project Artichoke")
+    assert search_kb.search_nodes("artichoke")[0][0]["node"].id == "n_mk"
+
+    search_kb.merge_nodes("n_ops", "n_mk")
+    assert [r["node"].id for r in search_kb.search_nodes("mk")[0]] == ["n_ops"]
+    assert search_kb.search_nodes("artichoke")[0][0]["node"].id == "n_ops"
+
+    search_kb.remove_node("n_ops")
+    assert search_kb.search_nodes("mk") == ([], 0)
+    assert search_kb.search_nodes("artichoke", fuzzy=False) == ([], 0)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Edge Operations Tests
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -479,6 +629,46 @@ def test_get_or_create_edge_existing(kb_with_edges: KnowledgeBase) -> None:
     assert edge.id == original_id
 
 
+def test_get_edges_for_node_incoming_and_outgoing(kb_with_edges: KnowledgeBase) -> None:
+    """get_edges_for_node should return both outgoing and incoming edges."""
+    edge_ids = {e.id for e in kb_with_edges.get_edges_for_node("node_org_1")}
+    assert edge_ids == {"edge_1", "edge_3"}
+
+    assert kb_with_edges.get_edges_for_node("nonexistent") == []
+
+
+def test_remove_node_removes_incident_edges(kb_with_edges: KnowledgeBase) -> None:
+    """remove_node should drop the node, its edges and its lookup entries."""
+    assert kb_with_edges.remove_node("node_org_1") is True
+
+    assert kb_with_edges.get_node("node_org_1") is None
+    assert kb_with_edges.get_node_by_label("CIA") is None
+    assert kb_with_edges.get_edge("edge_1") is None
+    assert kb_with_edges.get_edge("edge_3") is None
+    assert kb_with_edges.get_edge("edge_2") is not None
+    assert "node_org_1" not in kb_with_edges._graph
+    assert kb_with_edges._changes[("node", "node_org_1")] == "delete"
+    assert kb_with_edges._changes[("edge", "edge_1")] == "delete"
+
+    assert kb_with_edges.remove_node("node_org_1") is False
+
+
+def test_adjacency_index_after_merge(kb_with_edges: KnowledgeBase) -> None:
+    """merge_nodes should keep the edge adjacency index consistent."""
+    # Merging CIA into Gottlieb collapses edge_1 into a self-loop and
+    # redirects edge_3 onto the survivor
+    kb_with_edges.merge_nodes("node_person_1", "node_org_1")
+
+    assert kb_with_edges.get_edges_for_node("node_org_1") == []
+    assert kb_with_edges.get_edge_between("node_person_1", "node_org_1") is None
+
+    edge = kb_with_edges.get_edge_between("node_person_1", "node_project_1")
+    assert edge is not None
+    survivor_edges = kb_with_edges.get_edges_for_node("node_person_1")
+    assert [e.id for e in survivor_edges] == [edge.id]
+    assert all(e.source_node_id != e.target_node_id for e in survivor_edges)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # add_relationship Tests
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -613,6 +803,73 @@ def test_get_neighbors_isolated_node(empty_kb: KnowledgeBase) -> None:
     assert neighbors == []
 
 
+def test_page_nodes_sort_orders(kb_with_edges: KnowledgeBase) -> None:
+    """page_nodes should order by label, degree or recency."""
+    by_label, _, total = kb_with_edges.page_nodes(sort="label")
+    labels = [n.label for n in by_label]
+    assert labels == sorted(labels, key=str.lower)
+    assert total == len(kb_with_edges._nodes)
+
+    by_degree, _, _ = kb_with_edges.page_nodes(sort="degree")
+    degrees = [kb_with_edges.node_degree(n.id) for n in by_degree]
+    assert degrees == sorted(degrees, reverse=True)
+
+    by_recency, _, _ = kb_with_edges.page_nodes(sort="recency")
+    stamps = [n.updated_at for n in by_recency]
+    assert stamps == sorted(stamps, reverse=True)
+
+
+def test_page_nodes_sorts_punctuation_only_labels(
+    kb_with_edges: KnowledgeBase,
+) -> None:
+    """Labels that normalize to nothing should sort by their raw label."""
+    odd = kb_with_edges.add_node(Node(label="?", entity_type="Thing"))
+
+    by_label, _, total = kb_with_edges.page_nodes(sort="label")
+    by_degree, _, _ = kb_with_edges.page_nodes(sort="degree")
+
+    assert by_label[0].id == odd.id
+    assert total == len(kb_with_edges._nodes)
+    assert by_degree[-1].id == odd.id
+
+
+def test_page_nodes_keyset_pagination(kb_with_edges: KnowledgeBase) -> None:
+    """Following next_key should return every node exactly once."""
+    everything, _, _ = kb_with_edges.page_nodes(sort="degree", limit=100)
+
+    seen: list[str] = []
+    after = None
+    while True:
+        page, after, _ = kb_with_edges.page_nodes(sort="degree", limit=1, after=after)
+        seen.extend(n.id for n in page)
+        if after is None:
+            break
+
+    assert seen == [n.id for n in everything]
+
+
+def test_page_nodes_filters(kb_with_edges: KnowledgeBase) -> None:
+    """page_nodes should filter by entity type and by neighborhood."""
+    people, next_key, total = kb_with_edges.page_nodes(entity_type="Person")
+    assert people and all(n.entity_type == "Person" for n in people)
+    assert next_key is None and total == len(people)
+
+    neighbors, _, total = kb_with_edges.page_nodes(neighbors_of="node_project_1")
+    assert {n.id for n in neighbors} == {"node_person_1", "node_org_1"}
+    assert total == 2
+    assert kb_with_edges.page_nodes(neighbors_of="nonexistent_node")[2] == 0
+
+
+def test_page_nodes_rejects_mismatched_key(kb_with_edges: KnowledgeBase) -> None:
+    """An `after` key from another sort order should raise ValueError."""
+    _, label_key, _ = kb_with_edges.page_nodes(sort="label", limit=1)
+
+    with pytest.raises(ValueError):
+        kb_with_edges.page_nodes(sort="degree", after=label_key)
+    with pytest.raises(ValueError):
+        kb_with_edges.page_nodes(sort="size")
+
+
 def test_find_paths(kb_with_edges: KnowledgeBase) -> None:
     """find_paths should return paths between two nodes."""
     # Path from Sidney Gottlieb to MKUltra
@@ -669,6 +926,49 @@ def test_find_paths_max_length(kb_with_edges: KnowledgeBase) -> None:
         assert len(path) <= 2  # path length is node count
 
 
+def test_find_paths_shortest_first_and_limit(kb_with_edges: KnowledgeBase) -> None:
+    """find_paths should return shortest paths first, up to limit."""
+    paths = kb_with_edges.find_paths("node_person_1", "node_project_1")
+    assert paths == [
+        ["node_person_1", "node_project_1"],
+        ["node_person_1", "node_org_1", "node_project_1"],
+    ]
+
+    paths = kb_with_edges.find_paths("node_person_1", "node_project_1", limit=1)
+    assert paths == [["node_person_1", "node_project_1"]]
+
+
+def test_find_paths_relationship_type_filter(kb_with_edges: KnowledgeBase) -> None:
+    """find_paths should only follow edges with the requested relationship types."""
+    paths = kb_with_edges.find_paths(
+        "node_person_1",
+        "node_project_1",
+        relationship_types=["Worked_For", "funded"],
+    )
+
+    assert paths == [["node_person_1", "node_org_1", "node_project_1"]]
+
+
+def test_find_paths_entity_type_filter(kb_with_edges: KnowledgeBase) -> None:
+    """Intermediate nodes must match the entity type filter; endpoints need not."""
+    paths = kb_with_edges.find_paths(
+        "node_person_1",
+        "node_project_1",
+        entity_types=["Person"],
+    )
+
+    assert paths == [["node_person_1", "node_project_1"]]
+
+
+def test_find_paths_budget_exhausted(kb_with_edges: KnowledgeBase) -> None:
+    """An exhausted budget should cut the search short and say so."""
+    budget = PathBudget(max_expansions=0)
+    paths = kb_with_edges.find_paths("node_person_1", "node_project_1", budget=budget)
+
+    assert paths == []
+    assert budget.exhausted is True
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Statistics Tests
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -727,6 +1027,44 @@ def test_stats_multiple_relationships_per_edge(kb_with_edges: KnowledgeBase) ->
     assert stats["relationship_types"]["worked_for"] == 1  # Original
 
 
+def test_from_records_matches_incremental_build(kb_with_edges: KnowledgeBase) -> None:
+    """from_records should build the same storage and indexes as add_*."""
+    kb = KnowledgeBase.from_records(
+        kb_with_edges._nodes.values(),
+        kb_with_edges._edges.values(),
+        kb_with_edges._sources.values(),
+        id=kb_with_edges.id,
+        name=kb_with_edges.name,
+    )
+
+    assert kb.id == kb_with_edges.id
+    assert list(kb._nodes) == list(kb_with_edges._nodes)
+    assert list(kb._edges) == list(kb_with_edges._edges)
+    assert kb._sources == kb_with_edges._sources
+    assert kb._label_to_id == kb_with_edges._label_to_id
+    assert kb._alias_to_id == kb_with_edges._alias_to_id
+    assert kb._edge_index == kb_with_edges._edge_index
+    assert kb._node_edges == kb_with_edges._node_edges
+    assert kb._ngram_to_ids == kb_with_edges._ngram_to_ids
+    assert kb._node_search_names == kb_with_edges._node_search_names
+    assert kb._changes == {}
+    assert kb._nx_graph is None
+
+
+def test_graph_holds_lightweight_attributes(kb_with_edges: KnowledgeBase) -> None:
+    """The NetworkX graph should carry IDs and summary attributes only."""
+    graph = kb_with_edges._graph
+
+    assert graph.nodes["node_person_1"] == {
+        "label": "Sidney Gottlieb",
+        "entity_type": "Person",
+    }
+    assert graph.edges["node_person_1", "node_org_1"] == {
+        "edge_id": "edge_1",
+        "relationships": ["worked_for"],
+    }
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Source Operations Tests
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -756,6 +1094,154 @@ def test_add_and_get_source(empty_kb: KnowledgeBase) -> None:
     assert not_found is None
 
 
+def test_remove_source_records_change(empty_kb: KnowledgeBase) -> None:
+    """remove_source should drop the source and record a delete."""
+    empty_kb.add_source(Source(id="s1", title="Video", source_type=SourceType.VIDEO))
+    empty_kb._changes.clear()
+
+    assert empty_kb.remove_source("s1") is True
+    assert empty_kb.get_source("s1") is None
+    assert empty_kb._changes == {("source", "s1"): "delete"}
+
+    assert empty_kb.remove_source("s1") is False
+
+
+@pytest.fixture
+def two_source_kb() -> KnowledgeBase:
+    """Nodes and relationships extracted from two overlapping sources."""
+    kb = KnowledgeBase(name="Two sources")
+    for source_id in ["ep1", "ep2"]:
+        kb.add_source(Source(id=source_id, title=source_id))
+    for label, source_ids in [
+        ("Gottlieb", ["ep1", "ep2"]),
+        ("CIA", ["ep1", "ep2"]),
+        ("Army", ["ep1"]),
+        ("Olson", ["ep1"]),
+    ]:
+        node = kb.add_node(Node(id=label, label=label, entity_type="Entity"))
+        for source_id in source_ids:
+            kb.add_node_source(node.id, source_id)
+    kb.add_relationship("Gottlieb", "CIA", "worked_for", "ep1")
+    kb.add_relationship("Gottlieb", "CIA", "directed", "ep2")
+    kb.add_relationship("Gottlieb", "Army", "consulted", "ep1")
+    return kb
+
+
+def test_source_footprint_follows_changes(two_source_kb: KnowledgeBase) -> None:
+    """The provenance index should track sources, merges and reloads."""
+    kb = two_source_kb
+    cia_edge = kb.get_edge_between("Gottlieb", "CIA")
+    army_edge = kb.get_edge_between("Gottlieb", "Army")
+    assert cia_edge is not None and army_edge is not None
+
+    footprint = kb.get_source_footprint("ep1")
+
+    assert footprint["node_ids"] == ["Gottlieb", "CIA", "Army", "Olson"]
+    assert footprint["relationships"] == [(cia_edge.id, 0), (army_edge.id, 0)]
+    assert kb.get_source_footprint("ep2")["relationships"] == [(cia_edge.id, 1)]
+
+    kb.merge_nodes("Gottlieb", "Olson")
+    reloaded = KnowledgeBase.from_records(
+        kb._nodes.values(), kb._edges.values(), kb._sources.values()
+    )
+
+    assert kb.get_source_footprint("ep1")["node_ids"] == ["Gottlieb", "CIA", "Army"]
+    assert reloaded._source_to_nodes == kb._source_to_nodes
+    assert reloaded._source_to_edges == kb._source_to_edges
+
+
+def test_retract_source_removes_only_its_contributions(
+    two_source_kb: KnowledgeBase,
+) -> None:
+    """Shared nodes and other sources' relationships should survive."""
+    kb = two_source_kb
+    version = kb.generation
+
+    stats = kb.retract_source("ep1")
+
+    assert stats == {
+        "relationships_removed": 2,
+        "edges_removed": 1,
+        "nodes_removed": 2,
+        "nodes_updated": 2,
+    }
+    assert kb.get_source("ep1") is None
+    assert sorted(kb._nodes) == ["CIA", "Gottlieb"]
+    assert kb.get_node("Gottlieb").source_ids == ["ep2"]  # type: ignore[union-attr]
+    edge = kb.get_edge_between("Gottlieb", "CIA")
+    assert edge is not None
+    assert edge.get_relationship_types() == ["directed"]
+    assert kb.get_edges_by_relationship_type("worked_for") == []
+    assert kb.get_source_footprint("ep1") == {"node_ids": [], "relationships": []}
+    assert ("delete", "node", "Army") in [
+        (c["op"], c["kind"], c["id"]) for c in kb.changes_since(version) or []
+    ]
+
+    with pytest.raises(ValueError, match="Source not found"):
+        kb.retract_source("ep1")
+
+
+def test_retract_source_keeps_connected_nodes(two_source_kb: KnowledgeBase) -> None:
+    """A node left without sources but still connected should be kept."""
+    kb = two_source_kb
+    kb.add_relationship("Army", "CIA", "trained", "ep2")
+
+    stats = kb.retract_source("ep1")
+
+    assert stats["nodes_removed"] == 1  # Olson only
+    assert kb.get_node("Army") is not None
+    assert kb.get_node("Army").source_ids == []  # type: ignore[union-attr]
+
+
+def test_retract_source_keeps_named_orphans(two_source_kb: KnowledgeBase) -> None:
+    """Orphans named in keep_labels (label or alias) should be kept."""
+    two_source_kb.add_alias("Olson", "Frank Olson")
+
+    stats = two_source_kb.retract_source("ep1", keep_labels=["frank olson"])
+
+    assert stats["nodes_removed"] == 1  # Army only
+    assert two_source_kb.get_node("Olson") is not None
+
+
+def test_node_removal_touches_only_mentioning_sources(
+    two_source_kb: KnowledgeBase,
+) -> None:
+    """Mention spans should be updated via the index, not a scan of all sources."""
+    kb = two_source_kb
+    kb.index_mentions("ep1", "Olson met Army officers. Olson left.")
+    kb.index_mentions("ep2", "Gottlieb ran the CIA program.")
+    kb.add_source(Source(id="ep3", title="ep3"))
+    kb._changes.clear()
+
+    class NoScan(dict[str, Source]):
+        def values(self) -> Any:
+            raise AssertionError("scanned every source")
+
+    kb._sources = NoScan(kb._sources)
+    kb.remove_node("Olson")
+    kb.merge_nodes("Gottlieb", "CIA")
+    kb._sources = dict(kb._sources)
+
+    # ep3 mentions neither node, so it is never rewritten
+    assert {key for key in kb._changes if key[0] == "source"} == {
+        ("source", "ep1"),
+        ("source", "ep2"),
+    }
+    assert kb.mention_counts("Gottlieb") == {"ep2": 2}
+    assert kb._node_to_mention_sources == {
+        "Army": {"ep1": None},
+        "Gottlieb": {"ep2": None},
+    }
+
+    kb.remove_source("ep1")
+    reloaded = KnowledgeBase.from_records(
+        kb._nodes.values(), kb._edges.values(), kb._sources.values()
+    )
+
+    assert kb._node_to_mention_sources == {"Gottlieb": {"ep2": None}}
+    assert reloaded._node_to_mention_sources == kb._node_to_mention_sources
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Updated Timestamp Tests
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -772,3 +1258,59 @@ def test_updated_at_changes_on_add(empty_kb: KnowledgeBase) -> None:
     empty_kb.add_node(Node(label="Test", entity_type="Entity"))
 
     assert empty_kb.updated_at > initial_updated
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Change Feed Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def test_changes_since_coalesces_to_latest_state(kb_with_edges: KnowledgeBase) -> None:
+    """Each changed node/edge should appear once, with its current element."""
+    version = kb_with_edges.generation
+
+    kb_with_edges.add_alias("node_person_1", "Joseph Scheider")
+    kb_with_edges.add_alias("node_person_1", "Black Sorcerer")
+    kb_with_edges.add_source(
+        Source(id="src_x", title="Video", source_type=SourceType.VIDEO)
+    )
+    kb_with_edges.remove_edge("edge_1")
+    newcomer = kb_with_edges.add_node(Node(label="Newcomer", entity_type="Person"))
+
+    changes = kb_with_edges.changes_since(version, kb_with_edges.feed_epoch)
+
+    assert changes is not None
+    assert [(c["op"], c["kind"], c["id"]) for c in changes] == [
+        ("upsert", "node", "node_person_1"),
+        ("delete", "edge", "edge_1"),
+        ("upsert", "node", newcomer.id),
+    ]
+    assert "Black Sorcerer" in changes[0]["element"]["data"]["aliases"]
+    assert kb_with_edges.changes_since(kb_with_edges.generation) == []
+
+
+def test_changes_since_requires_resync(
+    monkeypatch: pytest.MonkeyPatch, kb_with_edges: KnowledgeBase
+) -> None:
+    """Other epochs, unknown versions and dropped changes should force a resync."""
+    assert kb_with_edges.changes_since(0, "other_epoch") is None
+    assert kb_with_edges.changes_since(kb_with_edges.generation + 1) is None
+
+    monkeypatch.setattr("app.kg.knowledge_base.CHANGE_FEED_SIZE", 2)
+    kb = KnowledgeBase(name="Small feed")
+    for label in ["A", "B", "C"]:
+        kb.add_node(Node(label=label, entity_type="Entity"))
+
+    assert kb.changes_since(0) is None
+    assert kb.changes_since(1) is not None
+    assert len(kb.changes_since(1) or []) == 2
+
+
+def test_from_records_starts_a_new_feed(kb_with_edges: KnowledgeBase) -> None:
+    """A reloaded KB should have an empty feed under a new epoch."""
+    kb = KnowledgeBase.from_records(
+        kb_with_edges._nodes.values(), kb_with_edges._edges.values()
+    )
+
+    assert kb.feed_epoch != kb_with_edges.feed_epoch
+    assert kb.changes_since(kb.generation) == []
@@ -0,0 +1,118 @@
+"""
+Unit tests for server-side graph layout (app/kg/layout.py).
+
+Tests cover:
+- layout_graph: determinism, separation, incremental placement
+- place_missing: provisional positions next to neighbors
+- submit_layout: background execution
+"""
+
+from __future__ import annotations
+
+import math
+
+import networkx as nx  # type: ignore[import-untyped]
+import pytest
+
+from app.kg.layout import layout_graph, place_missing, submit_layout
+
+
+def _distance(a: tuple[float, float], b: tuple[float, float]) -> float:
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+
+@pytest.fixture
+def grid() -> tuple[list[str], list[tuple[str, str]]]:
+    """A 6x6 grid graph as node IDs and edges."""
+    graph = nx.grid_2d_graph(6, 6)
+    name = {node: f"n{i}" for i, node in enumerate(graph.nodes())}
+    return list(name.values()), [(name[u], name[v]) for u, v in graph.edges()]
+
+
+def test_layout_graph_is_deterministic(
+    grid: tuple[list[str], list[tuple[str, str]]],
+) -> None:
+    """The same graph and seed should give the same positions."""
+    node_ids, edges = grid
+
+    first = layout_graph(node_ids, edges)
+
+    assert set(first) == set(node_ids)
+    assert layout_graph(node_ids, edges) == first
+
+
+def test_layout_graph_keeps_neighbors_closer_than_strangers(
+    grid: tuple[list[str], list[tuple[str, str]]],
+) -> None:
+    """Connected nodes should end up nearer each other than average."""
+    node_ids, edges = grid
+    positions = layout_graph(node_ids, edges)
+
+    edge_mean = sum(_distance(positions[u], positions[v]) for u, v in edges) / len(
+        edges
+    )
+    pairs = [(u, v) for i, u in enumerate(node_ids) for v in node_ids[i + 1 :]]
+    pair_mean = sum(_distance(positions[u], positions[v]) for u, v in pairs) / len(
+        pairs
+    )
+
+    assert edge_mean < pair_mean / 2
+    assert len(set(positions.values())) == len(node_ids)
+
+
+def test_layout_graph_places_new_nodes_incrementally(
+    grid: tuple[list[str], list[tuple[str, str]]],
+) -> None:
+    """Existing nodes should keep their positions; new ones land nearby."""
+    node_ids, edges = grid
+    previous = layout_graph(node_ids, edges)
+
+    positions = layout_graph(
+        [*node_ids, "new"], [*edges, ("new", "n0")], previous=previous
+    )
+
+    assert {n: positions[n] for n in node_ids} == previous
+    edge_mean = sum(_distance(previous[u], previous[v]) for u, v in edges) / len(edges)
+    assert _distance(positions["new"], previous["n0"]) < 3 * edge_mean
+
+
+def test_layout_graph_relays_out_after_large_growth() -> None:
+    """Mostly new graphs should be laid out from scratch."""
+    previous = layout_graph(["a", "b"], [("a", "b")])
+    node_ids = ["a", "b", *(f"x{i}" for i in range(10))]
+
+    positions = layout_graph(
+        node_ids, [("a", "b"), *(("a", f"x{i}") for i in range(10))], previous
+    )
+
+    assert set(positions) == set(node_ids)
+    assert positions["a"] != previous["a"]
+
+
+def test_layout_graph_handles_trivial_graphs() -> None:
+    """Empty and single-node graphs should not fail."""
+    assert layout_graph([], []) == {}
+    assert set(layout_graph(["solo"], [])) == {"solo"}
+
+
+def test_place_missing_uses_neighbor_centroid() -> None:
+    """Missing nodes should be placed near their placed neighbors only."""
+    positions = {"a": (0.0, 0.0), "b": (1000.0, 0.0)}
+
+    placed = place_missing(
+        ["c", "lonely"], {"c": ["a", "b"], "lonely": ["unknown"]}, positions
+    )
+
+    assert set(placed) == {"c"}
+    assert _distance(placed["c"], (500.0, 0.0)) < 100
+
+
+def test_submit_layout_runs_in_background(
+    grid: tuple[list[str], list[tuple[str, str]]],
+) -> None:
+    """The future should resolve to the same result as a direct call."""
+    node_ids, edges = grid
+
+    assert submit_layout(node_ids, edges).result(timeout=30) == layout_graph(
+        node_ids, edges
+    )
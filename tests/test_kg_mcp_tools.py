@@ -315,6 +315,7 @@ async def test_extract_to_kg_success(
         title="Episode 2: The Early Years",
         source_id="ep2_12345",
         transcript_id=None,
+        replace=False,
     )
 
 
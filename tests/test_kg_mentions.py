@@ -0,0 +1,100 @@
+"""
+Unit tests for the entity mention index (app/kg/mentions.py).
+
+Tests cover:
+- MentionMatcher: multi-pattern, whole-word, case-insensitive matching
+- to_byte_spans / read_excerpt: byte offsets into the file on disk
+- KnowledgeBase.index_mentions: indexing, merges, removal, persistence
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.kg.knowledge_base import KnowledgeBase
+from app.kg.mentions import (
+    MentionMatcher,
+    merge_spans,
+    read_excerpt,
+    read_transcript_text,
+    to_byte_spans,
+)
+from app.kg.models import Node, Source
+from app.kg.persistence import load_knowledge_base, save_knowledge_base
+
+
+def test_matcher_finds_every_whole_word_mention() -> None:
+    """All names should match anywhere, ignoring case and partial words."""
+    matcher = MentionMatcher([("CIA", "cia"), ("Gottlieb", "g"), ("he", "he")])
+    text = "The CIA hired Gottlieb. Later the cia, and GOTTLIEB, ... Specialties."
+
+    found = matcher.find(text)
+
+    assert found["cia"] == [(4, 7), (34, 37)]
+    assert [text[s:e] for s, e in found["g"]] == ["Gottlieb", "GOTTLIEB"]
+    assert "he" not in found  # Only inside "The", "the" and "Specialties"
+
+
+def test_matcher_keeps_longest_overlapping_name_per_node() -> None:
+    """A node's longer name should win over a name nested inside it."""
+    matcher = MentionMatcher(
+        [("Sidney Gottlieb", "g"), ("Gottlieb", "g"), ("Sidney", "s")]
+    )
+
+    found = matcher.find("Sidney Gottlieb met Gottlieb")
+
+    assert found["g"] == [(0, 15), (20, 28)]
+    assert found["s"] == [(0, 6)]  # Other nodes still match inside it
+
+
+def test_merge_spans_unions_without_overlap() -> None:
+    """Merged spans should be sorted and not double count nested matches."""
+    assert merge_spans([(0, 15), (40, 45)], [(7, 15), (20, 28)]) == [
+        (0, 15),
+        (20, 28),
+        (40, 45),
+    ]
+
+
+def test_byte_spans_and_excerpts_match_the_file(tmp_path: Path) -> None:
+    """Byte spans should address the raw file, even with multi-byte text."""
+    path = tmp_path / "transcript.txt"
+    path.write_bytes("Café owner\r\nThe naïve Zoë met Café staff.".encode())
+    text = read_transcript_text(path)
+
+    spans = to_byte_spans(text, MentionMatcher([("Zoë", "z")]).find(text))
+    start, end = spans["z"][0]
+
+    assert path.read_bytes()[start:end].decode() == "Zoë"
+    # The window starts inside "ï"; the partial character is dropped
+    assert read_excerpt(path, (start, end), before=4, after=8) == "...ve Zoë met..."
+    assert read_excerpt(path, (start, end + 1000)) is None
+
+
+def test_index_mentions_survives_merge_remove_and_reload(tmp_path: Path) -> None:
+    """Spans should follow merges, drop with removed nodes and persist."""
+    kb = KnowledgeBase(name="Test")
+    kb.add_source(Source(id="src1", title="Episode 1"))
+    cia = kb.add_node(Node(label="CIA", entity_type="Organization"))
+    agency = kb.add_node(Node(label="The Agency", entity_type="Organization"))
+    white = kb.add_node(Node(label="George White", entity_type="Person"))
+
+    count = kb.index_mentions(
+        "src1", "The Agency, i.e. the CIA, paid George White. The CIA denied it."
+    )
+
+    assert count == 4
+    assert kb.get_mention_spans(cia.id, "src1") == [(21, 24), (49, 52)]
+    assert kb.get_mention_spans(cia.id, "missing") is None
+
+    kb.merge_nodes(cia.id, agency.id)
+    kb.remove_node(white.id)
+
+    assert kb.get_mention_spans(cia.id, "src1") == [(0, 10), (21, 24), (49, 52)]
+    assert kb.get_mention_spans(white.id, "src1") == []
+
+    save_knowledge_base(kb, tmp_path)
+    loaded = load_knowledge_base(tmp_path / kb.id)
+
+    assert loaded is not None
+    assert loaded.get_mention_spans(cia.id, "src1") == [(0, 10), (21, 24), (49, 52)]
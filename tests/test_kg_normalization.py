@@ -159,6 +159,13 @@ class TestGenerateNgrams:
         # "Xu" - common Chinese surname
         assert generate_ngrams("Xu") == {"xu"}
 
+    def test_prenormalized_input(self) -> None:
+        """normalized=True skips normalization and gives the same grams."""
+        name = normalize_entity_name("  Café  Society ")
+        assert generate_ngrams(name, normalized=True) == generate_ngrams(
+            "  Café  Society "
+        )
+
 
 class TestNormalizeForIndex:
     """Tests for normalize_for_index function."""
@@ -199,6 +206,11 @@ class TestNormalizeForIndex:
         keys = [normalize_for_index(v) for v in variations]
         assert all(k == "johnsmith" for k in keys)
 
+    def test_prenormalized_input(self) -> None:
+        """normalized=True skips normalization and gives the same key."""
+        name = normalize_entity_name("Dr. Jane  Doe")
+        assert normalize_for_index(name, normalized=True) == "drjanedoe"
+
 
 class TestNormalizationIntegration:
     """Integration tests for normalization across the resolution system."""
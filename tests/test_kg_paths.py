@@ -0,0 +1,186 @@
+"""
+Unit tests for bounded k-shortest path enumeration (app/kg/paths.py).
+
+Tests cover:
+- bidirectional_shortest_path: shortest path, depth limit, ignored nodes/edges
+- iter_shortest_paths: agreement with NetworkX, laziness, undirected mode
+- PathBudget: expansion and time limits
+"""
+
+from __future__ import annotations
+
+from itertools import islice, pairwise
+
+import networkx as nx  # type: ignore[import-untyped]
+import pytest
+
+from app.kg.paths import (
+    Neighbors,
+    PathBudget,
+    bidirectional_shortest_path,
+    iter_shortest_paths,
+)
+
+
+def _str_nodes(graph: nx.DiGraph) -> nx.DiGraph:
+    """The graph with its integer node IDs as strings, like KB node IDs."""
+    return nx.relabel_nodes(graph, str)
+
+
+def _directed(graph: nx.DiGraph) -> tuple[Neighbors, Neighbors]:
+    """Successor/predecessor callables for a directed NetworkX graph."""
+    return graph.successors, graph.predecessors
+
+
+@pytest.fixture
+def ladder() -> nx.DiGraph:
+    """A 2x6 ladder with all edges pointing away from node 0."""
+    graph = nx.ladder_graph(6)
+    return _str_nodes(nx.DiGraph([(min(u, v), max(u, v)) for u, v in graph.edges()]))
+
+
+def test_bidirectional_shortest_path_matches_networkx(ladder: nx.DiGraph) -> None:
+    """The BFS path should be a shortest path."""
+    successors, predecessors = _directed(ladder)
+    path = bidirectional_shortest_path(
+        "0", "11", successors, predecessors, 20, PathBudget()
+    )
+
+    assert path is not None
+    assert path[0] == "0" and path[-1] == "11"
+    assert len(path) == nx.shortest_path_length(ladder, "0", "11") + 1
+    assert all(ladder.has_edge(u, v) for u, v in pairwise(path))
+
+
+def test_bidirectional_shortest_path_respects_max_length(ladder: nx.DiGraph) -> None:
+    """No path longer than max_length should be returned."""
+    successors, predecessors = _directed(ladder)
+    shortest = nx.shortest_path_length(ladder, "0", "11")
+
+    assert (
+        bidirectional_shortest_path(
+            "0", "11", successors, predecessors, shortest - 1, PathBudget()
+        )
+        is None
+    )
+    assert (
+        bidirectional_shortest_path(
+            "0", "11", successors, predecessors, shortest, PathBudget()
+        )
+        is not None
+    )
+
+
+def test_bidirectional_shortest_path_ignores_nodes_and_edges() -> None:
+    """Ignored nodes and edges should force a detour."""
+    graph = nx.DiGraph([("a", "b"), ("b", "d"), ("a", "c"), ("c", "d")])
+    successors, predecessors = _directed(graph)
+
+    path = bidirectional_shortest_path(
+        "a", "d", successors, predecessors, 5, PathBudget(), ignore_nodes={"b"}
+    )
+    assert path == ["a", "c", "d"]
+
+    path = bidirectional_shortest_path(
+        "a",
+        "d",
+        successors,
+        predecessors,
+        5,
+        PathBudget(),
+        ignore_edges={("a", "b"), ("c", "d")},
+    )
+    assert path is None
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_iter_shortest_paths_matches_networkx(seed: int) -> None:
+    """Path lengths should match NetworkX's shortest_simple_paths."""
+    graph = _str_nodes(nx.gnp_random_graph(25, 0.15, seed=seed, directed=True))
+    successors, predecessors = _directed(graph)
+    source, target = "0", "24"
+    if not nx.has_path(graph, source, target):
+        pytest.skip("random graph has no path")
+
+    ours = list(
+        islice(
+            iter_shortest_paths(
+                source, target, successors, predecessors, 25, PathBudget()
+            ),
+            15,
+        )
+    )
+    expected = list(islice(nx.shortest_simple_paths(graph, source, target), 15))
+
+    assert [len(p) for p in ours] == [len(p) for p in expected]
+    assert len({tuple(p) for p in ours}) == len(ours)
+    for path in ours:
+        assert len(set(path)) == len(path)
+        assert all(graph.has_edge(u, v) for u, v in pairwise(path))
+
+
+def test_iter_shortest_paths_enumerates_all_within_cutoff(ladder: nx.DiGraph) -> None:
+    """Without a limit, every simple path within the cutoff is yielded once."""
+    successors, predecessors = _directed(ladder)
+
+    ours = {
+        tuple(p)
+        for p in iter_shortest_paths(
+            "0", "11", successors, predecessors, 7, PathBudget()
+        )
+    }
+    expected = {tuple(p) for p in nx.all_simple_paths(ladder, "0", "11", cutoff=7)}
+
+    assert ours == expected
+
+
+def test_iter_shortest_paths_is_lazy() -> None:
+    """Taking one path from a dense graph should cost few expansions."""
+    graph = _str_nodes(nx.complete_graph(40, create_using=nx.DiGraph))
+    successors, predecessors = _directed(graph)
+    budget = PathBudget()
+
+    first = next(iter_shortest_paths("0", "39", successors, predecessors, 5, budget))
+
+    assert first == ["0", "39"]
+    assert budget.expansions <= 2
+
+
+def test_iter_shortest_paths_undirected() -> None:
+    """Undirected mode should traverse edges against their direction."""
+    graph = nx.DiGraph([("a", "b"), ("c", "b"), ("a", "d"), ("d", "c")])
+
+    def neighbors(node: str) -> list[str]:
+        return [*graph.successors(node), *graph.predecessors(node)]
+
+    paths = list(
+        iter_shortest_paths(
+            "a", "c", neighbors, neighbors, 5, PathBudget(), directed=False
+        )
+    )
+
+    assert sorted(paths) == [["a", "b", "c"], ["a", "d", "c"]]
+
+
+def test_budget_expansion_limit_stops_search() -> None:
+    """A tiny expansion budget should stop the search and mark it exhausted."""
+    graph = _str_nodes(nx.path_graph(100, create_using=nx.DiGraph))
+    successors, predecessors = _directed(graph)
+    budget = PathBudget(max_expansions=10)
+
+    paths = list(iter_shortest_paths("0", "99", successors, predecessors, 200, budget))
+
+    assert paths == []
+    assert budget.exhausted is True
+
+
+def test_budget_time_limit_stops_search() -> None:
+    """An expired time budget should stop the search."""
+    graph = _str_nodes(nx.path_graph(10, create_using=nx.DiGraph))
+    successors, predecessors = _directed(graph)
+    budget = PathBudget(time_limit=0.0)
+
+    assert (
+        list(iter_shortest_paths("0", "9", successors, predecessors, 20, budget)) == []
+    )
+    assert budget.exhausted is True
@@ -0,0 +1,153 @@
+"""
+Unit tests for typed pattern queries (app/kg/patterns.py and
+KnowledgeBase.match_pattern).
+
+Tests cover:
+- parse_pattern: node/relationship syntax, directions, errors
+- Type indexes: maintained through adds, merges, removals and reloads
+- match_pattern: typed joins, directions, property filters, variables
+- ask_about_graph pattern handler: formatting and errors
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.agent.kg_tool import _handle_pattern
+from app.kg.knowledge_base import KnowledgeBase
+from app.kg.models import Node
+from app.kg.patterns import NodePattern, RelationshipPattern, parse_pattern
+
+
+@pytest.fixture
+def kb() -> KnowledgeBase:
+    """People, organizations and a location with typed relationships."""
+    kb = KnowledgeBase(name="Patterns")
+    for node_id, entity_type in [
+        ("Gottlieb", "Person"),
+        ("White", "Person"),
+        ("CIA", "Organization"),
+        ("Army", "Organization"),
+        ("San Francisco", "Location"),
+    ]:
+        kb.add_node(Node(id=node_id, label=node_id, entity_type=entity_type))
+    kb.get_node("Gottlieb").properties["role"] = "chemist"  # type: ignore[union-attr]
+    kb.add_relationship("Gottlieb", "CIA", "worked_for", "src")
+    kb.add_relationship("White", "CIA", "worked_for", "src")
+    kb.add_relationship("White", "Army", "served_in", "src")
+    kb.add_relationship("CIA", "San Francisco", "operated_in", "src")
+    return kb
+
+
+def _paths(kb: KnowledgeBase, pattern: str) -> list[list[str]]:
+    return [[n["id"] for n in m["nodes"]] for m in kb.match_pattern(pattern)]
+
+
+def test_parse_pattern_reads_nodes_and_relationships() -> None:
+    """Variables, types, properties and all arrow forms should parse."""
+    pattern = parse_pattern(
+        "(p:Person|Agent {label: 'Sidney Gottlieb', age: 52})"
+        "-[worked_for|:funded_by]->(:Organization)<--(`Place Name`)-[]-()"
+    )
+
+    assert pattern.nodes[0] == NodePattern(
+        "p", ("Person", "Agent"), {"label": "Sidney Gottlieb", "age": 52}
+    )
+    assert pattern.nodes[2] == NodePattern("Place Name")
+    assert pattern.relationships == (
+        RelationshipPattern(("worked_for", "funded_by"), "out"),
+        RelationshipPattern((), "in"),
+        RelationshipPattern((), "any"),
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["Person", "(:Person", "(:Person)->(b)", "(a)<-[x]->(b)", "(a {k: v})", "()" * 2],
+)
+def test_parse_pattern_rejects_invalid_syntax(text: str) -> None:
+    """Malformed patterns should raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid pattern"):
+        parse_pattern(text)
+
+
+def test_parse_pattern_limits_hops() -> None:
+    """Patterns longer than MAX_PATTERN_HOPS relationships are refused."""
+    with pytest.raises(ValueError, match="limited"):
+        parse_pattern("()" + "-->()" * 5)
+
+
+def test_type_indexes_follow_mutations(kb: KnowledgeBase) -> None:
+    """Type lookups should reflect merges, removals and reloads."""
+    assert [n.id for n in kb.find_nodes(entity_type="Person")] == ["Gottlieb", "White"]
+    worked_for = kb.get_edges_by_relationship_type("worked_for")
+    assert [e.target_node_id for e in worked_for] == ["CIA", "CIA"]
+
+    kb.merge_nodes("CIA", "Army")
+    kb.remove_node("Gottlieb")
+
+    assert [n.id for n in kb.find_nodes(entity_type="Organization")] == ["CIA"]
+    served_in = kb.get_edges_by_relationship_type("served_in")
+    assert [e.source_node_id for e in served_in] == ["White"]
+    assert kb.get_edges_by_relationship_type("worked_for")[0].source_node_id == "White"
+
+    reloaded = KnowledgeBase.from_records(kb._nodes.values(), kb._edges.values())
+    assert reloaded._type_to_nodes == kb._type_to_nodes
+    assert reloaded._relationship_to_edges.keys() == kb._relationship_to_edges.keys()
+
+
+def test_match_pattern_joins_typed_hops(kb: KnowledgeBase) -> None:
+    """Types should match case-insensitively, in either written direction."""
+    assert _paths(kb, "(:Person)-[worked_for]->(:Organization)") == [
+        ["Gottlieb", "CIA"],
+        ["White", "CIA"],
+    ]
+    assert _paths(kb, "(:organization)<-[WORKED_FOR]-(:Person)") == [
+        ["CIA", "Gottlieb"],
+        ["CIA", "White"],
+    ]
+    assert _paths(kb, "(:Person)-[worked_for]->()-[operated_in]->(:Location)") == [
+        ["Gottlieb", "CIA", "San Francisco"],
+        ["White", "CIA", "San Francisco"],
+    ]
+    assert _paths(kb, "(:Organization)-[worked_for]->(:Person)") == []
+    assert _paths(kb, "(:Unknown)--()") == []
+
+
+def test_match_pattern_filters_properties_and_variables(kb: KnowledgeBase) -> None:
+    """Property filters, undirected hops and repeated variables should apply."""
+    assert _paths(kb, "(:Person {label: 'white'})--(o)") == [
+        ["White", "CIA"],
+        ["White", "Army"],
+    ]
+    assert _paths(kb, "({role: 'chemist'})-->()") == [["Gottlieb", "CIA"]]
+    # Same-node variables: no round trip exists, distinct people do
+    assert _paths(kb, "(a:Person)-->(:Organization)<--(a)") == []
+    assert _paths(kb, "(a:Person)-->(:Organization)<--(b:Person)") == [
+        ["Gottlieb", "CIA", "White"],
+        ["White", "CIA", "Gottlieb"],
+    ]
+
+
+def test_match_pattern_reports_matched_types_and_limit(kb: KnowledgeBase) -> None:
+    """Edges should list the types that matched; limit caps results."""
+    kb.add_relationship("White", "CIA", "consulted_for", "src")
+
+    matches = kb.match_pattern("(:Person)-[consulted_for]->(:Organization)")
+
+    assert matches[0]["edges"][0]["relationship_types"] == ["consulted_for"]
+    assert matches[0]["edges"][0]["source_node_id"] == "White"
+    assert len(kb.match_pattern("(:Person)-->()", limit=2)) == 2
+
+
+def test_pattern_handler_formats_paths(kb: KnowledgeBase) -> None:
+    """The agent tool should render arrows in the written direction."""
+    result = _handle_pattern(
+        kb, {"pattern": "(:Location)<-[operated_in]-(:Organization)", "limit": 5}
+    )
+    invalid = _handle_pattern(kb, {"pattern": "(:Location"})
+
+    text = result["content"][0]["text"]
+    assert "San Francisco (Location) <-[operated_in]- CIA (Organization)" in text
+    assert invalid["success"] is False
+    assert "Invalid pattern" in invalid["error"]
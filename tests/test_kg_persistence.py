@@ -7,6 +7,8 @@ Tests cover:
 - save/load roundtrip: Data integrity across serialization
 - list_knowledge_bases: Enumerating stored knowledge bases
 - export_graphml: GraphML format export for visualization tools
+- get_knowledge_base_revision: Cheap change detection via meta.json
+- Journaled saves: append-only change log, replay on load, compaction
 - _atomic_write: Write-to-temp-then-rename pattern
 
 Uses tmp_path fixture for isolated filesystem tests.
@@ -15,6 +17,8 @@ Uses tmp_path fixture for isolated filesystem tests.
 from __future__ import annotations
 
 import json
+import sqlite3
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 
@@ -25,13 +29,17 @@ from app.kg.domain import ConnectionType, DomainProfile, SeedEntity, ThingType
 from app.kg.knowledge_base import KnowledgeBase
 from app.kg.models import Edge, Node, RelationshipDetail, Source, SourceType
 from app.kg.persistence import (
+    GRAPHML_FILE,
+    JOURNAL_FILE,
     _atomic_write,
+    ensure_graphml,
     export_graphml,
+    get_knowledge_base_revision,
     list_knowledge_bases,
     load_knowledge_base,
     save_knowledge_base,
 )
-
+from app.kg.sqlite_store import SCHEMA_VERSION, SQLITE_FILE
 
 # =============================================================================
 # Fixtures
@@ -197,7 +205,6 @@ def test_save_creates_files(
         "nodes.json",
         "edges.json",
         "sources.json",
-        "graph.graphml",
     ]
     for filename in expected_files:
         filepath = kb_dir / filename
@@ -514,6 +521,51 @@ def test_export_graphml(tmp_path: Path, sample_knowledge_base: KnowledgeBase) ->
     assert edge_data["count"] == 2
 
 
+def test_save_does_not_write_graphml(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that saves skip the export and delete a stale one."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path)
+    kb_dir = tmp_path / kb.id
+    assert not (kb_dir / GRAPHML_FILE).exists()
+
+    assert ensure_graphml(kb, tmp_path) == kb_dir / GRAPHML_FILE
+    kb.add_node(Node(id="node_004", label="Jane Roe", entity_type="Person"))
+    save_knowledge_base(kb, tmp_path)
+    assert not (kb_dir / GRAPHML_FILE).exists()
+
+
+def test_ensure_graphml_generates_once_per_revision(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that the export is generated lazily and reused until a save."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path)
+
+    path = ensure_graphml(kb, tmp_path)
+    assert path is not None
+    G = nx.read_graphml(str(path))
+    assert G.number_of_nodes() == 3
+    mtime = path.stat().st_mtime_ns
+
+    assert ensure_graphml(kb, tmp_path) == path
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_ensure_graphml_skips_unsaved_or_stale_kb(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that a KB that differs from disk doesn't populate the cache."""
+    kb = sample_knowledge_base
+    assert ensure_graphml(kb, tmp_path) is None
+
+    save_knowledge_base(kb, tmp_path)
+    kb.add_node(Node(id="node_004", label="Jane Roe", entity_type="Person"))
+    assert ensure_graphml(kb, tmp_path) is None
+    assert not (tmp_path / kb.id / GRAPHML_FILE).exists()
+
+
 def test_export_graphml_empty_kb(tmp_path: Path) -> None:
     """Test GraphML export handles empty knowledge base."""
     kb = KnowledgeBase(id="empty_kb", name="Empty KB")
@@ -626,3 +678,413 @@ def test_roundtrip_preserves_timestamps(tmp_path: Path) -> None:
     assert loaded_kb is not None
     assert loaded_kb.created_at == kb.created_at
     assert loaded_kb.updated_at == kb.updated_at
+
+
+# =============================================================================
+# Test: get_knowledge_base_revision
+# =============================================================================
+
+
+def test_revision_changes_on_every_save(tmp_path: Path) -> None:
+    """Test that each save stamps a new revision, even with no changes."""
+    kb = KnowledgeBase(id="rev_kb", name="Revision KB")
+
+    first = save_knowledge_base(kb, tmp_path)
+    assert get_knowledge_base_revision(tmp_path / "rev_kb") == first
+
+    second = save_knowledge_base(kb, tmp_path)
+    assert second != first
+    assert get_knowledge_base_revision(tmp_path / "rev_kb") == second
+
+
+def test_revision_missing_kb(tmp_path: Path) -> None:
+    """Test that a missing knowledge base has no revision."""
+    assert get_knowledge_base_revision(tmp_path / "missing") is None
+
+
+def test_revision_legacy_meta_falls_back_to_mtime(tmp_path: Path) -> None:
+    """Test that meta.json without a revision falls back to mtime."""
+    kb_dir = tmp_path / "legacy_kb"
+    kb_dir.mkdir()
+    (kb_dir / "meta.json").write_text(json.dumps({"id": "legacy_kb"}))
+
+    revision = get_knowledge_base_revision(kb_dir)
+    assert revision is not None
+    assert revision.startswith("mtime:")
+
+
+# =============================================================================
+# Test: journaled saves
+# =============================================================================
+
+
+def _graph_state(kb: KnowledgeBase) -> tuple[dict, dict, dict]:
+    """Serialize a KB's nodes, edges and sources for comparison."""
+    return (
+        {nid: n.model_dump() for nid, n in kb._nodes.items()},
+        {eid: e.model_dump() for eid, e in kb._edges.items()},
+        {sid: s.model_dump() for sid, s in kb._sources.items()},
+    )
+
+
+def test_journaled_first_save_writes_snapshot(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that the first journaled save writes a snapshot, not a journal."""
+    save_knowledge_base(sample_knowledge_base, tmp_path, journaled=True)
+
+    kb_dir = tmp_path / sample_knowledge_base.id
+    assert (kb_dir / "nodes.json").exists()
+    assert not (kb_dir / JOURNAL_FILE).exists()
+    assert sample_knowledge_base._changes == {}
+
+
+def test_journaled_save_appends_only_changes(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that later journaled saves append changes and leave the snapshot."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path, journaled=True)
+    kb_dir = tmp_path / kb.id
+    snapshot = (kb_dir / "nodes.json").read_text()
+
+    kb.add_node(Node(id="node_004", label="Jane Roe", entity_type="Person"))
+    kb.add_relationship("Jane Roe", "Acme Corp", "worked_for", "src_001")
+    save_knowledge_base(kb, tmp_path, journaled=True)
+
+    assert (kb_dir / "nodes.json").read_text() == snapshot
+    records = [
+        json.loads(line) for line in (kb_dir / JOURNAL_FILE).read_text().splitlines()
+    ]
+    assert [(r["op"], r["kind"]) for r in records] == [
+        ("upsert", "node"),
+        ("upsert", "edge"),
+    ]
+    meta = json.loads((kb_dir / "meta.json").read_text())
+    assert meta["journal_entries"] == 2
+    assert meta["journal_size"] == (kb_dir / JOURNAL_FILE).stat().st_size
+
+
+def test_journaled_load_replays_merge(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that loading replays upserts and deletes from a merge."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path, journaled=True)
+
+    kb.merge_nodes("node_002", "node_003")
+    kb.add_node_source("node_001", "src_002")
+    save_knowledge_base(kb, tmp_path, journaled=True)
+
+    loaded = load_knowledge_base(tmp_path / kb.id)
+    assert loaded is not None
+    assert _graph_state(loaded) == _graph_state(kb)
+    assert loaded.get_node("node_003") is None
+    assert loaded.get_node_by_label("Project X") is loaded.get_node("node_002")
+    assert loaded._changes == {}
+
+
+def test_journaled_load_ignores_torn_append(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that bytes past the committed journal size are ignored."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path, journaled=True)
+    kb.add_node(Node(id="node_004", label="Jane Roe", entity_type="Person"))
+    save_knowledge_base(kb, tmp_path, journaled=True)
+
+    journal = tmp_path / kb.id / JOURNAL_FILE
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"op": "upsert", "kind": "no')
+
+    loaded = load_knowledge_base(tmp_path / kb.id)
+    assert loaded is not None
+    assert _graph_state(loaded) == _graph_state(kb)
+
+    # The next append truncates the torn tail before writing
+    loaded.add_node(Node(id="node_005", label="Sam Poe", entity_type="Person"))
+    save_knowledge_base(loaded, tmp_path, journaled=True)
+    reloaded = load_knowledge_base(tmp_path / kb.id)
+    assert reloaded is not None
+    assert reloaded.get_node("node_005") is not None
+
+
+def test_journaled_save_compacts(
+    tmp_path: Path,
+    sample_knowledge_base: KnowledgeBase,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a journal past the compaction threshold becomes a snapshot."""
+    monkeypatch.setattr("app.kg.persistence.JOURNAL_COMPACT_MIN_ENTRIES", 0)
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path, journaled=True)
+    kb.add_node(Node(id="node_004", label="Jane Roe", entity_type="Person"))
+
+    save_knowledge_base(kb, tmp_path, journaled=True, compact_ratio=0.0)
+
+    kb_dir = tmp_path / kb.id
+    assert not (kb_dir / JOURNAL_FILE).exists()
+    nodes = json.loads((kb_dir / "nodes.json").read_text())
+    assert "node_004" in {n["id"] for n in nodes}
+
+
+def test_journaled_save_after_external_write_snapshots(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that a KB whose base revision is stale writes a full snapshot."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path, journaled=True)
+
+    other = load_knowledge_base(tmp_path / kb.id)
+    assert other is not None
+    other.add_node(Node(id="node_004", label="Jane Roe", entity_type="Person"))
+    save_knowledge_base(other, tmp_path, journaled=True)
+
+    # kb was loaded before other's save, so appending would be unsafe
+    kb.add_node(Node(id="node_005", label="Sam Poe", entity_type="Person"))
+    save_knowledge_base(kb, tmp_path, journaled=True)
+
+    loaded = load_knowledge_base(tmp_path / kb.id)
+    assert loaded is not None
+    assert _graph_state(loaded) == _graph_state(kb)
+
+
+def _crash_on_meta_write(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make the next meta.json write fail, as if the process died there."""
+
+    def failing_write(path: Path, content: str | bytes) -> None:
+        if path.name == "meta.json":
+            raise OSError("simulated crash")
+        _atomic_write(path, content)
+
+    monkeypatch.setattr("app.kg.persistence._atomic_write", failing_write)
+
+
+def test_compaction_crash_before_meta_keeps_committed_state(
+    tmp_path: Path,
+    sample_knowledge_base: KnowledgeBase,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a snapshot without its meta.json never meets the old journal."""
+    monkeypatch.setattr("app.kg.persistence.JOURNAL_COMPACT_MIN_ENTRIES", 0)
+    kb = sample_knowledge_base
+    kb_dir = tmp_path / kb.id
+    save_knowledge_base(kb, tmp_path, journaled=True)
+    kb.add_alias("node_001", "Johnny")
+    save_knowledge_base(kb, tmp_path, journaled=True)
+    committed = load_knowledge_base(kb_dir)
+    assert committed is not None
+
+    kb.remove_node("node_001")
+    kb.add_node(Node(id="node_004", label="Jane Roe", entity_type="Person"))
+    with monkeypatch.context() as m:
+        _crash_on_meta_write(m)
+        with pytest.raises(OSError):
+            save_knowledge_base(kb, tmp_path, journaled=True, compact_ratio=0.0)
+
+    loaded = load_knowledge_base(kb_dir)
+    assert loaded is not None
+    assert _graph_state(loaded) == _graph_state(committed)
+
+    # The next save discards the uncommitted snapshot
+    save_knowledge_base(loaded, tmp_path, journaled=True)
+    assert sorted(p.name for p in kb_dir.glob("nodes.json*")) == ["nodes.json"]
+
+
+def test_compaction_crash_after_meta_loads_new_snapshot(
+    tmp_path: Path,
+    sample_knowledge_base: KnowledgeBase,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a committed snapshot is used even if it was never moved into place."""
+    monkeypatch.setattr("app.kg.persistence.JOURNAL_COMPACT_MIN_ENTRIES", 0)
+    kb = sample_knowledge_base
+    kb_dir = tmp_path / kb.id
+    save_knowledge_base(kb, tmp_path, journaled=True)
+    kb.add_alias("node_001", "Johnny")
+    save_knowledge_base(kb, tmp_path, journaled=True)
+
+    kb.remove_node("node_001")
+    with monkeypatch.context() as m:
+        m.setattr("app.kg.persistence._install_snapshot", lambda *args: None)
+        save_knowledge_base(kb, tmp_path, journaled=True, compact_ratio=0.0)
+
+    loaded = load_knowledge_base(kb_dir)
+    assert loaded is not None
+    assert loaded.get_node("node_001") is None
+    assert _graph_state(loaded) == _graph_state(kb)
+
+    # The next save finishes moving the snapshot into place
+    loaded.add_node(Node(id="node_004", label="Jane Roe", entity_type="Person"))
+    save_knowledge_base(loaded, tmp_path, journaled=True)
+    assert sorted(p.name for p in kb_dir.glob("nodes.json*")) == ["nodes.json"]
+    reloaded = load_knowledge_base(kb_dir)
+    assert reloaded is not None
+    assert _graph_state(reloaded) == _graph_state(loaded)
+
+
+# =============================================================================
+# Test: sqlite backend
+# =============================================================================
+
+
+def test_sqlite_save_load_roundtrip(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that the sqlite backend round-trips nodes, edges and sources."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path, backend="sqlite")
+
+    kb_dir = tmp_path / kb.id
+    assert (kb_dir / SQLITE_FILE).exists()
+    assert not (kb_dir / "nodes.json").exists()
+    assert json.loads((kb_dir / "meta.json").read_text())["storage"] == "sqlite"
+
+    loaded = load_knowledge_base(kb_dir)
+    assert loaded is not None
+    assert _graph_state(loaded) == _graph_state(kb)
+    assert loaded._changes == {}
+
+
+def test_sqlite_save_applies_changes_and_keeps_backend(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that later saves keep the sqlite backend and apply merges."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path, backend="sqlite")
+
+    kb.merge_nodes("node_002", "node_003")
+    kb.add_node(Node(id="node_004", label="Jane Roe", entity_type="Person"))
+    kb.add_relationship("Jane Roe", "Acme Corp", "worked_for", "src_001")
+    save_knowledge_base(kb, tmp_path)
+
+    kb_dir = tmp_path / kb.id
+    assert json.loads((kb_dir / "meta.json").read_text())["storage"] == "sqlite"
+    loaded = load_knowledge_base(kb_dir)
+    assert loaded is not None
+    assert _graph_state(loaded) == _graph_state(kb)
+    assert loaded.get_node("node_003") is None
+
+
+def test_sqlite_outdated_schema_is_rebuilt(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """An incremental save to a file at another schema version rewrites it."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path, backend="sqlite")
+    db_path = tmp_path / kb.id / SQLITE_FILE
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+
+    kb.add_node(Node(id="node_new", label="Newcomer", entity_type="Person"))
+    save_knowledge_base(kb, tmp_path)
+    loaded = load_knowledge_base(tmp_path / kb.id)
+
+    assert loaded is not None
+    assert list(loaded._nodes) == list(kb._nodes)
+    assert len(loaded._edges) == len(kb._edges)
+    with closing(sqlite3.connect(db_path)) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone() == (SCHEMA_VERSION,)
+
+
+def test_sqlite_load_reports_missing_database(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Loading should fail, not create an empty database, if kb.sqlite is gone."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path, backend="sqlite")
+    db_path = tmp_path / kb.id / SQLITE_FILE
+    db_path.unlink()
+
+    with pytest.raises(FileNotFoundError):
+        load_knowledge_base(tmp_path / kb.id)
+    assert not db_path.exists()
+
+
+def test_sqlite_roundtrip_keeps_mention_counts(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Mention spans (and so counts) should survive sqlite saves and reloads."""
+    kb = sample_knowledge_base
+    source_id = next(iter(kb._sources))
+    kb.index_mentions(source_id, "John Doe called John Doe, then john doe hung up.")
+    save_knowledge_base(kb, tmp_path, backend="sqlite")
+    kb.index_mentions(source_id, "Only John Doe here.")
+    save_knowledge_base(kb, tmp_path, backend="sqlite")
+
+    loaded = load_knowledge_base(tmp_path / kb.id)
+
+    assert loaded is not None
+    assert loaded.get_mentions("John Doe")[0]["mention_count"] == 1
+    assert loaded.get_mentions("John Doe") == kb.get_mentions("John Doe")
+
+
+def test_switching_backend_removes_old_files(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that switching backends rewrites the data and cleans up."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path, journaled=True)
+    kb.add_node(Node(id="node_004", label="Jane Roe", entity_type="Person"))
+    save_knowledge_base(kb, tmp_path, journaled=True)
+
+    kb_dir = tmp_path / kb.id
+    save_knowledge_base(kb, tmp_path, backend="sqlite")
+    assert not (kb_dir / JOURNAL_FILE).exists()
+    assert not (kb_dir / "edges.json").exists()
+
+    save_knowledge_base(kb, tmp_path, backend="json")
+    assert not (kb_dir / SQLITE_FILE).exists()
+    loaded = load_knowledge_base(kb_dir)
+    assert loaded is not None
+    assert _graph_state(loaded) == _graph_state(kb)
+
+
+def test_save_rejects_unknown_backend(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that an unknown storage backend raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown storage backend"):
+        save_knowledge_base(sample_knowledge_base, tmp_path, backend="parquet")
+
+
+# =============================================================================
+# Test: JSON encoding
+# =============================================================================
+
+
+def test_save_writes_minified_json_by_default(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that data files are minified unless compact=False."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path)
+    nodes_file = tmp_path / kb.id / "nodes.json"
+    assert "\n" not in nodes_file.read_text()
+
+    save_knowledge_base(kb, tmp_path, compact=False)
+    assert nodes_file.read_text().startswith("[\n  {")
+    loaded = load_knowledge_base(tmp_path / kb.id)
+    assert loaded is not None
+    assert _graph_state(loaded) == _graph_state(kb)
+
+
+def test_load_reads_legacy_stdlib_json(
+    tmp_path: Path, sample_knowledge_base: KnowledgeBase
+) -> None:
+    """Test that files written with json.dumps(default=str) still load."""
+    kb = sample_knowledge_base
+    save_knowledge_base(kb, tmp_path)
+    kb_dir = tmp_path / kb.id
+    for name, store in (
+        ("nodes.json", kb._nodes),
+        ("edges.json", kb._edges),
+        ("sources.json", kb._sources),
+    ):
+        data = [obj.model_dump() for obj in store.values()]
+        (kb_dir / name).write_text(json.dumps(data, indent=2, default=str))
+
+    loaded = load_knowledge_base(kb_dir)
+    assert loaded is not None
+    assert _graph_state(loaded) == _graph_state(kb)
@@ -12,22 +12,29 @@ Tests cover:
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from app.kg.knowledge_base import KnowledgeBase
 from app.kg.models import Edge, Node, RelationshipDetail, Source, SourceType
+from app.kg.normalization import generate_ngrams
 from app.kg.resolution import (
     EntityMatcher,
     MergeHistory,
     ResolutionCandidate,
     ResolutionConfig,
     _block_by_first_char,
+    _block_by_ngrams,
+    _iter_minhash_pairs,
+    _iter_ngram_pairs,
+    _iter_sorted_neighborhood_pairs,
     alias_overlap_score,
+    iter_candidate_pairs,
     jaro_winkler_similarity,
     levenshtein_similarity,
 )
 
-
 # ============================================================================
 # String Similarity Function Tests
 # ============================================================================
@@ -225,6 +232,94 @@ class TestBlockByFirstChar:
         assert blocks == {}
 
 
+class TestCandidatePairBlocking:
+    """Tests for streaming n-gram, sorted-neighborhood and MinHash blocking."""
+
+    @pytest.fixture
+    def nodes(self) -> list[Node]:
+        """Nodes with two near-duplicate pairs and an unrelated node."""
+        return [
+            Node(id="n1", label="John Smith", entity_type="Person"),
+            Node(id="n2", label="Acme Corporation", entity_type="Organization"),
+            Node(id="n3", label="Jon Smith", entity_type="Person"),
+            Node(id="n4", label="Acme Corp", entity_type="Organization"),
+            Node(id="n5", label="Zebra", entity_type="Animal"),
+        ]
+
+    def test_ngram_pairs_match_legacy_pair_counts(self, nodes: list[Node]) -> None:
+        """Streaming n-gram blocking should find the pairs a full count would."""
+        expected = set()
+        ngrams = [generate_ngrams(node.label) for node in nodes]
+        for a in range(len(nodes)):
+            for b in range(a + 1, len(nodes)):
+                if len(ngrams[a] & ngrams[b]) >= 2:
+                    expected.add((a, b))
+
+        pairs = list(_iter_ngram_pairs(nodes))
+
+        assert set(pairs) == expected
+        assert pairs == sorted(pairs)
+        assert _block_by_ngrams(nodes) == pairs
+
+    def test_ngram_stop_gram_pruning(self) -> None:
+        """Posting lists above max_block_size should not generate pairs."""
+        nodes = [
+            Node(id=f"n{i}", label=f"the {chr(97 + i)}", entity_type="Thing")
+            for i in range(5)
+        ]
+
+        assert len(list(_iter_ngram_pairs(nodes, min_shared_ngrams=1))) == 10
+        assert (
+            list(_iter_ngram_pairs(nodes, min_shared_ngrams=1, max_block_size=4)) == []
+        )
+
+    def test_default_config_keeps_large_blocks(self) -> None:
+        """The default config should score every pair a full count would."""
+        nodes = [
+            Node(id=f"n{i}", label=f"the {chr(97 + i)}", entity_type="Thing")
+            for i in range(5)
+        ]
+        pruned = ResolutionConfig(max_block_size=4)
+
+        pairs = list(iter_candidate_pairs(nodes, ResolutionConfig(), 1))
+
+        assert pairs == list(_iter_ngram_pairs(nodes, min_shared_ngrams=1))
+        assert len(pairs) == 10
+        assert list(iter_candidate_pairs(nodes, pruned, 1)) == []
+
+    def test_sorted_neighborhood_pairs(self, nodes: list[Node]) -> None:
+        """Sorted-neighborhood blocking should pair adjacent sorted keys."""
+        pairs = set(_iter_sorted_neighborhood_pairs(nodes, window=2))
+
+        # Sorted keys: acmecorp, acmecorporation, johnsmith, jonsmith, zebra
+        assert (1, 3) in pairs
+        assert (0, 2) in pairs
+        assert (0, 4) not in pairs  # johnsmith / zebra are not adjacent
+        assert all(a < b for a, b in pairs)
+
+    def test_minhash_pairs_find_near_duplicates(self, nodes: list[Node]) -> None:
+        """MinHash LSH should bucket near-duplicate names together."""
+        pairs = set(_iter_minhash_pairs(nodes, num_perm=64, bands=32))
+
+        assert (0, 2) in pairs
+        assert all(4 not in pair for pair in pairs)
+
+    def test_iter_candidate_pairs_uses_config_strategy(self, nodes: list[Node]) -> None:
+        """iter_candidate_pairs should dispatch on blocking_strategy."""
+        config = ResolutionConfig(
+            blocking_strategy="sorted_neighborhood", sorted_neighborhood_window=2
+        )
+
+        assert list(iter_candidate_pairs(nodes, config)) == list(
+            _iter_sorted_neighborhood_pairs(nodes, window=2)
+        )
+
+    def test_minhash_bands_must_divide_num_perm(self) -> None:
+        """ResolutionConfig should reject bands that don't divide num_perm."""
+        with pytest.raises(ValueError):
+            ResolutionConfig(minhash_num_perm=64, minhash_bands=10)
+
+
 # ============================================================================
 # EntityMatcher Tests
 # ============================================================================
@@ -373,6 +468,42 @@ class TestEntityMatcher:
             for i in range(len(candidates) - 1):
                 assert candidates[i].confidence >= candidates[i + 1].confidence
 
+    def test_score_pairs_matches_compute_similarity(
+        self, custom_matcher: EntityMatcher
+    ) -> None:
+        """Batch scoring should reproduce compute_similarity exactly."""
+        kb = KnowledgeBase(name="Test KB")
+        nodes = [
+            Node(id="n1", label="John Smith", entity_type="Person", aliases=["JS"]),
+            Node(id="n2", label="john smith", entity_type="Person"),
+            Node(id="n3", label="Jon Smyth", entity_type="Person", aliases=["JS"]),
+            Node(id="n4", label="Acme Corp", entity_type="Organization"),
+            Node(id="n5", label="...", entity_type="Organization"),
+        ]
+        for node in nodes:
+            kb.add_node(node)
+        kb.add_relationship("John Smith", "Acme Corp", "works_for", "src")
+        kb.add_relationship("Jon Smyth", "Acme Corp", "works_for", "src")
+
+        pairs = [(a, b) for a in range(len(nodes)) for b in range(a + 1, len(nodes))]
+        confidence, signals = custom_matcher.score_pairs(nodes, pairs, kb)
+
+        for k, (a, b) in enumerate(pairs):
+            expected, expected_signals = custom_matcher.compute_similarity(
+                nodes[a], nodes[b], kb
+            )
+            assert confidence[k] == expected
+            assert {name: values[k] for name, values in signals.items()} == (
+                expected_signals
+            )
+
+    def test_score_pairs_empty(self, matcher: EntityMatcher) -> None:
+        """Scoring no pairs should return empty arrays."""
+        confidence, signals = matcher.score_pairs([], [])
+
+        assert len(confidence) == 0
+        assert all(len(values) == 0 for values in signals.values())
+
 
 # ============================================================================
 # Resolution Models Tests
@@ -424,6 +555,7 @@ class TestResolutionModels:
         )
         assert 0.99 <= active_weight <= 1.01
         assert config.semantic_weight == 0.0  # Default until embeddings added
+        assert config.max_block_size is None  # No stop-gram pruning by default
 
     def test_resolution_config_validation(self) -> None:
         """ResolutionConfig should validate bounds."""
@@ -768,6 +900,46 @@ class TestKnowledgeBaseFindCandidates:
         # Should find few or no candidates
         assert len(candidates) == 0
 
+    def test_find_candidates_for_node_only_scores_blocked_nodes(
+        self, kb_with_similar_nodes: KnowledgeBase
+    ) -> None:
+        """Nodes sharing no trigram or normalized key should not be scored."""
+        new_node = Node(id="n_new", label="Apple", entity_type="Company")
+        config = ResolutionConfig(review_threshold=0.0)
+
+        with patch.object(
+            EntityMatcher, "candidates_from_pairs", autospec=True, return_value=[]
+        ) as mock_score:
+            kb_with_similar_nodes.find_candidates_for_node(new_node, config)
+
+        _, nodes, pairs = mock_score.call_args.args
+        assert {nodes[b].id for _, b in pairs} == {"n1", "n2"}
+
+    def test_find_candidates_for_node_matches_normalized_key(self) -> None:
+        """Names differing only in punctuation/spacing should be blocked together."""
+        kb = KnowledgeBase(name="Test KB")
+        kb.add_node(Node(id="n1", label="J.F.K.", entity_type="Person"))
+
+        # "jfk" shares no trigram with "j.f.k", only the normalized key
+        new_node = Node(id="n_new", label="JFK", entity_type="Person")
+
+        assert kb._blocked_candidate_ids(new_node) == ["n1"]
+
+    def test_blocking_index_tracks_aliases_and_merges(
+        self, kb_with_similar_nodes: KnowledgeBase
+    ) -> None:
+        """Blocking index should follow add_alias and merge_nodes."""
+        kb = kb_with_similar_nodes
+        kb.add_alias("n3", "MSFT")
+        assert kb.get_node_by_label("msft") is kb.get_node("n3")
+
+        probe = Node(id="probe", label="MSFT", entity_type="Company")
+        assert "n3" in kb._blocked_candidate_ids(probe)
+
+        kb.merge_nodes("n1", "n2")
+        probe = Node(id="probe", label="Apple Inc.", entity_type="Company")
+        assert kb._blocked_candidate_ids(probe) == ["n1"]
+
 
 # ============================================================================
 # KGProject Resolution Fields Tests
@@ -56,6 +56,10 @@ class MockKGService:
         """Get project by ID."""
         return self.projects.get(project_id)
 
+    def state_tag(self, project_id: str) -> str | None:
+        """No state fingerprint (conditional GET disabled)."""
+        return None
+
     async def scan_for_duplicates(
         self,
         project_id: str,
@@ -5,6 +5,7 @@ This module tests the KnowledgeGraphService including:
 - Project lifecycle (create, get, list)
 - Persistence (atomic writes, cross-instance persistence)
 - Discovery confirmation workflow
+- KnowledgeBase cache (LRU, revision-validated, write-through)
 
 Uses tmp_path fixture for isolated test directories.
 All tests are async using @pytest.mark.asyncio.
@@ -29,6 +30,9 @@ from app.kg.domain import (
     SeedEntity,
     ThingType,
 )
+from app.kg.knowledge_base import KnowledgeBase
+from app.kg.models import Node
+from app.kg.persistence import load_knowledge_base, save_knowledge_base
 from app.services.kg_service import KnowledgeGraphService
 
 if TYPE_CHECKING:
@@ -1105,3 +1109,154 @@ class TestFindTranscriptByTitle:
 
             result = kg_service._find_transcript_by_title("The Search")
             assert result == "exact222"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# KNOWLEDGE BASE CACHE TESTS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestKnowledgeBaseCache:
+    """Tests for the in-memory KnowledgeBase cache."""
+
+    def _save_kb(self, kg_service: KnowledgeGraphService, kb_id: str) -> None:
+        kb = KnowledgeBase(id=kb_id, name=f"KB {kb_id}")
+        kb.add_node(Node(id=f"{kb_id}_n1", label="Alice", entity_type="Person"))
+        save_knowledge_base(kb, kg_service.kb_path)
+
+    def test_repeated_loads_return_same_instance(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Test that unchanged KBs are served from cache without reloading."""
+        self._save_kb(kg_service, "kb_cache_01")
+
+        with patch(
+            "app.services.kg_service.load_knowledge_base",
+            wraps=load_knowledge_base,
+        ) as mock_load:
+            kb1 = kg_service.load_kb("kb_cache_01")
+            kb2 = kg_service.load_kb("kb_cache_01")
+
+        assert kb1 is not None
+        assert kb1 is kb2
+        assert mock_load.call_count == 1
+
+    def test_missing_kb_returns_none(self, kg_service: KnowledgeGraphService) -> None:
+        """Test that a KB that doesn't exist on disk returns None."""
+        assert kg_service.load_kb("kb_missing01") is None
+
+    def test_external_write_invalidates_cache(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Test that a save made outside the service forces a reload."""
+        self._save_kb(kg_service, "kb_cache_02")
+        cached = kg_service.load_kb("kb_cache_02")
+        assert cached is not None
+
+        # Modify and save through a separately loaded copy
+        external = load_knowledge_base(kg_service.kb_path / "kb_cache_02")
+        assert external is not None
+        external.add_node(Node(id="kb_cache_02_n2", label="Bob", entity_type="Person"))
+        save_knowledge_base(external, kg_service.kb_path)
+
+        reloaded = kg_service.load_kb("kb_cache_02")
+        assert reloaded is not None
+        assert reloaded is not cached
+        assert reloaded.get_node("kb_cache_02_n2") is not None
+
+    def test_save_kb_is_write_through(self, kg_service: KnowledgeGraphService) -> None:
+        """Test that save_kb persists and keeps the same instance cached."""
+        self._save_kb(kg_service, "kb_cache_03")
+        kb = kg_service.load_kb("kb_cache_03")
+        assert kb is not None
+
+        kb.add_node(Node(id="kb_cache_03_n2", label="Bob", entity_type="Person"))
+        kg_service.save_kb(kb)
+
+        with patch("app.services.kg_service.load_knowledge_base") as mock_load:
+            assert kg_service.load_kb("kb_cache_03") is kb
+        mock_load.assert_not_called()
+
+        on_disk = load_knowledge_base(kg_service.kb_path / "kb_cache_03")
+        assert on_disk is not None
+        assert on_disk.get_node("kb_cache_03_n2") is not None
+
+    def test_failed_save_drops_dirty_kb(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Test that a KB whose save fails is reloaded from disk, not served."""
+        self._save_kb(kg_service, "kb_cache_05")
+        kb = kg_service.load_kb("kb_cache_05")
+        assert kb is not None
+
+        kb.add_node(Node(id="kb_cache_05_n2", label="Bob", entity_type="Person"))
+        with (
+            patch(
+                "app.services.kg_service.save_knowledge_base",
+                side_effect=OSError("disk full"),
+            ),
+            pytest.raises(OSError),
+        ):
+            kg_service.save_kb(kb)
+
+        assert "kb_cache_05" not in kg_service._kbs
+        reloaded = kg_service.load_kb("kb_cache_05")
+        assert reloaded is not None and reloaded is not kb
+        assert reloaded.get_node("kb_cache_05_n2") is None
+
+    @pytest.mark.asyncio
+    async def test_failed_merge_save_keeps_disk_state(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Test that a merge whose save fails leaves no half-applied merge cached."""
+        project = await kg_service.create_project("Merge Fails")
+        kb = KnowledgeBase(id="kb_cache_06", name="KB")
+        kb.add_node(Node(id="n_alice", label="Alice", entity_type="Person"))
+        kb.add_node(Node(id="n_alicia", label="Alicia", entity_type="Person"))
+        save_knowledge_base(kb, kg_service.kb_path)
+        project.kb_id = kb.id
+        await kg_service._save_project(project)
+        assert kg_service.load_kb(kb.id) is not None
+
+        with (
+            patch(
+                "app.services.kg_service.save_knowledge_base",
+                side_effect=OSError("disk full"),
+            ),
+            pytest.raises(OSError),
+        ):
+            await kg_service.merge_entities(project.id, "n_alice", "n_alicia")
+
+        reloaded = kg_service.load_kb(kb.id)
+        assert reloaded is not None
+        assert reloaded.get_node("n_alicia") is not None
+
+    def test_lru_eviction(self, kg_service: KnowledgeGraphService) -> None:
+        """Test that the least recently used KB is evicted at capacity."""
+        kg_service._max_kb_cache_size = 2
+        for kb_id in ("kb_cache_0a", "kb_cache_0b", "kb_cache_0c"):
+            self._save_kb(kg_service, kb_id)
+
+        kg_service.load_kb("kb_cache_0a")
+        kg_service.load_kb("kb_cache_0b")
+        kg_service.load_kb("kb_cache_0a")  # Touch a, so b is oldest
+        kg_service.load_kb("kb_cache_0c")
+
+        assert list(kg_service._kbs) == ["kb_cache_0a", "kb_cache_0c"]
+
+    @pytest.mark.asyncio
+    async def test_delete_project_evicts_kb(
+        self, kg_service: KnowledgeGraphService
+    ) -> None:
+        """Test that deleting a project drops its cached KB."""
+        project = await kg_service.create_project("Cached")
+        self._save_kb(kg_service, "kb_cache_04")
+        project.kb_id = "kb_cache_04"
+        await kg_service._save_project(project)
+
+        assert await kg_service.get_knowledge_base(project.id) is not None
+        assert "kb_cache_04" in kg_service._kbs
+
+        await kg_service.delete_project(project.id)
+
+        assert "kb_cache_04" not in kg_service._kbs
@@ -334,6 +334,94 @@ class TestExtractFromTranscript:
         assert updated_project.source_count >= 1
         assert updated_project.kb_id is not None
 
+    @pytest.mark.asyncio
+    async def test_extract_replace_swaps_previous_results(
+        self,
+        kg_service: KnowledgeGraphService,
+        sample_domain_profile: DomainProfile,
+        sample_extraction_result: ExtractionResult,
+    ) -> None:
+        """Re-extracting with replace should drop what the old run contributed."""
+        from claude_agent_sdk import ResultMessage, UserMessage
+
+        from app.kg.tools.extraction import EXTRACTION_DATA_MARKER
+
+        project = await kg_service.create_project("Replace Test")
+        project.domain_profile = sample_domain_profile
+        project.state = ProjectState.ACTIVE
+        await kg_service._save_project(project)
+
+        def mock_client_for(result: ExtractionResult) -> AsyncMock:
+            tool_result_block = MagicMock()
+            tool_result_block.__class__.__name__ = "ToolResultBlock"
+            tool_result_block.content = [
+                {
+                    "type": "text",
+                    "text": f"{EXTRACTION_DATA_MARKER}{json.dumps(result.model_dump())}",
+                },
+            ]
+            mock_user_msg = MagicMock(spec=UserMessage)
+            mock_user_msg.content = [tool_result_block]
+            mock_result = MagicMock(spec=ResultMessage)
+            mock_result.is_error = False
+            mock_result.num_turns = 1
+            mock_result.total_cost_usd = 0.0
+
+            async def mock_receive():
+                yield mock_user_msg
+                yield mock_result
+
+            mock_client = AsyncMock()
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_client.receive_response = mock_receive
+            return mock_client
+
+        corrected = ExtractionResult(
+            entities=[
+                ExtractedEntity(label="John Doe", entity_type="Person"),
+                ExtractedEntity(label="NewCo", entity_type="Organization"),
+            ],
+            relationships=[
+                ExtractedRelationship(
+                    source_label="John Doe",
+                    target_label="NewCo",
+                    relationship_type="works_for",
+                ),
+            ],
+        )
+
+        with patch("app.services.kg_service.ClaudeSDKClient") as mock_client_class:
+            mock_client_class.return_value = mock_client_for(sample_extraction_result)
+            await kg_service.extract_from_transcript(
+                project_id=project.id,
+                transcript="Test transcript content",
+                title="Test Video",
+                source_id="video789",
+            )
+            first_kb = await kg_service.get_knowledge_base(project.id)
+            john_id = first_kb.get_node_by_label("John Doe").id  # type: ignore[union-attr]
+            mock_client_class.return_value = mock_client_for(corrected)
+            result = await kg_service.extract_from_transcript(
+                project_id=project.id,
+                transcript="Corrected transcript content",
+                title="Test Video",
+                source_id="video789",
+                replace=True,
+            )
+
+        kb = await kg_service.get_knowledge_base(project.id)
+        assert kb is not None
+        assert result["retracted"]["nodes_removed"] == 1  # TechCorp
+        assert kb.get_node_by_label("John Doe").id == john_id  # type: ignore[union-attr]
+        assert kb.get_node_by_label("TechCorp") is None
+        assert kb.get_node_by_label("NewCo") is not None
+        assert kb.stats()["edge_count"] == 1
+        updated_project = await kg_service.get_project(project.id)
+        assert updated_project is not None
+        assert updated_project.thing_count == 2
+        assert updated_project.source_count == 1
+
     @pytest.mark.asyncio
     async def test_extract_adds_discoveries_to_pending(
         self,